@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Benchmark listing calibrations.
+
+Saves a few hundred tip length and labware offset calibrations, then
+compares listing them from the calibration database against the way they
+used to be listed, which opened and parsed one JSON file per calibration.
+
+Usage: python -m benchmarks.calibration_storage [calibration_count]
+"""
+import copy
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from opentrons import config
+from opentrons.calibration_storage import get, modify
+from opentrons.calibration_storage.database import CalibrationKind, get_database
+from opentrons.calibration_storage.encoder_decoder import (
+    DateTimeDecoder,
+    DateTimeEncoder,
+)
+from opentrons.protocols.labware import get_labware_definition
+from opentrons.types import Point
+
+_DEFAULT_CALIBRATION_COUNT = 300
+_REPEAT_COUNT = 50
+
+
+def _legacy_read_directory(directory: Path) -> Dict[str, object]:
+    all_data = {}
+    for file in os.scandir(directory):
+        if file.name.endswith(".json"):
+            with open(file.path, "r") as f:
+                all_data[file.name] = json.load(f, cls=DateTimeDecoder)
+    return all_data
+
+
+def _export_to_files(kind: CalibrationKind, directory: Path) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    for key, data in get_database().get_all(kind).items():
+        (directory / f"{key}.json").write_text(json.dumps(data, cls=DateTimeEncoder))
+
+
+def _time(func: Callable[[], object]) -> List[float]:
+    times = []
+    for _ in range(_REPEAT_COUNT):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def _print(label: str, times: List[float]) -> None:
+    print(
+        f"  {label:<9} median {statistics.median(times) * 1e3:7.2f} ms"
+        f"  min {min(times) * 1e3:7.2f} ms"
+    )
+
+
+def main(calibration_count: int) -> None:
+    """Print the time to list every calibration from files and the database."""
+    tiprack = get_labware_definition("opentrons_96_tiprack_300ul")
+    plate = get_labware_definition("corning_96_wellplate_360ul_flat")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config.CONFIG["calibration_database_file"] = Path(tmpdir) / "calibrations.db"
+        tip_length_dir = Path(tmpdir) / "tip_lengths"
+        offset_dir = Path(tmpdir) / "offsets"
+
+        for i in range(calibration_count):
+            modify.save_tip_length_calibration(
+                f"pipette{i}", modify.create_tip_length_data(tiprack, 50.0)
+            )
+            definition = copy.deepcopy(plate)
+            definition["parameters"]["loadName"] = f"plate_{i}"
+            modify.save_labware_calibration(
+                f"plate_{i}.json", definition, Point(1, 2, 3)
+            )
+
+        _export_to_files(CalibrationKind.TIP_LENGTH, tip_length_dir)
+        _export_to_files(CalibrationKind.LABWARE_OFFSET, offset_dir)
+        (offset_dir / "index.json").write_text(
+            json.dumps(
+                {
+                    "version": 1,
+                    "data": get_database().get_all(
+                        CalibrationKind.LABWARE_OFFSET_INDEX
+                    ),
+                }
+            )
+        )
+
+        print(f"Listing {calibration_count} tip length calibrations:")
+        _print("files", _time(lambda: _legacy_read_directory(tip_length_dir)))
+        _print("database", _time(get.get_all_tip_length_calibrations))
+
+        print(f"Listing {calibration_count} labware offset calibrations:")
+        _print("files", _time(lambda: _legacy_read_directory(offset_dir)))
+        _print("database", _time(get.get_all_calibrations))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_CALIBRATION_COUNT)
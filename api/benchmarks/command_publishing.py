@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Benchmark publishing protocol API commands.
+
+Simulates protocols made of many protocol API calls, each of which
+publishes a command through `opentrons.commands.publisher`. Runs each one
+with nothing subscribed to the broker, first with the fast path turned off
+so that every command is still built and published, then with the fast
+path that skips that work. Runs each once more with the subscriber that a
+`ProtocolContext` normally has, which records the run log returned by
+`ProtocolContext.commands()`. The other runs remove it with
+`ProtocolContext.cleanup()`.
+
+One protocol only makes comments, so publishing is most of its work; the
+other aspirates and dispenses, which also moves the simulated hardware.
+
+Usage: python -m benchmarks.command_publishing [step_count]
+"""
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+from opentrons import simulate
+from opentrons.commands import publisher
+from opentrons.protocol_api import ProtocolContext
+
+_DEFAULT_STEP_COUNT = 10_000
+_REPEAT_COUNT = 3
+
+
+@contextmanager
+def _fast_path(enabled: bool) -> Iterator[None]:
+    should_publish = publisher._should_publish
+    if not enabled:
+        publisher._should_publish = lambda broker: True
+    try:
+        yield
+    finally:
+        publisher._should_publish = should_publish
+
+
+def _comments(ctx: ProtocolContext, step_count: int) -> None:
+    for step in range(step_count):
+        ctx.comment(f"step {step}")
+
+
+def _liquid_handling(ctx: ProtocolContext, step_count: int) -> None:
+    tiprack = ctx.load_labware("opentrons_96_tiprack_300ul", 1)
+    plate = ctx.load_labware("corning_96_wellplate_360ul_flat", 2)
+    pipette = ctx.load_instrument("p300_single_gen2", "right", tip_racks=[tiprack])
+
+    pipette.pick_up_tip()
+    wells = plate.wells()
+    for step in range(step_count // 2):
+        pipette.aspirate(10, wells[step % len(wells)])
+        pipette.dispense(10)
+    pipette.drop_tip()
+
+
+def _time_run(
+    protocol: Callable[[ProtocolContext, int], None], step_count: int, subscribe: bool
+) -> float:
+    ctx = simulate.get_protocol_api("2.12")
+    if not subscribe:
+        ctx.cleanup()
+
+    start = time.perf_counter()
+    protocol(ctx, step_count)
+    return time.perf_counter() - start
+
+
+def main(step_count: int) -> None:
+    """Print the time to simulate protocols with and without the fast path."""
+    # Import and load everything the simulation needs before timing it.
+    _time_run(_liquid_handling, 10, subscribe=False)
+
+    for name, protocol, protocol_step_count in (
+        ("comments", _comments, step_count),
+        ("aspirates and dispenses", _liquid_handling, step_count // 10),
+    ):
+        print(f"Simulating {protocol_step_count} {name}:")
+        for label, fast_path, subscribe in (
+            ("no subscribers, fast path off", False, False),
+            ("no subscribers, fast path on", True, False),
+            ("run log subscriber", True, True),
+        ):
+            with _fast_path(fast_path):
+                elapsed = min(
+                    _time_run(protocol, protocol_step_count, subscribe)
+                    for _ in range(_REPEAT_COUNT)
+                )
+            print(
+                f"  {label:<30} {elapsed:7.3f} s"
+                f"  {elapsed / protocol_step_count * 1e6:6.1f} µs/step"
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_STEP_COUNT)
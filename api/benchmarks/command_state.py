@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Benchmark the cost of command actions and queries as a run gets long.
+
+Queues up a large number of commands, then runs and completes a sample
+of them at the start and end of the queue. For each sample, prints the
+average time to handle a command's actions and to query the command
+state the way the engine and robot server do after every action.
+The cost per command should stay flat no matter how many commands
+are in the run.
+
+Usage: python -m benchmarks.command_state [command_count]
+"""
+import sys
+import time
+from datetime import datetime
+from typing import List
+
+from opentrons.protocol_engine import commands
+from opentrons.protocol_engine.actions import (
+    PlayAction,
+    QueueCommandAction,
+    UpdateCommandAction,
+)
+from opentrons.protocol_engine.state import Config
+from opentrons.protocol_engine.state.commands import CommandStore, CommandView
+
+_DEFAULT_COMMAND_COUNT = 50_000
+_SAMPLE_SIZE = 1000
+
+
+def _queue_commands(store: CommandStore, command_count: int) -> List[str]:
+    command_ids = [f"command-{i}" for i in range(command_count)]
+    created_at = datetime(year=2022, month=1, day=1)
+
+    for command_id in command_ids:
+        store.handle_action(
+            QueueCommandAction(
+                command_id=command_id,
+                created_at=created_at,
+                request=commands.WaitForResumeCreate(
+                    params=commands.WaitForResumeParams()
+                ),
+            )
+        )
+
+    store.handle_action(PlayAction(requested_at=created_at))
+    return command_ids
+
+
+def _run_commands(store: CommandStore, command_ids: List[str]) -> float:
+    """Run and complete some commands, returning the mean time per command."""
+    view = CommandView(store.state)
+    start = time.perf_counter()
+
+    for command_id in command_ids:
+        queued_command = view.get(command_id)
+        store.handle_action(
+            UpdateCommandAction(
+                command=queued_command.copy(
+                    update={"status": commands.CommandStatus.RUNNING}
+                )
+            )
+        )
+        view.get_current()
+        store.handle_action(
+            UpdateCommandAction(
+                command=queued_command.copy(
+                    update={"status": commands.CommandStatus.SUCCEEDED}
+                )
+            )
+        )
+        view.get_current()
+        view.get_all_complete()
+        view.get_next_queued()
+        view.get_status()
+
+    return (time.perf_counter() - start) / len(command_ids)
+
+
+def main(command_count: int) -> None:
+    """Print the mean cost per command near the start and end of a long run."""
+    assert command_count >= 2 * _SAMPLE_SIZE, f"Need at least {2 * _SAMPLE_SIZE}."
+
+    store = CommandStore(is_door_open=False, config=Config())
+    command_ids = _queue_commands(store, command_count)
+
+    first_sample = command_ids[:_SAMPLE_SIZE]
+    middle = command_ids[_SAMPLE_SIZE:-_SAMPLE_SIZE]
+    last_sample = command_ids[-_SAMPLE_SIZE:]
+
+    # Complete everything in between, so the last sample runs at the end of a
+    # long history of completed commands, like it would in a real run.
+    first_cost = _run_commands(store, first_sample)
+    if len(middle) > 0:
+        _run_commands(store, middle)
+    last_cost = _run_commands(store, last_sample)
+
+    print(f"Run of {command_count} commands, mean cost to run one command:")
+    print(f"  first {_SAMPLE_SIZE} commands: {first_cost * 1e6:8.1f} µs")
+    print(f"  last {_SAMPLE_SIZE} commands:  {last_cost * 1e6:8.1f} µs")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_COMMAND_COUNT)
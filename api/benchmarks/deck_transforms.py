@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Benchmark transforming between deck and machine coordinates.
+
+Transforms 10,000 deck points to machine coordinates and back, one point
+at a time through `opentrons.util.linal` the way the hardware controller
+used to, and as one array with a cached `DeckTransform`. Also times the
+position conversions done on every move and position refresh.
+
+Usage: python -m benchmarks.deck_transforms [point_count]
+"""
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from opentrons.hardware_control.motion_utilities import (
+    deck_from_machine,
+    deck_transform,
+    machine_from_deck,
+)
+from opentrons.hardware_control.types import Axis
+from opentrons.types import Point
+from opentrons.util import linal
+
+_DEFAULT_POINT_COUNT = 10_000
+_REPEAT_COUNT = 20
+
+_ATTITUDE = [[1.001, 0.002, 0.0], [-0.003, 0.998, 0.0], [0.0, 0.0, 1.0]]
+_OFFSET = Point(0, 0, 0)
+
+
+def _legacy_machine_from_deck(points: List[Point]) -> List[Point]:
+    return [Point(*linal.apply_transform(_ATTITUDE, point)) for point in points]
+
+
+def _legacy_deck_from_machine(points: List[Point]) -> List[Point]:
+    return [Point(*linal.apply_reverse(_ATTITUDE, point)) for point in points]
+
+
+def _time(func: Callable[[], object], repeat_count: int) -> List[float]:
+    times = []
+    for _ in range(repeat_count):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def _print(label: str, times: List[float], unit: str, scale: float) -> None:
+    print(
+        f"  {label:<10} median {statistics.median(times) * scale:9.2f} {unit}"
+        f"  min {min(times) * scale:9.2f} {unit}"
+    )
+
+
+def main(point_count: int) -> None:
+    """Print the time to transform points with each approach."""
+    deck_points = np.random.default_rng(0).uniform(0, 400, size=(point_count, 3))
+    deck_point_list = [Point(*point) for point in deck_points.tolist()]
+    transform = deck_transform(_ATTITUDE, _OFFSET)
+
+    print(f"Deck to machine, {point_count} points:")
+    _print(
+        "legacy",
+        _time(lambda: _legacy_machine_from_deck(deck_point_list), 3),
+        "ms",
+        1e3,
+    )
+    _print(
+        "batched",
+        _time(lambda: transform.machine_from_deck(deck_points), _REPEAT_COUNT),
+        "ms",
+        1e3,
+    )
+
+    machine_points = transform.machine_from_deck(deck_points)
+    machine_point_list = [Point(*point) for point in machine_points.tolist()]
+    print(f"Machine to deck, {point_count} points:")
+    _print(
+        "legacy",
+        _time(lambda: _legacy_deck_from_machine(machine_point_list), 3),
+        "ms",
+        1e3,
+    )
+    _print(
+        "batched",
+        _time(lambda: transform.deck_from_machine(machine_points), _REPEAT_COUNT),
+        "ms",
+        1e3,
+    )
+
+    deck_pos: Dict[Axis, float] = {Axis.X: 100, Axis.Y: 200, Axis.Z: 50, Axis.B: 3}
+    machine_pos: Dict[Axis, float] = {
+        Axis.X: 100,
+        Axis.Y: 200,
+        Axis.Z: 50,
+        Axis.A: 60,
+        Axis.B: 3,
+        Axis.C: 4,
+    }
+    print("Single position conversions:")
+    _print(
+        "to machine",
+        _time(lambda: machine_from_deck(deck_pos, _ATTITUDE, _OFFSET), point_count),
+        "µs",
+        1e6,
+    )
+    _print(
+        "to deck",
+        _time(lambda: deck_from_machine(machine_pos, _ATTITUDE, _OFFSET), point_count),
+        "µs",
+        1e6,
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_POINT_COUNT)
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Benchmark looking up labware definitions.
+
+Compares the labware definition registry against the way definitions used
+to be looked up, which opened and parsed the definition file on every
+lookup. Prints the time to simulate a protocol that loads a full deck of
+labware, and the latency of `EquipmentHandler.load_labware` in the
+Protocol Engine, which also parses each definition into a model.
+
+Usage: python -m benchmarks.labware_definitions [repeat_count]
+"""
+import asyncio
+import io
+import json
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional, cast
+
+from opentrons_shared_data.deck import load as load_deck
+from opentrons_shared_data.labware.dev_types import LabwareDefinition
+from opentrons import simulate
+from opentrons.hardware_control import HardwareControlAPI
+from opentrons.protocols.api_support.constants import (
+    CUSTOM_NAMESPACE,
+    OPENTRONS_NAMESPACE,
+    deck_type,
+)
+from opentrons.protocols.labware import definition
+from opentrons.protocol_engine import DeckSlotLocation
+from opentrons.protocol_engine.execution import EquipmentHandler
+from opentrons.protocol_engine.state import Config, StateStore
+from opentrons.types import DeckSlotName
+
+_DEFAULT_REPEAT_COUNT = 20
+
+_LABWARE = [
+    "opentrons_96_tiprack_300ul",
+    "opentrons_96_tiprack_300ul",
+    "opentrons_96_tiprack_20ul",
+    "corning_96_wellplate_360ul_flat",
+    "corning_96_wellplate_360ul_flat",
+    "corning_96_wellplate_360ul_flat",
+    "nest_96_wellplate_100ul_pcr_full_skirt",
+    "nest_96_wellplate_100ul_pcr_full_skirt",
+    "nest_12_reservoir_15ml",
+    "opentrons_24_tuberack_nest_1.5ml_snapcap",
+    "corning_384_wellplate_112ul_flat",
+]
+
+_PROTOCOL = "\n".join(
+    [
+        "metadata = {'apiLevel': '2.12'}",
+        "def run(ctx):",
+        *(
+            f"    ctx.load_labware({load_name!r}, {slot})"
+            for slot, load_name in enumerate(_LABWARE, start=1)
+        ),
+    ]
+)
+
+
+def _legacy_get_standard_labware_definition(
+    load_name: str, namespace: Optional[str] = None, version: Optional[int] = None
+) -> LabwareDefinition:
+    checked_version = 1 if version is None else version
+    for checked_namespace in (
+        [OPENTRONS_NAMESPACE, CUSTOM_NAMESPACE] if namespace is None else [namespace]
+    ):
+        def_path = definition._get_path_to_labware(
+            load_name, checked_namespace.lower(), checked_version
+        )
+        try:
+            with open(def_path, "rb") as f:
+                return cast(LabwareDefinition, json.loads(f.read().decode("utf-8")))
+        except FileNotFoundError:
+            pass
+    raise FileNotFoundError(load_name)
+
+
+@contextmanager
+def _legacy_lookups(legacy: bool) -> Iterator[None]:
+    if not legacy:
+        yield
+        return
+
+    registry_lookup = definition._get_standard_labware_definition
+    definition._get_standard_labware_definition = (
+        _legacy_get_standard_labware_definition
+    )
+    try:
+        yield
+    finally:
+        definition._get_standard_labware_definition = registry_lookup
+
+
+def _time(func: Callable[[], object], repeat_count: int) -> List[float]:
+    times = []
+    for _ in range(repeat_count):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def _simulate() -> None:
+    protocol_file = io.StringIO(_PROTOCOL)
+    protocol_file.name = "labware_definitions.py"
+    simulate.simulate(protocol_file)
+
+
+async def _load_labware(repeat_count: int) -> List[float]:
+    subject = EquipmentHandler(
+        hardware_api=cast(HardwareControlAPI, None),
+        state_store=StateStore(
+            config=Config(),
+            deck_definition=load_deck(deck_type(), 3),
+            deck_fixed_labware=[],
+            is_door_open=False,
+        ),
+    )
+    location = DeckSlotLocation(slotName=DeckSlotName.SLOT_1)
+
+    times = []
+    for i in range(repeat_count * len(_LABWARE)):
+        start = time.perf_counter()
+        await subject.load_labware(
+            load_name=_LABWARE[i % len(_LABWARE)],
+            namespace=OPENTRONS_NAMESPACE,
+            version=1,
+            location=location,
+            labware_id=None,
+        )
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main(repeat_count: int) -> None:
+    """Print simulation times and engine load latencies with each lookup."""
+    # Import everything the simulation needs before timing it.
+    _simulate()
+
+    print(f"Simulating a protocol that loads {len(_LABWARE)} labware:")
+    for legacy in (True, False):
+        with _legacy_lookups(legacy):
+            times = _time(_simulate, repeat_count)
+        label = "legacy" if legacy else "registry"
+        print(
+            f"  {label:<9} median {statistics.median(times) * 1e3:7.1f} ms"
+            f"  min {min(times) * 1e3:7.1f} ms"
+        )
+
+    print("EquipmentHandler.load_labware:")
+    for legacy in (True, False):
+        with _legacy_lookups(legacy):
+            times = asyncio.run(_load_labware(repeat_count))
+        label = "legacy" if legacy else "registry"
+        print(
+            f"  {label:<9} median {statistics.median(times) * 1e3:7.2f} ms"
+            f"  min {min(times) * 1e3:7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_REPEAT_COUNT)
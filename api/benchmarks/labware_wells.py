@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Benchmark loading labware with many wells.
+
+Loads a full deck of 384 well plates and prints the time it takes and the
+memory the plates hold on to, measured with tracemalloc. Loads them as they
+are loaded now, with wells built when they're first accessed, then again
+building every well, row, column and tip tracker at load the way labware
+used to. Also prints the time and memory after every well of every plate
+has been accessed.
+
+Usage: python -m benchmarks.labware_wells [repeat_count]
+"""
+import gc
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import List, Tuple
+
+from opentrons import simulate
+from opentrons.protocol_api.labware import Labware
+
+_DEFAULT_REPEAT_COUNT = 10
+_LOAD_NAME = "corning_384_wellplate_112ul_flat"
+_SLOTS = range(1, 12)
+
+
+def _load(eager: bool) -> Tuple[List[Labware], float]:
+    ctx = simulate.get_protocol_api("2.12")
+    start = time.perf_counter()
+    plates = [ctx.load_labware(_LOAD_NAME, slot) for slot in _SLOTS]
+    if eager:
+        for plate in plates:
+            plate._implementation.get_tip_tracker()
+    return plates, time.perf_counter() - start
+
+
+def _access_all(plates: List[Labware]) -> float:
+    start = time.perf_counter()
+    for plate in plates:
+        plate.wells()
+        plate.rows()
+        plate.columns()
+    return time.perf_counter() - start
+
+
+def _measure(eager: bool, access_all: bool) -> Tuple[float, int]:
+    gc.collect()
+    tracemalloc.start()
+    plates, elapsed = _load(eager)
+    if access_all:
+        elapsed += _access_all(plates)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, retained
+
+
+def main(repeat_count: int) -> None:
+    """Print the time and memory to load a deck of plates."""
+    # Import and load everything the simulation needs before measuring it.
+    _load(eager=True)
+
+    print(f"Loading {len(_SLOTS)} {_LOAD_NAME}:")
+    for label, eager, access_all in (
+        ("eager", True, False),
+        ("lazy", False, False),
+        ("eager, all wells used", True, True),
+        ("lazy, all wells used", False, True),
+    ):
+        times = []
+        for _ in range(repeat_count):
+            elapsed, retained = _measure(eager, access_all)
+            times.append(elapsed)
+        print(
+            f"  {label:<22} median {statistics.median(times) * 1e3:6.1f} ms"
+            f"  memory {retained / 1e6:5.2f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_REPEAT_COUNT)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Benchmark the latency and CPU cost of polling a module over serial.
+
+Runs the temperature module emulator in a subprocess and polls its
+temperature over the emulator's socket with a `SerialConnection`, the way
+the temperature module poller does. Polls first with the default
+thread-based transport and then with the event loop transport
+(`event_loop_io=True`). Prints the round trip latency of each poll and the
+CPU time this process spent per poll, including its worker threads.
+
+Usage: python -m benchmarks.serial_transport [poll_count]
+"""
+import asyncio
+import logging
+import multiprocessing
+import statistics
+import sys
+import time
+from typing import List
+
+from opentrons.drivers.asyncio.communication import SerialConnection
+from opentrons.drivers.command_builder import CommandBuilder
+from opentrons.drivers.temp_deck.driver import (
+    GCODE,
+    TEMP_DECK_ACK,
+    TEMP_DECK_BAUDRATE,
+    TEMP_DECK_COMMAND_TERMINATOR,
+)
+from opentrons.hardware_control.emulation.module_server import ModuleStatusClient
+from opentrons.hardware_control.emulation.module_server.helpers import wait_emulators
+from opentrons.hardware_control.emulation.scripts import run_app
+from opentrons.hardware_control.emulation.settings import Settings
+from opentrons.hardware_control.emulation.types import ModuleType
+
+_DEFAULT_POLL_COUNT = 2000
+
+
+def _run_emulator(settings: Settings) -> None:
+    # The proxy logs every disconnection as an error.
+    logging.disable(logging.ERROR)
+    asyncio.run(run_app.run(settings, modules=[ModuleType.Temperature.value]))
+
+
+async def _wait_for_emulator(settings: Settings) -> None:
+    client = await ModuleStatusClient.connect(
+        host="localhost",
+        port=settings.module_server.port,
+        retries=50,
+        interval_seconds=0.1,
+    )
+    await wait_emulators(client=client, modules=[ModuleType.Temperature], timeout=5)
+    client.close()
+
+
+async def _poll(settings: Settings, event_loop_io: bool, poll_count: int) -> None:
+    connection = await SerialConnection.create(
+        port=f"socket://127.0.0.1:{settings.temperature_proxy.driver_port}",
+        baud_rate=TEMP_DECK_BAUDRATE,
+        timeout=1,
+        ack=TEMP_DECK_ACK,
+        event_loop_io=event_loop_io,
+    )
+    command = CommandBuilder(terminator=TEMP_DECK_COMMAND_TERMINATOR).add_gcode(
+        gcode=GCODE.GET_TEMP
+    )
+
+    try:
+        # Warm up the connection and the emulator.
+        for _ in range(100):
+            await connection.send_command(command=command)
+
+        latencies: List[float] = []
+        cpu_start = time.process_time()
+        for _ in range(poll_count):
+            start = time.perf_counter()
+            await connection.send_command(command=command)
+            latencies.append(time.perf_counter() - start)
+        cpu = time.process_time() - cpu_start
+    finally:
+        await connection.close()
+
+    latencies.sort()
+    label = "event loop" if event_loop_io else "thread"
+    print(
+        f"  {label:<11}"
+        f" mean {statistics.mean(latencies) * 1e6:7.0f} µs"
+        f"  p50 {latencies[len(latencies) // 2] * 1e6:7.0f} µs"
+        f"  p99 {latencies[int(len(latencies) * 0.99)] * 1e6:7.0f} µs"
+        f"  cpu {cpu / poll_count * 1e6:7.0f} µs/poll"
+    )
+
+
+def main(poll_count: int) -> None:
+    """Print poll latency and CPU cost for each serial transport."""
+    settings = Settings()
+    emulator = multiprocessing.Process(
+        target=_run_emulator, args=(settings,), daemon=True
+    )
+    emulator.start()
+
+    try:
+        asyncio.run(_wait_for_emulator(settings))
+        print(f"{poll_count} temperature polls:")
+        for event_loop_io in (False, True):
+            asyncio.run(_poll(settings, event_loop_io, poll_count))
+    finally:
+        emulator.terminate()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_POLL_COUNT)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Benchmark pipelined G-code submission to the Smoothie emulator.
+
+Runs the Smoothie emulator in a background thread and drives it with a
+`SmoothieDriver` over its socket, first waiting for every command to
+finish (the default) and then in pipelined mode. Prints the rate of
+back-to-back gantry moves, and the end-to-end time of a 96-well transfer
+that moves liquid from each well of one plate to the same well of another.
+
+The emulator executes moves instantly, so this measures only the serial
+round trips that pipelining saves, not any time gained by letting
+Smoothie's planner blend queued moves.
+
+Usage: python -m benchmarks.smoothie_pipelining [move_count]
+"""
+import asyncio
+import sys
+import threading
+import time
+from contextlib import AsyncExitStack
+from typing import Awaitable, Callable
+
+from opentrons.config.robot_configs import build_config_ot2
+from opentrons.drivers.smoothie_drivers import SmoothieDriver
+from opentrons.hardware_control.emulation.scripts import run_smoothie
+from opentrons.hardware_control.emulation.settings import Settings
+
+_DEFAULT_MOVE_COUNT = 500
+_CONNECT_RETRIES = 50
+
+_WELL_SPACING_MM = 9.0
+_SOURCE_ORIGIN = (100.0, 100.0)
+_DESTINATION_ORIGIN = (250.0, 100.0)
+_TRAVEL_Z = 100.0
+_WELL_Z = 20.0
+
+
+def _start_emulator(settings: Settings) -> None:
+    thread = threading.Thread(
+        target=asyncio.run, args=(run_smoothie.run(settings),), daemon=True
+    )
+    thread.start()
+
+
+async def _connect(settings: Settings) -> SmoothieDriver:
+    for _ in range(_CONNECT_RETRIES):
+        try:
+            return await SmoothieDriver.build(
+                port=f"socket://127.0.0.1:{settings.smoothie.port}",
+                config=build_config_ot2({}),
+            )
+        except Exception:
+            await asyncio.sleep(0.1)
+    raise RuntimeError("Could not connect to the Smoothie emulator.")
+
+
+async def _run_moves(driver: SmoothieDriver, move_count: int) -> None:
+    for i in range(move_count):
+        await driver.move({"X": 100 + i % 2, "Y": 100 + i % 2})
+
+
+async def _run_transfer(driver: SmoothieDriver) -> None:
+    for row in range(8):
+        for column in range(12):
+            offset_x = column * _WELL_SPACING_MM
+            offset_y = row * _WELL_SPACING_MM
+            for (origin_x, origin_y), plunger in (
+                (_SOURCE_ORIGIN, 1.0),
+                (_DESTINATION_ORIGIN, 10.0),
+            ):
+                await driver.move({"X": origin_x + offset_x, "Y": origin_y + offset_y})
+                await driver.move({"A": _WELL_Z})
+                await driver.move({"C": plunger})
+                await driver.move({"A": _TRAVEL_Z})
+
+
+async def _time(
+    driver: SmoothieDriver, pipelined: bool, run: Callable[[], Awaitable[None]]
+) -> float:
+    start = time.perf_counter()
+    async with AsyncExitStack() as stack:
+        if pipelined:
+            await stack.enter_async_context(driver.pipelined())
+        await run()
+    return time.perf_counter() - start
+
+
+async def _main(move_count: int) -> None:
+    settings = Settings()
+    _start_emulator(settings)
+    driver = await _connect(settings)
+
+    try:
+        await driver.home()
+
+        print(f"{move_count} back-to-back gantry moves:")
+        for pipelined in (False, True):
+            elapsed = await _time(
+                driver, pipelined, lambda: _run_moves(driver, move_count)
+            )
+            label = "pipelined" if pipelined else "waiting"
+            print(f"  {label:<10} {move_count / elapsed:10,.0f} moves/s")
+
+        print("96-well transfer:")
+        for pipelined in (False, True):
+            await driver.move({"A": _TRAVEL_Z, "C": 0})
+            elapsed = await _time(driver, pipelined, lambda: _run_transfer(driver))
+            label = "pipelined" if pipelined else "waiting"
+            print(f"  {label:<10} {elapsed:10.2f} s")
+    finally:
+        await driver.disconnect()
+
+
+def main(move_count: int) -> None:
+    """Print move rates and transfer times with and without pipelining."""
+    asyncio.run(_main(move_count))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_MOVE_COUNT)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Benchmark the cost of dispatching command actions as a run gets long.
+
+For each of several run lengths, dispatches a `QueueCommandAction` and
+an `UpdateCommandAction` for every command through a full `StateStore`,
+so every substore handles every action and the state views are updated
+after each one. Prints the mean cost per action for each run length.
+The cost per action should stay flat no matter how long the run is.
+
+Usage: python -m benchmarks.state_store [command_count ...]
+"""
+import gc
+import sys
+import time
+from datetime import datetime
+from typing import List
+
+from opentrons_shared_data.deck import load as load_deck
+from opentrons.protocols.api_support.constants import deck_type
+from opentrons.protocol_engine import commands
+from opentrons.protocol_engine.actions import (
+    PlayAction,
+    QueueCommandAction,
+    UpdateCommandAction,
+)
+from opentrons.protocol_engine.state import Config, StateStore
+
+_DEFAULT_COMMAND_COUNTS = [1000, 5000, 20_000, 50_000]
+
+
+def _dispatch_commands(store: StateStore, command_count: int) -> float:
+    """Queue and complete commands, returning the mean time per action."""
+    created_at = datetime(year=2022, month=1, day=1)
+    request = commands.WaitForResumeCreate(params=commands.WaitForResumeParams())
+    start = time.perf_counter()
+
+    for i in range(command_count):
+        command_id = f"command-{i}"
+        store.handle_action(
+            QueueCommandAction(
+                command_id=command_id,
+                created_at=created_at,
+                request=request,
+            )
+        )
+        queued_command = store.commands.get(command_id)
+        store.handle_action(
+            UpdateCommandAction(
+                command=queued_command.copy(
+                    update={"status": commands.CommandStatus.SUCCEEDED}
+                )
+            )
+        )
+
+    return (time.perf_counter() - start) / (2 * command_count)
+
+
+def main(command_counts: List[int]) -> None:
+    """Print the mean cost per action for runs of each length."""
+    deck_definition = load_deck(deck_type(), 3)
+
+    print("Mean cost to dispatch one command action:")
+
+    for command_count in command_counts:
+        store = StateStore(
+            config=Config(),
+            deck_definition=deck_definition,
+            deck_fixed_labware=[],
+            is_door_open=False,
+        )
+        store.handle_action(PlayAction(requested_at=datetime.now()))
+
+        # Garbage collection passes get longer as the run accumulates objects,
+        # which would hide the cost of the actions themselves.
+        gc.disable()
+        try:
+            cost = _dispatch_commands(store, command_count)
+        finally:
+            gc.enable()
+
+        print(f"  {command_count:>8} commands: {cost * 1e6:8.1f} µs")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or _DEFAULT_COMMAND_COUNTS)
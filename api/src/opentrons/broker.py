@@ -34,8 +34,16 @@ class Broker:
 
         return unsubscribe
 
+    def subscriber_count(self, topic: Literal["command"]) -> int:
+        """Get the number of handlers subscribed to a topic.
+
+        Publishers can skip building messages for topics nobody subscribes to.
+        """
+        return len(self.subscriptions.get(topic, ()))
+
     def publish(self, topic: Literal["command"], message: types.CommandMessage) -> None:
-        [handler(message) for handler in self.subscriptions.get(topic, [])]
+        for handler in self.subscriptions.get(topic, ()):
+            handler(message)
 
     def set_logger(self, logger: logging.Logger) -> None:
         self.logger = logger
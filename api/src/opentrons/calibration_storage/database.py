@@ -0,0 +1,211 @@
+""" opentrons.calibration_storage.database: the database that holds
+calibration data.
+
+All calibration data is kept in a single SQLite file, as JSON blobs keyed
+by the kind of calibration and an identifier. Reads are answered from an
+in-process cache of every decoded calibration of a kind, which is dropped
+when this process writes that kind and when another process writes
+anything. Software from before the database reads calibrations from
+files instead, so modify and delete keep those files up to date as well.
+
+These methods should only be imported inside the calibration_storage
+module.
+"""
+import copy
+import enum
+import json
+import logging
+import sqlite3
+import threading
+import typing
+from pathlib import Path
+
+from opentrons import config
+
+from .encoder_decoder import DateTimeEncoder, DateTimeDecoder
+
+log = logging.getLogger(__name__)
+
+# The schema version, stored as the database's user_version. A database
+# with a user_version of 0 hasn't had its calibrations imported from the
+# legacy directory layout yet.
+_SCHEMA_VERSION = 1
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS calibration (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (kind, key)
+)
+"""
+
+
+class CalibrationKind(str, enum.Enum):
+    """The kinds of calibration data in the database."""
+
+    LABWARE_OFFSET_INDEX = "labwareOffsetIndex"
+    LABWARE_OFFSET = "labwareOffset"
+    TIP_LENGTH = "tipLength"
+    PIPETTE_OFFSET = "pipetteOffset"
+    DECK_CALIBRATION = "deckCalibration"
+    GRIPPER_OFFSET = "gripperOffset"
+
+
+#: The key of the one deck calibration.
+DECK_CALIBRATION_KEY = "deck"
+
+
+def pipette_offset_key(mount: str, pipette_id: str) -> str:
+    """Get the key of a pipette's offset on a mount, like ``left/P20...``."""
+    return f"{mount}/{pipette_id}"
+
+
+class CalibrationDatabase:
+    """A single-file store of calibration data, with a read cache.
+
+    Every method returns a copy of the cached data, so callers can modify it.
+    Keys are converted to strings, the same way they used to be formatted
+    into file names, so that a simulated pipette with no ID still gets a
+    calibration.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        self._connection.execute(_CREATE_TABLE)
+        self._connection.commit()
+        self._cache: typing.Dict[
+            CalibrationKind, typing.Dict[str, typing.Dict[str, typing.Any]]
+        ] = {}
+        self._data_version = self._get_data_version()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def needs_import(self) -> bool:
+        """Whether calibrations haven't been imported from files yet."""
+        with self._lock:
+            row = self._connection.execute("PRAGMA user_version").fetchone()
+            return bool(row[0] < _SCHEMA_VERSION)
+
+    def mark_imported(self) -> None:
+        """Record that calibrations have been imported from files."""
+        with self._lock:
+            self._connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            self._connection.commit()
+
+    def get(
+        self, kind: CalibrationKind, key: str
+    ) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """Get one calibration, or None if there isn't one."""
+        with self._lock:
+            data = self._get_kind(kind).get(str(key))
+            return None if data is None else copy.deepcopy(data)
+
+    def get_all(
+        self, kind: CalibrationKind
+    ) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        """Get every calibration of a kind, in the order first saved."""
+        with self._lock:
+            return copy.deepcopy(self._get_kind(kind))
+
+    def save(
+        self, kind: CalibrationKind, key: str, data: typing.Mapping[str, typing.Any]
+    ) -> None:
+        """Add or replace one calibration."""
+        encoded = json.dumps(data, cls=DateTimeEncoder)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO calibration (kind, key, data) VALUES (?, ?, ?) "
+                "ON CONFLICT (kind, key) DO UPDATE SET data = excluded.data",
+                (kind.value, str(key), encoded),
+            )
+            self._cache.pop(kind, None)
+
+    def delete(self, kind: CalibrationKind, key: str) -> bool:
+        """Delete one calibration, returning whether there was one to delete."""
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "DELETE FROM calibration WHERE kind = ? AND key = ?",
+                (kind.value, str(key)),
+            )
+            self._cache.pop(kind, None)
+            return bool(cursor.rowcount > 0)
+
+    def clear(self, kind: CalibrationKind) -> None:
+        """Delete every calibration of a kind."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM calibration WHERE kind = ?", (kind.value,)
+            )
+            self._cache.pop(kind, None)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _get_kind(
+        self, kind: CalibrationKind
+    ) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        data_version = self._get_data_version()
+        if data_version != self._data_version:
+            # Another connection has written to the database.
+            self._cache.clear()
+            self._data_version = data_version
+
+        try:
+            return self._cache[kind]
+        except KeyError:
+            rows = self._connection.execute(
+                "SELECT key, data FROM calibration WHERE kind = ? ORDER BY rowid",
+                (kind.value,),
+            )
+            cached = self._cache[kind] = {key: _decode(data) for key, data in rows}
+            return cached
+
+    def _get_data_version(self) -> int:
+        return int(self._connection.execute("PRAGMA data_version").fetchone()[0])
+
+
+def _decode(data: str) -> typing.Dict[str, typing.Any]:
+    return typing.cast(
+        typing.Dict[str, typing.Any], json.loads(data, cls=DateTimeDecoder)
+    )
+
+
+_database: typing.Optional[CalibrationDatabase] = None
+_database_lock = threading.Lock()
+
+
+def get_database() -> CalibrationDatabase:
+    """Get the calibration database for the current config.
+
+    The first time a database is opened, calibrations are imported into it
+    from the directories they used to be stored in. If the import fails, the
+    database isn't kept, so the import is tried again on the next call.
+    """
+    global _database
+    path = config.get_opentrons_path("calibration_database_file")
+
+    with _database_lock:
+        if _database is None or _database.path != path:
+            if _database is not None:
+                _database.close()
+                _database = None
+            database = CalibrationDatabase(path)
+            try:
+                if database.needs_import:
+                    # Imported here because migration needs this module.
+                    from . import migration
+
+                    migration.import_calibration_files(database)
+                    database.mark_imported()
+            except BaseException:
+                database.close()
+                raise
+            _database = database
+        return _database
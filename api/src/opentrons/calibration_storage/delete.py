@@ -1,12 +1,21 @@
 """ opentrons.calibration_storage.delete: functions that
-remove single or multiple calibration files from the
-file system.
+remove single or multiple calibrations from the calibration
+database.
+
+The files that calibrations used to be stored in are kept in sync with
+the database for older software, so they are removed or rewritten too.
 """
 # TODO(mc, 2022-06-08): this module has no unit tests
 # add tests before making any additional changes
 from pathlib import Path
 
-from . import types as local_types, file_operators as io
+from . import types as local_types, legacy_files
+from .database import (
+    CalibrationKind,
+    DECK_CALIBRATION_KEY,
+    get_database,
+    pipette_offset_key,
+)
 
 from opentrons import config
 from opentrons.types import Mount
@@ -14,9 +23,13 @@ from opentrons.types import Mount
 
 def clear_calibrations() -> None:
     """
-    Delete all calibration files for labware. This includes deleting tip-length
+    Delete all calibrations for labware. This includes deleting tip-length
     data for tipracks.
     """
+    database = get_database()
+    database.clear(CalibrationKind.LABWARE_OFFSET_INDEX)
+    database.clear(CalibrationKind.LABWARE_OFFSET)
+
     calibration_path = config.get_opentrons_path("labware_calibration_offsets_dir_v2")
     try:
         targets = [f for f in calibration_path.iterdir() if f.suffix == ".json"]
@@ -26,48 +39,18 @@ def clear_calibrations() -> None:
         pass
 
 
-def _remove_offset_from_index(calibration_id: local_types.CalibrationID) -> None:
-    """
-    Helper function to remove an individual offset file.
-
-    :param calibration_id: labware hash
-    :raises FileNotFoundError: If index file does not exist or
-    the specified id is not in the index file.
-    """
-    offset_path = config.get_opentrons_path("labware_calibration_offsets_dir_v2")
-    index_path = offset_path / "index.json"
-    blob = io.read_cal_file(str(index_path))
-
-    del blob["data"][calibration_id]
-    io.save_to_file(index_path, blob)
-
-
 def delete_offset_file(calibration_id: local_types.CalibrationID) -> None:
     """
-    Given a labware's hash, delete the file and remove it from the index file.
+    Given a labware's hash, delete its offset and remove it from the index.
 
     :param calibration_id: labware hash
+    :raises KeyError: If the specified id is not in the index.
     """
-    offset_path = config.get_opentrons_path("labware_calibration_offsets_dir_v2")
-    offset = offset_path / f"{calibration_id}.json"
-    try:
-        _remove_offset_from_index(calibration_id)
-        offset.unlink()
-    except FileNotFoundError:
-        pass
-
-
-def _remove_tip_length_from_index(tiprack: str, pipette: str) -> None:
-    """
-    Remove tip length data from the index file
-    """
-    tip_length_dir = config.get_tip_length_cal_path()
-    index_path = tip_length_dir / "index.json"
-    blob = io.read_cal_file(str(index_path))
-
-    if tiprack in blob and pipette in blob[tiprack]:
-        blob[tiprack].remove(pipette)
-        io.save_to_file(index_path, blob)
+    database = get_database()
+    if not database.delete(CalibrationKind.LABWARE_OFFSET_INDEX, calibration_id):
+        raise KeyError(calibration_id)
+    database.delete(CalibrationKind.LABWARE_OFFSET, calibration_id)
+    legacy_files.remove_labware_offset(calibration_id)
 
 
 def delete_tip_length_calibration(tiprack: str, pipette: str) -> None:
@@ -77,24 +60,29 @@ def delete_tip_length_calibration(tiprack: str, pipette: str) -> None:
 
     :param tiprack: tiprack hash
     :param pipette: pipette serial number
+    :raises FileNotFoundError: If the pipette has no tip length calibrations.
     """
-    tip_length_dir = config.get_tip_length_cal_path()
-    tip_length_path = tip_length_dir / f"{pipette}.json"
-    blob = io.read_cal_file(str(tip_length_path))
+    database = get_database()
+    blob = database.get(CalibrationKind.TIP_LENGTH, pipette)
+    if blob is None:
+        raise FileNotFoundError(f"No tip length calibrations for {pipette}")
 
     if tiprack in blob:
         del blob[tiprack]
         if blob:
-            io.save_to_file(tip_length_path, blob)
+            database.save(CalibrationKind.TIP_LENGTH, pipette, blob)
+            legacy_files.save_tip_lengths(pipette, blob)
         else:
-            tip_length_path.unlink()
-        _remove_tip_length_from_index(tiprack, pipette)
+            database.delete(CalibrationKind.TIP_LENGTH, pipette)
+            legacy_files.remove_tip_lengths(pipette)
 
 
 def clear_tip_length_calibration() -> None:
     """
-    Delete all tip length calibration files.
+    Delete all tip length calibrations.
     """
+    get_database().clear(CalibrationKind.TIP_LENGTH)
+
     tip_length_path = config.get_tip_length_cal_path()
     try:
         targets = (f for f in tip_length_path.iterdir() if f.suffix == ".json")
@@ -104,43 +92,18 @@ def clear_tip_length_calibration() -> None:
         pass
 
 
-def _remove_pipette_offset_from_index(pipette: str, mount: Mount) -> None:
-    """
-    Helper function to remove an individual pipette offset file.
-
-    :param pipette: pipette serial number
-    :param mount: pipette mount
-    :raises FileNotFoundError: If index file does not exist or
-    the specified id is not in the index file.
-    """
-    offset_dir = config.get_opentrons_path("pipette_calibration_dir")
-    index_path = offset_dir / "index.json"
-    blob = io.read_cal_file(str(index_path))
-
-    try:
-        blob[mount.name.lower()].remove(pipette)
-        io.save_to_file(index_path, blob)
-    except (KeyError, ValueError):
-        # If the index file does not have a mount entry, you get
-        # an error here
-        pass
-
-
 def delete_pipette_offset_file(pipette: str, mount: Mount) -> None:
     """
-    Delete pipette offset file based on mount and pipette serial number
+    Delete pipette offset based on mount and pipette serial number
 
     :param pipette: pipette serial number
     :param mount: pipette mount
     """
-    offset_dir = config.get_opentrons_path("pipette_calibration_dir")
-    offset_path = offset_dir / mount.name.lower() / f"{pipette}.json"
-
-    try:
-        _remove_pipette_offset_from_index(pipette, mount)
-        offset_path.unlink()
-    except FileNotFoundError:
-        pass
+    mount_key = mount.name.lower()
+    get_database().delete(
+        CalibrationKind.PIPETTE_OFFSET, pipette_offset_key(mount_key, pipette)
+    )
+    legacy_files.remove_pipette_offset(mount_key, pipette)
 
 
 def _remove_json_files_in_directories(p: Path) -> None:
@@ -154,8 +117,9 @@ def _remove_json_files_in_directories(p: Path) -> None:
 
 def clear_pipette_offset_calibrations() -> None:
     """
-    Delete all pipette offset calibration files.
+    Delete all pipette offset calibrations.
     """
+    get_database().clear(CalibrationKind.PIPETTE_OFFSET)
 
     offset_dir = config.get_opentrons_path("pipette_calibration_dir")
     try:
@@ -172,6 +136,8 @@ def delete_robot_deck_attitude() -> None:
     robot_dir = config.get_opentrons_path("robot_calibration_dir")
     gantry_path = robot_dir / "deck_calibration.json"
 
+    get_database().delete(CalibrationKind.DECK_CALIBRATION, DECK_CALIBRATION_KEY)
+
     # TODO(mc, 2022-06-08): this leaves legacy deck calibration backup files in place
     # we should eventually clean them up, too, because they can really crowd /data/
     _delete_file(legacy_deck_calibration_file)
@@ -180,21 +146,21 @@ def delete_robot_deck_attitude() -> None:
 
 def delete_gripper_calibration_file(gripper: str) -> None:
     """
-    Delete gripper calibration offset file based on gripper serial number
+    Delete gripper calibration offset based on gripper serial number
 
     :param gripper: gripper serial number
     """
-    offset_dir = config.get_opentrons_path("gripper_calibration_dir")
-    offset_path = offset_dir / f"{gripper}.json"
+    get_database().delete(CalibrationKind.GRIPPER_OFFSET, gripper)
 
-    if offset_path.exists():
-        offset_path.unlink()
+    offset_dir = config.get_opentrons_path("gripper_calibration_dir")
+    _delete_file(offset_dir / f"{gripper}.json")
 
 
 def clear_gripper_calibration_offsets() -> None:
     """
-    Delete all gripper calibration data files.
+    Delete all gripper calibration data.
     """
+    get_database().clear(CalibrationKind.GRIPPER_OFFSET)
 
     offset_dir = config.get_opentrons_path("gripper_calibration_dir")
     try:
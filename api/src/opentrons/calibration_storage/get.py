@@ -1,18 +1,24 @@
 """ opentrons.calibration_storage.get: functions for grabing calibration
 
 This module has functions that you can import to load robot or
-labware calibration from its designated file location.
+labware calibration from the calibration database.
 """
-import itertools
 import logging
 import json
 import typing
+from pathlib import Path
 from typing_extensions import Literal
 
 from opentrons import config
 from opentrons.types import Point, Mount
 
-from . import types as local_types, file_operators as io, helpers, migration, modify
+from . import types as local_types, helpers, modify
+from .database import (
+    CalibrationKind,
+    DECK_CALIBRATION_KEY,
+    get_database,
+    pipette_offset_key,
+)
 
 if typing.TYPE_CHECKING:
     from opentrons_shared_data.labware.dev_types import LabwareDefinition
@@ -56,38 +62,24 @@ def get_all_calibrations() -> typing.List[local_types.CalibrationInformation]:
     labware calibration files found on the robot.
     """
     all_calibrations: typing.List[local_types.CalibrationInformation] = []
-    offset_path = config.get_opentrons_path("labware_calibration_offsets_dir_v2")
-    index_path = offset_path / "index.json"
-    if not index_path.exists():
-        return all_calibrations
-
-    migration.check_index_version(index_path)
-    index_file = io.read_cal_file(str(index_path))
-    calibration_index = index_file.get("data", {})
+    database = get_database()
+    calibration_index = database.get_all(CalibrationKind.LABWARE_OFFSET_INDEX)
+    offsets = database.get_all(CalibrationKind.LABWARE_OFFSET)
     for key, data in calibration_index.items():
-        cal_path = offset_path / f"{key}.json"
-        if cal_path.exists():
-            try:
-                cal_blob = io.read_cal_file(str(cal_path))
-            except json.JSONDecodeError:
-                log.error(
-                    f"Skipping corrupt calibration file (bad JSON): {str(cal_path)}"
-                )
-                continue
+        cal_blob = offsets.get(key)
+        if cal_blob is not None:
             calibration = _format_calibration_type(cal_blob)  # type: ignore
             try:
                 all_calibrations.append(
                     local_types.CalibrationInformation(
                         calibration=calibration,
-                        parent=_format_parent(data),
+                        parent=_format_parent(data),  # type: ignore[arg-type]
                         labware_id=key,
                         uri=data["uri"],
                     )
                 )
             except (KeyError, ValueError):
-                log.exception(
-                    f"Skipping corrupt calibration file (bad data) {str(cal_path)}"
-                )
+                log.exception(f"Skipping corrupt labware calibration (bad data) {key}")
                 continue
     return all_calibrations
 
@@ -96,8 +88,9 @@ def _get_tip_length_data(
     pip_id: str, labware_hash: str, labware_load_name: str, labware_uri: "LabwareUri"
 ) -> local_types.TipLengthCalibration:
     try:
-        pip_tip_length_path = config.get_tip_length_cal_path() / f"{pip_id}.json"
-        tip_rack_data = io.read_cal_file(str(pip_tip_length_path))
+        tip_rack_data = get_database().get(CalibrationKind.TIP_LENGTH, pip_id)
+        if tip_rack_data is None:
+            raise KeyError(pip_id)
         tip_length_info = tip_rack_data[labware_hash]
         return local_types.TipLengthCalibration(
             tip_length=tip_length_info["tipLength"],
@@ -108,7 +101,7 @@ def _get_tip_length_data(
             status=_get_calibration_status(tip_length_info),
             uri=labware_uri,
         )
-    except (FileNotFoundError, KeyError, json.JSONDecodeError):
+    except KeyError:
         raise local_types.TipLengthCalNotFound(
             f"Tip length of {labware_load_name} has not been "
             f"calibrated for this pipette: {pip_id} and cannot"
@@ -130,13 +123,12 @@ def get_labware_calibration(
     :return: A point which represents the delta from well A1 origin of
     a labware
     """
-    offset_path = config.get_opentrons_path("labware_calibration_offsets_dir_v2")
     offset = Point(0, 0, 0)
-    labware_path = offset_path / lookup_path
-    if labware_path.exists():
+    calibration_data = get_database().get(
+        CalibrationKind.LABWARE_OFFSET, Path(lookup_path).stem
+    )
+    if calibration_data is not None:
         modify.add_existing_labware_to_index_file(definition, parent, slot)
-        migration.check_index_version(offset_path / "index.json")
-        calibration_data = io.read_cal_file(str(labware_path))
         offset_array = calibration_data["default"]["offset"]
         offset = Point(x=offset_array[0], y=offset_array[1], z=offset_array[2])
     return offset
@@ -171,35 +163,19 @@ def get_all_tip_length_calibrations() -> typing.List[local_types.TipLengthCalibr
     tip length calibration files found on the robot.
     """
     all_calibrations: typing.List[local_types.TipLengthCalibration] = []
-    tip_length_dir = config.get_opentrons_path("tip_length_calibration_dir")
-    index_path = tip_length_dir / "index.json"
-    if not index_path.exists():
-        return all_calibrations
-
-    index_file = io.read_cal_file(str(index_path))
-    unique_pips = set(itertools.chain(*index_file.values()))
-    for pip in unique_pips:
-        cal_path = tip_length_dir / f"{pip}.json"
-        if cal_path.exists():
-            try:
-                data = io.read_cal_file(str(cal_path))
-            except json.JSONDecodeError:
-                log.error(
-                    f"Skipping corrupt calibration file (bad json): {str(cal_path)}"
-                )
-                continue
-            for tiprack, info in data.items():
-                all_calibrations.append(
-                    local_types.TipLengthCalibration(
-                        tip_length=info["tipLength"],
-                        pipette=pip,
-                        tiprack=tiprack,
-                        last_modified=info["lastModified"],
-                        source=_get_calibration_source(info),
-                        status=_get_calibration_status(info),
-                        uri=_get_tip_rack_uri(info),
-                    )
+    for pip, data in get_database().get_all(CalibrationKind.TIP_LENGTH).items():
+        for tiprack, info in data.items():
+            all_calibrations.append(
+                local_types.TipLengthCalibration(
+                    tip_length=info["tipLength"],
+                    pipette=pip,
+                    tiprack=tiprack,
+                    last_modified=info["lastModified"],
+                    source=_get_calibration_source(info),
+                    status=_get_calibration_status(info),
+                    uri=_get_tip_rack_uri(info),
                 )
+            )
     return all_calibrations
 
 
@@ -233,16 +209,8 @@ def _get_tip_rack_uri(
 
 
 def get_robot_deck_attitude() -> typing.Optional[local_types.DeckCalibration]:
-    robot_dir = config.get_opentrons_path("robot_calibration_dir")
-    gantry_path = robot_dir / "deck_calibration.json"
-    if gantry_path.exists():
-        try:
-            data = io.read_cal_file(gantry_path)
-        except json.JSONDecodeError:
-            log.error(
-                f"Skipping corrupt calibration file (bad json): {str(gantry_path)}"
-            )
-            return None
+    data = get_database().get(CalibrationKind.DECK_CALIBRATION, DECK_CALIBRATION_KEY)
+    if data is not None:
         try:
             return local_types.DeckCalibration(
                 attitude=data["attitude"],
@@ -261,16 +229,10 @@ def get_robot_deck_attitude() -> typing.Optional[local_types.DeckCalibration]:
 def get_pipette_offset(
     pip_id: str, mount: Mount
 ) -> typing.Optional[local_types.PipetteOffsetByPipetteMount]:
-    pip_dir = config.get_opentrons_path("pipette_calibration_dir")
-    offset_path = pip_dir / mount.name.lower() / f"{pip_id}.json"
-    if offset_path.exists():
-        try:
-            data = io.read_cal_file(offset_path)
-        except json.JSONDecodeError:
-            log.error(
-                f"Skipping corrupt calibration file (bad json): {str(offset_path)}"
-            )
-            return None
+    data = get_database().get(
+        CalibrationKind.PIPETTE_OFFSET, pipette_offset_key(mount.name.lower(), pip_id)
+    )
+    if data is not None:
         assert "offset" in data.keys(), "Not valid pipette calibration data"
         return local_types.PipetteOffsetByPipetteMount(
             offset=data["offset"],
@@ -295,43 +257,24 @@ def get_all_pipette_offset_calibrations() -> typing.List[
     pipette offset calibration files found on the robot.
     """
     all_calibrations: typing.List[local_types.PipetteOffsetCalibration] = []
-    pip_dir = config.get_opentrons_path("pipette_calibration_dir")
-    index_path = pip_dir / "index.json"
-    if not index_path.exists():
-        return all_calibrations
-
-    index_file = io.read_cal_file(str(index_path))
-    for mount_key, pips in index_file.items():
-        for pip in pips:
-            cal_path = pip_dir / mount_key / f"{pip}.json"
-            if cal_path.exists():
-                try:
-                    data = io.read_cal_file(str(cal_path))
-                except json.JSONDecodeError:
-                    log.error(
-                        "Skipping corrupt calibration file (bad json): "
-                        + f"{str(cal_path)}"
-                    )
-                    continue
-                try:
-                    all_calibrations.append(
-                        local_types.PipetteOffsetCalibration(
-                            pipette=pip,
-                            mount=mount_key,
-                            offset=data["offset"],
-                            tiprack=data["tiprack"],
-                            uri=data["uri"],
-                            last_modified=data["last_modified"],
-                            source=_get_calibration_source(data),
-                            status=_get_calibration_status(data),
-                        )
-                    )
-                except (KeyError, ValueError):
-                    log.exception(
-                        "Skipping corrupt calibration file (bad data): "
-                        + f"{str(cal_path)}"
-                    )
-                    continue
+    for key, data in get_database().get_all(CalibrationKind.PIPETTE_OFFSET).items():
+        mount_key, pip = key.split("/", 1)
+        try:
+            all_calibrations.append(
+                local_types.PipetteOffsetCalibration(
+                    pipette=pip,
+                    mount=mount_key,
+                    offset=data["offset"],
+                    tiprack=data["tiprack"],
+                    uri=data["uri"],
+                    last_modified=data["last_modified"],
+                    source=_get_calibration_source(data),
+                    status=_get_calibration_status(data),
+                )
+            )
+        except (KeyError, ValueError):
+            log.exception(f"Skipping corrupt pipette calibration (bad data): {key}")
+            continue
     return all_calibrations
 
 
@@ -360,16 +303,8 @@ def get_custom_tiprack_definition_for_tlc(labware_uri: str) -> "LabwareDefinitio
 def get_gripper_calibration_offset(
     gripper_id: str,
 ) -> typing.Optional[local_types.GripperCalibrationOffset]:
-    gripper_dir = config.get_opentrons_path("gripper_calibration_dir")
-    offset_path = gripper_dir / f"{gripper_id}.json"
-    if offset_path.exists():
-        try:
-            data = io.read_cal_file(offset_path)
-        except json.JSONDecodeError:
-            log.error(
-                f"Skipping corrupt calibration file (bad json): {str(offset_path)}"
-            )
-            return None
+    data = get_database().get(CalibrationKind.GRIPPER_OFFSET, gripper_id)
+    if data is not None:
         assert "offset" in data.keys(), "Not valid gripper calibration data"
         return local_types.GripperCalibrationOffset(
             offset=data["offset"],
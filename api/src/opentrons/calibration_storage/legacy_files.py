@@ -0,0 +1,157 @@
+""" opentrons.calibration_storage.legacy_files: functions that keep the
+calibration files from before the calibration database up to date.
+
+The database is where calibrations are read from, but every change is
+also written to the JSON file the calibration used to be stored in, and
+to the index files that listed them, so that software from before the
+database still finds the same calibrations after a downgrade.
+
+These methods should only be imported inside the calibration_storage
+module.
+"""
+import typing
+from pathlib import Path
+
+from opentrons import config
+
+from . import file_operators as io, migration
+
+
+def save_labware_offset_index_entry(
+    full_id: str, index_data: typing.Mapping[str, typing.Any]
+) -> None:
+    """Add a labware to the labware offset index file."""
+    offset_dir = config.get_opentrons_path("labware_calibration_offsets_dir_v2")
+    offset_dir.mkdir(parents=True, exist_ok=True)
+    index_file = offset_dir / "index.json"
+    if index_file.exists():
+        migration.check_index_version(index_file)
+        blob = io.read_cal_file(str(index_file))
+    else:
+        blob = {}
+
+    blob.setdefault("data", {})[full_id] = index_data
+    blob["version"] = migration.MAX_VERSION
+    io.save_to_file(index_file, blob)
+
+
+def save_labware_offset(
+    labware_id: str, calibration_data: typing.Mapping[str, typing.Any]
+) -> None:
+    """Save a labware offset to its own file."""
+    offset_dir = config.get_opentrons_path("labware_calibration_offsets_dir_v2")
+    offset_dir.mkdir(parents=True, exist_ok=True)
+    io.save_to_file(offset_dir / f"{labware_id}.json", calibration_data)
+
+
+def remove_labware_offset(labware_id: str) -> None:
+    """Remove a labware offset's file and its entry in the index file."""
+    offset_dir = config.get_opentrons_path("labware_calibration_offsets_dir_v2")
+    index_file = offset_dir / "index.json"
+    try:
+        blob = io.read_cal_file(str(index_file))
+    except FileNotFoundError:
+        pass
+    else:
+        if blob.get("data", {}).pop(labware_id, None) is not None:
+            io.save_to_file(index_file, blob)
+    _delete_file(offset_dir / f"{labware_id}.json")
+
+
+def save_tip_lengths(
+    pip_id: str, tip_length_data: typing.Mapping[str, typing.Any]
+) -> None:
+    """Save every tip length of a pipette to its file, and index them."""
+    tip_length_dir = config.get_tip_length_cal_path()
+    tip_length_dir.mkdir(parents=True, exist_ok=True)
+    io.save_to_file(tip_length_dir / f"{pip_id}.json", tip_length_data)
+    _index_tip_lengths(pip_id, tip_length_data.keys())
+
+
+def remove_tip_lengths(pip_id: str) -> None:
+    """Remove a pipette's tip length file and its index entries."""
+    tip_length_dir = config.get_tip_length_cal_path()
+    _delete_file(tip_length_dir / f"{pip_id}.json")
+    _index_tip_lengths(pip_id, ())
+
+
+def _index_tip_lengths(pip_id: str, lw_hashes: typing.Iterable[str]) -> None:
+    """List a pipette in the tip length index under exactly these tipracks."""
+    index_file = config.get_tip_length_cal_path() / "index.json"
+    try:
+        index_data = io.read_cal_file(str(index_file))
+    except FileNotFoundError:
+        index_data = {}
+
+    lw_hashes = set(lw_hashes)
+    for lw_hash, pip_ids in index_data.items():
+        if lw_hash not in lw_hashes and pip_id in pip_ids:
+            pip_ids.remove(pip_id)
+    for lw_hash in lw_hashes:
+        pip_ids = index_data.setdefault(lw_hash, [])
+        if pip_id not in pip_ids:
+            pip_ids.append(pip_id)
+
+    if index_data or index_file.exists():
+        io.save_to_file(index_file, index_data)
+
+
+def save_pipette_offset(
+    mount_key: str, pip_id: str, offset_data: typing.Mapping[str, typing.Any]
+) -> None:
+    """Save a pipette offset to its file, and index it."""
+    offset_dir = config.get_opentrons_path("pipette_calibration_dir")
+    pip_dir = offset_dir / mount_key
+    pip_dir.mkdir(parents=True, exist_ok=True)
+    io.save_to_file(pip_dir / f"{pip_id}.json", offset_data)
+
+    index_file = offset_dir / "index.json"
+    try:
+        index_data = io.read_cal_file(str(index_file))
+    except FileNotFoundError:
+        index_data = {}
+    pip_ids = index_data.setdefault(mount_key, [])
+    if pip_id not in pip_ids:
+        pip_ids.append(pip_id)
+        io.save_to_file(index_file, index_data)
+
+
+def remove_pipette_offset(mount_key: str, pip_id: str) -> None:
+    """Remove a pipette offset's file and its index entry."""
+    offset_dir = config.get_opentrons_path("pipette_calibration_dir")
+    _delete_file(offset_dir / mount_key / f"{pip_id}.json")
+
+    index_file = offset_dir / "index.json"
+    try:
+        index_data = io.read_cal_file(str(index_file))
+    except FileNotFoundError:
+        return
+    pip_ids = index_data.get(mount_key, [])
+    if pip_id in pip_ids:
+        pip_ids.remove(pip_id)
+        io.save_to_file(index_file, index_data)
+
+
+def save_deck_calibration(deck_data: typing.Mapping[str, typing.Any]) -> None:
+    """Save the deck calibration to its file."""
+    robot_dir = config.get_opentrons_path("robot_calibration_dir")
+    robot_dir.mkdir(parents=True, exist_ok=True)
+    io.save_to_file(robot_dir / "deck_calibration.json", deck_data)
+
+
+def save_gripper_offset(
+    gripper_id: str, offset_data: typing.Mapping[str, typing.Any]
+) -> None:
+    """Save a gripper offset to its file."""
+    gripper_dir = config.get_opentrons_path("gripper_calibration_dir")
+    gripper_dir.mkdir(parents=True, exist_ok=True)
+    io.save_to_file(gripper_dir / f"{gripper_id}.json", offset_data)
+
+
+# TODO(mc, 2022-06-07): replace with Path.unlink(missing_ok=True)
+# when we are on Python >= 3.8
+def _delete_file(path: Path) -> None:
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
@@ -1,5 +1,19 @@
+import logging
 import typing
+from pathlib import Path
+
+from opentrons import config
+
 from . import file_operators as io, types as local_types
+from .database import (
+    CalibrationDatabase,
+    CalibrationKind,
+    DECK_CALIBRATION_KEY,
+    pipette_offset_key,
+)
+
+
+log = logging.getLogger(__name__)
 
 
 MAX_VERSION = 1
@@ -52,3 +66,88 @@ def migrate_index_0_to_1(index_path: local_types.StrPath) -> None:
         }
     migrated_file = {"version": 1, "data": updated_entries}
     io.save_to_file(index_path, migrated_file)
+
+
+def import_calibration_files(database: CalibrationDatabase) -> None:
+    """
+    Calibrations used to be saved as JSON files in a directory for each
+    kind of calibration, alongside index files that listed the files.
+    This function copies all of them into the calibration database.
+
+    The files are left where they are; corrupt files are skipped.
+    """
+    offset_dir = config.get_opentrons_path("labware_calibration_offsets_dir_v2")
+    _import_offset_index(database, offset_dir / "index.json")
+    _import_calibration_dir(database, CalibrationKind.LABWARE_OFFSET, offset_dir)
+
+    _import_calibration_dir(
+        database, CalibrationKind.TIP_LENGTH, config.get_tip_length_cal_path()
+    )
+
+    pipette_dir = config.get_opentrons_path("pipette_calibration_dir")
+    for mount in ("left", "right"):
+        _import_calibration_dir(
+            database,
+            CalibrationKind.PIPETTE_OFFSET,
+            pipette_dir / mount,
+            key_prefix=pipette_offset_key(mount, ""),
+        )
+
+    deck_path = (
+        config.get_opentrons_path("robot_calibration_dir") / "deck_calibration.json"
+    )
+    deck_calibration = _read_calibration_file(deck_path)
+    if deck_calibration is not None:
+        database.save(
+            CalibrationKind.DECK_CALIBRATION, DECK_CALIBRATION_KEY, deck_calibration
+        )
+
+    _import_calibration_dir(
+        database,
+        CalibrationKind.GRIPPER_OFFSET,
+        config.get_opentrons_path("gripper_calibration_dir"),
+    )
+
+
+def _import_offset_index(database: CalibrationDatabase, index_path: Path) -> None:
+    try:
+        check_index_version(index_path)
+        offset_index = _read_calibration_file(index_path)
+        index_data = (offset_index or {}).get("data", {}).items()
+    except (AttributeError, KeyError, TypeError, ValueError):
+        log.exception(f"Skipping corrupt labware offset index: {str(index_path)}")
+        return
+    for key, data in index_data:
+        database.save(CalibrationKind.LABWARE_OFFSET_INDEX, key, data)
+
+
+def _import_calibration_dir(
+    database: CalibrationDatabase,
+    kind: CalibrationKind,
+    calibration_dir: Path,
+    key_prefix: str = "",
+) -> None:
+    if not calibration_dir.is_dir():
+        return
+    for path in sorted(calibration_dir.iterdir()):
+        if path.suffix != ".json" or path.name == "index.json":
+            continue
+        data = _read_calibration_file(path)
+        if data is not None:
+            database.save(kind, key_prefix + path.stem, data)
+
+
+def _read_calibration_file(
+    path: Path,
+) -> typing.Optional[typing.Dict[str, typing.Any]]:
+    try:
+        data = io.read_cal_file(path)
+    except FileNotFoundError:
+        return None
+    except ValueError:
+        log.error(f"Skipping corrupt calibration file (bad json): {str(path)}")
+        return None
+    if not isinstance(data, dict):
+        log.error(f"Skipping corrupt calibration file (bad data): {str(path)}")
+        return None
+    return data
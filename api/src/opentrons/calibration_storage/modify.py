@@ -2,7 +2,9 @@
 calibration storage
 
 This module has functions that you can import to save robot or
-labware calibration to its designated file location.
+labware calibration to the calibration database. Each calibration is
+also written to the file it used to be stored in, so that software from
+before the database still finds it.
 """
 import typing
 from pathlib import Path
@@ -14,7 +16,13 @@ from opentrons.types import Mount, Point
 from opentrons.protocols.api_support.constants import OPENTRONS_NAMESPACE
 from opentrons.util.helpers import utc_now
 
-from . import file_operators as io, types as local_types, helpers, migration
+from . import file_operators as io, types as local_types, helpers, legacy_files
+from .database import (
+    CalibrationKind,
+    DECK_CALIBRATION_KEY,
+    get_database,
+    pipette_offset_key,
+)
 
 if typing.TYPE_CHECKING:
     from .dev_types import (
@@ -30,37 +38,24 @@ if typing.TYPE_CHECKING:
 
 def _add_to_index_offset_file(parent: str, slot: str, uri: str, lw_hash: str) -> None:
     """
-    A helper method to create or add to an index file so that calibration
-    files can be looked up by their hash to reveal the labware uri and
-    parent information of a given file.
+    A helper method to add to the labware offset index so that calibrations
+    can be looked up by their hash to reveal the labware uri and
+    parent information of a given calibration.
 
     :param parent: A labware object
     :param slot
     :param lw_hash: The labware hash of the calibration
     """
-    offset = config.get_opentrons_path("labware_calibration_offsets_dir_v2")
-    index_file = offset / "index.json"
-    if index_file.exists():
-        migration.check_index_version(index_file)
-        blob = io.read_cal_file(str(index_file))
-    else:
-        blob = {}
-
+    database = get_database()
     full_id = f"{lw_hash}{parent}"
-    try:
-        blob["data"][full_id]
-    except KeyError:
+    if database.get(CalibrationKind.LABWARE_OFFSET_INDEX, full_id) is None:
         if parent:
             mod_dict = {"parent": parent, "fullParent": f"{slot}-{parent}"}
         else:
             mod_dict = {}
         new_index_data = {"uri": f"{uri}", "slot": full_id, "module": mod_dict}
-        if blob.get("data"):
-            blob["data"][full_id] = new_index_data
-        else:
-            blob["data"] = {full_id: new_index_data}
-        blob["version"] = migration.MAX_VERSION
-        io.save_to_file(index_file, blob)
+        database.save(CalibrationKind.LABWARE_OFFSET_INDEX, full_id, new_index_data)
+        legacy_files.save_labware_offset_index_entry(full_id, new_index_data)
 
 
 def add_existing_labware_to_index_file(
@@ -80,24 +75,25 @@ def save_labware_calibration(
 ) -> None:
     """
     Function to be used whenever an updated delta is found for the first well
-    of a given labware. If an offset file does not exist, create the file
-    using labware id as the filename. If the file does exist, load it and
-    modify the delta and the lastModified fields under the "default" key.
+    of a given labware. If an offset does not exist, create it using the
+    labware id as its key. If it does exist, modify the delta and the
+    lastModified fields under the "default" key.
 
-    :param labware_path: name of labware offset path
+    :param labware_path: name of labware offset path, whose stem is the
+    labware id
     :param definition: full definition of the labware
     :param delta: point you are saving
     :param slot: slot the labware calibration is associated with
     [not yet implemented so it will currently only be an empty string]
     :param parent: parent of the labware, either a slot or a module.
     """
-    offset_path = config.get_opentrons_path("labware_calibration_offsets_dir_v2")
-    labware_offset_path = offset_path / labware_path
+    labware_id = Path(labware_path).stem
     labware_hash = helpers.hash_labware_def(definition)
     uri = helpers.uri_from_definition(definition)
     _add_to_index_offset_file(parent, slot, uri, labware_hash)
-    calibration_data = _helper_offset_data_format(str(labware_offset_path), delta)
-    io.save_to_file(labware_offset_path, calibration_data)
+    calibration_data = _helper_offset_data_format(labware_id, delta)
+    get_database().save(CalibrationKind.LABWARE_OFFSET, labware_id, calibration_data)
+    legacy_files.save_labware_offset(labware_id, calibration_data)
 
 
 def create_tip_length_data(
@@ -150,10 +146,11 @@ def _save_custom_tiprack_definition(
 
 
 def _helper_offset_data_format(
-    filepath: str,
+    labware_id: str,
     delta: Point,
 ) -> typing.Dict[str, typing.Any]:
-    if not Path(filepath).is_file():
+    calibration_data = get_database().get(CalibrationKind.LABWARE_OFFSET, labware_id)
+    if calibration_data is None:
         calibration_data = {
             "default": {
                 "offset": [delta.x, delta.y, delta.z],
@@ -161,52 +158,26 @@ def _helper_offset_data_format(
             }
         }
     else:
-        calibration_data = io.read_cal_file(filepath)
         calibration_data["default"]["offset"] = [delta.x, delta.y, delta.z]
         calibration_data["default"]["lastModified"] = utc_now()
     return calibration_data
 
 
-def _append_to_index_tip_length_file(pip_id: str, lw_hash: str) -> None:
-    index_file = config.get_tip_length_cal_path() / "index.json"
-    try:
-        index_data = io.read_cal_file(str(index_file))
-    except FileNotFoundError:
-        index_data = {}
-
-    if lw_hash not in index_data:
-        index_data[lw_hash] = [pip_id]
-    elif pip_id not in index_data[lw_hash]:
-        index_data[lw_hash].append(pip_id)
-
-    io.save_to_file(index_file, index_data)
-
-
 def save_tip_length_calibration(
     pip_id: str, tip_length_cal: "PipTipLengthCalibration"
 ) -> None:
     """
-    Function used to save tip length calibration to file.
+    Function used to save tip length calibration.
 
     :param pip_id: pipette id to associate with this tip length
     :param tip_length_cal: results of the data created using
            :meth:`create_tip_length_data`
     """
-    tip_length_dir_path = config.get_tip_length_cal_path()
-    tip_length_dir_path.mkdir(parents=True, exist_ok=True)
-    pip_tip_length_path = tip_length_dir_path / f"{pip_id}.json"
-
-    for lw_hash in tip_length_cal.keys():
-        _append_to_index_tip_length_file(pip_id, lw_hash)
-
-    try:
-        tip_length_data = io.read_cal_file(str(pip_tip_length_path))
-    except FileNotFoundError:
-        tip_length_data = {}
-
+    database = get_database()
+    tip_length_data = database.get(CalibrationKind.TIP_LENGTH, pip_id) or {}
     tip_length_data.update(tip_length_cal)
-
-    io.save_to_file(pip_tip_length_path, tip_length_data)
+    database.save(CalibrationKind.TIP_LENGTH, pip_id, tip_length_data)
+    legacy_files.save_tip_lengths(pip_id, tip_length_data)
 
 
 def save_robot_deck_attitude(
@@ -216,9 +187,6 @@ def save_robot_deck_attitude(
     source: typing.Optional[local_types.SourceType] = None,
     cal_status: typing.Optional[local_types.CalibrationStatus] = None,
 ) -> None:
-    robot_dir = config.get_opentrons_path("robot_calibration_dir")
-    robot_dir.mkdir(parents=True, exist_ok=True)
-    gantry_path = robot_dir / "deck_calibration.json"
     if cal_status:
         status = cal_status
     else:
@@ -235,23 +203,10 @@ def save_robot_deck_attitude(
         "source": source or local_types.SourceType.user,
         "status": status_dict,
     }
-    io.save_to_file(gantry_path, gantry_dict)
-
-
-def _add_to_pipette_offset_index_file(pip_id: str, mount: Mount) -> None:
-    index_file = config.get_opentrons_path("pipette_calibration_dir") / "index.json"
-    try:
-        index_data = index_data = io.read_cal_file(str(index_file))
-    except FileNotFoundError:
-        index_data = {}
-
-    mount_key = mount.name.lower()
-    if mount_key not in index_data:
-        index_data[mount_key] = [pip_id]
-    elif pip_id not in index_data[mount_key]:
-        index_data[mount_key].append(pip_id)
-
-    io.save_to_file(index_file, index_data)
+    get_database().save(
+        CalibrationKind.DECK_CALIBRATION, DECK_CALIBRATION_KEY, gantry_dict
+    )
+    legacy_files.save_deck_calibration(gantry_dict)
 
 
 def save_pipette_calibration(
@@ -262,8 +217,6 @@ def save_pipette_calibration(
     tiprack_uri: str,
     cal_status: typing.Optional[local_types.CalibrationStatus] = None,
 ) -> None:
-    pip_dir = config.get_opentrons_path("pipette_calibration_dir") / mount.name.lower()
-    pip_dir.mkdir(parents=True, exist_ok=True)
     if cal_status:
         status = cal_status
     else:
@@ -271,7 +224,6 @@ def save_pipette_calibration(
     status_dict: "CalibrationStatusDict" = helpers.convert_to_dict(  # type: ignore[assignment]
         status
     )
-    offset_path = pip_dir / f"{pip_id}.json"
     offset_dict: "PipetteCalibrationData" = {
         "offset": [offset.x, offset.y, offset.z],
         "tiprack": tiprack_hash,
@@ -280,8 +232,13 @@ def save_pipette_calibration(
         "source": local_types.SourceType.user,
         "status": status_dict,
     }
-    io.save_to_file(offset_path, offset_dict)
-    _add_to_pipette_offset_index_file(pip_id, mount)
+    mount_key = mount.name.lower()
+    get_database().save(
+        CalibrationKind.PIPETTE_OFFSET,
+        pipette_offset_key(mount_key, pip_id),
+        offset_dict,
+    )
+    legacy_files.save_pipette_offset(mount_key, pip_id, offset_dict)
 
 
 def save_gripper_calibration(
@@ -289,9 +246,6 @@ def save_gripper_calibration(
     gripper_id: str,
     cal_status: typing.Optional[local_types.CalibrationStatus] = None,
 ) -> None:
-    gripper_dir = config.get_opentrons_path("gripper_calibration_dir")
-    gripper_dir.mkdir(parents=True, exist_ok=True)
-    gripper_path = gripper_dir / f"{gripper_id}.json"
     if cal_status:
         status = cal_status
     else:
@@ -306,7 +260,8 @@ def save_gripper_calibration(
         "source": local_types.SourceType.user,
         "status": status_dict,
     }
-    io.save_to_file(gripper_path, offset_dict)
+    get_database().save(CalibrationKind.GRIPPER_OFFSET, gripper_id, offset_dict)
+    legacy_files.save_gripper_offset(gripper_id, offset_dict)
 
 
 @typing.overload
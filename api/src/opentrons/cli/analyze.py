@@ -1,13 +1,18 @@
 """Opentrons analyze CLI."""
 import click
+import statistics
+import time
 
 from anyio import run, Path as AsyncPath
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 from pydantic import BaseModel
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from typing_extensions import Literal
 
+from opentrons_shared_data.labware.labware_definition import LabwareDefinition
+
 from opentrons.protocols.api_support.types import APIVersion
 from opentrons.protocol_reader import (
     ProtocolReader,
@@ -19,6 +24,9 @@ from opentrons.protocol_reader import (
 from opentrons.protocol_runner import create_simulating_runner
 from opentrons.protocol_engine import Command, ErrorOccurrence
 
+# Files that may be protocols, when searching a directory in batch mode.
+_PROTOCOL_SUFFIXES = (".py", ".json")
+
 
 @click.command()
 @click.argument(
@@ -32,13 +40,48 @@ from opentrons.protocol_engine import Command, ErrorOccurrence
     help="Return analysis results as machine-readable JSON.",
     type=click.Path(path_type=AsyncPath),
 )
-def analyze(files: Sequence[Path], json_output: Optional[Path]) -> None:
+@click.option(
+    "--batch",
+    is_flag=True,
+    help=(
+        "Analyze each file as a separate protocol, in parallel,"
+        " writing one JSON result per line."
+    ),
+)
+@click.option(
+    "--labware",
+    multiple=True,
+    help="A custom labware definition to use for every protocol in a batch.",
+    type=click.Path(exists=True, path_type=Path, file_okay=True, dir_okay=False),
+)
+@click.option(
+    "--jobs",
+    help="How many protocols to analyze at once in a batch. Defaults to one per CPU.",
+    type=click.IntRange(min=1),
+)
+def analyze(
+    files: Sequence[Path],
+    json_output: Optional[AsyncPath],
+    batch: bool,
+    labware: Sequence[Path],
+    jobs: Optional[int],
+) -> None:
     """Analyze a protocol.
 
     You can use `opentrons analyze` to get a protocol's expected
     equipment and commands.
+
+    With `--batch`, every file given, and every Python and JSON file in the
+    directories given, is analyzed as a protocol of its own. Labware
+    definitions found in the directories are skipped; pass custom labware
+    for the batch with `--labware`.
     """
-    run(_analyze, files, json_output)
+    if batch:
+        _analyze_batch(files, labware, json_output, jobs)
+    elif labware or jobs:
+        raise click.UsageError("`--labware` and `--jobs` require `--batch`.")
+    else:
+        run(_analyze, files, json_output)
 
 
 def _get_input_files(files_and_dirs: Sequence[Path]) -> List[Path]:
@@ -53,6 +96,61 @@ def _get_input_files(files_and_dirs: Sequence[Path]) -> List[Path]:
     return results
 
 
+def _get_batch_protocol_files(files_and_dirs: Sequence[Path]) -> List[Path]:
+    results: List[Path] = []
+
+    for entry in files_and_dirs:
+        if entry.is_dir():
+            results.extend(
+                sorted(
+                    path
+                    for path in entry.glob("**/*")
+                    if path.is_file()
+                    and path.suffix in _PROTOCOL_SUFFIXES
+                    and not _is_labware_definition(path)
+                )
+            )
+        else:
+            results.append(entry)
+
+    return results
+
+
+def _is_labware_definition(path: Path) -> bool:
+    if path.suffix != ".json":
+        return False
+    try:
+        LabwareDefinition.parse_file(path)
+    except ValueError:
+        return False
+    return True
+
+
+async def _analyze_files(input_files: Sequence[Path]) -> "AnalyzeResults":
+    protocol_source = await ProtocolReader().read_saved(
+        files=input_files,
+        directory=None,
+    )
+
+    runner = await create_simulating_runner()
+    analysis = await runner.run(protocol_source)
+
+    return AnalyzeResults(
+        createdAt=datetime.now(tz=timezone.utc),
+        files=[
+            ProtocolFile(name=f.path.name, role=f.role) for f in protocol_source.files
+        ],
+        config=(
+            JsonConfig(schemaVersion=protocol_source.config.schema_version)
+            if isinstance(protocol_source.config, JsonProtocolConfig)
+            else PythonConfig(apiVersion=protocol_source.config.api_version)
+        ),
+        metadata=protocol_source.metadata,
+        commands=analysis.commands,
+        errors=analysis.state_summary.errors,
+    )
+
+
 async def _analyze(
     files_and_dirs: Sequence[Path],
     json_output: Optional[AsyncPath],
@@ -60,33 +158,11 @@ async def _analyze(
     input_files = _get_input_files(files_and_dirs)
 
     try:
-        protocol_source = await ProtocolReader().read_saved(
-            files=input_files,
-            directory=None,
-        )
+        results = await _analyze_files(input_files)
     except ProtocolFilesInvalidError as error:
         raise click.ClickException(str(error))
 
-    runner = await create_simulating_runner()
-    analysis = await runner.run(protocol_source)
-
     if json_output:
-        results = AnalyzeResults(
-            createdAt=datetime.now(tz=timezone.utc),
-            files=[
-                ProtocolFile(name=f.path.name, role=f.role)
-                for f in protocol_source.files
-            ],
-            config=(
-                JsonConfig(schemaVersion=protocol_source.config.schema_version)
-                if isinstance(protocol_source.config, JsonProtocolConfig)
-                else PythonConfig(apiVersion=protocol_source.config.api_version)
-            ),
-            metadata=protocol_source.metadata,
-            commands=analysis.commands,
-            errors=analysis.state_summary.errors,
-        )
-
         await json_output.write_text(
             results.json(exclude_none=True),
             encoding="utf-8",
@@ -98,6 +174,118 @@ async def _analyze(
         )
 
 
+def _analyze_batch(
+    files_and_dirs: Sequence[Path],
+    labware_files: Sequence[Path],
+    json_output: Optional[AsyncPath],
+    jobs: Optional[int],
+) -> None:
+    """Analyze protocols in a process pool, streaming results as JSON Lines.
+
+    Each worker process analyzes many protocols, so the cost of importing
+    the protocol engine and anything it caches is paid once per worker
+    rather than once per protocol.
+    """
+    if not json_output:
+        raise click.UsageError(
+            "Currently, this tool only supports JSON mode. Use `--json-output`."
+        )
+
+    protocol_files = _get_batch_protocol_files(files_and_dirs)
+    elapsed_seconds: List[Tuple[float, Path]] = []
+    failures = 0
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor, open(
+        json_output, "w", encoding="utf-8"
+    ) as output:
+        futures = {
+            executor.submit(_analyze_batch_item, protocol_file, labware_files): (
+                protocol_file
+            )
+            for protocol_file in protocol_files
+        }
+        for future in as_completed(futures):
+            item = _get_batch_result(future, futures[future])
+            output.write(item.json(exclude_none=True) + "\n")
+            output.flush()
+            if item.elapsedSeconds is not None:
+                elapsed_seconds.append((item.elapsedSeconds, Path(item.file)))
+            if item.error is not None or (item.result and item.result.errors):
+                failures += 1
+
+    _print_batch_report(
+        len(protocol_files), elapsed_seconds, failures, time.perf_counter() - start
+    )
+    if failures:
+        raise click.ClickException(
+            f"{failures} of {len(protocol_files)} protocols could not be analyzed"
+            " or had analysis errors."
+        )
+
+
+def _get_batch_result(
+    future: "Future[BatchAnalyzeResult]", protocol_file: Path
+) -> "BatchAnalyzeResult":
+    """Get the result of a batch item, even if its worker couldn't return one.
+
+    The worker process may have died, which breaks the whole pool, or the
+    result may not have survived being sent back. Either way only this
+    item is reported as failed, and the rest of the batch is still written.
+    """
+    try:
+        return future.result()
+    except Exception as e:
+        return BatchAnalyzeResult(
+            file=str(protocol_file),
+            elapsedSeconds=None,
+            result=None,
+            error=f"{type(e).__name__}: {e}",
+        )
+
+
+def _analyze_batch_item(
+    protocol_file: Path, labware_files: Sequence[Path]
+) -> "BatchAnalyzeResult":
+    """Analyze one protocol of a batch. Runs in a worker process."""
+    start = time.perf_counter()
+    result: Optional[AnalyzeResults] = None
+    error: Optional[str] = None
+
+    try:
+        result = run(_analyze_files, [protocol_file, *labware_files])
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+
+    return BatchAnalyzeResult(
+        file=str(protocol_file),
+        elapsedSeconds=time.perf_counter() - start,
+        result=result,
+        error=error,
+    )
+
+
+def _print_batch_report(
+    count: int,
+    elapsed_seconds: Sequence[Tuple[float, Path]],
+    failures: int,
+    total: float,
+) -> None:
+    click.echo(
+        f"Analyzed {count} protocols ({failures} failed) in {total:.2f} s.",
+        err=True,
+    )
+    if elapsed_seconds:
+        times = [elapsed for elapsed, _ in elapsed_seconds]
+        slowest_time, slowest_file = max(elapsed_seconds)
+        click.echo(
+            f"Per protocol: mean {statistics.mean(times):.2f} s,"
+            f" median {statistics.median(times):.2f} s,"
+            f" max {slowest_time:.2f} s ({slowest_file}).",
+            err=True,
+        )
+
+
 class ProtocolFile(BaseModel):
     """A file in a protocol analysis."""
 
@@ -128,3 +316,12 @@ class AnalyzeResults(BaseModel):
     metadata: Dict[str, Any]
     commands: List[Command]
     errors: List[ErrorOccurrence]
+
+
+class BatchAnalyzeResult(BaseModel):
+    """One line of batch analysis output: the results for one protocol."""
+
+    file: str
+    elapsedSeconds: Optional[float]
+    result: Optional[AnalyzeResults]
+    error: Optional[str]
@@ -1,7 +1,8 @@
 import functools
 import inspect
+import logging
 from contextlib import contextmanager
-from typing import Any, Callable, Iterator, Optional, TypeVar, cast
+from typing import Any, Callable, Iterator, Optional, TypeVar, Union, cast
 from uuid import uuid4
 
 from opentrons.broker import Broker
@@ -63,6 +64,9 @@ def publish(command: CommandPayloadCreator) -> Callable[[FuncT], FuncT]:
                 broker, Broker
             ), "Only methods of CommandPublisher classes should be decorated."
 
+            if not _should_publish(broker):
+                return func(*args, **kwargs)
+
             func_sig = _inspect_signature(func)
             bound_func_args = func_sig.bind(*args, **kwargs)
             bound_func_args.apply_defaults()
@@ -100,12 +104,24 @@ def publish(command: CommandPayloadCreator) -> Callable[[FuncT], FuncT]:
 
 
 @contextmanager
-def publish_context(broker: Broker, command: CommandPayload) -> Iterator[None]:
+def publish_context(
+    broker: Broker, command: Union[CommandPayload, Callable[[], CommandPayload]]
+) -> Iterator[None]:
     """Publish messages before and after the `with` block has run.
 
+    `command` may be a function that creates the command, which is only called
+    if something would see the messages.
+
     If an `error` is raised in the `with` block, it will be published in the "after"
     message and re-raised.
     """
+    if not _should_publish(broker):
+        yield
+        return
+
+    if callable(command):
+        command = command()
+
     message_id = str(uuid4())
     _do_publish(broker=broker, message_id=message_id, command=command, when="before")
 
@@ -130,6 +146,17 @@ def _inspect_signature(func: Callable[..., Any]) -> inspect.Signature:
     return inspect.signature(func)
 
 
+def _should_publish(broker: Broker) -> bool:
+    """Whether anything would see a published command: a subscriber or the log.
+
+    Building and publishing the messages for every call into the protocol API
+    is slow, so it's skipped when nothing would see them.
+    """
+    return broker.subscriber_count(COMMAND_TOPIC) > 0 or broker.logger.isEnabledFor(
+        logging.INFO
+    )
+
+
 def _do_publish(
     broker: Broker,
     message_id: str,
@@ -148,7 +175,7 @@ def _do_publish(
         "error": error,
     }
 
-    if when == "before":
+    if when == "before" and broker.logger.isEnabledFor(logging.INFO):
         payload_str = ", ".join(f"{k}: {v}" for k, v in payload.items() if k != "text")
         broker.logger.info(f"{name}: {payload_str}")
 
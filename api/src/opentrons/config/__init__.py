@@ -258,6 +258,14 @@ CONFIG_ELEMENTS = (
         ConfigElementType.DIR,
         "The dir where gripper calibration is stored",
     ),
+    ConfigElement(
+        "calibration_database_file",
+        "Calibration Database",
+        Path("robot") / "calibrations.db",
+        ConfigElementType.FILE,
+        "The SQLite database where deck, pipette, tip length, gripper "
+        "and labware calibrations are stored",
+    ),
 )
 #: The available configuration file elements to modify. All of these can be
 #: changed by editing opentrons.json, where the keys are the name elements,
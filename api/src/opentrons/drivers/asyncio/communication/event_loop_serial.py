@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+from concurrent.futures.thread import ThreadPoolExecutor
+from typing import AsyncGenerator, Dict, Optional
+
+from serial import Serial, SerialException, SerialTimeoutException  # type: ignore[import]
+
+from .async_serial import AsyncSerial, TimeoutProperties
+
+_READ_SIZE = 4096
+
+
+class EventLoopSerial(AsyncSerial):
+    """AsyncSerial that reads and writes on the event loop, not in a thread.
+
+    `AsyncSerial` hands every read and write to a worker thread. This
+    instead registers the serial port's non-blocking file descriptor with
+    the event loop, buffers whatever arrives, and completes a read as soon
+    as its match is in the buffer. Writes go straight to the file
+    descriptor, without waiting for the data to be transmitted.
+
+    Opening and closing the port still happen in the worker thread.
+
+    This needs an event loop that supports `add_reader`, so it doesn't
+    work with the proactor event loop on Windows.
+    """
+
+    def __init__(
+        self,
+        serial: Serial,
+        executor: ThreadPoolExecutor,
+        loop: asyncio.AbstractEventLoop,
+        reset_buffer_before_write: bool,
+    ) -> None:
+        """
+        Constructor
+
+        Args:
+            serial: connected Serial object
+            executor: a thread pool executor
+            loop: event loop
+        """
+        super().__init__(
+            serial=serial,
+            executor=executor,
+            loop=loop,
+            reset_buffer_before_write=reset_buffer_before_write,
+        )
+        self._timeouts: Dict[TimeoutProperties, Optional[float]] = {
+            "timeout": serial.timeout,
+            "write_timeout": serial.write_timeout,
+        }
+        self._buffer = bytearray()
+        # Where to resume looking for a match, so that data isn't searched
+        # again every time more of it arrives.
+        self._search_start = 0
+        self._fd: Optional[int] = None
+        self._read_waiter: Optional["asyncio.Future[None]"] = None
+        self._read_error: Optional[Exception] = None
+        if serial.is_open:
+            self._start_reading()
+
+    async def read_until(self, match: bytes) -> bytes:
+        """
+        Read data until match.
+
+        Args:
+            match: a sequence of bytes to match
+
+        Returns:
+            read data, including the match. If the read times out, whatever
+            data was read.
+        """
+        timeout = self._timeouts["timeout"]
+        deadline = None if timeout is None else self._loop.time() + timeout
+
+        while True:
+            index = self._buffer.find(match, self._search_start)
+            if index >= 0:
+                return self._take(index + len(match))
+
+            # A match may straddle the data already read and the data to come.
+            self._search_start = max(0, len(self._buffer) - len(match) + 1)
+
+            if self._read_error is not None:
+                raise self._read_error
+
+            if not await self._wait_readable(self._remaining(deadline)):
+                return self._take(len(self._buffer))
+
+    async def write(self, data: bytes) -> None:
+        """
+        Write data
+
+        Args:
+            data: data to write.
+
+        Returns:
+            None
+        """
+        if self._reset_buffer_before_write:
+            self.reset_input_buffer()
+
+        assert self._fd is not None, "The port is not open."
+        timeout = self._timeouts["write_timeout"]
+        deadline = None if timeout is None else self._loop.time() + timeout
+        remaining_data = memoryview(data)
+
+        while remaining_data:
+            try:
+                written = os.write(self._fd, remaining_data)
+            except (BlockingIOError, InterruptedError):
+                written = 0
+            remaining_data = remaining_data[written:]
+
+            if remaining_data and not await self._wait_writable(
+                self._remaining(deadline)
+            ):
+                raise SerialTimeoutException("Write timeout")
+
+    async def open(self) -> None:
+        """
+        Open the connection.
+
+        Returns: None
+        """
+        await super().open()
+        self._start_reading()
+
+    async def close(self) -> None:
+        """
+        Close the connection
+
+        Returns: None
+        """
+        self._stop_reading()
+        await super().close()
+
+    def reset_input_buffer(self) -> None:
+        """Reset the input buffer"""
+        self._buffer.clear()
+        self._search_start = 0
+        self._serial.reset_input_buffer()
+
+    @contextlib.asynccontextmanager
+    async def timeout_override(
+        self, timeout_property: TimeoutProperties, timeout: Optional[float]
+    ) -> AsyncGenerator[None, None]:
+        """Context manager that will temporarily override the default timeout."""
+        default_timeout = self._timeouts[timeout_property]
+        if timeout is not None:
+            self._timeouts[timeout_property] = timeout
+        try:
+            yield
+        finally:
+            self._timeouts[timeout_property] = default_timeout
+
+    def _start_reading(self) -> None:
+        fd: int = self._serial.fileno()
+        os.set_blocking(fd, False)
+        self._fd = fd
+        self._read_error = None
+        self._loop.add_reader(fd, self._on_readable)
+
+    def _stop_reading(self) -> None:
+        if self._fd is not None:
+            self._loop.remove_reader(self._fd)
+            self._fd = None
+        self._buffer.clear()
+        self._search_start = 0
+
+    def _remaining(self, deadline: Optional[float]) -> Optional[float]:
+        return None if deadline is None else max(0.0, deadline - self._loop.time())
+
+    def _take(self, size: int) -> bytes:
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        self._search_start = 0
+        return data
+
+    def _on_readable(self) -> None:
+        assert self._fd is not None
+        try:
+            data = os.read(self._fd, _READ_SIZE)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as e:
+            self._on_read_error(SerialException(f"read failed: {e}"))
+            return
+
+        if not data:
+            # Same as pyserial, which reports this as an error rather than EOF.
+            self._on_read_error(
+                SerialException(
+                    "device reports readiness to read but returned no data "
+                    "(device disconnected or multiple access on port?)"
+                )
+            )
+            return
+
+        self._buffer += data
+        if self._read_waiter is not None and not self._read_waiter.done():
+            self._read_waiter.set_result(None)
+
+    def _on_read_error(self, error: Exception) -> None:
+        assert self._fd is not None
+        self._loop.remove_reader(self._fd)
+        self._read_error = error
+        if self._read_waiter is not None and not self._read_waiter.done():
+            self._read_waiter.set_result(None)
+
+    async def _wait_readable(self, timeout: Optional[float]) -> bool:
+        """Wait for more data to be read, returning False on timeout."""
+        self._read_waiter = self._loop.create_future()
+        try:
+            await asyncio.wait_for(self._read_waiter, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._read_waiter = None
+
+    async def _wait_writable(self, timeout: Optional[float]) -> bool:
+        """Wait for room to write more data, returning False on timeout."""
+        assert self._fd is not None
+        fd = self._fd
+        waiter: "asyncio.Future[None]" = self._loop.create_future()
+
+        def _on_writable() -> None:
+            if not waiter.done():
+                waiter.set_result(None)
+
+        self._loop.add_writer(fd, _on_writable)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._loop.remove_writer(fd)
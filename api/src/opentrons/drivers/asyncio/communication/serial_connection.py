@@ -8,6 +8,7 @@ from opentrons.drivers.command_builder import CommandBuilder
 
 from .errors import NoResponse, AlarmResponse, ErrorResponse
 from .async_serial import AsyncSerial
+from .event_loop_serial import EventLoopSerial
 
 log = logging.getLogger(__name__)
 
@@ -26,6 +27,7 @@ class SerialConnection:
         error_keyword: Optional[str] = None,
         alarm_keyword: Optional[str] = None,
         reset_buffer_before_write: bool = False,
+        event_loop_io: bool = False,
     ) -> SerialConnection:
         """
         Create a connection.
@@ -46,10 +48,13 @@ class SerialConnection:
                            (default: alarm)
             reset_buffer_before_write: whether to reset the read buffer before
               every write
+            event_loop_io: read and write on the event loop, rather than in
+              a worker thread. See `EventLoopSerial`.
 
         Returns: SerialConnection
         """
-        serial = await AsyncSerial.create(
+        serial_class = EventLoopSerial if event_loop_io else AsyncSerial
+        serial = await serial_class.create(
             port=port,
             baud_rate=baud_rate,
             timeout=timeout,
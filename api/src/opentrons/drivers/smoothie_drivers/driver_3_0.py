@@ -12,10 +12,10 @@ import asyncio
 import contextlib
 import logging
 from os import environ
-from time import time
+from time import monotonic, time
 from typing import Any, Dict, Optional, Union, List, Tuple, cast, AsyncIterator
 
-from math import isclose
+from math import isclose, sqrt
 
 from opentrons.drivers.serial_communication import get_ports_by_name
 from serial.serialutil import SerialException  # type: ignore[import]
@@ -198,6 +198,19 @@ class SmoothieDriver:
         }
 
         self._is_hard_halting = asyncio.Event()
+
+        # Pipelined mode: while `_pipeline_depth` is nonzero, moves and
+        # speed changes are streamed to the smoothie without waiting for them
+        # to finish. `_motion_pending` is set while streamed commands may still
+        # be executing, and `_motion_done_at` is when they are expected to
+        # finish. `_streamed_current` is the axis-current state the smoothie
+        # was last successfully told to use, so unchanged currents aren't
+        # resent; it is None when that state isn't known.
+        self._pipeline_depth = 0
+        self._motion_pending = False
+        self._motion_done_at = 0.0
+        self._streamed_current: Optional[Dict[str, float]] = None
+
         self._move_split_config: MoveSplits = {}
         #: Cache of currently configured splits from callers
         self._axes_moved_at = AxisMoveTimestamp(AXES)
@@ -551,7 +564,7 @@ class SmoothieDriver:
             self._combined_speed = float(value)
         command = self._build_speed_command(float(value))
         log.debug(f"set_speed: {command}")
-        await self._send_command(command)
+        await self._send_command(command, pipelined=True)
 
     def push_speed(self) -> None:
         self._saved_axes_speed = float(self._combined_speed)
@@ -589,7 +602,7 @@ class SmoothieDriver:
             command = command.add_float(prefix=axis, value=value, precision=None)
 
         log.debug(f"set_axis_max_speed: {command}")
-        await self._send_command(command)
+        await self._send_command(command, pipelined=True)
 
     def push_axis_max_speed(self) -> None:
         self._saved_max_speed_settings = self._max_speed_settings.copy()
@@ -616,7 +629,7 @@ class SmoothieDriver:
             command.add_float(prefix=axis, value=value, precision=None)
 
         log.debug(f"set_acceleration: {command}")
-        await self._send_command(command)
+        await self._send_command(command, pipelined=True)
 
     def push_acceleration(self) -> None:
         self._saved_acceleration = self._acceleration.copy()
@@ -714,8 +727,17 @@ class SmoothieDriver:
         Sends the driver's current settings to the serial port as gcode. Call
         this method to set the axis-current state on the actual Smoothie
         motor-driver.
+
+        In pipelined mode, this does nothing if the smoothie is already using
+        the saved currents.
         """
-        await self._send_command(self._generate_current_command())
+        if self._is_pipelining and self.current == self._streamed_current:
+            return
+        await self._send_command(
+            self._generate_current_command(),
+            pipelined=True,
+            current=self.current.copy(),
+        )
 
     def _generate_current_command(self) -> CommandBuilder:
         """
@@ -793,6 +815,60 @@ class SmoothieDriver:
         if active_currents:
             self._save_current(active_currents, axes_active=True)
 
+    @contextlib.asynccontextmanager
+    async def pipelined(self) -> AsyncIterator[None]:
+        """
+        Stream moves to the smoothie instead of waiting for each one to finish.
+
+        Inside this context, moves and speed changes are acknowledged as soon
+        as smoothie has queued them, so consecutive moves cost one serial
+        round trip each and can be blended by smoothie's planner. Every other
+        command is a sync point: the driver waits for all streamed commands
+        to finish before sending it. Current changes take effect as soon as
+        smoothie reads them, so they also wait for queued moves to finish,
+        but in the same round trip as the change itself.
+
+        Errors and alarms from a streamed move may be reported on a later
+        command; they are raised from that command, and the robot is homed
+        as if that command had been the move.
+
+        Axes that stop moving keep their currents until the next current
+        change, rather than dwelling after every move, so that streamed
+        moves don't wait on each other just to lower them.
+
+        Leaving the context restores the saved currents and waits for every
+        streamed command to finish.
+        """
+        self._pipeline_depth += 1
+        try:
+            yield
+        finally:
+            try:
+                if self._pipeline_depth == 1:
+                    await self._set_saved_current()
+                    await self.wait_for_idle()
+            finally:
+                self._pipeline_depth -= 1
+
+    async def wait_for_idle(self) -> None:
+        """
+        Wait for smoothie to finish every command it has been sent.
+
+        This only needs to be called explicitly in pipelined mode, to wait
+        for streamed moves to finish without sending any other command.
+        """
+        if self._motion_pending:
+            await self._send_command(
+                _command_builder().add_gcode(gcode=GCODE.WAIT),
+                ack_timeout=DEFAULT_EXECUTE_TIMEOUT,
+                pipelined=True,
+            )
+            self._motion_pending = False
+
+    @property
+    def _is_pipelining(self) -> bool:
+        return self._pipeline_depth > 0
+
     # ----------- Private functions --------------- #
 
     async def _wait_for_ack(self) -> None:
@@ -816,14 +892,16 @@ class SmoothieDriver:
         )
         await self.update_homed_flags()
 
-    # Potential place for command optimization (buffering, flushing, etc)
-    async def _send_command(
+    async def _send_command(  # noqa: C901
         self,
         command: CommandBuilder,
         timeout: float = DEFAULT_EXECUTE_TIMEOUT,
         suppress_error_msg: bool = False,
         ack_timeout: float = DEFAULT_ACK_TIMEOUT,
         suppress_home_after_error: bool = False,
+        pipelined: bool = False,
+        current: Optional[Dict[str, float]] = None,
+        motion_sec: float = 0.0,
     ) -> str:
         """
         Submit a GCODE command to the robot, followed by M400 to block until
@@ -859,14 +937,48 @@ class SmoothieDriver:
             like home, it should be long enough to allow the command to
             complete in the worst case. If this is None, the timeout will
             be infinite. This is almost certainly not what you want.
+        :param pipelined: In pipelined mode, send the command without the
+            M400, so that it doesn't block until done. Only for commands that
+            smoothie executes in order with the moves queued before them.
+        :param current: The axis currents the command sets, if it sets them
+            all. Once the command succeeds, these are the currents smoothie
+            is known to be using.
+        :param motion_sec: How long the command's moves are expected to
+            take. When streamed, smoothie only acks a move once it has room
+            to queue it, so the ack timeout is extended by the time the
+            moves queued before it, and the move itself, should take.
         """
         if self.simulating:
             return ""
+        streamed = pipelined and self._is_pipelining
+        motion_pending = self._motion_pending
+        sets_current = GCODE.SET_CURRENT in command
+        ack_timeout = (
+            self._queue_motion(motion_sec, ack_timeout) if streamed else ack_timeout
+        )
+        if sets_current:
+            self._streamed_current = None
+        if motion_pending and (not streamed or sets_current):
+            # Wait for the streamed moves to finish before smoothie executes
+            # this command, in the same round trip as the command itself.
+            command = (
+                _command_builder()
+                .add_gcode(gcode=GCODE.WAIT)
+                .add_builder(builder=command)
+            )
+            ack_timeout = max(ack_timeout, timeout)
         try:
-            return await self._send_command_unsynchronized(
-                command, ack_timeout, timeout
+            result = await self._send_command_unsynchronized(
+                command, ack_timeout, timeout, wait=not streamed
             )
+            self._motion_pending = streamed
+            if sets_current:
+                self._streamed_current = current
+            return result
         except SmoothieError as se:
+            # Smoothie drops its queued moves when it errors
+            self._motion_pending = False
+            self._streamed_current = None
             # XXX: This is a reentrancy error because another command could
             # swoop in here. We're already resetting though and errors (should
             # be) rare so it's probably fine, but the actual solution to this
@@ -876,7 +988,7 @@ class SmoothieDriver:
             if not suppress_error_msg:
                 log.warning(f"alarm/error: command={command}, resp={se.ret_code}")
             if (
-                GCODE.MOVE in command or GCODE.PROBE in command
+                GCODE.MOVE in command or GCODE.PROBE in command or motion_pending
             ) and not suppress_home_after_error:
                 if error_axis not in "XYZABC":
                     error_axis = AXES
@@ -884,8 +996,23 @@ class SmoothieDriver:
                 await self.home(error_axis)
             raise SmoothieError(se.ret_code, str(command))
 
+    def _queue_motion(self, motion_sec: float, ack_timeout: float) -> float:
+        """
+        Account for a streamed command's moves, and return the ack timeout
+        to use for it: long enough for every queued move to finish, with
+        room to spare, since smoothie may only have room to queue the
+        command once they have.
+        """
+        now = monotonic()
+        self._motion_done_at = max(self._motion_done_at, now) + motion_sec
+        return max(ack_timeout, DEFAULT_ACK_TIMEOUT + 2 * (self._motion_done_at - now))
+
     async def _send_command_unsynchronized(
-        self, command: CommandBuilder, ack_timeout: float, execute_timeout: float
+        self,
+        command: CommandBuilder,
+        ack_timeout: float,
+        execute_timeout: float,
+        wait: bool = True,
     ) -> str:
         assert self._connection, "There is no connection."
         command_result = ""
@@ -893,12 +1020,13 @@ class SmoothieDriver:
             command_result = await self._connection.send_command(
                 command=command, retries=DEFAULT_COMMAND_RETRIES, timeout=ack_timeout
             )
-            wait_command = CommandBuilder(
-                terminator=SMOOTHIE_COMMAND_TERMINATOR
-            ).add_gcode(gcode=GCODE.WAIT)
-            await self._connection.send_command(
-                command=wait_command, retries=0, timeout=execute_timeout
-            )
+            if wait:
+                wait_command = CommandBuilder(
+                    terminator=SMOOTHIE_COMMAND_TERMINATOR
+                ).add_gcode(gcode=GCODE.WAIT)
+                await self._connection.send_command(
+                    command=wait_command, retries=0, timeout=execute_timeout
+                )
         except AlarmResponse as e:
             self._handle_return(ret_code=e.response, is_alarm=True)
         except ErrorResponse as e:
@@ -1372,8 +1500,16 @@ class SmoothieDriver:
         if split_command_string or (checked_speed != self._combined_speed):
             command.add_builder(builder=self._build_speed_command(checked_speed))
 
-        # introduce the standard currents
-        command.add_builder(builder=self._generate_current_command())
+        # introduce the standard currents. While pipelining, only the moving
+        # axes need theirs; axes that stopped keep theirs until the next
+        # current change, so that this move can queue behind the last one.
+        streamed_current = self._streamed_current
+        if (
+            not self._is_pipelining
+            or streamed_current is None
+            or any(streamed_current.get(ax) != self.current[ax] for ax in moving_axes)
+        ):
+            command.add_builder(builder=self._generate_current_command())
 
         # move to target position, including any added backlash to B/C axes
         command.add_gcode(GCODE.MOVE).add_builder(builder=primary_command_string)
@@ -1404,17 +1540,39 @@ class SmoothieDriver:
             # TODO (hmg) a movement's timeout should be calculated by
             # how long the movement is expected to take.
             await _do_split()
-            await self._send_command(command, timeout=DEFAULT_EXECUTE_TIMEOUT)
+            await self._send_command(
+                command,
+                timeout=DEFAULT_EXECUTE_TIMEOUT,
+                pipelined=True,
+                current=self.current.copy(),
+                motion_sec=self._estimate_move_time(moving_target, checked_speed),
+            )
         finally:
-            # dwell pipette motors because they get hot
+            # dwell pipette motors because they get hot. While pipelining,
+            # that waits for the next current change or the end of pipelining
             plunger_axis_moved = "".join(set("BC") & set(target.keys()))
             if plunger_axis_moved:
                 self.dwell_axes(plunger_axis_moved)
-                await self._set_saved_current()
+                if not self._is_pipelining:
+                    await self._set_saved_current()
             self._axes_moved_at.mark_moved(moving_axes)
 
         self._update_position(target)
 
+    def _estimate_move_time(self, target: Dict[str, float], speed: float) -> float:
+        """
+        Estimate how long a move to `target` at `speed` takes, ignoring
+        acceleration: the longer of the time along the path at the combined
+        speed, and the time each axis takes at its maximum speed.
+        """
+        distances = {ax: abs(coord - self.position[ax]) for ax, coord in target.items()}
+        estimate = sqrt(sum(d * d for d in distances.values())) / speed
+        for ax, distance in distances.items():
+            max_speed = self._max_speed_settings.get(ax)
+            if max_speed:
+                estimate = max(estimate, distance / max_speed)
+        return estimate
+
     async def home(
         self, axis: str = AXES, disabled: str = DISABLE_AXES
     ) -> Dict[str, float]:
@@ -1588,7 +1746,6 @@ class SmoothieDriver:
         fullstep_prefix, fullstep_postfix = self._build_fullstep_configurations(
             "".join(to_unstick)
         )
-
         command_sequence = [
             fullstep_prefix.add_builder(builder=split_currents)
             .add_gcode(gcode=GCODE.DWELL)
@@ -1820,6 +1977,8 @@ class SmoothieDriver:
             await asyncio.sleep(0.25)
             self._gpio_chardev.set_reset_pin(True)
             await asyncio.sleep(0.25)
+            self._motion_pending = False
+            self._streamed_current = None
             await self._wait_for_ack()
             await self._reset_from_error()
 
@@ -1846,6 +2005,8 @@ class SmoothieDriver:
             await asyncio.sleep(0.25)
             self._gpio_chardev.set_halt_pin(True)
             await asyncio.sleep(0.25)
+            # halting drops smoothie's queued moves
+            self._motion_pending = False
             self.run_flag.set()
 
     async def update_firmware(  # noqa: C901
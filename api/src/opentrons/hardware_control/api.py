@@ -1002,11 +1002,13 @@ class API(
         _add_tip_to_instrs()
         # neighboring tips tend to get stuck in the space between
         # the volume chamber and the drop-tip sleeve on p1000.
-        # This extra shake ensures those tips are removed
-        for rel_point, speed in spec.shake_off_list:
-            await self.move_rel(mount, rel_point, speed=speed)
+        # This extra shake ensures those tips are removed. The shakes
+        # are short, so stream them rather than waiting for each one.
+        async with self._backend.pipelined():
+            for rel_point, speed in spec.shake_off_list:
+                await self.move_rel(mount, rel_point, speed=speed)
 
-        await self.retract(mount, spec.retract_target)
+            await self.retract(mount, spec.retract_target)
 
     async def drop_tip(self, mount: top_types.Mount, home_after: bool = True) -> None:
         """Drop tip at the current location."""
@@ -1034,8 +1036,9 @@ class API(
                     top_types.Point(0, 0, 0),
                 )
 
-        for shake in spec.shake_moves:
-            await self.move_rel(mount, shake[0], speed=shake[1])
+        async with self._backend.pipelined():
+            for shake in spec.shake_moves:
+                await self.move_rel(mount, shake[0], speed=shake[1])
 
         self._backend.set_active_current(spec.ending_current)
         _remove()
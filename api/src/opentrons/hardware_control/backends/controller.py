@@ -1,8 +1,9 @@
 from __future__ import annotations
 import asyncio
-from contextlib import contextmanager, AsyncExitStack
+from contextlib import asynccontextmanager, contextmanager, AsyncExitStack
 import logging
 from typing import (
+    AsyncIterator,
     Callable,
     Iterator,
     Any,
@@ -242,6 +243,15 @@ class Controller:
         finally:
             self._smoothie_driver.pop_active_current()
 
+    @asynccontextmanager
+    async def pipelined(self) -> AsyncIterator[None]:
+        """Stream moves to the smoothie, waiting for them only at sync points.
+
+        See :py:meth:`SmoothieDriver.pipelined`.
+        """
+        async with self._smoothie_driver.pipelined():
+            yield
+
     async def _handle_watch_event(self) -> None:
         try:
             event = await self._event_watcher.get_event()
@@ -5,7 +5,9 @@ import asyncio
 from contextlib import asynccontextmanager
 import logging
 from copy import deepcopy
+from pathlib import Path
 from typing import (
+    Callable,
     Dict,
     List,
     Optional,
@@ -508,8 +510,40 @@ class OT3Controller:
                 retry_count=3,
                 timeout_seconds=20,
                 erase=True,
+                # The bootloader isn't known to ignore repeated chunks, so a
+                # chunk whose ack is lost can't safely be resent.
+                chunk_retry_count=0,
             )
 
+    async def update_firmwares(
+        self,
+        firmware_files: Dict[OT3SubSystem, str],
+        progress_callback: Optional[
+            Callable[[OT3SubSystem, firmware_update.UpdateProgress], None]
+        ] = None,
+    ) -> None:
+        """Update the firmware on several subsystems at once."""
+        sub_systems = {sub_system_to_node_id(s): s for s in firmware_files}
+
+        def _on_progress(
+            node_id: NodeId, progress: firmware_update.UpdateProgress
+        ) -> None:
+            if progress_callback:
+                progress_callback(sub_systems[node_id], progress)
+
+        await firmware_update.run_updates(
+            messenger=self._messenger,
+            hex_files={
+                sub_system_to_node_id(s): Path(f) for s, f in firmware_files.items()
+            },
+            # The same values as update_firmware.
+            retry_count=3,
+            timeout_seconds=20,
+            erase=True,
+            chunk_retry_count=0,
+            progress_callback=_on_progress,
+        )
+
     def engaged_axes(self) -> OT3AxisMap[bool]:
         """Get engaged axes."""
         return {}
@@ -5,6 +5,7 @@ import asyncio
 from contextlib import asynccontextmanager
 import logging
 from typing import (
+    Callable,
     Dict,
     List,
     Optional,
@@ -31,6 +32,7 @@ from .ot3utils import (
 )
 
 from opentrons_hardware.firmware_bindings.constants import NodeId
+from opentrons_hardware.firmware_update import UpdateProgress
 from opentrons_hardware.hardware_control.motion_planning import (
     Move,
     Coordinates,
@@ -387,6 +389,16 @@ class OT3Simulator:
         """Update the firmware."""
         pass
 
+    async def update_firmwares(
+        self,
+        firmware_files: Dict[OT3SubSystem, str],
+        progress_callback: Optional[
+            Callable[[OT3SubSystem, UpdateProgress], None]
+        ] = None,
+    ) -> None:
+        """Update the firmware on several subsystems at once."""
+        pass
+
     def engaged_axes(self) -> OT3AxisMap[bool]:
         """Get engaged axes."""
         return {}
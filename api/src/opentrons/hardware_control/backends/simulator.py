@@ -3,8 +3,17 @@ import asyncio
 import copy
 import logging
 from threading import Event
-from typing import Dict, Optional, List, Tuple, TYPE_CHECKING, Sequence, Iterator
-from contextlib import contextmanager
+from typing import (
+    AsyncIterator,
+    Dict,
+    Optional,
+    List,
+    Tuple,
+    TYPE_CHECKING,
+    Sequence,
+    Iterator,
+)
+from contextlib import asynccontextmanager, contextmanager
 
 from opentrons_shared_data.pipette import dummy_model_for_name
 
@@ -295,6 +304,10 @@ class Simulator:
     def save_current(self) -> Iterator[None]:
         yield
 
+    @asynccontextmanager
+    async def pipelined(self) -> AsyncIterator[None]:
+        yield
+
     @property
     def axis_bounds(self) -> Dict[Axis, Tuple[float, float]]:
         """The (minimum, maximum) bounds for each axis."""
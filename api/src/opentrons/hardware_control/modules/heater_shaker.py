@@ -22,12 +22,15 @@ from opentrons.hardware_control.modules.types import (
 
 log = logging.getLogger(__name__)
 
-POLL_PERIOD = 1.0
+# Poll slowly while idle or holding, and quickly while the temperature or
+# speed is changing or the labware latch is moving.
+POLL_PERIOD = 2.0
+ACTIVE_POLL_PERIOD = 0.25
 
 # TODO(mc, 2022-06-14): this techinque copied from temperature module
 # to speed up simulation of heater-shaker protocols, but it's pretty silly
 # module simulation in PAPIv2 needs to be seriously rethought
-SIMULATING_POLL_PERIOD = POLL_PERIOD / 20.0
+SIMULATING_POLL_PERIOD = 0.05
 
 
 class HeaterShakerError(RuntimeError):
@@ -103,6 +106,8 @@ class HeaterShaker(mod_abc.AbstractModule):
         self._poller = Poller(
             reader=PollerReader(driver=self._driver),
             interval_seconds=polling_period,
+            active_interval_seconds=min(polling_period, ACTIVE_POLL_PERIOD),
+            is_active=self._is_changing,
             listener=self._listener,
         )
         # TODO (spp, 2022-02-23): refine this to include user-facing error message.
@@ -168,14 +173,36 @@ class HeaterShaker(mod_abc.AbstractModule):
                 status = SpeedStatus.ACCELERATING
         return status
 
+    @classmethod
+    def _is_changing(cls, state: "PollResult") -> bool:
+        """Whether the temperature, speed or labware latch is still changing."""
+        return (
+            cls._get_temperature_status(state.temperature)
+            in (TemperatureStatus.HEATING, TemperatureStatus.COOLING)
+            or cls._get_speed_status(state.rpm)
+            in (SpeedStatus.ACCELERATING, SpeedStatus.DECELERATING)
+            or state.labware_latch
+            in (
+                HeaterShakerLabwareLatchStatus.OPENING,
+                HeaterShakerLabwareLatchStatus.CLOSING,
+            )
+        )
+
     def model(self) -> str:
         return self._model_from_revision(self._device_info.get("model"))
 
     def bootloader(self) -> UploadFunction:
         return update.upload_via_dfu
 
-    async def wait_next_poll(self) -> None:
-        """Wait for the next poll to complete."""
+    async def wait_next_poll(self, poll_now: bool = False) -> None:
+        """
+        Wait for the next poll to complete.
+
+        Args:
+            poll_now: Poll right away rather than at the next scheduled time.
+        """
+        if poll_now:
+            self._poller.poll_now()
         await self._listener.wait_next_poll()
 
     @property
@@ -265,7 +292,7 @@ class HeaterShaker(mod_abc.AbstractModule):
         """
         await self.wait_for_is_running()
         await self._driver.set_temperature(temperature=celsius)
-        await self.wait_next_poll()
+        await self.wait_next_poll(poll_now=True)
 
         async def _wait() -> None:
             # Wait until we reach the target temperature.
@@ -301,7 +328,7 @@ class HeaterShaker(mod_abc.AbstractModule):
         # This is fraught, and probably still open to race conditions.
         # Re-think this pattern, potentially even at the driver/firmware level
         await self._driver.set_temperature(celsius)
-        await self.wait_next_poll()
+        await self.wait_next_poll(poll_now=True)
 
     async def await_temperature(self, awaiting_temperature: float) -> None:
         """Await temperature in degree Celsius.
@@ -342,7 +369,7 @@ class HeaterShaker(mod_abc.AbstractModule):
         """
         await self.wait_for_is_running()
         await self._driver.set_rpm(rpm)
-        await self.wait_next_poll()
+        await self.wait_next_poll(poll_now=True)
 
         async def _wait() -> None:
             # Wait until we reach the target speed.
@@ -369,6 +396,7 @@ class HeaterShaker(mod_abc.AbstractModule):
         """
         await self.wait_for_is_running()
         await self._driver.set_rpm(rpm)
+        self._poller.poll_now()
 
     # TODO(mc, 2022-06-14): not used, remove
     async def await_speed(self, awaiting_speed: int) -> None:
@@ -417,28 +445,30 @@ class HeaterShaker(mod_abc.AbstractModule):
         await self.wait_for_is_running()
         await self._driver.deactivate_heater()
         await self._driver.home()
-        await self.wait_next_poll()
+        await self.wait_next_poll(poll_now=True)
 
     async def deactivate_heater(self) -> None:
         """Stop heating/cooling"""
         await self.wait_for_is_running()
         await self._driver.deactivate_heater()
-        await self.wait_next_poll()
+        await self.wait_next_poll(poll_now=True)
 
     async def deactivate_shaker(self) -> None:
         """Stop shaking and home the plate"""
         await self.wait_for_is_running()
         await self._driver.home()
-        await self.wait_next_poll()
+        await self.wait_next_poll(poll_now=True)
 
     async def open_labware_latch(self) -> None:
         await self.wait_for_is_running()
         await self._driver.open_labware_latch()
+        self._poller.poll_now()
         await self._wait_for_labware_latch(HeaterShakerLabwareLatchStatus.IDLE_OPEN)
 
     async def close_labware_latch(self) -> None:
         await self.wait_for_is_running()
         await self._driver.close_labware_latch()
+        self._poller.poll_now()
         await self._wait_for_labware_latch(HeaterShakerLabwareLatchStatus.IDLE_CLOSED)
 
     async def prep_for_update(self) -> str:
@@ -17,8 +17,10 @@ from opentrons.hardware_control.modules import update, mod_abc, types
 
 log = logging.getLogger(__name__)
 
-TEMP_POLL_INTERVAL_SECS = 1.0
-SIM_TEMP_POLL_INTERVAL_SECS = TEMP_POLL_INTERVAL_SECS / 20.0
+# Poll slowly while idle or holding, and quickly while heating or cooling.
+TEMP_POLL_INTERVAL_SECS = 2.0
+TEMP_ACTIVE_POLL_INTERVAL_SECS = 0.25
+SIM_TEMP_POLL_INTERVAL_SECS = 0.05
 
 
 class TempDeck(mod_abc.AbstractModule):
@@ -96,6 +98,10 @@ class TempDeck(mod_abc.AbstractModule):
         self._poller = Poller(
             reader=PollerReader(driver=self._driver),
             interval_seconds=polling_frequency,
+            active_interval_seconds=min(
+                polling_frequency, TEMP_ACTIVE_POLL_INTERVAL_SECS
+            ),
+            is_active=self._is_ramping,
             listener=self._listener,
         )
 
@@ -114,8 +120,15 @@ class TempDeck(mod_abc.AbstractModule):
     def bootloader(self) -> types.UploadFunction:
         return update.upload_via_avrdude
 
-    async def wait_next_poll(self) -> None:
-        """Wait for the next poll to complete."""
+    async def wait_next_poll(self, poll_now: bool = False) -> None:
+        """
+        Wait for the next poll to complete.
+
+        Args:
+            poll_now: Poll right away rather than at the next scheduled time.
+        """
+        if poll_now:
+            self._poller.poll_now()
         await self._listener.wait_next_poll()
 
     async def set_temperature(self, celsius: float) -> None:
@@ -128,7 +141,7 @@ class TempDeck(mod_abc.AbstractModule):
         """
         await self.wait_for_is_running()
         await self._driver.set_temperature(celsius=celsius)
-        await self.wait_next_poll()
+        await self.wait_next_poll(poll_now=True)
 
         async def _wait() -> None:
             # Wait until we reach the target temperature.
@@ -149,6 +162,7 @@ class TempDeck(mod_abc.AbstractModule):
         """
         await self.wait_for_is_running()
         await self._driver.set_temperature(celsius)
+        self._poller.poll_now()
 
     async def await_temperature(self, awaiting_temperature: float) -> None:
         """
@@ -178,6 +192,7 @@ class TempDeck(mod_abc.AbstractModule):
         """Stop heating/cooling and turn off the fan"""
         await self.wait_for_is_running()
         await self._driver.deactivate()
+        self._poller.poll_now()
 
     @property
     def device_info(self) -> Mapping[str, str]:
@@ -252,6 +267,14 @@ class TempDeck(mod_abc.AbstractModule):
                 status = TemperatureStatus.HEATING
         return status
 
+    @classmethod
+    def _is_ramping(cls, temperature: Temperature) -> bool:
+        """Whether the temperature is still heading for its target."""
+        return cls._get_status(temperature) in (
+            TemperatureStatus.HEATING,
+            TemperatureStatus.COOLING,
+        )
+
     @staticmethod
     def _model_from_revision(revision: Optional[str]) -> str:
         """Defines the revision -> model mapping"""
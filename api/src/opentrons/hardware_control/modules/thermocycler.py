@@ -21,8 +21,11 @@ from opentrons.drivers.thermocycler import (
 
 MODULE_LOG = logging.getLogger(__name__)
 
-POLLING_FREQUENCY_SEC = 1.0
-SIM_POLLING_FREQUENCY_SEC = POLLING_FREQUENCY_SEC / 20.0
+# Poll slowly while idle or holding, and quickly while the block or lid is
+# heating or cooling, the lid is moving, or a hold is about to end.
+POLLING_FREQUENCY_SEC = 2.0
+ACTIVE_POLLING_FREQUENCY_SEC = 0.25
+SIM_POLLING_FREQUENCY_SEC = 0.05
 
 TEMP_UPDATE_RETRIES = 50
 
@@ -114,8 +117,13 @@ class Thermocycler(mod_abc.AbstractModule):
         self._listener = ThermocyclerListener(
             loop=loop, interrupt_callback=self._enter_error_state
         )
+        self._polling_interval_sec = polling_interval_sec
         self._poller = Poller(
             interval_seconds=polling_interval_sec,
+            active_interval_seconds=min(
+                polling_interval_sec, ACTIVE_POLLING_FREQUENCY_SEC
+            ),
+            is_active=self._is_changing,
             listener=self._listener,
             reader=PollerReader(driver=self._driver),
         )
@@ -162,23 +170,27 @@ class Thermocycler(mod_abc.AbstractModule):
         """Deactivate the lid heating pad"""
         await self.wait_for_is_running()
         await self._driver.deactivate_lid()
+        self._poller.poll_now()
 
     async def deactivate_block(self) -> None:
         """Deactivate the block peltiers"""
         await self.wait_for_is_running()
         self._clear_cycle_counters()
         await self._driver.deactivate_block()
+        self._poller.poll_now()
 
     async def deactivate(self) -> None:
         """Deactivate the block peltiers and lid heating pad"""
         await self.wait_for_is_running()
         self._clear_cycle_counters()
         await self._driver.deactivate_all()
+        self._poller.poll_now()
 
     async def open(self) -> str:
         """Open the lid if it is closed"""
         await self.wait_for_is_running()
         await self._driver.open_lid()
+        self._poller.poll_now()
         await self._wait_for_lid_status(ThermocyclerLidStatus.OPEN)
         return ThermocyclerLidStatus.OPEN
 
@@ -186,6 +198,7 @@ class Thermocycler(mod_abc.AbstractModule):
         """Close the lid if it is open"""
         await self.wait_for_is_running()
         await self._driver.close_lid()
+        self._poller.poll_now()
         await self._wait_for_lid_status(ThermocyclerLidStatus.CLOSED)
         return ThermocyclerLidStatus.CLOSED
 
@@ -257,6 +270,7 @@ class Thermocycler(mod_abc.AbstractModule):
         await self._driver.set_plate_temperature(
             temp=temperature, hold_time=hold_time, volume=volume
         )
+        self._poller.poll_now()
 
         # Wait for target temperature to be set.
         retries = 0
@@ -339,6 +353,7 @@ class Thermocycler(mod_abc.AbstractModule):
         """Set the lid temperature in deg Celsius"""
         await self.wait_for_is_running()
         await self._driver.set_lid_temperature(temp=temperature)
+        self._poller.poll_now()
         # Wait for target to be set
         retries = 0
         while self.lid_target != temperature:
@@ -393,7 +408,7 @@ class Thermocycler(mod_abc.AbstractModule):
             hold_time=hold_time_seconds,
             volume=volume,
         )
-        await self.wait_next_poll()
+        await self.wait_next_poll(poll_now=True)
 
     # TODO(mc, 2022-04-26): de-duplicate with `set_lid_temperature`
     async def set_target_lid_temperature(self, celsius: float) -> None:
@@ -406,7 +421,7 @@ class Thermocycler(mod_abc.AbstractModule):
         """
         await self.wait_for_is_running()
         await self._driver.set_lid_temperature(temp=celsius)
-        await self.wait_next_poll()
+        await self.wait_next_poll(poll_now=True)
 
     async def _wait_for_lid_temp(self) -> None:
         """
@@ -453,10 +468,28 @@ class Thermocycler(mod_abc.AbstractModule):
         while self.lid_status != status:
             await self.wait_next_poll()
 
-    async def wait_next_poll(self) -> None:
-        """Wait for the next poll to complete."""
+    async def wait_next_poll(self, poll_now: bool = False) -> None:
+        """
+        Wait for the next poll to complete.
+
+        Args:
+            poll_now: Poll right away rather than at the next scheduled time.
+        """
+        if poll_now:
+            self._poller.poll_now()
         await self._listener.wait_next_poll()
 
+    def _is_changing(self, state: "PolledData") -> bool:
+        """Whether the block or lid is changing, or a hold is about to end."""
+        ramping = (TemperatureStatus.HEATING, TemperatureStatus.COOLING)
+        hold = state.plate_temperature.hold
+        return (
+            self._listener.plate_status in ramping
+            or self._listener.lid_status in ramping
+            or state.lid_status == ThermocyclerLidStatus.IN_BETWEEN
+            or (hold is not None and 0 < hold <= self._polling_interval_sec)
+        )
+
     @property
     def lid_target(self) -> Optional[float]:
         return (
@@ -1,13 +1,28 @@
 """Utilities for calculating motion correctly."""
 
-from typing import Callable, Dict, Union, overload, TypeVar, Optional, cast
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Tuple,
+    Union,
+    overload,
+    TypeVar,
+    Optional,
+    cast,
+)
 from collections import OrderedDict
+from dataclasses import dataclass
+import numpy as np
 from opentrons.types import Mount, Point
 from opentrons.calibration_storage.types import AttitudeMatrix
-from opentrons.util import linal
 from .types import Axis, OT3Axis, OT3Mount
 from functools import lru_cache
 
+if TYPE_CHECKING:
+    import numpy.typing as npt
+    from opentrons.util.linal import DoubleArray
+
 
 # TODO: The offset_for_mount function should be defined with an overload
 # set, as with other functions in this module. Unfortunately, mypy < 0.920
@@ -296,25 +311,99 @@ def target_position_from_plunger(  # type: ignore[no-untyped-def]
     return all_axes_pos
 
 
+@dataclass(frozen=True)
+class DeckTransform:
+    """The affine transform between deck and machine coordinates.
+
+    This precomposes an attitude matrix, the offset added in machine
+    coordinates and an optional offset subtracted in deck coordinates (a
+    mount's offset, for instance) into one matrix and one offset, so that
+    whole arrays of points can be transformed at once. Use
+    :py:func:`deck_transform` to get one, since it caches them.
+    """
+
+    attitude: "DoubleArray"
+    inverse: "DoubleArray"
+    offset: "DoubleArray"
+
+    def machine_from_deck(self, deck_points: "npt.ArrayLike") -> "DoubleArray":
+        """Transform deck points, an Nx3 array or a single point, to machine
+        points of the same shape."""
+        return np.asarray(deck_points, dtype=float) @ self.attitude.T + self.offset
+
+    def deck_from_machine(self, machine_points: "npt.ArrayLike") -> "DoubleArray":
+        """Transform machine points, an Nx3 array or a single point, to deck
+        points of the same shape."""
+        return (np.asarray(machine_points, dtype=float) - self.offset) @ self.inverse.T
+
+
+@lru_cache(16)
+def _deck_transform(
+    attitude: Tuple[Tuple[float, ...], ...], offset: Point, mount_offset: Point
+) -> DeckTransform:
+    matrix: "DoubleArray" = np.array(attitude, dtype=float)
+    inverse: "DoubleArray" = np.linalg.inv(matrix)  # type: ignore[no-untyped-call]
+    machine_offset: "DoubleArray" = np.array(offset, dtype=float) - matrix @ np.array(
+        mount_offset, dtype=float
+    )
+    for array in (matrix, inverse, machine_offset):
+        array.setflags(write=False)
+    return DeckTransform(attitude=matrix, inverse=inverse, offset=machine_offset)
+
+
+def deck_transform(
+    attitude: Union[AttitudeMatrix, "DoubleArray"],
+    offset: Point,
+    mount_offset: Point = Point(0, 0, 0),
+) -> DeckTransform:
+    """Get the transform from deck to machine coordinates.
+
+    A machine point is ``attitude @ (deck_point - mount_offset) + offset``.
+    Transforms are cached, so there is one for each combination of deck
+    calibration and mount.
+    """
+    return _deck_transform(tuple(tuple(row) for row in attitude), offset, mount_offset)
+
+
+def machine_points_from_deck_points(
+    deck_points: "npt.ArrayLike",
+    attitude: Union[AttitudeMatrix, "DoubleArray"],
+    offset: Point,
+) -> "DoubleArray":
+    """Transform an Nx3 array of deck points to machine points."""
+    return deck_transform(attitude, offset).machine_from_deck(deck_points)
+
+
+def deck_points_from_machine_points(
+    machine_points: "npt.ArrayLike",
+    attitude: Union[AttitudeMatrix, "DoubleArray"],
+    offset: Point,
+) -> "DoubleArray":
+    """Transform an Nx3 array of machine points to deck points."""
+    return deck_transform(attitude, offset).deck_from_machine(machine_points)
+
+
 def deck_point_from_machine_point(
     machine_point: Point, attitude: AttitudeMatrix, offset: Point
 ) -> Point:
     return Point(
-        *linal.apply_reverse(
-            attitude,
-            machine_point - offset,
-        )
+        *deck_transform(attitude, offset).deck_from_machine(machine_point).tolist()
     )
 
 
 def machine_point_from_deck_point(
     deck_point: Point, attitude: AttitudeMatrix, offset: Point
 ) -> Point:
-    return Point(*linal.apply_transform(attitude, deck_point)) + offset
+    return Point(
+        *deck_transform(attitude, offset).machine_from_deck(deck_point).tolist()
+    )
 
 
 AxisType = TypeVar("AxisType", Axis, OT3Axis)
 
+_GANTRY_AXES = frozenset((*Axis.gantry_axes(), *OT3Axis.gantry_axes()))
+_MOUNT_AXES = frozenset((*Axis.mount_axes(), *OT3Axis.mount_axes()))
+
 
 def machine_from_deck(
     deck_pos: Dict[AxisType, float],
@@ -322,31 +411,19 @@ def machine_from_deck(
     offset: Point,
 ) -> Dict[AxisType, float]:
     """Build a machine-axis position from a deck position"""
-    to_transform = Point(*(tp for ax, tp in deck_pos.items() if ax in ax.gantry_axes()))
-
-    # Pre-fill the dict we’ll send to the backend with the axes we don’t
-    # need to transform
-    machine_pos = {
-        ax: pos for ax, pos in deck_pos.items() if ax not in ax.gantry_axes()
-    }
-    if len(to_transform) != 3:
+    gantry_axes = [ax for ax in deck_pos if ax in _GANTRY_AXES]
+    if len(gantry_axes) != 3:
         raise ValueError(
             "Moves must specify either exactly an " "x, y, and (z or a) or none of them"
         )
 
-    # Type ignored below because linal.apply_transform (rightly) specifies
-    # Tuple[float, float, float] and the implied type from
-    # target_position.items() is (rightly) Tuple[float, ...] with unbounded
-    # size; unfortunately, mypy can’t quite figure out the length check
-    # above that makes this OK
-    transformed = machine_point_from_deck_point(to_transform, attitude, offset)
-
-    to_check = {
-        ax: transformed[idx]
-        for idx, ax in enumerate(deck_pos.keys())
-        if ax in ax.gantry_axes()
-    }
-    machine_pos.update({ax: pos for ax, pos in to_check.items()})
+    transformed = deck_transform(attitude, offset).machine_from_deck(
+        [deck_pos[ax] for ax in gantry_axes]
+    )
+
+    # The axes we don’t need to transform pass through unchanged.
+    machine_pos = {ax: pos for ax, pos in deck_pos.items() if ax not in _GANTRY_AXES}
+    machine_pos.update(zip(gantry_axes, transformed.tolist()))
     return machine_pos
 
 
@@ -357,25 +434,28 @@ def deck_from_machine(
 ) -> Dict[AxisType, float]:
     """Build a deck-abs position store from the machine's position"""
     axis_enum = type(next(iter(machine_pos.keys())))
-    plunger_axes = {k: v for k, v in machine_pos.items() if k not in k.gantry_axes()}
-    mount_axes = {k: v for k, v in machine_pos.items() if k in k.mount_axes()}
-    deck_positions_by_mount = {
-        axis_enum.to_mount(axis): deck_point_from_machine_point(
-            Point(machine_pos[axis_enum.X], machine_pos[axis_enum.Y], value),
-            attitude,
-            offset,
+    mount_axes = [ax for ax in machine_pos if ax in _MOUNT_AXES]
+    machine_x = machine_pos[axis_enum.X]
+    machine_y = machine_pos[axis_enum.Y]
+
+    # Transform the carriage position for every mount at once.
+    deck_points = (
+        deck_transform(attitude, offset)
+        .deck_from_machine(
+            [(machine_x, machine_y, machine_pos[ax]) for ax in mount_axes]
         )
-        for axis, value in mount_axes.items()
-    }
-    position_for_gantry = next(iter(deck_positions_by_mount.values()))
+        .tolist()
+    )
     deck_pos = {
-        axis_enum.X: position_for_gantry[0],
-        axis_enum.Y: position_for_gantry[1],
+        axis_enum.X: deck_points[0][0],
+        axis_enum.Y: deck_points[0][1],
     }
-    for mount, pos in deck_positions_by_mount.items():
-        deck_pos[axis_enum.by_mount(mount)] = pos[2]
+    for ax, point in zip(mount_axes, deck_points):
+        deck_pos[ax] = point[2]
 
-    deck_pos.update(plunger_axes)
+    deck_pos.update(
+        {ax: pos for ax, pos in machine_pos.items() if ax not in _GANTRY_AXES}
+    )
     return deck_pos
 
 
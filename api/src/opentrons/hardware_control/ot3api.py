@@ -29,6 +29,7 @@ from opentrons.config.types import (
     CapacitivePassSettings,
 )
 from .backends.ot3utils import get_system_constraints
+from opentrons_hardware.firmware_update import UpdateProgress
 from opentrons_hardware.hardware_control.motion_planning import (
     MoveManager,
     MoveTarget,
@@ -375,6 +376,21 @@ class OT3API(
         """Update the firmware on the hardware."""
         await self._backend.update_firmware(firmware_file, target)
 
+    async def update_firmwares(
+        self,
+        firmware_files: Dict[OT3SubSystem, str],
+        progress_callback: Optional[
+            Callable[[OT3SubSystem, UpdateProgress], None]
+        ] = None,
+    ) -> None:
+        """Update the firmware on several subsystems at once.
+
+        :param firmware_files: The path to the firmware file for each subsystem.
+        :param progress_callback: A function called with the progress of each
+                                  subsystem's update.
+        """
+        await self._backend.update_firmwares(firmware_files, progress_callback)
+
     @staticmethod
     def _gantry_load_from_instruments(
         instruments: Mapping[OT3Mount, Optional[InstrumentDict]]
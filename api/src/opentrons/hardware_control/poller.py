@@ -1,12 +1,16 @@
 import asyncio
 from abc import abstractmethod, ABC
 from collections import deque
-from typing import TypeVar, Generic, Deque, Optional
+from typing import Callable, Dict, TypeVar, Generic, Deque, Optional
+from weakref import WeakKeyDictionary
 import logging
 
 DataT = TypeVar("DataT")
 log = logging.getLogger(__name__)
 
+# Polls due within this long of each other are run on the same wake-up.
+DEFAULT_COALESCE_SECONDS = 0.1
+
 
 class Reader(ABC, Generic[DataT]):
     """Interface of poller target."""
@@ -103,14 +107,111 @@ class WaitableListener(Listener[DataT]):
                 f.set_exception(exc)
 
 
+class PollScheduler:
+    """Schedules the polls of every poller on an event loop with one timer.
+
+    Each poller tells the scheduler when its next poll is due. Rather than
+    every poller sleeping on its own, the scheduler keeps a single timer
+    armed for the earliest due poll, and when it fires starts every poll
+    that is due within `coalesce_seconds`. Pollers with similar intervals
+    then share wake-ups, and the event loop only wakes when there is
+    something to do.
+    """
+
+    def __init__(self, coalesce_seconds: float = DEFAULT_COALESCE_SECONDS) -> None:
+        """
+        Constructor.
+
+        Args:
+            coalesce_seconds: how far ahead of its due time a poll may be
+                started to share a wake-up with another.
+        """
+        self._coalesce_seconds = coalesce_seconds
+        self._deadlines: Dict[Callable[[], None], float] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def schedule(self, callback: Callable[[], None], delay: float) -> None:
+        """
+        Schedule a callback, replacing any earlier schedule of it.
+
+        Args:
+            callback: The function to call when due.
+            delay: Seconds from now until it is due.
+
+        Returns: None
+        """
+        loop = asyncio.get_running_loop()
+        self._deadlines[callback] = loop.time() + delay
+        self._arm(loop)
+
+    def cancel(self, callback: Callable[[], None]) -> None:
+        """
+        Cancel a scheduled callback, if it is scheduled.
+
+        Args:
+            callback: The callback to cancel.
+
+        Returns: None
+        """
+        self._deadlines.pop(callback, None)
+        if not self._deadlines and self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _arm(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Make sure the timer fires by the earliest deadline."""
+        deadline = min(self._deadlines.values())
+        if self._timer is not None:
+            if self._timer.when() <= deadline:
+                return
+            self._timer.cancel()
+        self._timer = loop.call_at(deadline, self._on_timer, loop)
+
+    def _on_timer(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Run everything that is due, and wait for whatever is next."""
+        self._timer = None
+        cutoff = loop.time() + self._coalesce_seconds
+        due = [cb for cb, deadline in self._deadlines.items() if deadline <= cutoff]
+        for callback in due:
+            del self._deadlines[callback]
+        for callback in due:
+            callback()
+        if self._deadlines:
+            self._arm(loop)
+
+
+_schedulers: "WeakKeyDictionary[asyncio.AbstractEventLoop, PollScheduler]" = (
+    WeakKeyDictionary()
+)
+
+
+def get_scheduler() -> PollScheduler:
+    """Get the poll scheduler shared by the pollers on the running loop."""
+    loop = asyncio.get_running_loop()
+    scheduler = _schedulers.get(loop)
+    if scheduler is None:
+        scheduler = _schedulers[loop] = PollScheduler()
+    return scheduler
+
+
 class Poller(Generic[DataT]):
-    """Asyncio poller."""
+    """Asyncio poller.
+
+    Polls once as soon as it is created, then waits `interval_seconds`
+    between polls, or `active_interval_seconds` after a poll whose result
+    `is_active` says is still changing, such as a module ramping to a
+    target. Waits are scheduled with a `PollScheduler`, which by default is
+    shared with every other poller on the event loop.
+    """
 
     def __init__(
         self,
         interval_seconds: float,
         reader: Reader[DataT],
         listener: Listener[DataT],
+        active_interval_seconds: Optional[float] = None,
+        is_active: Optional[Callable[[DataT], bool]] = None,
+        scheduler: Optional[PollScheduler] = None,
     ) -> None:
         """
         Constructor.
@@ -119,37 +220,84 @@ class Poller(Generic[DataT]):
             interval_seconds: time in between polls.
             reader: The data reader.
             listener: event listener.
+            active_interval_seconds: time in between polls while active.
+                Defaults to interval_seconds.
+            is_active: Whether a poll result is active. Defaults to never.
+            scheduler: The scheduler to use. Defaults to the running loop's.
         """
-        self._shutdown_event = asyncio.Event()
         self._interval = interval_seconds
+        self._active_interval = (
+            active_interval_seconds
+            if active_interval_seconds is not None
+            else interval_seconds
+        )
+        self._is_active = is_active
         self._listener = listener
         self._reader = reader
-        self._task = asyncio.create_task(self._poller())
+        self._scheduler = scheduler or get_scheduler()
+        self._stopped = False
+        self._poll_requested = False
+        self._terminated = asyncio.Event()
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._start_poll()
+
+    def poll_now(self) -> None:
+        """
+        Poll as soon as possible rather than at the next scheduled time.
+
+        If a poll is already under way, poll again when it finishes, so
+        that the next poll result is read after this call.
+
+        Returns: None
+        """
+        if self._stopped:
+            return
+        if self._task is not None:
+            self._poll_requested = True
+        else:
+            self._scheduler.schedule(self._start_poll, 0)
 
     def stop(self) -> None:
         """Signal poller to stop."""
-        self._shutdown_event.set()
+        if self._stopped:
+            return
+        self._stopped = True
+        self._scheduler.cancel(self._start_poll)
+        if self._task is None:
+            self._terminate()
 
     async def stop_and_wait(self) -> None:
         """Stop poller and wait for it to terminate."""
         self.stop()
-        await self._task
-
-    async def _poller(self) -> None:
-        """Poll task entrypoint."""
-        while True:
-            try:
-                poll = await self._reader.read()
-                self._listener.on_poll(poll)
-            except Exception as e:
-                log.exception("Polling exception")
-                self._listener.on_error(e)
-
-            try:
-                await asyncio.wait_for(self._shutdown_event.wait(), self._interval)
-            except asyncio.TimeoutError:
-                pass
-            else:
-                break
-
+        await self._terminated.wait()
+
+    def _start_poll(self) -> None:
+        """Start a poll, unless one is under way."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._poll())
+
+    async def _poll(self) -> None:
+        """Poll once and schedule the next poll."""
+        interval = self._interval
+        try:
+            poll = await self._reader.read()
+            self._listener.on_poll(poll)
+            if self._is_active is not None and self._is_active(poll):
+                interval = self._active_interval
+        except Exception as e:
+            log.exception("Polling exception")
+            self._listener.on_error(e)
+        finally:
+            self._task = None
+
+        if self._stopped:
+            self._terminate()
+        else:
+            if self._poll_requested:
+                self._poll_requested = False
+                interval = 0
+            self._scheduler.schedule(self._start_poll, interval)
+
+    def _terminate(self) -> None:
         self._listener.on_terminated()
+        self._terminated.set()
@@ -158,7 +158,7 @@ def load_attitude_matrix() -> types.DeckCalibration:
             log.debug(
                 "Attitude deck calibration matrix not found. Migrating "
                 "existing affine deck calibration matrix to {}".format(
-                    config.get_opentrons_path("robot_calibration_dir")
+                    config.get_opentrons_path("calibration_database_file")
                 )
             )
             attitude = migrate_affine_xy_to_attitude(gantry_cal)
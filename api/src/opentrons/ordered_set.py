@@ -1,7 +1,8 @@
 """A set that preserves the order in which elements are added."""
 
 
-from typing import Dict, Generic, Hashable, Iterable, Iterator, TypeVar
+from collections import OrderedDict
+from typing import Generic, Hashable, Iterable, Iterator, TypeVar
 from typing_extensions import Literal
 
 
@@ -19,7 +20,11 @@ class OrderedSet(Generic[_SetElementT]):
     """
 
     def __init__(self, source_iterable: Iterable[_SetElementT] = tuple()) -> None:
-        self._elements: Dict[_SetElementT, Literal[True]] = {}
+        # A plain dict would also preserve order, but after many elements are
+        # removed from the front, getting its first element takes time proportional
+        # to the number removed. OrderedDict's linked list keeps that constant,
+        # which matters for FIFO queues like the protocol engine's command queue.
+        self._elements: "OrderedDict[_SetElementT, Literal[True]]" = OrderedDict()
         for element in source_iterable:
             self.add(element)
 
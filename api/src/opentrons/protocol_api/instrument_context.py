@@ -225,7 +225,7 @@ class InstrumentContext(CommandPublisher):
 
         with publish_context(
             broker=self.broker,
-            command=cmds.aspirate(
+            command=lambda: cmds.aspirate(
                 instrument=self,
                 volume=c_vol,
                 location=dest,
@@ -319,7 +319,7 @@ class InstrumentContext(CommandPublisher):
 
         with publish_context(
             broker=self.broker,
-            command=cmds.dispense(
+            command=lambda: cmds.dispense(
                 instrument=self,
                 volume=c_vol,
                 location=loc,
@@ -386,7 +386,7 @@ class InstrumentContext(CommandPublisher):
 
         with publish_context(
             broker=self.broker,
-            command=cmds.mix(
+            command=lambda: cmds.mix(
                 instrument=self,
                 repetitions=repetitions,
                 volume=c_vol,
@@ -457,7 +457,7 @@ class InstrumentContext(CommandPublisher):
 
         with publish_context(
             broker=self.broker,
-            command=cmds.blow_out(
+            command=lambda: cmds.blow_out(
                 instrument=self,
                 location=location or self._ctx.location_cache,  # type: ignore[arg-type]
             ),
@@ -714,7 +714,7 @@ class InstrumentContext(CommandPublisher):
 
         with publish_context(
             broker=self.broker,
-            command=cmds.pick_up_tip(instrument=self, location=target),
+            command=lambda: cmds.pick_up_tip(instrument=self, location=target),
         ):
             self.move_to(target.top(), publish=False)
             self._implementation.pick_up_tip(
@@ -836,7 +836,7 @@ class InstrumentContext(CommandPublisher):
 
         with publish_context(
             broker=self.broker,
-            command=cmds.drop_tip(instrument=self, location=target),
+            command=lambda: cmds.drop_tip(instrument=self, location=target),
         ):
             self.move_to(target, publish=False)
             self._implementation.drop_tip(home_after=home_after)
@@ -869,7 +869,7 @@ class InstrumentContext(CommandPublisher):
 
         mount_name = self._implementation.get_mount().name.lower()
 
-        with publish_context(broker=self.broker, command=cmds.home(mount_name)):
+        with publish_context(broker=self.broker, command=lambda: cmds.home(mount_name)):
             self._implementation.home()
 
         return self
@@ -1208,7 +1208,7 @@ class InstrumentContext(CommandPublisher):
         if publish:
             publish_ctx = publish_context(
                 broker=self.broker,
-                command=cmds.move_to(
+                command=lambda: cmds.move_to(
                     instrument=self,
                     location=location or self._ctx.location_cache,  # type: ignore[arg-type]
                 ),
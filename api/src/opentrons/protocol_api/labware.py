@@ -54,6 +54,8 @@ class Well:
     such as :py:meth:`top`, :py:meth:`bottom`
     """
 
+    __slots__ = ("_api_version", "_impl", "_geometry")
+
     def __init__(
         self,
         well_implementation: WellImplementation,
@@ -265,6 +267,7 @@ class Labware(DeckItem):
             )
         self._api_version = api_level
         self._implementation = implementation
+        self._well_cache: Dict[str, Well] = {}
 
     @property
     def separate_calibration(self) -> bool:
@@ -276,7 +279,7 @@ class Labware(DeckItem):
         return self._api_version
 
     def __getitem__(self, key: str) -> Well:
-        return self.wells_by_name()[key]
+        return self._well_from_impl(self._implementation.get_well(key))
 
     @property  # type: ignore
     @requires_version(2, 0)
@@ -371,7 +374,7 @@ class Labware(DeckItem):
         if isinstance(idx, int):
             res = self._implementation.get_wells()[idx]
         elif isinstance(idx, str):
-            res = self._implementation.get_wells_by_name()[idx]
+            res = self._implementation.get_well(idx)
         else:
             res = NotImplemented
         return self._well_from_impl(res)
@@ -399,8 +402,7 @@ class Labware(DeckItem):
         elif isinstance(args[0], int):
             res = [self._implementation.get_wells()[idx] for idx in args]  # type: ignore[index]
         elif isinstance(args[0], str):
-            by_name = self._implementation.get_wells_by_name()
-            res = [by_name[idx] for idx in args]  # type: ignore[index]
+            res = [self._implementation.get_well(idx) for idx in args]  # type: ignore[arg-type]
         else:
             raise TypeError
         return [self._well_from_impl(w) for w in res]
@@ -684,7 +686,15 @@ class Labware(DeckItem):
             self._implementation.reset_tips()
 
     def _well_from_impl(self, well: WellImplementation) -> Well:
-        return Well(well_implementation=well, api_level=self._api_version)
+        # Wells are cached so that accessing them doesn't allocate, as long as
+        # the implementation hasn't rebuilt them, e.g. after calibration.
+        name = well.get_name()
+        cached = self._well_cache.get(name)
+        if cached is None or cached._impl is not well:
+            cached = self._well_cache[name] = Well(
+                well_implementation=well, api_level=self._api_version
+            )
+        return cached
 
 
 def save_definition(
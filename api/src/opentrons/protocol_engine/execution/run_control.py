@@ -1,7 +1,7 @@
 """Run control command side-effect logic."""
 import asyncio
 
-from ..state import StateStore
+from ..state import StateStore, StateTopic
 from ..actions import ActionDispatcher, PauseAction, PauseSource
 
 
@@ -24,7 +24,8 @@ class RunControlHandler:
         if not self._state_store.config.ignore_pause:
             self._action_dispatcher.dispatch(PauseAction(source=PauseSource.PROTOCOL))
             await self._state_store.wait_for(
-                condition=self._state_store.commands.get_is_running
+                condition=self._state_store.commands.get_is_running,
+                topics=[StateTopic.COMMANDS],
             )
 
     async def wait_for_duration(self, seconds: float) -> None:
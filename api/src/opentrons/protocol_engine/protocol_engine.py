@@ -15,7 +15,7 @@ from .execution import (
     DoorWatcher,
     HardwareStopper,
 )
-from .state import StateStore, StateView
+from .state import StateStore, StateTopic, StateView
 from .plugins import AbstractPlugin, PluginStarter
 from .actions import (
     ActionDispatcher,
@@ -152,6 +152,7 @@ class ProtocolEngine:
         await self._state_store.wait_for(
             self._state_store.commands.get_is_complete,
             command_id=command_id,
+            topics=[StateTopic.COMMANDS],
         )
 
     async def add_and_execute_command(self, request: CommandCreate) -> Command:
@@ -191,7 +192,8 @@ class ProtocolEngine:
             CommandExecutionFailedError: if any protocol command failed.
         """
         await self._state_store.wait_for(
-            condition=self._state_store.commands.get_all_complete
+            condition=self._state_store.commands.get_all_complete,
+            topics=[StateTopic.COMMANDS],
         )
 
     async def finish(
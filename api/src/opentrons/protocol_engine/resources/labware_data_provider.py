@@ -5,7 +5,7 @@ abstract away rough edges until we can improve those underlying interfaces.
 """
 import logging
 from anyio import to_thread
-from typing import Optional, cast
+from typing import Dict, Optional, Tuple, cast
 
 from opentrons_shared_data.labware.dev_types import LabwareDefinition as LabwareDefDict
 from opentrons.protocols.models import LabwareDefinition
@@ -16,6 +16,14 @@ from opentrons.calibration_storage.types import TipLengthCalNotFound
 
 log = logging.getLogger(__name__)
 
+# Parsed definitions, along with the raw definitions they were parsed from.
+# `get_labware_definition` returns the same raw definition every time until
+# the labware on disk changes, so a parsed definition can be reused for as
+# long as its raw definition is the one that comes back.
+_parsed_definitions: Dict[
+    Tuple[str, str, int], Tuple[LabwareDefDict, LabwareDefinition]
+] = {}
+
 
 class LabwareDataProvider:
     """Labware data provider."""
@@ -28,8 +36,8 @@ class LabwareDataProvider:
     ) -> LabwareDefinition:
         """Get a labware definition given the labware's identification.
 
-        Note: this method hits the filesystem, which will have performance
-        implications if it is called often.
+        Note: the first call for each definition hits the filesystem; later
+        calls return the same, cached definition, which must not be modified.
         """
         return await to_thread.run_sync(
             LabwareDataProvider._get_labware_definition_sync,
@@ -42,9 +50,15 @@ class LabwareDataProvider:
     def _get_labware_definition_sync(
         load_name: str, namespace: str, version: int
     ) -> LabwareDefinition:
-        return LabwareDefinition.parse_obj(
-            get_labware_definition(load_name, namespace, version)
-        )
+        key = (load_name, namespace, version)
+        raw_definition = get_labware_definition(load_name, namespace, version)
+        cached = _parsed_definitions.get(key)
+        if cached is not None and cached[0] is raw_definition:
+            return cached[1]
+
+        definition = LabwareDefinition.parse_obj(raw_definition)
+        _parsed_definitions[key] = (raw_definition, definition)
+        return definition
 
     @staticmethod
     async def get_calibrated_tip_length(
@@ -1,6 +1,6 @@
 """Protocol engine state module."""
 
-from .state import State, StateStore, StateView
+from .state import State, StateStore, StateView, StateTopic, WaitForStats
 from .state_summary import StateSummary
 from .config import Config
 from .commands import CommandState, CommandView, CommandSlice, CurrentCommand
@@ -26,6 +26,8 @@ __all__ = [
     "State",
     "StateStore",
     "StateView",
+    "StateTopic",
+    "WaitForStats",
     "StateSummary",
     # static engine configuration
     "Config",
@@ -25,3 +25,12 @@ class HandlesActions(ABC):
     def handle_action(self, action: Action) -> None:
         """React to a state-change action."""
         ...
+
+    def get_is_changed_by(self, action: Action) -> bool:
+        """Get whether an action may change this object's state.
+
+        Used to only notify waiters of changes that they depend on,
+        so this must be True for any action that `handle_action` reacts to.
+        By default, every action is assumed to change state.
+        """
+        return True
@@ -1,19 +1,49 @@
 """Simple state change notification interface."""
 import asyncio
+from typing import Dict, FrozenSet, Hashable, Iterable, Optional
 
 
 class ChangeNotifier:
-    """An interface tto emit or subscribe to state change notifications."""
+    """An interface to emit or subscribe to state change notifications.
+
+    Notifications may be scoped to topics, like the parts of state that changed,
+    so that subscribers are only woken up by the changes that they care about.
+    """
 
     def __init__(self) -> None:
-        """Initialize the ChangeNotifier with an internal Event."""
-        self._event = asyncio.Event()
+        """Initialize the ChangeNotifier with no subscribers."""
+        # Each waiter's event, mapped to the topics it's waiting on, if any.
+        # Kept in insertion order so waiters are woken in the order they waited.
+        self._waiters: Dict[asyncio.Event, Optional[FrozenSet[Hashable]]] = {}
+
+    def notify(self, topics: Optional[Iterable[Hashable]] = None) -> None:
+        """Notify `wait`'ers that the state has changed.
+
+        Arguments:
+            topics: The topics that changed. If omitted, all waiters are
+                notified, regardless of the topics they're waiting on.
+        """
+        changed_topics = frozenset(topics) if topics is not None else None
+
+        for event, waiter_topics in self._waiters.items():
+            if (
+                changed_topics is None
+                or waiter_topics is None
+                or not changed_topics.isdisjoint(waiter_topics)
+            ):
+                event.set()
+
+    async def wait(self, topics: Optional[Iterable[Hashable]] = None) -> None:
+        """Wait until the next state change notification.
 
-    def notify(self) -> None:
-        """Notify all `wait`'ers that the state has changed."""
-        self._event.set()
+        Arguments:
+            topics: Only wake up for notifications of these topics.
+                If omitted, wake up for every notification.
+        """
+        event = asyncio.Event()
+        self._waiters[event] = frozenset(topics) if topics is not None else None
 
-    async def wait(self) -> None:
-        """Wait until the next state change notification."""
-        self._event.clear()
-        await self._event.wait()
+        try:
+            await event.wait()
+        finally:
+            del self._waiters[event]
@@ -147,6 +147,20 @@ class CommandState:
     are stored on the individual commands themselves.
     """
 
+    last_completed_index: Optional[int]
+    """The highest index, in `all_command_ids`, of a succeeded or failed command.
+
+    Kept up to date as commands change so that finding the "current"
+    command doesn't require searching through all of them.
+    """
+
+    failed_protocol_command_id: Optional[str]
+    """The ID of the earliest-added non-setup command with an error, if any.
+
+    Kept up to date as commands change so that checking whether all
+    commands have completed doesn't require searching through all of them.
+    """
+
 
 class CommandStore(HasState[CommandState], HandlesActions):
     """Command state container."""
@@ -173,6 +187,8 @@ class CommandStore(HasState[CommandState], HandlesActions):
             errors_by_id={},
             run_completed_at=None,
             run_started_at=None,
+            last_completed_index=None,
+            failed_protocol_command_id=None,
         )
 
     def handle_action(self, action: Action) -> None:  # noqa: C901
@@ -203,9 +219,8 @@ class CommandStore(HasState[CommandState], HandlesActions):
 
             next_index = len(self._state.all_command_ids)
             self._state.all_command_ids.append(action.command_id)
-            self._state.commands_by_id[queued_command.id] = CommandEntry(
-                index=next_index,
-                command=queued_command,
+            self._set_command_entry(
+                CommandEntry(index=next_index, command=queued_command)
             )
 
             if action.request.intent == CommandIntent.SETUP:
@@ -223,15 +238,10 @@ class CommandStore(HasState[CommandState], HandlesActions):
             if prev_entry is None:
                 index = len(self._state.all_command_ids)
                 self._state.all_command_ids.append(command.id)
-                self._state.commands_by_id[command.id] = CommandEntry(
-                    index=index,
-                    command=command,
-                )
             else:
-                self._state.commands_by_id[command.id] = CommandEntry(
-                    index=prev_entry.index,
-                    command=command,
-                )
+                index = prev_entry.index
+
+            self._set_command_entry(CommandEntry(index=index, command=command))
 
             self._state.queued_command_ids.discard(command.id)
             self._state.queued_setup_command_ids.discard(command.id)
@@ -250,18 +260,20 @@ class CommandStore(HasState[CommandState], HandlesActions):
             )
 
             prev_entry = self._state.commands_by_id[action.command_id]
-            self._state.commands_by_id[action.command_id] = CommandEntry(
-                index=prev_entry.index,
-                # TODO(mc, 2022-06-06): add new "cancelled" status or similar
-                # and don't set `completedAt` in commands other than the
-                # specific one that failed
-                command=prev_entry.command.copy(
-                    update={
-                        "error": error_occurrence,
-                        "completedAt": action.failed_at,
-                        "status": CommandStatus.FAILED,
-                    }
-                ),
+            self._set_command_entry(
+                CommandEntry(
+                    index=prev_entry.index,
+                    # TODO(mc, 2022-06-06): add new "cancelled" status or similar
+                    # and don't set `completedAt` in commands other than the
+                    # specific one that failed
+                    command=prev_entry.command.copy(
+                        update={
+                            "error": error_occurrence,
+                            "completedAt": action.failed_at,
+                            "status": CommandStatus.FAILED,
+                        }
+                    ),
+                )
             )
 
             if prev_entry.command.intent == CommandIntent.SETUP:
@@ -278,14 +290,16 @@ class CommandStore(HasState[CommandState], HandlesActions):
             for command_id in other_command_ids_to_fail:
                 prev_entry = self._state.commands_by_id[command_id]
 
-                self._state.commands_by_id[command_id] = CommandEntry(
-                    index=prev_entry.index,
-                    command=prev_entry.command.copy(
-                        update={
-                            "completedAt": action.failed_at,
-                            "status": CommandStatus.FAILED,
-                        }
-                    ),
+                self._set_command_entry(
+                    CommandEntry(
+                        index=prev_entry.index,
+                        command=prev_entry.command.copy(
+                            update={
+                                "completedAt": action.failed_at,
+                                "status": CommandStatus.FAILED,
+                            }
+                        ),
+                    )
                 )
 
             if self._state.running_command_id == action.command_id:
@@ -349,6 +363,45 @@ class CommandStore(HasState[CommandState], HandlesActions):
                 elif action.door_state == DoorState.CLOSED:
                     self._state.is_door_blocking = False
 
+    def get_is_changed_by(self, action: Action) -> bool:
+        """Get whether an action may change command state."""
+        return isinstance(
+            action,
+            (
+                QueueCommandAction,
+                UpdateCommandAction,
+                FailCommandAction,
+                PlayAction,
+                PauseAction,
+                StopAction,
+                FinishAction,
+                HardwareStoppedAction,
+                DoorChangeAction,
+            ),
+        )
+
+    def _set_command_entry(self, entry: CommandEntry) -> None:
+        """Add or replace a command, keeping the command indexes up to date.
+
+        Commands only ever move forward through their statuses,
+        and never lose their errors, so the indexes only move one way.
+        """
+        command = entry.command
+        self._state.commands_by_id[command.id] = entry
+
+        if command.status in (CommandStatus.SUCCEEDED, CommandStatus.FAILED):
+            last_completed_index = self._state.last_completed_index
+            if last_completed_index is None or entry.index > last_completed_index:
+                self._state.last_completed_index = entry.index
+
+        if command.error is not None and command.intent != CommandIntent.SETUP:
+            failed_id = self._state.failed_protocol_command_id
+            if (
+                failed_id is None
+                or entry.index < self._state.commands_by_id[failed_id].index
+            ):
+                self._state.failed_protocol_command_id = command.id
+
 
 class CommandView(HasState[CommandState]):
     """Read-only command state view."""
@@ -428,17 +481,17 @@ class CommandView(HasState[CommandState]):
                 index=entry.index,
             )
 
-        # TODO(mc, 2022-02-07): this is O(n) in the worst case for no good reason.
-        # Resolve prior to JSONv6 support, where this will matter.
-        for reverse_index, cid in enumerate(reversed(self._state.all_command_ids)):
-            if self.get_is_complete(cid):
-                entry = self._state.commands_by_id[cid]
-                return CurrentCommand(
-                    command_id=entry.command.id,
-                    command_key=entry.command.key,
-                    created_at=entry.command.createdAt,
-                    index=len(self._state.all_command_ids) - reverse_index - 1,
-                )
+        last_completed_index = self._state.last_completed_index
+
+        if last_completed_index is not None:
+            command_id = self._state.all_command_ids[last_completed_index]
+            entry = self._state.commands_by_id[command_id]
+            return CurrentCommand(
+                command_id=entry.command.id,
+                command_key=entry.command.key,
+                created_at=entry.command.createdAt,
+                index=entry.index,
+            )
 
         return None
 
@@ -517,10 +570,9 @@ class CommandView(HasState[CommandState]):
         no_command_queued = len(self._state.queued_command_ids) == 0
 
         if no_command_running and no_command_queued:
-            for command_id in self._state.all_command_ids:
-                command = self._state.commands_by_id[command_id].command
-                if command.error and command.intent != CommandIntent.SETUP:
-                    raise ProtocolCommandFailedError(command_id=command_id)
+            failed_command_id = self._state.failed_protocol_command_id
+            if failed_command_id is not None:
+                raise ProtocolCommandFailedError(command_id=failed_command_id)
             return True
         else:
             return False
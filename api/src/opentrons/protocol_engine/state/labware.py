@@ -119,6 +119,17 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
             )
             self._state.definitions_by_uri[uri] = action.definition
 
+    def get_is_changed_by(self, action: Action) -> bool:
+        """Get whether an action may change labware state.
+
+        Commands only change labware state with their results,
+        so commands without results yet are ignored.
+        """
+        if isinstance(action, UpdateCommandAction):
+            return action.command.result is not None
+
+        return isinstance(action, (AddLabwareOffsetAction, AddLabwareDefinitionAction))
+
     def _handle_command(self, command: Command) -> None:
         """Modify state in reaction to a command."""
         if isinstance(command.result, LoadLabwareResult):
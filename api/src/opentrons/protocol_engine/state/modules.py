@@ -124,6 +124,17 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
                 module_live_data=action.module_live_data,
             )
 
+    def get_is_changed_by(self, action: Action) -> bool:
+        """Get whether an action may change module state.
+
+        Commands only change module state with their results,
+        so commands without results yet are ignored.
+        """
+        if isinstance(action, UpdateCommandAction):
+            return action.command.result is not None
+
+        return isinstance(action, AddModuleAction)
+
     def _handle_command(self, command: Command) -> None:
         if isinstance(command.result, LoadModuleResult):
             self._add_module_substate(
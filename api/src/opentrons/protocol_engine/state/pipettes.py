@@ -71,6 +71,17 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
         if isinstance(action, UpdateCommandAction):
             self._handle_command(action.command)
 
+    def get_is_changed_by(self, action: Action) -> bool:
+        """Get whether an action may change pipette state.
+
+        Commands only change pipette state with their results,
+        so commands without results yet are ignored.
+        """
+        return (
+            isinstance(action, UpdateCommandAction)
+            and action.command.result is not None
+        )
+
     def _handle_command(self, command: Command) -> None:
         if isinstance(
             command.result,
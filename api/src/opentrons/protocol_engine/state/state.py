@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from enum import Enum
 from functools import partial
-from typing import Any, Callable, List, Optional, Sequence, TypeVar
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, TypeVar
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV3
 
@@ -33,6 +34,26 @@ class State:
     modules: ModuleState
 
 
+class StateTopic(str, Enum):
+    """A part of engine state that `StateStore.wait_for` can wait for changes to."""
+
+    COMMANDS = "commands"
+    LABWARE = "labware"
+    PIPETTES = "pipettes"
+    MODULES = "modules"
+
+
+@dataclass(frozen=True)
+class WaitForStats:
+    """Counts of how often `StateStore.wait_for` conditions have been re-checked."""
+
+    wakeups: int
+    """Times a waiting condition was re-checked after a state change."""
+
+    satisfied: int
+    """Times a re-checked condition was satisfied, ending its wait."""
+
+
 class StateView(HasState[State]):
     """A read-only view of computed state."""
 
@@ -130,14 +151,16 @@ class StateStore(StateView, ActionHandler):
         )
         self._module_store = ModuleStore()
 
-        self._substores: List[HandlesActions] = [
-            self._command_store,
-            self._pipette_store,
-            self._labware_store,
-            self._module_store,
-        ]
+        self._substores_by_topic: Dict[StateTopic, HandlesActions] = {
+            StateTopic.COMMANDS: self._command_store,
+            StateTopic.PIPETTES: self._pipette_store,
+            StateTopic.LABWARE: self._labware_store,
+            StateTopic.MODULES: self._module_store,
+        }
         self._config = config
         self._change_notifier = change_notifier or ChangeNotifier()
+        self._wait_for_wakeups = 0
+        self._wait_for_satisfied = 0
         self._initialize_state()
 
     def handle_action(self, action: Action) -> None:
@@ -147,15 +170,20 @@ class StateStore(StateView, ActionHandler):
             action: An action object representing a state change. Will be
                 passed to all substores so they can react accordingly.
         """
-        for substore in self._substores:
+        changed_topics = []
+
+        for topic, substore in self._substores_by_topic.items():
+            if substore.get_is_changed_by(action):
+                changed_topics.append(topic)
             substore.handle_action(action)
 
-        self._update_state_views()
+        self._update_state_views(changed_topics)
 
     async def wait_for(
         self,
         condition: Callable[..., Optional[ReturnT]],
         *args: Any,
+        topics: Optional[Iterable[StateTopic]] = None,
         **kwargs: Any,
     ) -> ReturnT:
         """Wait for a condition to become true, checking whenever state changes.
@@ -194,6 +222,9 @@ class StateStore(StateView, ActionHandler):
             condition: A function that returns a truthy value when the `await`
                 should resolve.
             *args: Positional arguments to pass to `condition`.
+            topics: The parts of state that `condition` depends on. If given,
+                `condition` will only be re-checked when one of them changes.
+                Otherwise, it will be re-checked whenever any state changes.
             **kwargs: Named arguments to pass to `condition`.
 
         Returns:
@@ -206,11 +237,22 @@ class StateStore(StateView, ActionHandler):
         is_done = predicate()
 
         while not is_done:
-            await self._change_notifier.wait()
+            await self._change_notifier.wait(topics)
+            self._wait_for_wakeups += 1
             is_done = predicate()
 
+            if is_done:
+                self._wait_for_satisfied += 1
+
         return is_done
 
+    def get_wait_for_stats(self) -> WaitForStats:
+        """Get how often `wait_for` conditions have been re-checked and satisfied."""
+        return WaitForStats(
+            wakeups=self._wait_for_wakeups,
+            satisfied=self._wait_for_satisfied,
+        )
+
     def _get_next_state(self) -> State:
         """Get a new instance of the state value object."""
         return State(
@@ -243,7 +285,7 @@ class StateStore(StateView, ActionHandler):
             module_view=self._modules,
         )
 
-    def _update_state_views(self) -> None:
+    def _update_state_views(self, changed_topics: Sequence[StateTopic]) -> None:
         """Update state view interfaces to use latest underlying values."""
         next_state = self._get_next_state()
         self._state = next_state
@@ -251,4 +293,6 @@ class StateStore(StateView, ActionHandler):
         self._labware._state = next_state.labware
         self._pipettes._state = next_state.pipettes
         self._modules._state = next_state.modules
-        self._change_notifier.notify()
+
+        if len(changed_topics) > 0:
+            self._change_notifier.notify(changed_topics)
@@ -1,6 +1,6 @@
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, Sequence
+from typing import Dict, List, Optional, Sequence
 from opentrons.protocols.context.well import WellImplementation
 
 
@@ -15,19 +15,81 @@ class Grid:
     columns: HeaderToWells
 
 
+@dataclass(frozen=True)
+class WellLayout:
+    """The rows and columns of a labware's wells, as indices into its
+    well ordering.
+
+    This only depends on the well names, so one layout can be shared by every
+    labware with the same definition.
+    """
+
+    row_headers: Sequence[str]
+    column_headers: Sequence[str]
+    rows: Sequence[Sequence[int]]
+    columns: Sequence[Sequence[int]]
+
+    @classmethod
+    def from_names(cls, names: Sequence[str]) -> "WellLayout":
+        """Build the layout of wells ordered as in a labware definition."""
+        row_names = []
+        column_names = []
+        for name in names:
+            match = WellImplementation.pattern.match(name)
+            assert match, (
+                f"could not match '{name}' using "
+                f"pattern '{WellImplementation.pattern.pattern}'"
+            )
+            row_names.append(match.group(1))
+            column_names.append(match.group(2))
+        return cls._from_row_column_names(row_names, column_names)
+
+    @classmethod
+    def from_wells(cls, wells: Wells) -> "WellLayout":
+        return cls._from_row_column_names(
+            [well.get_row_name() for well in wells],
+            [well.get_column_name() for well in wells],
+        )
+
+    @classmethod
+    def _from_row_column_names(
+        cls, row_names: Sequence[str], column_names: Sequence[str]
+    ) -> "WellLayout":
+        rows: Dict[str, List[int]] = defaultdict(list)
+        columns: Dict[str, List[int]] = defaultdict(list)
+        for index, (row_name, column_name) in enumerate(zip(row_names, column_names)):
+            rows[row_name].append(index)
+            columns[column_name].append(index)
+        row_headers = sorted(rows.keys())
+        column_headers = sorted(columns.keys(), key=lambda k: int(k))
+        return cls(
+            row_headers=row_headers,
+            column_headers=column_headers,
+            rows=[rows[h] for h in row_headers],
+            columns=[columns[h] for h in column_headers],
+        )
+
+
 class WellGrid:
     """A helper class to extract Wells by row or column"""
 
-    def __init__(self, wells: Wells):
+    def __init__(self, wells: Wells, layout: Optional[WellLayout] = None):
         """
         Construct well grid from a collection of well objects ordered as they
          appear in ordering` field of Labware Defnition
+
+        :param layout: the layout of the wells, if it is already known
         """
-        self._grid = self._create_row_column(wells)
-        self._row_headers = sorted(self._grid.rows.keys())
-        self._column_headers = sorted(self._grid.columns.keys(), key=lambda k: int(k))
-        self._rows = [self._grid.rows[h] for h in self._row_headers]
-        self._columns = [self._grid.columns[h] for h in self._column_headers]
+        if layout is None:
+            layout = WellLayout.from_wells(wells)
+        self._row_headers = layout.row_headers
+        self._column_headers = layout.column_headers
+        self._rows = [[wells[i] for i in row] for row in layout.rows]
+        self._columns = [[wells[i] for i in column] for column in layout.columns]
+        self._grid = Grid(
+            rows=dict(zip(self._row_headers, self._rows)),
+            columns=dict(zip(self._column_headers, self._columns)),
+        )
 
     def row_headers(self) -> Sequence[str]:
         """List of row header names"""
@@ -60,21 +122,3 @@ class WellGrid:
     def get_column(self, column: str) -> Wells:
         """Get an individual column"""
         return self._grid.columns.get(column, [])
-
-    @staticmethod
-    def _create_row_column(wells: Wells) -> Grid:
-        """
-        Creates a dict of lists of Wells. Which way the labware is segmented
-        determines whether this is a dict of rows or dict of columns. If group
-        is 1, then it will collect wells that have the same alphabetic prefix
-        and therefore are considered to be in the same row. If group is 2, it
-        will collect wells that have the same numeric postfix and therefore
-        are considered to be in the same column.
-        """
-        columns = defaultdict(list)
-        rows = defaultdict(list)
-        for well in wells:
-            rows[well.get_row_name()].append(well)
-            columns[well.get_column_name()].append(well)
-        # copy to a non-default-dict
-        return Grid(columns=dict(columns), rows=dict(rows))
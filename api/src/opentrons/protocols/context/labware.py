@@ -87,6 +87,11 @@ class AbstractLabware(DeckItem):
     def get_wells_by_name(self) -> Dict[str, WellImplementation]:
         ...
 
+    @abstractmethod
+    def get_well(self, name: str) -> WellImplementation:
+        """Get one well by name, raising KeyError if there is no such well."""
+        ...
+
     @abstractmethod
     def get_geometry(self) -> AbstractLabwareGeometry:
         ...
@@ -1,4 +1,6 @@
-from typing import List, Dict, Optional
+import copy
+import functools
+from typing import List, Dict, Optional, Sequence, Tuple
 
 from opentrons.calibration_storage import helpers
 from opentrons.protocols.geometry.labware_geometry import LabwareGeometry
@@ -6,7 +8,7 @@ from opentrons.protocols.geometry.well_geometry import WellGeometry
 from opentrons.protocols.context.labware import AbstractLabware
 from opentrons.protocols.api_support.tip_tracker import TipTracker
 from opentrons.protocols.context.well import WellImplementation
-from opentrons.protocols.api_support.well_grid import WellGrid
+from opentrons.protocols.api_support.well_grid import WellGrid, WellLayout
 from opentrons.types import Point, Location
 from opentrons_shared_data.labware.dev_types import LabwareParameters, LabwareDefinition
 
@@ -50,14 +52,18 @@ class LabwareImplementation(AbstractLabware):
         self._definition = definition
 
         self._geometry = LabwareGeometry(definition, parent)
-        # flatten list of list of well names.
-        self._ordering = [well for col in definition["ordering"] for well in col]
-        self._wells: List[WellImplementation] = []
-        self._well_name_grid = WellGrid(wells=self._wells)
-        self._tip_tracker = TipTracker(columns=self._well_name_grid.get_columns())
+        self._ordering, self._well_indices, self._well_layout = _get_well_layout(
+            tuple(tuple(col) for col in definition["ordering"])
+        )
+
+        # Wells, and the grid and tip tracker made of them, are built when
+        # first needed; a labware often only has a few of its wells used.
+        self._wells: List[Optional[WellImplementation]] = []
+        self._all_wells: Optional[List[WellImplementation]] = None
+        self._well_name_grid: Optional[WellGrid] = None
+        self._tip_tracker: Optional[TipTracker] = None
 
         self._calibrated_offset = Point(0, 0, 0)
-        # Will cause building of the wells
         self.set_calibration(self._calibrated_offset)
 
     def get_uri(self) -> str:
@@ -91,9 +97,10 @@ class LabwareImplementation(AbstractLabware):
             z=self._geometry.offset.z + delta.z,
         )
         # The wells must be rebuilt
-        self._wells = self._build_wells()
-        self._well_name_grid = WellGrid(wells=self._wells)
-        self._tip_tracker = TipTracker(columns=self._well_name_grid.get_columns())
+        self._wells = [None] * len(self._ordering)
+        self._all_wells = None
+        self._well_name_grid = None
+        self._tip_tracker = None
 
     def get_calibrated_offset(self) -> Point:
         return self._calibrated_offset
@@ -105,24 +112,41 @@ class LabwareImplementation(AbstractLabware):
         return self._parameters["tipLength"]
 
     def set_tip_length(self, length: float):
+        # The definition may be shared with other labware, so change a copy.
+        self._parameters = copy.copy(self._parameters)
         self._parameters["tipLength"] = length
+        self._definition = copy.copy(self._definition)
+        self._definition["parameters"] = self._parameters
 
     def reset_tips(self) -> None:
         if self.is_tiprack():
+            # Wells that haven't been built yet will have tips when they are.
             for well in self._wells:
-                well.set_has_tip(True)
+                if well is not None:
+                    well.set_has_tip(True)
 
     def get_tip_tracker(self) -> TipTracker:
+        if self._tip_tracker is None:
+            self._tip_tracker = TipTracker(columns=self.get_well_grid().get_columns())
         return self._tip_tracker
 
     def get_well_grid(self) -> WellGrid:
+        if self._well_name_grid is None:
+            self._well_name_grid = WellGrid(
+                wells=self.get_wells(), layout=self._well_layout
+            )
         return self._well_name_grid
 
     def get_wells(self) -> List[WellImplementation]:
-        return self._wells
+        if self._all_wells is None:
+            self._all_wells = [self._get_well(i) for i in range(len(self._wells))]
+        return self._all_wells
 
     def get_wells_by_name(self) -> Dict[str, WellImplementation]:
-        return {well.get_name(): well for well in self._wells}
+        return {well.get_name(): well for well in self.get_wells()}
+
+    def get_well(self, name: str) -> WellImplementation:
+        return self._get_well(self._well_indices[name])
 
     def get_geometry(self) -> LabwareGeometry:
         return self._geometry
@@ -139,17 +163,33 @@ class LabwareImplementation(AbstractLabware):
     def load_name(self) -> str:
         return self._parameters["loadName"]
 
-    def _build_wells(self) -> List[WellImplementation]:
-        return [
-            WellImplementation(
+    def _get_well(self, index: int) -> WellImplementation:
+        well = self._wells[index]
+        if well is None:
+            name = self._ordering[index]
+            well = self._wells[index] = WellImplementation(
                 well_geometry=WellGeometry(
-                    well_props=self._well_definition[well],
+                    well_props=self._well_definition[name],
                     parent_point=self._calibrated_offset,
                     parent_object=self,
                 ),
-                display_name="{} of {}".format(well, self._display_name),
+                display_name="{} of {}".format(name, self._display_name),
                 has_tip=self.is_tiprack(),
-                name=well,
+                name=name,
             )
-            for well in self._ordering
-        ]
+        return well
+
+
+@functools.lru_cache(maxsize=64)
+def _get_well_layout(
+    ordering: Tuple[Tuple[str, ...], ...]
+) -> Tuple[Sequence[str], Dict[str, int], WellLayout]:
+    """Get the well names in order, their indices, and their layout.
+
+    These only depend on the definition's well ordering, so they are shared
+    by every labware with the same definition.
+    """
+    # flatten list of list of well names.
+    names = [well for col in ordering for well in col]
+    indices = {name: index for index, name in enumerate(names)}
+    return names, indices, WellLayout.from_names(names)
@@ -10,6 +10,15 @@ class WellImplementation:
 
     pattern = re.compile(WELL_NAME_PATTERN, re.X)
 
+    __slots__ = (
+        "_display_name",
+        "_has_tip",
+        "_name",
+        "_row_name",
+        "_column_name",
+        "_geometry",
+    )
+
     def __init__(
         self, well_geometry: WellGeometry, display_name: str, has_tip: bool, name: str
     ):
@@ -6,6 +6,7 @@ This module provides things like :py:class:`ModuleGeometry` and
 objects on the deck (as opposed to calling commands on them, which is handled
 by :py:mod:`.module_contexts`)
 """
+import copy
 import functools
 import logging
 import re
@@ -299,7 +300,8 @@ class ThermocyclerGeometry(ModuleGeometry):
     # NOTE: this func is unused until "semi" configuration
     def labware_accessor(self, labware: Labware) -> Labware:
         # Block first three columns from being accessed
-        definition = labware._implementation.get_definition()
+        # Copy the definition, which may be shared with other labware.
+        definition = copy.copy(labware._implementation.get_definition())
         definition["ordering"] = definition["ordering"][2::]
         return Labware(
             implementation=LabwareImplementation(definition, super().location),
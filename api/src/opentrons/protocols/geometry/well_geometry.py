@@ -15,6 +15,18 @@ if TYPE_CHECKING:
 
 
 class WellGeometry:
+    __slots__ = (
+        "_position",
+        "_parent",
+        "_length",
+        "_width",
+        "_diameter",
+        "_x_size",
+        "_y_size",
+        "_max_volume",
+        "_depth",
+    )
+
     def __init__(
         self,
         well_props: WellDefinition,
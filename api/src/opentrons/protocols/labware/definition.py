@@ -2,10 +2,11 @@ import logging
 import json
 import os
 import shutil
+import threading
 from dataclasses import dataclass
 
 from pathlib import Path
-from typing import Any, AnyStr, List, Dict, Union
+from typing import Any, AnyStr, List, Dict, Optional, Sequence, Tuple, Union
 
 import jsonschema  # type: ignore
 
@@ -26,6 +27,130 @@ from opentrons_shared_data.labware.dev_types import LabwareDefinition
 
 MODULE_LOG = logging.getLogger(__name__)
 
+# Versions are kept as they appear in file names.
+_DefinitionKey = Tuple[str, str, str]
+
+
+class _LabwareDefinitionRegistry:
+    """An index of the labware definitions on disk.
+
+    The first lookup scans the standard and custom definition directories
+    once for every ``(namespace, load_name, version)``. Definitions are
+    then read from disk the first time they're asked for, and the same
+    object is returned on every later lookup, so callers must not modify
+    the definitions they get.
+
+    The index must be invalidated when definitions are added or removed.
+    If a lookup misses, the directories are scanned again before giving
+    up, in case a definition was added some other way.
+    """
+
+    def __init__(self, standard_defs_path: Path, user_defs_path: Path) -> None:
+        self._standard_defs_path = standard_defs_path
+        self._user_defs_path = user_defs_path
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[_DefinitionKey, Path]] = None
+        self._load_names: List[str] = []
+        self._definitions: Dict[_DefinitionKey, LabwareDefinition] = {}
+
+    def get(
+        self, load_name: str, namespaces: Sequence[str], version: int
+    ) -> LabwareDefinition:
+        """Get a definition from the first of ``namespaces`` that has it.
+
+        :raises FileNotFoundError: If none of the namespaces have it.
+        """
+        with self._lock:
+            key = self._find(load_name, namespaces, version)
+            if key is None:
+                self._index = None
+                key = self._find(load_name, namespaces, version)
+            if key is None:
+                raise FileNotFoundError(
+                    f"No labware definition for {load_name} v{version} "
+                    f"in namespaces {list(namespaces)}"
+                )
+
+            try:
+                return self._definitions[key]
+            except KeyError:
+                pass
+
+            with open(self._get_index()[key], "rb") as f:
+                labware_def: LabwareDefinition = json.loads(f.read().decode("utf-8"))
+            self._definitions[key] = labware_def
+            return labware_def
+
+    def get_load_names(self) -> List[str]:
+        """Get the name of every standard and custom labware directory."""
+        with self._lock:
+            self._get_index()
+            return list(self._load_names)
+
+    def invalidate(self) -> None:
+        """Forget the index and every loaded definition."""
+        with self._lock:
+            self._index = None
+            self._load_names = []
+            self._definitions.clear()
+
+    def _find(
+        self, load_name: str, namespaces: Sequence[str], version: int
+    ) -> Optional[_DefinitionKey]:
+        index = self._get_index()
+        for namespace in namespaces:
+            key = (namespace, load_name, str(version))
+            if key in index:
+                return key
+        return None
+
+    def _get_index(self) -> Dict[_DefinitionKey, Path]:
+        if self._index is None:
+            index: Dict[_DefinitionKey, Path] = {}
+            load_names: List[str] = []
+            self._scan(self._standard_defs_path, OPENTRONS_NAMESPACE, index, load_names)
+            if self._user_defs_path.is_dir():
+                with os.scandir(self._user_defs_path) as namespaces:
+                    for namespace in namespaces:
+                        if not namespace.is_dir():
+                            continue
+                        # Opentrons definitions are only ever read from
+                        # shared data, so don't index custom copies of them.
+                        self._scan(
+                            Path(namespace.path),
+                            namespace.name,
+                            index if namespace.name != OPENTRONS_NAMESPACE else {},
+                            load_names,
+                        )
+            self._index = index
+            self._load_names = load_names
+        return self._index
+
+    @staticmethod
+    def _scan(
+        path: Path,
+        namespace: str,
+        index: Dict[_DefinitionKey, Path],
+        load_names: List[str],
+    ) -> None:
+        with os.scandir(path) as labware_dirs:
+            for labware_dir in labware_dirs:
+                if not labware_dir.is_dir():
+                    continue
+                load_names.append(labware_dir.name)
+                with os.scandir(labware_dir.path) as def_files:
+                    for def_file in def_files:
+                        version, ext = os.path.splitext(def_file.name)
+                        if ext == ".json":
+                            key = (namespace, labware_dir.name, version)
+                            index[key] = Path(def_file.path)
+
+
+_registry = _LabwareDefinitionRegistry(
+    standard_defs_path=get_shared_data_root() / STANDARD_DEFS_PATH,
+    user_defs_path=USER_DEFS_PATH,
+)
+
 
 def get_labware_definition(
     load_name: str,
@@ -73,20 +198,7 @@ def get_all_labware_definitions() -> List[str]:
         name_space + version existing on the robot
     """
     labware_list = ModifiedList()
-
-    def _check_for_subdirectories(path):
-        with os.scandir(path) as top_path:
-            for sub_dir in top_path:
-                if sub_dir.is_dir():
-                    labware_list.append(sub_dir.name)
-
-    # check for standard labware
-    _check_for_subdirectories(get_shared_data_root() / STANDARD_DEFS_PATH)
-
-    # check for custom labware
-    for namespace in os.scandir(USER_DEFS_PATH):
-        _check_for_subdirectories(namespace)
-
+    labware_list.extend(_registry.get_load_names())
     return labware_list
 
 
@@ -130,6 +242,7 @@ def save_definition(
     Path(def_path).parent.mkdir(parents=True, exist_ok=True)
     with open(def_path, "w") as f:
         json.dump(labware_def, f)
+    _registry.invalidate()
 
 
 def verify_definition(
@@ -161,6 +274,7 @@ def delete_all_custom_labware() -> None:
     """Delete all custom labware"""
     if USER_DEFS_PATH.is_dir():
         shutil.rmtree(USER_DEFS_PATH)
+    _registry.invalidate()
 
 
 def save_calibration(labware: AbstractLabware, delta: Point) -> None:
@@ -243,32 +357,25 @@ def _get_standard_labware_definition(
         """
 
     if namespace is None:
-        for fallback_namespace in [OPENTRONS_NAMESPACE, CUSTOM_NAMESPACE]:
-            try:
-                return _get_standard_labware_definition(
-                    load_name, fallback_namespace, checked_version
-                )
-            except FileNotFoundError:
-                pass
-
-        raise FileNotFoundError(
-            error_msg_string.format(load_name, checked_version, OPENTRONS_NAMESPACE)
-        )
+        try:
+            return _registry.get(
+                load_name, [OPENTRONS_NAMESPACE, CUSTOM_NAMESPACE], checked_version
+            )
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                error_msg_string.format(load_name, checked_version, OPENTRONS_NAMESPACE)
+            )
 
     namespace = namespace.lower()
-    def_path = _get_path_to_labware(load_name, namespace, checked_version)
 
     try:
-        with open(def_path, "rb") as f:
-            labware_def = json.loads(f.read().decode("utf-8"))
+        return _registry.get(load_name, [namespace], checked_version)
     except FileNotFoundError:
         raise FileNotFoundError(
             f'Labware "{load_name}" not found with version {checked_version} '
             f'in namespace "{namespace}".'
         )
 
-    return labware_def
-
 
 def _get_parent_identifier(labware: AbstractLabware) -> str:
     """
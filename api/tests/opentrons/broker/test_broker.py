@@ -74,3 +74,19 @@ def test_add_listener() -> None:
     fake_obj.method_a(0, "2")
 
     assert calls == expected, "No calls expected after unsubscribe()"
+
+
+def test_subscriber_count() -> None:
+    broker = FakeClass().broker
+
+    def on_notify(message: CommandMessage) -> None:
+        pass
+
+    assert broker.subscriber_count("command") == 0
+
+    unsubscribe = broker.subscribe("command", on_notify)
+    broker.subscribe("command", on_notify)
+    assert broker.subscriber_count("command") == 1
+
+    unsubscribe()
+    assert broker.subscriber_count("command") == 0
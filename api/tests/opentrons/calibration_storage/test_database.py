@@ -0,0 +1,221 @@
+"""Tests for the calibration database."""
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from opentrons import config
+from opentrons.calibration_storage import (
+    delete,
+    file_operators as io,
+    get,
+    migration,
+    modify,
+)
+from opentrons.calibration_storage.database import (
+    CalibrationDatabase,
+    CalibrationKind,
+    get_database,
+)
+from opentrons.types import Mount, Point
+from opentrons.util.helpers import utc_now
+
+
+def test_import_calibration_files(ot_config_tempdir: Path) -> None:
+    """It should import calibrations from the legacy files once."""
+    last_modified = utc_now()
+    offset_dir = config.get_opentrons_path("labware_calibration_offsets_dir_v2")
+    io.save_to_file(
+        offset_dir / "index.json",
+        {
+            "version": 1,
+            "data": {"lw_hash": {"uri": "a/b/1", "slot": "lw_hash", "module": {}}},
+        },
+    )
+    io.save_to_file(
+        offset_dir / "lw_hash.json",
+        {"default": {"offset": [1, 2, 3], "lastModified": last_modified}},
+    )
+    io.save_to_file(
+        config.get_tip_length_cal_path() / "pip_1.json",
+        {"tr_hash": {"tipLength": 50.0, "lastModified": last_modified}},
+    )
+    pipette_dir = config.get_opentrons_path("pipette_calibration_dir") / "right"
+    pipette_dir.mkdir(parents=True)
+    io.save_to_file(
+        pipette_dir / "pip_2.json",
+        {
+            "offset": [4, 5, 6],
+            "tiprack": "tr_hash",
+            "uri": "a/b/1",
+            "last_modified": last_modified,
+        },
+    )
+    (pipette_dir / "pip_3.json").write_text("{")
+
+    [labware_offset] = get.get_all_calibrations()
+    assert labware_offset.labware_id == "lw_hash"
+    assert labware_offset.calibration.offset.value == [1, 2, 3]
+
+    [tip_length] = get.get_all_tip_length_calibrations()
+    assert tip_length.pipette == "pip_1"
+    assert tip_length.tip_length == 50.0
+    assert tip_length.last_modified == last_modified
+
+    pipette_offset = get.get_pipette_offset("pip_2", Mount.RIGHT)
+    assert pipette_offset is not None
+    assert pipette_offset.offset == [4, 5, 6]
+    assert get.get_pipette_offset("pip_3", Mount.RIGHT) is None
+
+    # Files written after the import are ignored.
+    io.save_to_file(
+        config.get_tip_length_cal_path() / "pip_4.json",
+        {"tr_hash": {"tipLength": 50.0, "lastModified": last_modified}},
+    )
+    assert len(get.get_all_tip_length_calibrations()) == 1
+
+
+def test_import_skips_corrupt_offset_index(ot_config_tempdir: Path) -> None:
+    """It should import the other calibrations if the offset index is corrupt."""
+    offset_dir = config.get_opentrons_path("labware_calibration_offsets_dir_v2")
+    offset_dir.mkdir(parents=True, exist_ok=True)
+    (offset_dir / "index.json").write_text("{")
+    io.save_to_file(
+        config.get_tip_length_cal_path() / "pip_1.json",
+        {"tr_hash": {"tipLength": 50.0, "lastModified": utc_now()}},
+    )
+
+    assert get.get_all_calibrations() == []
+    assert len(get.get_all_tip_length_calibrations()) == 1
+
+
+def test_import_retried_after_failure(
+    ot_config_tempdir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It should try the import again if it fails."""
+    io.save_to_file(
+        config.get_tip_length_cal_path() / "pip_1.json",
+        {"tr_hash": {"tipLength": 50.0, "lastModified": utc_now()}},
+    )
+    import_calibration_files = migration.import_calibration_files
+
+    def _fail(database: CalibrationDatabase) -> None:
+        raise OSError("oh no")
+
+    monkeypatch.setattr(migration, "import_calibration_files", _fail)
+    with pytest.raises(OSError):
+        get_database()
+
+    monkeypatch.setattr(migration, "import_calibration_files", import_calibration_files)
+    assert len(get.get_all_tip_length_calibrations()) == 1
+
+
+def test_get_returns_copies(tmp_path: Path) -> None:
+    """It should return data that can be changed without changing the cache."""
+    subject = CalibrationDatabase(tmp_path / "calibrations.db")
+    subject.save(CalibrationKind.GRIPPER_OFFSET, "grip_1", {"offset": [1, 2, 3]})
+
+    data = subject.get(CalibrationKind.GRIPPER_OFFSET, "grip_1")
+    assert data == {"offset": [1, 2, 3]}
+    data["offset"].append(4)
+
+    assert subject.get(CalibrationKind.GRIPPER_OFFSET, "grip_1") == {
+        "offset": [1, 2, 3]
+    }
+
+    all_data = subject.get_all(CalibrationKind.GRIPPER_OFFSET)
+    all_data["grip_1"]["offset"].clear()
+    all_data["grip_2"] = {}
+
+    assert subject.get_all(CalibrationKind.GRIPPER_OFFSET) == {
+        "grip_1": {"offset": [1, 2, 3]}
+    }
+
+
+def test_get_all_in_order_saved(tmp_path: Path) -> None:
+    """It should list calibrations in the order they were first saved."""
+    subject = CalibrationDatabase(tmp_path / "calibrations.db")
+    subject.save(CalibrationKind.TIP_LENGTH, "pip_2", {"version": 1})
+    subject.save(CalibrationKind.TIP_LENGTH, "pip_1", {"version": 1})
+    subject.save(CalibrationKind.TIP_LENGTH, "pip_2", {"version": 2})
+    subject.save(CalibrationKind.GRIPPER_OFFSET, "grip_1", {"version": 1})
+
+    assert subject.get_all(CalibrationKind.TIP_LENGTH) == {
+        "pip_2": {"version": 2},
+        "pip_1": {"version": 1},
+    }
+
+    assert subject.delete(CalibrationKind.TIP_LENGTH, "pip_2")
+    assert not subject.delete(CalibrationKind.TIP_LENGTH, "pip_2")
+    assert subject.get_all(CalibrationKind.TIP_LENGTH) == {"pip_1": {"version": 1}}
+
+    subject.clear(CalibrationKind.TIP_LENGTH)
+    assert subject.get_all(CalibrationKind.TIP_LENGTH) == {}
+    assert subject.get(CalibrationKind.GRIPPER_OFFSET, "grip_1") == {"version": 1}
+
+
+def test_cache_invalidated_by_other_process(tmp_path: Path) -> None:
+    """It should see calibrations that other connections save."""
+    subject = CalibrationDatabase(tmp_path / "calibrations.db")
+    other = CalibrationDatabase(tmp_path / "calibrations.db")
+
+    assert subject.get(CalibrationKind.GRIPPER_OFFSET, "grip_1") is None
+
+    other.save(CalibrationKind.GRIPPER_OFFSET, "grip_1", {"offset": [1, 2, 3]})
+    assert subject.get(CalibrationKind.GRIPPER_OFFSET, "grip_1") == {
+        "offset": [1, 2, 3]
+    }
+
+    other.delete(CalibrationKind.GRIPPER_OFFSET, "grip_1")
+    assert subject.get(CalibrationKind.GRIPPER_OFFSET, "grip_1") is None
+
+
+def test_database_follows_config(ot_config_tempdir: Path) -> None:
+    """It should open the database at the configured path."""
+    assert get_database().path == config.get_opentrons_path("calibration_database_file")
+    assert get_database() is get_database()
+
+
+def test_legacy_files_kept_in_sync(ot_config_tempdir: Path) -> None:
+    """It should write calibrations to their legacy files for older software."""
+    tip_length_dir = config.get_tip_length_cal_path()
+    pipette_dir = config.get_opentrons_path("pipette_calibration_dir")
+    tip_length: Any = {"tipLength": 50.0, "lastModified": utc_now()}
+
+    modify.save_tip_length_calibration(
+        "pip_1", {"tr_1": tip_length, "tr_2": tip_length}
+    )
+    modify.save_pipette_calibration(
+        Point(1, 2, 3), "pip_1", Mount.LEFT, "tr_1", "a/b/1"
+    )
+
+    assert io.read_cal_file(str(tip_length_dir / "pip_1.json")).keys() == {
+        "tr_1",
+        "tr_2",
+    }
+    assert io.read_cal_file(str(tip_length_dir / "index.json")) == {
+        "tr_1": ["pip_1"],
+        "tr_2": ["pip_1"],
+    }
+    pipette_offset = io.read_cal_file(str(pipette_dir / "left" / "pip_1.json"))
+    assert pipette_offset["offset"] == [1, 2, 3]
+    assert io.read_cal_file(str(pipette_dir / "index.json")) == {"left": ["pip_1"]}
+
+    delete.delete_tip_length_calibration("tr_1", "pip_1")
+    assert io.read_cal_file(str(tip_length_dir / "pip_1.json")).keys() == {"tr_2"}
+    assert io.read_cal_file(str(tip_length_dir / "index.json")) == {
+        "tr_1": [],
+        "tr_2": ["pip_1"],
+    }
+
+    delete.delete_tip_length_calibration("tr_2", "pip_1")
+    delete.delete_pipette_offset_file("pip_1", Mount.LEFT)
+    assert not (tip_length_dir / "pip_1.json").exists()
+    assert io.read_cal_file(str(tip_length_dir / "index.json")) == {
+        "tr_1": [],
+        "tr_2": [],
+    }
+    assert not (pipette_dir / "left" / "pip_1.json").exists()
+    assert io.read_cal_file(str(pipette_dir / "index.json")) == {"left": []}
+    assert get.get_all_tip_length_calibrations() == []
+    assert get.get_pipette_offset("pip_1", Mount.LEFT) is None
@@ -0,0 +1 @@
+"""Tests for the opentrons.cli module."""
@@ -0,0 +1,188 @@
+"""Tests for the `opentrons analyze` command."""
+import importlib
+import json
+import os
+import textwrap
+from pathlib import Path
+from typing import Sequence
+
+from click.testing import CliRunner
+from mock import patch
+
+from opentrons_shared_data.labware import load_definition
+
+from opentrons.cli import main
+from opentrons.cli.analyze import BatchAnalyzeResult, _analyze_batch_item
+
+# The module, rather than the command that `opentrons.cli` exports as `analyze`.
+analyze = importlib.import_module("opentrons.cli.analyze")
+
+
+def _write_python_protocol(path: Path, protocol_name: str) -> Path:
+    path.write_text(
+        textwrap.dedent(
+            f"""
+            metadata = {{"protocolName": "{protocol_name}", "apiLevel": "2.11"}}
+
+            def run(ctx):
+                ctx.load_labware("opentrons_96_tiprack_300ul", 1)
+            """
+        )
+    )
+    return path
+
+
+def test_batch(tmp_path: Path) -> None:
+    """It should write one result per protocol as JSON Lines."""
+    protocols = tmp_path / "protocols"
+    protocols.mkdir()
+    _write_python_protocol(protocols / "first.py", "First")
+    _write_python_protocol(protocols / "second.py", "Second")
+    (protocols / "notes.txt").write_text("not a protocol")
+    output = tmp_path / "results.jsonl"
+
+    result = CliRunner(mix_stderr=False).invoke(
+        main,
+        [
+            "analyze",
+            "--batch",
+            "--jobs",
+            "2",
+            str(protocols),
+            "--json-output",
+            str(output),
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Analyzed 2 protocols (0 failed)" in result.stderr
+
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    assert sorted(
+        (Path(line["file"]).name, line["result"]["metadata"]["protocolName"])
+        for line in lines
+    ) == [("first.py", "First"), ("second.py", "Second")]
+    assert all("error" not in line for line in lines)
+
+
+def test_batch_skips_labware(tmp_path: Path) -> None:
+    """It should not analyze labware definitions in a directory as protocols."""
+    protocols = tmp_path / "protocols"
+    protocols.mkdir()
+    _write_python_protocol(protocols / "protocol.py", "Protocol")
+    (protocols / "labware.json").write_text(
+        json.dumps(load_definition("opentrons_96_tiprack_300ul", 1))
+    )
+    output = tmp_path / "results.jsonl"
+
+    result = CliRunner(mix_stderr=False).invoke(
+        main,
+        ["analyze", "--batch", str(protocols), "--json-output", str(output)],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Analyzed 1 protocols (0 failed)" in result.stderr
+    [line] = [json.loads(line) for line in output.read_text().splitlines()]
+    assert Path(line["file"]).name == "protocol.py"
+
+
+def test_batch_error(tmp_path: Path) -> None:
+    """It should report protocols that can't be analyzed and keep going."""
+    good = _write_python_protocol(tmp_path / "good.py", "Good")
+    bad = tmp_path / "bad.py"
+    bad.write_text("this isn't a protocol")
+    output = tmp_path / "results.jsonl"
+
+    result = CliRunner(mix_stderr=False).invoke(
+        main,
+        ["analyze", "--batch", str(good), str(bad), "--json-output", str(output)],
+    )
+
+    assert result.exit_code != 0
+    assert "1 of 2 protocols could not be analyzed" in result.stderr
+
+    lines = {
+        Path(line["file"]).name: line
+        for line in map(json.loads, output.read_text().splitlines())
+    }
+    assert "result" in lines["good.py"]
+    assert "ProtocolFilesInvalidError" in lines["bad.py"]["error"]
+
+
+def test_batch_analysis_errors(tmp_path: Path) -> None:
+    """It should count protocols whose analysis has errors as failures."""
+    protocol = tmp_path / "protocol.py"
+    protocol.write_text(
+        textwrap.dedent(
+            """
+            metadata = {"apiLevel": "2.11"}
+
+            def run(ctx):
+                ctx.load_labware("not_a_real_labware", 1)
+            """
+        )
+    )
+    output = tmp_path / "results.jsonl"
+
+    result = CliRunner(mix_stderr=False).invoke(
+        main, ["analyze", "--batch", str(protocol), "--json-output", str(output)]
+    )
+
+    assert result.exit_code != 0
+    assert "Analyzed 1 protocols (1 failed)" in result.stderr
+    [line] = map(json.loads, output.read_text().splitlines())
+    assert "error" not in line
+    assert line["result"]["errors"]
+
+
+def _crash_on_crash_py(
+    protocol_file: Path, labware_files: Sequence[Path]
+) -> BatchAnalyzeResult:
+    if protocol_file.name == "crash.py":
+        os._exit(1)
+    return _analyze_batch_item(protocol_file, labware_files)
+
+
+def test_batch_worker_crash(tmp_path: Path) -> None:
+    """It should report a protocol whose worker died and write the rest."""
+    good = _write_python_protocol(tmp_path / "good.py", "Good")
+    crash = _write_python_protocol(tmp_path / "crash.py", "Crash")
+    output = tmp_path / "results.jsonl"
+
+    with patch.object(analyze, "_analyze_batch_item", _crash_on_crash_py):
+        result = CliRunner(mix_stderr=False).invoke(
+            main,
+            [
+                "analyze",
+                "--batch",
+                "--jobs",
+                "1",
+                str(good),
+                str(crash),
+                "--json-output",
+                str(output),
+            ],
+        )
+
+    # It exits with an error of its own, rather than the pool's.
+    assert result.exit_code == 1, result.exception
+    assert "of 2 protocols could not be analyzed" in result.stderr
+    lines = {
+        Path(line["file"]).name: line
+        for line in map(json.loads, output.read_text().splitlines())
+    }
+    assert set(lines) == {"good.py", "crash.py"}
+    assert "BrokenProcessPool" in lines["crash.py"]["error"]
+    assert "elapsedSeconds" not in lines["crash.py"]
+
+
+def test_jobs_requires_batch(tmp_path: Path) -> None:
+    """It should reject batch options without --batch."""
+    protocol = _write_python_protocol(tmp_path / "protocol.py", "Protocol")
+
+    result = CliRunner().invoke(
+        main,
+        ["analyze", "--jobs", "2", str(protocol), "--json-output", "out.json"],
+    )
+
+    assert result.exit_code == 2
@@ -1,6 +1,7 @@
 """Tests for opentrons.commands.publisher."""
 from __future__ import annotations
 
+import logging
 import pytest
 from decoy import Decoy, matchers
 from typing import Any, Dict, cast
@@ -11,8 +12,21 @@ from opentrons.commands.publisher import CommandPublisher, publish, publish_cont
 
 @pytest.fixture
 def broker(decoy: Decoy) -> Broker:
-    """Return a mocked out Broker."""
-    return decoy.mock(cls=Broker)
+    """Return a mocked out Broker with a subscriber."""
+    broker = decoy.mock(cls=Broker)
+    decoy.when(broker.subscriber_count("command")).then_return(1)
+    return broker
+
+
+@pytest.fixture
+def unsubscribed_broker(decoy: Decoy) -> Broker:
+    """Return a mocked out Broker with no subscribers and logging disabled."""
+    broker = decoy.mock(cls=Broker)
+    logger = decoy.mock(cls=logging.Logger)
+    decoy.when(broker.subscriber_count("command")).then_return(0)
+    decoy.when(broker.logger).then_return(logger)
+    decoy.when(logger.isEnabledFor(logging.INFO)).then_return(False)
+    return broker
 
 
 def test_publish_decorator(decoy: Decoy, broker: Broker) -> None:
@@ -317,3 +331,84 @@ def test_publish_context_with_error(decoy: Decoy, broker: Broker) -> None:
     )
 
     assert before_message_id.value == after_message_id.value
+
+
+def test_publish_decorator_without_subscribers(
+    decoy: Decoy, unsubscribed_broker: Broker
+) -> None:
+    """It should not build or publish messages if nothing would see them."""
+    _act = decoy.mock()
+    _get_command_payload = decoy.mock()
+
+    class _Subject(CommandPublisher):
+        @publish(command=_get_command_payload)
+        def act(self, foo: str, bar: int) -> int:
+            _act()
+            return 42
+
+    subject = _Subject(broker=unsubscribed_broker)
+
+    assert subject.act("hello", 42) == 42
+    decoy.verify(_act())
+    decoy.verify(_get_command_payload(foo="hello", bar=42), times=0)
+    decoy.verify(
+        unsubscribed_broker.publish(topic="command", message=matchers.Anything()),
+        times=0,
+    )
+
+
+def test_publish_context_without_subscribers(
+    decoy: Decoy, unsubscribed_broker: Broker
+) -> None:
+    """It should not create or publish messages if nothing would see them."""
+    create_command = decoy.mock()
+
+    with pytest.raises(RuntimeError, match="oh no"):
+        with publish_context(broker=unsubscribed_broker, command=create_command):
+            raise RuntimeError("oh no")
+
+    decoy.verify(create_command(), times=0)
+    decoy.verify(
+        unsubscribed_broker.publish(topic="command", message=matchers.Anything()),
+        times=0,
+    )
+
+
+def test_publish_context_creates_command(decoy: Decoy, broker: Broker) -> None:
+    """It should create the command with a function if given one."""
+    command = cast(
+        CommandDict,
+        {"name": "some_command", "payload": {"foo": "hello", "bar": 42}},
+    )
+
+    with publish_context(broker=broker, command=lambda: command):
+        pass
+
+    decoy.verify(
+        broker.publish(
+            topic="command",
+            message=cast(
+                CommandMessage,
+                {
+                    "$": "before",
+                    "id": matchers.IsA(str),
+                    "name": "some_command",
+                    "payload": {"foo": "hello", "bar": 42},
+                    "error": None,
+                },
+            ),
+        ),
+        broker.publish(
+            topic="command",
+            message=cast(
+                CommandMessage,
+                {
+                    "$": "after",
+                    "id": matchers.IsA(str),
+                    "name": "some_command",
+                    "payload": {"foo": "hello", "bar": 42},
+                    "error": None,
+                },
+            ),
+        ),
+    )
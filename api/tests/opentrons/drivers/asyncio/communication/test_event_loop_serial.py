@@ -0,0 +1,117 @@
+import asyncio
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Iterator, Tuple
+
+import pytest
+from mock import MagicMock
+from serial import Serial, SerialException  # type: ignore[import]
+from opentrons.drivers.asyncio.communication import EventLoopSerial
+
+
+@pytest.fixture
+def sockets() -> Iterator[Tuple[socket.socket, socket.socket]]:
+    """A connected pair of sockets: the port's, and the device's."""
+    port_socket, device_socket = socket.socketpair()
+    yield port_socket, device_socket
+    port_socket.close()
+    device_socket.close()
+
+
+@pytest.fixture
+def device(sockets: Tuple[socket.socket, socket.socket]) -> socket.socket:
+    """The device's end of the connection."""
+    return sockets[1]
+
+
+@pytest.fixture
+def mock_serial(sockets: Tuple[socket.socket, socket.socket]) -> MagicMock:
+    """Mock Serial, reading and writing the port's socket."""
+    m = MagicMock(spec=Serial)
+    m.is_open = True
+    m.timeout = 1
+    m.write_timeout = None
+    m.fileno.return_value = sockets[0].fileno()
+    return m
+
+
+@pytest.fixture
+async def subject(mock_serial: MagicMock) -> AsyncIterator[EventLoopSerial]:
+    """The test subject."""
+    subject = EventLoopSerial(
+        serial=mock_serial,
+        executor=ThreadPoolExecutor(),
+        loop=asyncio.get_running_loop(),
+        reset_buffer_before_write=False,
+    )
+    yield subject
+    await subject.close()
+
+
+async def test_read_until(subject: EventLoopSerial, device: socket.socket) -> None:
+    """It should read up to and including the match, keeping the rest."""
+    device.sendall(b"first ok\r\nsecond ok\r\n")
+
+    assert await subject.read_until(b"ok\r\n") == b"first ok\r\n"
+    assert await subject.read_until(b"ok\r\n") == b"second ok\r\n"
+
+
+async def test_read_until_split_match(
+    subject: EventLoopSerial, device: socket.socket
+) -> None:
+    """It should find a match that arrives over several reads."""
+    loop = asyncio.get_running_loop()
+    loop.call_later(0.01, device.sendall, b"response o")
+    loop.call_later(0.02, device.sendall, b"k\r")
+    loop.call_later(0.03, device.sendall, b"\n")
+
+    assert await subject.read_until(b"ok\r\n") == b"response ok\r\n"
+
+
+async def test_read_until_timeout(
+    subject: EventLoopSerial, device: socket.socket
+) -> None:
+    """It should return what it has read if the match doesn't arrive in time."""
+    device.sendall(b"partial")
+
+    async with subject.timeout_override("timeout", 0.05):
+        assert await subject.read_until(b"ok\r\n") == b"partial"
+
+
+async def test_read_until_disconnected(
+    subject: EventLoopSerial, device: socket.socket
+) -> None:
+    """It should raise if the device goes away."""
+    device.close()
+
+    with pytest.raises(SerialException):
+        await subject.read_until(b"ok\r\n")
+
+
+async def test_write(subject: EventLoopSerial, device: socket.socket) -> None:
+    """It should write all the data."""
+    data = b"x" * 1_000_000
+    received = bytearray()
+
+    async def _receive() -> None:
+        loop = asyncio.get_running_loop()
+        while len(received) < len(data):
+            received.extend(await loop.sock_recv(device, 65536))
+
+    device.setblocking(False)
+    await asyncio.gather(subject.write(data), _receive())
+    assert received == data
+
+
+async def test_reset_input_buffer(
+    subject: EventLoopSerial, mock_serial: MagicMock, device: socket.socket
+) -> None:
+    """It should drop buffered data and reset the underlying serial port."""
+    device.sendall(b"stale ok\r\n")
+    await asyncio.sleep(0.01)
+
+    subject.reset_input_buffer()
+    device.sendall(b"fresh ok\r\n")
+
+    assert await subject.read_until(b"ok\r\n") == b"fresh ok\r\n"
+    mock_serial.reset_input_buffer.assert_called_once()
@@ -1,9 +1,10 @@
 from typing import Type
 
 import pytest
-from mock import AsyncMock, call
+from mock import AsyncMock, call, patch
 
 from opentrons.drivers.asyncio.communication.async_serial import AsyncSerial
+from opentrons.drivers.asyncio.communication.event_loop_serial import EventLoopSerial
 from opentrons.drivers.asyncio.communication.serial_connection import SerialConnection
 from opentrons.drivers.asyncio.communication import (
     NoResponse,
@@ -125,3 +126,24 @@ async def test_on_retry(mock_serial_port: AsyncMock, subject: SerialConnection)
 
     mock_serial_port.close.assert_called_once()
     mock_serial_port.open.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    argnames=["event_loop_io", "serial_class"],
+    argvalues=[[False, AsyncSerial], [True, EventLoopSerial]],
+)
+async def test_create_serial_class(
+    event_loop_io: bool, serial_class: Type[AsyncSerial]
+) -> None:
+    """It should create the serial port transport that was asked for."""
+    with patch.object(serial_class, "create", new_callable=AsyncMock) as create:
+        create.return_value = AsyncMock(spec=serial_class)
+        await SerialConnection.create(
+            port="port",
+            baud_rate=115200,
+            timeout=1,
+            ack="ack",
+            event_loop_io=event_loop_io,
+        )
+
+    create.assert_called_once()
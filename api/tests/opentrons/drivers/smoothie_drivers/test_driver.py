@@ -464,3 +464,150 @@ async def test_auto_recover_on_error(
             await smoothie.move({"X": 10})
         mocked_send.assert_called_once()
         mocked_home.assert_called_once()
+
+
+async def test_pipelined_moves(
+    smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should stream moves and only wait when leaving pipelined mode."""
+    async with smoothie.pipelined():
+        await smoothie.move({"X": 10, "Y": 20})
+        await smoothie.move({"X": 30, "Y": 40})
+        await smoothie.move({"X": 50, "Y": 60})
+    cmds = [
+        c.kwargs["command"].build().strip()
+        for c in mock_connection.send_command.call_args_list
+    ]
+    assert cmds == [
+        "M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.1 G4 P0.005 G0 X10 Y20",
+        # currents are unchanged, so they aren't resent
+        "G0 X30 Y40",
+        "G0 X50 Y60",
+        "M400",
+    ]
+
+
+async def test_pipelined_current_change(
+    smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should wait for streamed moves before changing currents."""
+    smoothie.set_active_current({"B": 0.5})
+    async with smoothie.pipelined():
+        await smoothie.move({"X": 10, "Y": 20})
+        await smoothie.move({"B": 5})
+    cmds = [
+        c.kwargs["command"].build().strip()
+        for c in mock_connection.send_command.call_args_list
+    ]
+    assert cmds == [
+        "M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.1 G4 P0.005 G0 X10 Y20",
+        "M400 M907 A0.1 B0.5 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005 G0 B5.3 G0 B5",
+        # the plunger dwells when leaving pipelined mode
+        "M400 M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005",
+        "M400",
+    ]
+
+
+async def test_pipelined_defers_dwelling(
+    smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should not wait for streamed moves just to lower currents."""
+    async with smoothie.pipelined():
+        await smoothie.move({"X": 10, "Y": 20})
+        await smoothie.move({"Y": 50})
+        await smoothie.move({"Y": 30})
+    cmds = [
+        c.kwargs["command"].build().strip()
+        for c in mock_connection.send_command.call_args_list
+    ]
+    assert cmds == [
+        "M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.1 G4 P0.005 G0 X10 Y20",
+        # X keeps its current while only Y moves
+        "G0 Y50",
+        "G0 Y30",
+        "M400 M907 A0.1 B0.05 C0.05 X0.3 Y1.25 Z0.1 G4 P0.005",
+        "M400",
+    ]
+
+
+async def test_pipelined_ack_timeout(
+    smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should wait longer for acks the more motion is queued."""
+    async with smoothie.pipelined():
+        await smoothie.move({"X": 100})
+        await smoothie.move({"X": 200})
+        await smoothie.move({"X": 201})
+    timeouts = [
+        c.kwargs["timeout"] for c in mock_connection.send_command.call_args_list
+    ]
+    assert constants.DEFAULT_ACK_TIMEOUT < timeouts[0] < timeouts[1] < timeouts[2]
+
+
+async def test_current_unknown_after_failure(
+    smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should resend currents after a current change that may have failed."""
+    with patch.object(smoothie, "_send_command_unsynchronized"), patch.object(
+        smoothie, "_reset_from_error"
+    ), patch.object(smoothie, "home"):
+        mocked_send = cast(AsyncMock, smoothie._send_command_unsynchronized)
+        mocked_send.side_effect = [SmoothieError("M907", "error: Uh oh"), ""]
+        with pytest.raises(SmoothieError):
+            await smoothie.move({"X": 10})
+        assert smoothie._streamed_current is None
+    async with smoothie.pipelined():
+        await smoothie.move({"X": 20})
+    cmds = [
+        c.kwargs["command"].build().strip()
+        for c in mock_connection.send_command.call_args_list
+    ]
+    assert cmds == [
+        "M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4 P0.005 G0 X20",
+        "M400",
+    ]
+
+
+async def test_pipelined_sync_point(
+    smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should wait for streamed moves before a command that isn't streamed."""
+    async with smoothie.pipelined():
+        await smoothie.move({"X": 10, "Y": 20})
+        await smoothie.disengage_axis("Z")
+        await smoothie.move({"X": 30, "Y": 40})
+    cmds = [
+        c.kwargs["command"].build().strip()
+        for c in mock_connection.send_command.call_args_list
+    ]
+    assert cmds == [
+        "M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.1 G4 P0.005 G0 X10 Y20",
+        "M400 M18 Z",
+        "M400",
+        "G0 X30 Y40",
+        "M400",
+    ]
+
+
+async def test_pipelined_error_homes(
+    smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """Errors reported after a streamed move should recover as if from the move."""
+    with patch.object(smoothie, "_send_command_unsynchronized"), patch.object(
+        smoothie, "_reset_from_error"
+    ), patch.object(smoothie, "home"):
+        mocked_home = cast(AsyncMock, smoothie.home)
+        mocked_send = cast(AsyncMock, smoothie._send_command_unsynchronized)
+        mocked_send.side_effect = [
+            "",
+            SmoothieError("Alarm: Hard limit +X", "M18 Z"),
+            # leaving pipelined mode resends the currents and waits
+            "",
+            "",
+        ]
+        with pytest.raises(SmoothieError):
+            async with smoothie.pipelined():
+                await smoothie.move({"X": 10})
+                await smoothie.disengage_axis("Z")
+        mocked_home.assert_called_once_with("X")
+        assert not smoothie._motion_pending
@@ -1,5 +1,6 @@
 import pytest
 from itertools import chain
+from pathlib import Path
 from mock import AsyncMock, patch
 from opentrons.hardware_control.backends.ot3controller import OT3Controller
 from opentrons.hardware_control.backends.ot3utils import (
@@ -10,7 +11,8 @@ from opentrons.config.types import OT3Config
 from opentrons.config.robot_configs import build_config_ot3
 from opentrons_hardware.firmware_bindings.constants import NodeId, PipetteName
 from opentrons_hardware.drivers.can_bus.abstract_driver import AbstractCanDriver
-from opentrons.hardware_control.types import OT3Axis, OT3Mount
+from opentrons.hardware_control.types import OT3Axis, OT3Mount, OT3SubSystem
+from opentrons_hardware.firmware_update import UpdateProgress, UpdateState
 
 from opentrons_hardware.hardware_control.motion import (
     MoveType,
@@ -333,3 +335,33 @@ async def test_gripper_grip(controller: OT3Controller, mock_move_group_run):
         step = move_group[0][NodeId.gripper_g]
         assert step.stop_condition == MoveStopCondition.none
         assert step.move_type == MoveType.linear
+
+
+async def test_update_firmwares(controller: OT3Controller):
+    """It should update every subsystem at once, reporting by subsystem."""
+    progress = []
+
+    async def fake_run_updates(progress_callback, **kwargs):
+        progress_callback(
+            NodeId.pipette_left,
+            UpdateProgress(state=UpdateState.done, downloaded_bytes=10, total_bytes=10),
+        )
+
+    with patch(
+        "opentrons.hardware_control.backends.ot3controller.firmware_update.run_updates",
+        side_effect=fake_run_updates,
+    ) as mock_run_updates:
+        await controller.update_firmwares(
+            {
+                OT3SubSystem.head: "head.hex",
+                OT3SubSystem.pipette_left: "pipette.hex",
+            },
+            lambda sub_system, p: progress.append((sub_system, p.state)),
+        )
+
+    assert mock_run_updates.call_args.kwargs["hex_files"] == {
+        NodeId.head: Path("head.hex"),
+        NodeId.pipette_left: Path("pipette.hex"),
+    }
+    assert mock_run_updates.call_args.kwargs["chunk_retry_count"] == 0
+    assert progress == [(OT3SubSystem.pipette_left, UpdateState.done)]
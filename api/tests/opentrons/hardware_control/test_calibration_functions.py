@@ -2,6 +2,11 @@ import numpy as np
 
 from opentrons import config
 from opentrons.calibration_storage import file_operators as io
+from opentrons.calibration_storage.database import (
+    CalibrationKind,
+    DECK_CALIBRATION_KEY,
+    get_database,
+)
 from opentrons.hardware_control import robot_calibration
 from opentrons.util.helpers import utc_now
 from opentrons.types import Mount
@@ -22,9 +27,6 @@ def test_migrate_affine_xy_to_attitude():
 
 
 def test_save_calibration(ot_config_tempdir):
-    pathway = (
-        config.get_opentrons_path("robot_calibration_dir") / "deck_calibration.json"
-    )
     pip_id = "fakePip"
     lw_hash = "fakeHash"
     e = ((1, 1, 3), (2, 2, 2), (1, 2, 1))
@@ -39,7 +41,8 @@ def test_save_calibration(ot_config_tempdir):
         "status": {"markedBad": False},
     }
     robot_calibration.save_attitude_matrix(e, a, pip_id, lw_hash)
-    data = io.read_cal_file(pathway)
+    data = get_database().get(CalibrationKind.DECK_CALIBRATION, DECK_CALIBRATION_KEY)
+    assert data is not None
     data["last_modified"] = None
     assert data == expected
 
@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+from opentrons.hardware_control.motion_utilities import (
+    deck_from_machine,
+    deck_points_from_machine_points,
+    deck_transform,
+    machine_from_deck,
+    machine_points_from_deck_points,
+)
+from opentrons.hardware_control.types import Axis, OT3Axis
+from opentrons.types import Point
+from opentrons.util import linal
+
+ATTITUDE = [[1.001, 0.002, 0.0], [-0.003, 0.998, 0.0], [0.0, 0.0, 1.0]]
+OFFSET = Point(10, 20, 30)
+
+
+def test_transform_points_matches_linal() -> None:
+    """It should transform arrays of points like linal does one at a time."""
+    deck_points = np.random.default_rng(0).uniform(-500, 500, size=(100, 3))
+
+    machine_points = machine_points_from_deck_points(deck_points, ATTITUDE, OFFSET)
+    expected = [
+        np.add(linal.apply_transform(ATTITUDE, tuple(point)), OFFSET)
+        for point in deck_points
+    ]
+    assert machine_points == pytest.approx(np.array(expected))
+
+    assert deck_points_from_machine_points(
+        machine_points, ATTITUDE, OFFSET
+    ) == pytest.approx(deck_points)
+
+
+def test_transform_mount_offset() -> None:
+    """It should subtract a mount offset before applying the attitude."""
+    mount_offset = Point(-34, 0, 0)
+    subject = deck_transform(ATTITUDE, OFFSET, mount_offset)
+    deck_point = np.array([100.0, 200.0, 50.0])
+
+    expected = deck_transform(ATTITUDE, OFFSET).machine_from_deck(
+        deck_point - mount_offset
+    )
+    assert subject.machine_from_deck(deck_point) == pytest.approx(expected)
+    assert subject.deck_from_machine(expected) == pytest.approx(deck_point)
+
+
+def test_deck_transform_cached() -> None:
+    """It should reuse transforms, which can't be modified."""
+    subject = deck_transform(ATTITUDE, OFFSET)
+    assert deck_transform(np.array(ATTITUDE), OFFSET) is subject
+
+    with pytest.raises(ValueError):
+        subject.attitude[0, 0] = 2
+
+
+def test_machine_from_deck() -> None:
+    """It should transform the gantry axes and pass the others through."""
+    machine_pos = machine_from_deck(
+        {Axis.X: 100, Axis.Y: 200, Axis.A: 50, Axis.C: 3}, ATTITUDE, OFFSET
+    )
+    expected = np.add(linal.apply_transform(ATTITUDE, (100, 200, 50)), OFFSET)
+    assert list(machine_pos.keys()) == [Axis.C, Axis.X, Axis.Y, Axis.A]
+    assert [machine_pos[ax] for ax in (Axis.X, Axis.Y, Axis.A)] == pytest.approx(
+        expected
+    )
+    assert machine_pos[Axis.C] == 3
+
+    with pytest.raises(ValueError):
+        machine_from_deck({Axis.X: 100, Axis.Y: 200}, ATTITUDE, OFFSET)
+
+
+def test_deck_from_machine_round_trip() -> None:
+    """It should transform each mount's position."""
+    deck_pos = {
+        OT3Axis.X: 100.0,
+        OT3Axis.Y: 200.0,
+        OT3Axis.Z_L: 50.0,
+        OT3Axis.Z_R: 60.0,
+        OT3Axis.Z_G: 70.0,
+        OT3Axis.P_L: 4.0,
+    }
+    machine_pos = {
+        **machine_from_deck(
+            {ax: deck_pos[ax] for ax in (OT3Axis.X, OT3Axis.Y, OT3Axis.Z_L)},
+            np.identity(3),
+            OFFSET,
+        ),
+        OT3Axis.Z_R: 90.0,
+        OT3Axis.Z_G: 100.0,
+        OT3Axis.P_L: 4.0,
+    }
+
+    assert deck_from_machine(machine_pos, np.identity(3), OFFSET) == pytest.approx(
+        deck_pos
+    )
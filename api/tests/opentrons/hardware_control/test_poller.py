@@ -3,7 +3,13 @@ from typing import Callable
 
 import pytest
 from mock import AsyncMock, MagicMock
-from opentrons.hardware_control.poller import Poller, Listener, Reader, WaitableListener
+from opentrons.hardware_control.poller import (
+    Poller,
+    PollScheduler,
+    Listener,
+    Reader,
+    WaitableListener,
+)
 
 
 async def test_poll_error() -> None:
@@ -54,6 +60,87 @@ async def test_await_poll_error() -> None:
     await p.stop_and_wait()
 
 
+async def test_active_interval() -> None:
+    """It should poll at the active interval while results are active."""
+    reader = AsyncMock(spec=Reader)
+    reader.read.side_effect = [1, 1, 1, 0, 0]
+    listener = WaitableListener[int]()
+
+    p: Poller[int] = Poller(
+        interval_seconds=10,
+        active_interval_seconds=0.01,
+        is_active=lambda result: result == 1,
+        reader=reader,
+        listener=listener,
+    )
+    assert [await listener.wait_next_poll() for _ in range(4)] == [1, 1, 1, 0]
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(listener.wait_next_poll(), timeout=0.1)
+    await p.stop_and_wait()
+
+    assert reader.read.call_count == 4
+
+
+async def test_poll_now() -> None:
+    """It should poll right away when asked to."""
+    reader = AsyncMock(spec=Reader)
+    reader.read.side_effect = [1, 2]
+    listener = WaitableListener[int]()
+
+    p: Poller[int] = Poller(interval_seconds=10, reader=reader, listener=listener)
+    assert await listener.wait_next_poll() == 1
+
+    p.poll_now()
+    assert await asyncio.wait_for(listener.wait_next_poll(), timeout=1) == 2
+    await p.stop_and_wait()
+
+
+async def test_poll_now_during_poll() -> None:
+    """It should poll again after a poll that was under way when asked."""
+    reader = AsyncMock(spec=Reader)
+    reader.read.side_effect = [1, 2]
+    listener = WaitableListener[int]()
+
+    p: Poller[int] = Poller(interval_seconds=10, reader=reader, listener=listener)
+    # The first poll has started but not finished.
+    p.poll_now()
+    assert await listener.wait_next_poll() == 1
+    assert await asyncio.wait_for(listener.wait_next_poll(), timeout=1) == 2
+    await p.stop_and_wait()
+
+
+async def test_scheduler_coalesces_polls() -> None:
+    """It should run polls that are due close together on one wake-up."""
+    loop = asyncio.get_running_loop()
+    scheduler = PollScheduler(coalesce_seconds=0.05)
+    start = loop.time()
+    calls = []
+
+    scheduler.schedule(lambda: calls.append(("first", loop.time())), 0.02)
+    scheduler.schedule(lambda: calls.append(("second", loop.time())), 0.05)
+    scheduler.schedule(lambda: calls.append(("third", loop.time())), 0.2)
+    await asyncio.sleep(0.1)
+
+    assert [name for name, _ in calls] == ["first", "second"]
+    # The second ran early, along with the first.
+    assert calls[1][1] < start + 0.05
+
+    await asyncio.sleep(0.2)
+    assert [name for name, _ in calls] == ["first", "second", "third"]
+
+
+async def test_scheduler_cancel() -> None:
+    """It should not run a canceled callback."""
+    scheduler = PollScheduler()
+    callback = MagicMock()
+
+    scheduler.schedule(callback, 0.01)
+    scheduler.cancel(callback)
+    await asyncio.sleep(0.05)
+
+    callback.assert_not_called()
+
+
 @pytest.mark.parametrize(
     argnames=["func"],
     argvalues=[
@@ -15,7 +15,8 @@ from opentrons.protocols.labware.definition import _get_parent_identifier
 from opentrons_shared_data import load_shared_data
 from opentrons_shared_data.labware.dev_types import WellDefinition
 
-from opentrons.calibration_storage import helpers, get, delete, file_operators
+from opentrons.calibration_storage import helpers, get, delete
+from opentrons.calibration_storage.database import CalibrationKind, get_database
 from opentrons.types import Point, Location
 from opentrons.hardware_control.modules.types import ModuleType, MagneticModuleModel
 from opentrons.protocols.api_support.types import APIVersion
@@ -298,6 +299,55 @@ def test_back_compat(corning_96_wellplate_360ul_flat) -> None:
     assert repr(w11[1][2]) == well_c3_name
 
 
+def test_wells_built_lazily(corning_96_wellplate_360ul_flat) -> None:
+    lw = corning_96_wellplate_360ul_flat
+    impl = lw._implementation
+
+    assert lw["B2"].well_name == "B2"
+    assert [well.get_name() for well in impl._wells if well is not None] == ["B2"]
+    assert lw["B2"] is lw.wells()[9]
+    assert lw.rows()[1][1] is lw["B2"]
+    assert lw.columns_by_name()["2"][1] is lw["B2"]
+
+    with pytest.raises(KeyError):
+        lw["Z99"]
+
+
+def test_wells_rebuilt_after_calibration(corning_96_wellplate_360ul_flat) -> None:
+    lw = corning_96_wellplate_360ul_flat
+    well = lw["A1"]
+
+    lw.set_calibration(Point(1, 2, 3))
+
+    assert lw["A1"] is not well
+    assert lw["A1"].top().point == well.top().point + Point(1, 2, 3)
+    assert lw.wells()[0] is lw["A1"]
+
+
+def test_well_layout_shared(corning_96_wellplate_360ul_flat_def) -> None:
+    impls = [
+        LabwareImplementation(
+            definition=corning_96_wellplate_360ul_flat_def,
+            parent=Location(Point(0, 0, 0), f"Slot {slot}"),
+        )
+        for slot in (1, 2)
+    ]
+
+    assert impls[0]._well_layout is impls[1]._well_layout
+    assert impls[0].get_well_grid().get_columns()[0][0] is impls[0].get_well("A1")
+    assert impls[1].get_well_grid().get_columns()[0][0] is impls[1].get_well("A1")
+
+
+def test_reset_tips_lazily(opentrons_96_tiprack_300ul) -> None:
+    tiprack = opentrons_96_tiprack_300ul
+    tiprack.use_tips(tiprack["A1"], num_channels=8)
+    assert not tiprack["H1"].has_tip
+
+    tiprack.reset()
+
+    assert all(well.has_tip for well in tiprack.wells())
+
+
 def test_well_parent(corning_96_wellplate_360ul_flat) -> None:
     lw = corning_96_wellplate_360ul_flat
     parent = Location(Point(7, 8, 9), lw)
@@ -641,9 +691,8 @@ def test_add_index_file(labware_name, labware_offset_tempdir) -> None:
     full_id = f"{labware_hash}{str_parent}"
     blob = {"uri": f"{lw_uri}", "slot": full_id, "module": mod_dict}
 
-    lw_path = labware_offset_tempdir / "index.json"
-    info = file_operators.read_cal_file(lw_path)
-    assert info["data"][full_id] == blob
+    info = get_database().get(CalibrationKind.LABWARE_OFFSET_INDEX, full_id)
+    assert info == blob
 
 
 def test_delete_one_calibration(set_up_index_file) -> None:
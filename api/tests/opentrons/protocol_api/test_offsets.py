@@ -15,6 +15,7 @@ from opentrons.calibration_storage import (
     encoder_decoder as ed,
     types as cs_types,
 )
+from opentrons.calibration_storage.database import CalibrationKind, get_database
 from opentrons.protocol_api import labware
 from opentrons.protocols.context.protocol_api.labware import LabwareImplementation
 from opentrons.protocols.labware.definition import _get_labware_path
@@ -61,12 +62,6 @@ minimalLabwareDef = {
 }
 
 
-def path(calibration_name):
-    return config.get_opentrons_path(
-        "labware_calibration_offsets_dir_v2"
-    ) / "{}.json".format(calibration_name)
-
-
 def tlc_path(pip_id):
     return config.get_tip_length_cal_path() / "{}.json".format(pip_id)
 
@@ -81,15 +76,9 @@ def mock_hash_labware(labware_def):
 
 @pytest.fixture
 def clear_calibration(monkeypatch):
-    try:
-        os.remove(path({MOCK_HASH}))
-    except FileNotFoundError:
-        pass
+    delete.clear_calibrations()
     yield
-    try:
-        os.remove(path(MOCK_HASH))
-    except FileNotFoundError:
-        pass
+    delete.clear_calibrations()
 
 
 @pytest.fixture
@@ -107,20 +96,14 @@ def clear_custom_tiprack_dir(monkeypatch):
 
 @pytest.fixture
 def clear_tlc_calibration(monkeypatch):
-    try:
-        os.remove(tlc_path(PIPETTE_ID))
-    except FileNotFoundError:
-        pass
+    delete.clear_tip_length_calibration()
     yield
-    try:
-        os.remove(tlc_path("index"))
-    except FileNotFoundError:
-        pass
+    delete.clear_tip_length_calibration()
 
 
 def test_save_labware_calibration(monkeypatch, clear_calibration):
-    # Test the save calibration file
-    assert not os.path.exists(path(MOCK_HASH))
+    # Test the save calibration
+    assert get_database().get(CalibrationKind.LABWARE_OFFSET, MOCK_HASH) is None
 
     impl = LabwareImplementation(minimalLabwareDef, Location(Point(0, 0, 0), "deck"))  # type: ignore[arg-type]
     impl.set_calibration = Mock()  # type: ignore[assignment]
@@ -131,7 +114,7 @@ def test_save_labware_calibration(monkeypatch, clear_calibration):
 
     point = Point(1, 1, 1)
     labware.save_calibration(test_labware, point)
-    assert os.path.exists(path(MOCK_HASH))
+    assert get_database().get(CalibrationKind.LABWARE_OFFSET, MOCK_HASH) is not None
     impl.set_calibration.assert_called_once_with(delta=point)
 
 
@@ -169,52 +152,35 @@ def test_create_tip_length_calibration_data(monkeypatch, clear_custom_tiprack_di
 
 
 def test_save_tip_length_calibration_data(monkeypatch, clear_tlc_calibration):
-    assert not os.path.exists(tlc_path(PIPETTE_ID))
+    assert get_database().get(CalibrationKind.TIP_LENGTH, PIPETTE_ID) is None
 
     test_data = {MOCK_HASH: {"tipLength": 22.0, "lastModified": 1}}
     modify.save_tip_length_calibration(PIPETTE_ID, test_data)  # type: ignore[arg-type]
-    assert os.path.exists(tlc_path(PIPETTE_ID))
-    # test an index file is also created
-    assert os.path.exists(tlc_path("index"))
-
-
-def test_add_index_file(monkeypatch, clear_tlc_calibration):
-    def get_result():
-        with open(tlc_path("index")) as f:
-            result = json.load(f)
-        return result
-
-    modify._append_to_index_tip_length_file("pip_1", "lw_1")
-    assert get_result() == {"lw_1": ["pip_1"]}
-
-    modify._append_to_index_tip_length_file("pip_2", "lw_1")
-    assert get_result() == {"lw_1": ["pip_1", "pip_2"]}
+    assert get_database().get(CalibrationKind.TIP_LENGTH, PIPETTE_ID) == test_data
 
-    modify._append_to_index_tip_length_file("pip_2", "lw_2")
-    assert get_result() == {"lw_1": ["pip_1", "pip_2"], "lw_2": ["pip_2"]}
+    other_data = {"other_hash": {"tipLength": 23.0, "lastModified": 1}}
+    modify.save_tip_length_calibration(PIPETTE_ID, other_data)  # type: ignore[arg-type]
+    assert get_database().get(CalibrationKind.TIP_LENGTH, PIPETTE_ID) == {
+        **test_data,
+        **other_data,
+    }
 
 
 def test_load_nonexistent_tip_length_calibration_data(
     monkeypatch, clear_tlc_calibration
 ):
-    assert not os.path.exists(tlc_path(PIPETTE_ID))
-
-    # file does not exist (FileNotFoundError)
+    # pipette has no tip length calibrations
     with pytest.raises(cs_types.TipLengthCalNotFound):
         get.load_tip_length_calibration(PIPETTE_ID, minimalLabwareDef)  # type: ignore[arg-type]
 
-    # labware hash not in calibration file (KeyError)
-    calpath = config.get_tip_length_cal_path()
-    with open(calpath / f"{PIPETTE_ID}.json", "w") as offset_file:
-        test_offset = {"FAKE_HASH": {"tipLength": 22.0, "lastModified": 1}}
-        json.dump(test_offset, offset_file)
+    # labware hash not in the pipette's tip length calibrations
+    test_offset = {"FAKE_HASH": {"tipLength": 22.0, "lastModified": 1}}
+    modify.save_tip_length_calibration(PIPETTE_ID, test_offset)  # type: ignore[arg-type]
     with pytest.raises(cs_types.TipLengthCalNotFound):
         get.load_tip_length_calibration(PIPETTE_ID, minimalLabwareDef)  # type: ignore[arg-type]
 
 
 def test_load_tip_length_calibration_data(monkeypatch, clear_tlc_calibration):
-    assert not os.path.exists(tlc_path(PIPETTE_ID))
-
     monkeypatch.setattr(helpers, "hash_labware_def", mock_hash_labware)
 
     tip_length = 22.0
@@ -234,13 +200,17 @@ def test_load_tip_length_calibration_data(monkeypatch, clear_tlc_calibration):
 
 
 def test_clear_tip_length_calibration_data(monkeypatch):
+    test_offset = {MOCK_HASH: {"tipLength": 22.0, "lastModified": 1}}
+    modify.save_tip_length_calibration(PIPETTE_ID, test_offset)  # type: ignore[arg-type]
+
+    # Files left over from before the calibration database should go, too.
     calpath = config.get_tip_length_cal_path()
     with open(calpath / f"{PIPETTE_ID}.json", "w") as offset_file:
-        test_offset = {MOCK_HASH: {"tipLength": 22.0, "lastModified": 1}}
         json.dump(test_offset, offset_file)
 
-    assert len([f for f in os.listdir(calpath) if f.endswith(".json")]) > 0
+    assert get.get_all_tip_length_calibrations() != []
     delete.clear_tip_length_calibration()
+    assert get.get_all_tip_length_calibrations() == []
     assert len([f for f in os.listdir(calpath) if f.endswith(".json")]) == 0
 
 
@@ -275,8 +245,7 @@ def test_schema_shape(monkeypatch, clear_calibration):
     monkeypatch.setattr(modify, "_helper_offset_data_format", fake_helper_data)
 
     labware.save_calibration(test_labware, Point(1, 1, 1))
-    with open(path(MOCK_HASH)) as f:
-        result = json.load(f, cls=ed.DateTimeDecoder)
+    result = get_database().get(CalibrationKind.LABWARE_OFFSET, MOCK_HASH)
     assert result == expected
 
 
@@ -25,6 +25,22 @@ async def test_labware_data_gets_standard_definition() -> None:
     assert result == LabwareDefinition.parse_obj(expected)
 
 
+async def test_labware_data_reuses_definition() -> None:
+    """It should parse each definition once."""
+    first = await LabwareDataProvider().get_labware_definition(
+        load_name="opentrons_96_tiprack_300ul",
+        namespace="opentrons",
+        version=1,
+    )
+    second = await LabwareDataProvider().get_labware_definition(
+        load_name="opentrons_96_tiprack_300ul",
+        namespace="opentrons",
+        version=1,
+    )
+
+    assert second is first
+
+
 async def test_labware_hash_match() -> None:
     """Labware dict vs Pydantic model hashing should match.
 
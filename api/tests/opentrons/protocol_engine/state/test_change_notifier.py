@@ -54,3 +54,22 @@ async def test_multiple_subscribers(count: int) -> None:
     await asyncio.gather(task_1, task_2, task_3)
 
     assert results == [1, 2, 3]
+
+
+async def test_topic_subscribers() -> None:
+    """Test that subscribers to topics are only notified of those topics."""
+    subject = ChangeNotifier()
+    result_a = asyncio.create_task(subject.wait(["a"]))
+    result_b = asyncio.create_task(subject.wait(["b"]))
+    result_any = asyncio.create_task(subject.wait())
+    await asyncio.sleep(0)
+
+    subject.notify(["a"])
+    await asyncio.sleep(0)
+
+    assert result_a.done() is True
+    assert result_b.done() is False
+    assert result_any.done() is True
+
+    subject.notify()
+    await result_b
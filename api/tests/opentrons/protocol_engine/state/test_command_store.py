@@ -9,7 +9,14 @@ from opentrons.types import MountType, DeckSlotName
 from opentrons.hardware_control.types import DoorState
 
 from opentrons.protocol_engine import commands, errors
-from opentrons.protocol_engine.types import DeckSlotLocation, PipetteName, WellLocation
+from opentrons.protocol_engine.types import (
+    DeckSlotLocation,
+    LabwareOffsetCreate,
+    LabwareOffsetLocation,
+    LabwareOffsetVector,
+    PipetteName,
+    WellLocation,
+)
 from opentrons.protocol_engine.state import Config
 from opentrons.protocol_engine.state.commands import (
     CommandState,
@@ -23,6 +30,7 @@ from opentrons.protocol_engine.actions import (
     QueueCommandAction,
     UpdateCommandAction,
     FailCommandAction,
+    AddLabwareOffsetAction,
     PlayAction,
     PauseAction,
     PauseSource,
@@ -70,6 +78,8 @@ def test_initial_state(
         all_command_ids=[],
         commands_by_id=OrderedDict(),
         errors_by_id={},
+        last_completed_index=None,
+        failed_protocol_command_id=None,
     )
 
 
@@ -602,6 +612,8 @@ def test_command_store_handles_pause_action(pause_source: PauseSource) -> None:
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
         errors_by_id={},
+        last_completed_index=None,
+        failed_protocol_command_id=None,
     )
 
 
@@ -623,6 +635,8 @@ def test_command_store_handles_play_action(pause_source: PauseSource) -> None:
         commands_by_id=OrderedDict(),
         errors_by_id={},
         run_started_at=datetime(year=2021, month=1, day=1),
+        last_completed_index=None,
+        failed_protocol_command_id=None,
     )
 
 
@@ -645,6 +659,8 @@ def test_command_store_handles_finish_action() -> None:
         commands_by_id=OrderedDict(),
         errors_by_id={},
         run_started_at=datetime(year=2021, month=1, day=1),
+        last_completed_index=None,
+        failed_protocol_command_id=None,
     )
 
 
@@ -677,6 +693,8 @@ def test_command_store_handles_stop_action() -> None:
         commands_by_id=OrderedDict(),
         errors_by_id={},
         run_started_at=datetime(year=2021, month=1, day=1),
+        last_completed_index=None,
+        failed_protocol_command_id=None,
     )
 
 
@@ -698,6 +716,8 @@ def test_command_store_cannot_restart_after_should_stop() -> None:
         commands_by_id=OrderedDict(),
         errors_by_id={},
         run_started_at=None,
+        last_completed_index=None,
+        failed_protocol_command_id=None,
     )
 
 
@@ -729,6 +749,8 @@ def test_command_store_save_started_completed_run_timestamp() -> None:
         commands_by_id=OrderedDict(),
         errors_by_id={},
         run_started_at=start_time,
+        last_completed_index=None,
+        failed_protocol_command_id=None,
     )
 
 
@@ -762,6 +784,8 @@ def test_command_store_saves_unknown_finish_error() -> None:
             )
         },
         run_started_at=None,
+        last_completed_index=None,
+        failed_protocol_command_id=None,
     )
 
 
@@ -785,6 +809,8 @@ def test_command_store_ignores_stop_after_graceful_finish() -> None:
         commands_by_id=OrderedDict(),
         errors_by_id={},
         run_started_at=datetime(year=2021, month=1, day=1),
+        last_completed_index=None,
+        failed_protocol_command_id=None,
     )
 
 
@@ -808,6 +834,8 @@ def test_command_store_ignores_finish_after_non_graceful_stop() -> None:
         commands_by_id=OrderedDict(),
         errors_by_id={},
         run_started_at=datetime(year=2021, month=1, day=1),
+        last_completed_index=None,
+        failed_protocol_command_id=None,
     )
 
 
@@ -853,6 +881,8 @@ def test_command_store_handles_command_failed() -> None:
         },
         errors_by_id={},
         run_started_at=None,
+        last_completed_index=0,
+        failed_protocol_command_id="command-id",
     )
 
 
@@ -874,6 +904,8 @@ def test_handles_hardware_stopped() -> None:
         commands_by_id=OrderedDict(),
         errors_by_id={},
         run_started_at=None,
+        last_completed_index=None,
+        failed_protocol_command_id=None,
     )
 
 
@@ -974,3 +1006,88 @@ def test_command_store_handles_stop_action_with_queued_commands() -> None:
     assert subject.state.queue_status == QueueStatus.PAUSED
 
     assert subject.state.run_result == RunResult.STOPPED
+
+
+def test_command_store_tracks_last_completed_index() -> None:
+    """It should keep track of the last command in the list to have completed."""
+    subject = CommandStore(is_door_open=False, config=Config())
+
+    subject.handle_action(
+        UpdateCommandAction(command=create_running_command(command_id="command-1"))
+    )
+    subject.handle_action(
+        UpdateCommandAction(command=create_queued_command(command_id="command-2"))
+    )
+    assert subject.state.last_completed_index is None
+
+    subject.handle_action(
+        UpdateCommandAction(command=create_succeeded_command(command_id="command-2"))
+    )
+    assert subject.state.last_completed_index == 1
+
+    subject.handle_action(
+        UpdateCommandAction(command=create_succeeded_command(command_id="command-1"))
+    )
+    assert subject.state.last_completed_index == 1
+
+
+def test_command_store_tracks_earliest_failed_protocol_command() -> None:
+    """It should keep track of the first non-setup command with an error."""
+    error = errors.ErrorOccurrence(
+        id="error-id",
+        errorType="ProtocolEngineError",
+        createdAt=datetime(year=2021, month=1, day=1),
+        detail="oh no",
+    )
+    subject = CommandStore(is_door_open=False, config=Config())
+
+    for command_id in ["command-1", "command-2", "command-3"]:
+        subject.handle_action(
+            UpdateCommandAction(command=create_queued_command(command_id=command_id))
+        )
+
+    subject.handle_action(
+        UpdateCommandAction(
+            command=create_failed_command(
+                command_id="command-1",
+                error=error,
+                intent=commands.CommandIntent.SETUP,
+            )
+        )
+    )
+    assert subject.state.failed_protocol_command_id is None
+
+    subject.handle_action(
+        UpdateCommandAction(
+            command=create_failed_command(command_id="command-3", error=error)
+        )
+    )
+    assert subject.state.failed_protocol_command_id == "command-3"
+
+    subject.handle_action(
+        UpdateCommandAction(
+            command=create_failed_command(command_id="command-2", error=error)
+        )
+    )
+    assert subject.state.failed_protocol_command_id == "command-2"
+
+
+def test_command_store_is_changed_by_command_and_run_actions() -> None:
+    """It should report which actions may change command state."""
+    subject = CommandStore(is_door_open=False, config=Config())
+
+    assert subject.get_is_changed_by(PlayAction(requested_at=datetime(2021, 1, 1)))
+    assert subject.get_is_changed_by(
+        UpdateCommandAction(command=create_running_command())
+    )
+    assert not subject.get_is_changed_by(
+        AddLabwareOffsetAction(
+            labware_offset_id="offset-id",
+            created_at=datetime(year=2021, month=1, day=1),
+            request=LabwareOffsetCreate(
+                definitionUri="definition-uri",
+                location=LabwareOffsetLocation(slotName=DeckSlotName.SLOT_1),
+                vector=LabwareOffsetVector(x=1, y=2, z=3),
+            ),
+        )
+    )
@@ -51,6 +51,16 @@ def get_command_view(
         command.id: CommandEntry(index=index, command=command)
         for index, command in enumerate(commands)
     }
+    completed_indices = [
+        index
+        for index, command in enumerate(commands)
+        if command.status in (cmd.CommandStatus.SUCCEEDED, cmd.CommandStatus.FAILED)
+    ]
+    failed_protocol_command_ids = [
+        command.id
+        for command in commands
+        if command.error is not None and command.intent != cmd.CommandIntent.SETUP
+    ]
 
     state = CommandState(
         queue_status=queue_status,
@@ -64,6 +74,8 @@ def get_command_view(
         all_command_ids=all_command_ids,
         commands_by_id=commands_by_id,
         run_started_at=run_started_at,
+        last_completed_index=max(completed_indices, default=None),
+        failed_protocol_command_id=next(iter(failed_protocol_command_ids), None),
     )
 
     return CommandView(state=state)
@@ -24,7 +24,7 @@ from opentrons.protocol_engine.actions import (
 )
 from opentrons.protocol_engine.state.labware import LabwareStore, LabwareState
 
-from .command_fixtures import create_load_labware_command
+from .command_fixtures import create_load_labware_command, create_running_command
 
 
 @pytest.fixture
@@ -162,3 +162,24 @@ def test_handles_add_labware_definition(
     subject.handle_action(AddLabwareDefinitionAction(definition=well_plate_def))
 
     assert subject.state.definitions_by_uri[expected_uri] == well_plate_def
+
+
+def test_is_changed_by_command_results_and_labware_actions(
+    well_plate_def: LabwareDefinition,
+    subject: LabwareStore,
+) -> None:
+    """It should report which actions may change labware state."""
+    load_labware = create_load_labware_command(
+        labware_id="test-labware-id",
+        location=DeckSlotLocation(slotName=DeckSlotName.SLOT_1),
+        definition=well_plate_def,
+        offset_id=None,
+    )
+
+    assert subject.get_is_changed_by(UpdateCommandAction(command=load_labware))
+    assert not subject.get_is_changed_by(
+        UpdateCommandAction(command=create_running_command())
+    )
+    assert subject.get_is_changed_by(
+        AddLabwareDefinitionAction(definition=well_plate_def)
+    )
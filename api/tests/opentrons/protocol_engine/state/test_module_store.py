@@ -35,6 +35,8 @@ from opentrons.protocol_engine.state.module_substates import (
 
 from opentrons.hardware_control.modules.types import LiveData
 
+from .command_fixtures import create_running_command, create_succeeded_command
+
 
 def test_initial_state() -> None:
     """It should initialize the module state."""
@@ -456,3 +458,15 @@ def test_handle_thermocycler_block_temperature_commands(
             target_lid_temperature=None,
         )
     }
+
+
+def test_is_changed_by_command_results() -> None:
+    """It should only report commands with results as changing module state."""
+    subject = ModuleStore()
+
+    assert subject.get_is_changed_by(
+        actions.UpdateCommandAction(command=create_succeeded_command())
+    )
+    assert not subject.get_is_changed_by(
+        actions.UpdateCommandAction(command=create_running_command())
+    )
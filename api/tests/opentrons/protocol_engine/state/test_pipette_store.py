@@ -13,6 +13,7 @@ from opentrons.protocol_engine.state.pipettes import (
 )
 
 from .command_fixtures import (
+    create_running_command,
     create_load_pipette_command,
     create_aspirate_command,
     create_dispense_command,
@@ -316,3 +317,17 @@ def test_tip_commands_update_has_tip(subject: PipetteStore) -> None:
     subject.handle_action(UpdateCommandAction(command=drop_tip_command))
 
     assert not subject.state.attached_tip_labware_by_id
+
+
+def test_is_changed_by_command_results(subject: PipetteStore) -> None:
+    """It should only report commands with results as changing pipette state."""
+    load_pipette = create_load_pipette_command(
+        pipette_id="pipette-id",
+        pipette_name=PipetteName.P300_SINGLE,
+        mount=MountType.LEFT,
+    )
+
+    assert subject.get_is_changed_by(UpdateCommandAction(command=load_pipette))
+    assert not subject.get_is_changed_by(
+        UpdateCommandAction(command=create_running_command())
+    )
@@ -6,8 +6,15 @@ import pytest
 from decoy import Decoy
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV3
-from opentrons.protocol_engine.state import State, StateStore, Config
-from opentrons.protocol_engine.actions import PlayAction
+from opentrons.protocol_engine.state import (
+    State,
+    StateStore,
+    StateTopic,
+    WaitForStats,
+    Config,
+)
+from opentrons.protocol_engine.actions import AddLabwareDefinitionAction, PlayAction
+from opentrons.protocols.models import LabwareDefinition
 from opentrons.protocol_engine.state.change_notifier import ChangeNotifier
 
 
@@ -61,9 +68,20 @@ def test_notify_on_state_change(
     subject: StateStore,
 ) -> None:
     """It should notify state changes when actions are handled."""
-    decoy.verify(change_notifier.notify(), times=0)
+    decoy.verify(change_notifier.notify([StateTopic.COMMANDS]), times=0)
     subject.handle_action(PlayAction(requested_at=datetime(year=2021, month=1, day=1)))
-    decoy.verify(change_notifier.notify(), times=1)
+    decoy.verify(change_notifier.notify([StateTopic.COMMANDS]), times=1)
+
+
+def test_notify_only_changed_topics(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    well_plate_def: LabwareDefinition,
+    subject: StateStore,
+) -> None:
+    """It should only notify the topics of substores that the action may change."""
+    subject.handle_action(AddLabwareDefinitionAction(definition=well_plate_def))
+    decoy.verify(change_notifier.notify([StateTopic.LABWARE]), times=1)
 
 
 async def test_wait_for_state(
@@ -83,7 +101,24 @@ async def test_wait_for_state(
     result = await subject.wait_for(check_condition, "foo", bar="baz")
     assert result == "hello world"
 
-    decoy.verify(await change_notifier.wait(), times=2)
+    decoy.verify(await change_notifier.wait(None), times=2)
+    assert subject.get_wait_for_stats() == WaitForStats(wakeups=2, satisfied=1)
+
+
+async def test_wait_for_state_topics(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should only wait for changes to the given topics."""
+    check_condition: Callable[..., Optional[str]] = decoy.mock()
+
+    decoy.when(check_condition()).then_return(None, "hello world")
+
+    result = await subject.wait_for(check_condition, topics=[StateTopic.COMMANDS])
+    assert result == "hello world"
+
+    decoy.verify(await change_notifier.wait([StateTopic.COMMANDS]), times=1)
 
 
 async def test_wait_for_state_short_circuit(
@@ -99,7 +134,7 @@ async def test_wait_for_state_short_circuit(
     result = await subject.wait_for(check_condition, "foo", bar="baz")
     assert result == "hello world"
 
-    decoy.verify(await change_notifier.wait(), times=0)
+    decoy.verify(await change_notifier.wait(None), times=0)
 
 
 async def test_wait_for_already_true(decoy: Decoy, subject: StateStore) -> None:
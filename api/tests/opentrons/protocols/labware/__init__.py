@@ -0,0 +1 @@
+"""Tests for the opentrons.protocols.labware module."""
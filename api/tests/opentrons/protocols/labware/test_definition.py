@@ -0,0 +1,123 @@
+"""Tests for looking up and saving labware definitions."""
+import json
+from pathlib import Path
+
+import pytest
+
+from opentrons_shared_data import load_shared_data
+from opentrons_shared_data.labware.dev_types import LabwareDefinition
+from opentrons.protocols.labware import definition
+
+
+@pytest.fixture
+def standard_defs_path(tmp_path: Path) -> Path:
+    """A directory with one standard definition in it."""
+    path = tmp_path / "standard"
+    (path / "standard_labware").mkdir(parents=True)
+    (path / "standard_labware" / "1.json").write_text(
+        json.dumps({"namespace": "opentrons", "version": 1})
+    )
+    return path
+
+
+@pytest.fixture
+def user_defs_path(tmp_path: Path) -> Path:
+    """An empty directory of custom definitions."""
+    path = tmp_path / "user"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def registry(
+    standard_defs_path: Path, user_defs_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> definition._LabwareDefinitionRegistry:
+    """A registry of the temporary definitions, used by the module functions."""
+    registry = definition._LabwareDefinitionRegistry(
+        standard_defs_path=standard_defs_path, user_defs_path=user_defs_path
+    )
+    monkeypatch.setattr(definition, "_registry", registry)
+    return registry
+
+
+@pytest.fixture
+def custom_def() -> LabwareDefinition:
+    """A valid custom labware definition."""
+    labware_def: LabwareDefinition = json.loads(
+        load_shared_data("labware/definitions/2/corning_96_wellplate_360ul_flat/1.json")
+    )
+    labware_def["namespace"] = "custom_beta"
+    labware_def["parameters"]["loadName"] = "custom_labware"
+    return labware_def
+
+
+def test_get_definition_memoized(
+    registry: definition._LabwareDefinitionRegistry,
+) -> None:
+    """It should load each definition once and then return the same object."""
+    result = definition.get_labware_definition("standard_labware")
+
+    assert result == {"namespace": "opentrons", "version": 1}
+    assert definition.get_labware_definition("standard_labware", "opentrons") is result
+
+
+def test_get_definition_not_found(
+    registry: definition._LabwareDefinitionRegistry,
+) -> None:
+    """It should raise if there's no such definition."""
+    with pytest.raises(FileNotFoundError, match="Unable to find a labware"):
+        definition.get_labware_definition("standard_labware", version=2)
+
+    with pytest.raises(FileNotFoundError, match='in namespace "custom_beta"'):
+        definition.get_labware_definition("standard_labware", "custom_beta")
+
+
+def test_save_definition_invalidates(
+    registry: definition._LabwareDefinitionRegistry,
+    user_defs_path: Path,
+    custom_def: LabwareDefinition,
+) -> None:
+    """It should find a definition as soon as it's saved."""
+    assert definition.get_all_labware_definitions() == ["standard_labware"]
+
+    definition.save_definition(custom_def, location=user_defs_path)
+
+    assert definition.get_all_labware_definitions() == [
+        "standard_labware",
+        "custom_labware",
+    ]
+    assert definition.get_labware_definition("custom_labware") == custom_def
+
+    custom_def["metadata"]["displayName"] = "Updated"
+    definition.save_definition(custom_def, force=True, location=user_defs_path)
+
+    result = definition.get_labware_definition("custom_labware", "custom_beta", 1)
+    assert result["metadata"]["displayName"] == "Updated"
+
+
+def test_definition_added_externally(
+    registry: definition._LabwareDefinitionRegistry,
+    user_defs_path: Path,
+    custom_def: LabwareDefinition,
+) -> None:
+    """It should look for definitions again when one isn't in its index."""
+    definition.get_labware_definition("standard_labware")
+
+    def_dir = user_defs_path / "custom_beta" / "custom_labware"
+    def_dir.mkdir(parents=True)
+    (def_dir / "1.json").write_text(json.dumps(custom_def))
+
+    assert definition.get_labware_definition("custom_labware") == custom_def
+
+
+def test_custom_opentrons_namespace_ignored(
+    registry: definition._LabwareDefinitionRegistry,
+    user_defs_path: Path,
+) -> None:
+    """It should only get Opentrons definitions from the standard definitions."""
+    def_dir = user_defs_path / "opentrons" / "fake_labware"
+    def_dir.mkdir(parents=True)
+    (def_dir / "1.json").write_text("{}")
+
+    with pytest.raises(FileNotFoundError):
+        definition.get_labware_definition("fake_labware", "opentrons")
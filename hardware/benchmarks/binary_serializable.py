@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Benchmark encoding and decoding of CAN message payloads.
+
+Compares the precompiled `BinarySerializable` codecs against the way
+payloads used to be encoded and decoded, which rebuilt the `struct`
+format string from the dataclass fields and copied every field with
+`dataclasses.astuple` on every message. Also measures decoding a stream
+of back-to-back sensor payloads with `build_all`.
+
+Usage: python -m benchmarks.binary_serializable
+"""
+import struct
+import timeit
+from dataclasses import astuple, fields
+from typing import Callable, List, Type
+
+from opentrons_hardware.firmware_bindings.messages import fields as msg_fields
+from opentrons_hardware.firmware_bindings.messages import payloads
+from opentrons_hardware.firmware_bindings import utils
+
+_ITERATIONS = 100_000
+_STREAM_LENGTH = 1000
+
+
+def _legacy_format_string(cls: Type[utils.BinarySerializable]) -> str:
+    return f"{cls.ENDIAN}{''.join(v.type.FORMAT for v in fields(cls))}"
+
+
+def _legacy_serialize(payload: utils.BinarySerializable) -> bytes:
+    string = _legacy_format_string(type(payload))
+    return struct.pack(string, *[x.value for x in astuple(payload)])
+
+
+def _legacy_build(
+    cls: Type[utils.BinarySerializable], data: bytes
+) -> utils.BinarySerializable:
+    format_string = _legacy_format_string(cls)
+    size = struct.calcsize(format_string)
+    b = struct.unpack(format_string, data[:size])
+    args = {v.name: v.type.build(b[i]) for i, v in enumerate(fields(cls))}
+    return cls(**args)  # type: ignore[call-arg]
+
+
+def _rate(func: Callable[[], object], number: int = _ITERATIONS) -> float:
+    """Get the best rate of calls to `func`, in calls per second."""
+    return number / min(timeit.repeat(func, number=number, repeat=3))
+
+
+def _print_rates(name: str, legacy: float, current: float) -> None:
+    print(
+        f"  {name:<10} {legacy:>12,.0f}/s -> {current:>12,.0f}/s"
+        f"  ({current / legacy:.1f}x)"
+    )
+
+
+def _benchmark_payload(payload: utils.BinarySerializable) -> None:
+    cls = type(payload)
+    data = payload.serialize()
+
+    assert _legacy_serialize(payload) == data
+    assert _legacy_build(cls, data) == cls.build(data) == payload
+
+    print(f"{cls.__name__} ({len(data)} bytes):")
+    _print_rates(
+        "encode",
+        legacy=_rate(lambda: _legacy_serialize(payload)),
+        current=_rate(payload.serialize),
+    )
+    _print_rates(
+        "decode",
+        legacy=_rate(lambda: _legacy_build(cls, data)),
+        current=_rate(lambda: cls.build(data)),
+    )
+
+
+def _benchmark_stream(payload: utils.BinarySerializable) -> None:
+    cls = type(payload)
+    size = cls.get_size()
+    stream = payload.serialize() * _STREAM_LENGTH
+
+    def _decode_legacy() -> List[utils.BinarySerializable]:
+        return [
+            _legacy_build(cls, stream[i : i + size])
+            for i in range(0, len(stream), size)
+        ]
+
+    def _decode_all() -> List[utils.BinarySerializable]:
+        return cls.build_all(stream)
+
+    assert _decode_legacy() == _decode_all()
+
+    print(f"Stream of {_STREAM_LENGTH} {cls.__name__}:")
+    _print_rates(
+        "decode",
+        legacy=_rate(_decode_legacy, number=100) * _STREAM_LENGTH,
+        current=_rate(_decode_all, number=100) * _STREAM_LENGTH,
+    )
+
+
+def main() -> None:
+    """Print encode and decode rates for typical payloads."""
+    sensor_response = payloads.ReadFromSensorResponsePayload(
+        sensor=msg_fields.SensorTypeField(1),
+        sensor_id=msg_fields.SensorIdField(0),
+        sensor_data=utils.Int32Field(123456),
+    )
+
+    _benchmark_payload(
+        payloads.AddLinearMoveRequestPayload(
+            group_id=utils.UInt8Field(0),
+            seq_id=utils.UInt8Field(1),
+            duration=utils.UInt32Field(2000),
+            acceleration=utils.Int32Field(-500),
+            velocity=utils.Int32Field(100_000),
+            request_stop_condition=utils.UInt8Field(0),
+        )
+    )
+    _benchmark_payload(sensor_response)
+    _benchmark_stream(sensor_response)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Benchmark downloading firmware to a simulated bootloader.
+
+Runs the simulated CAN bus from `opentrons_hardware.scripts.sim_socket_can`
+in this process, with a simulated bootloader node on it that acknowledges
+each data message after a delay, like a real node that has to receive the
+frame, write it to flash and send the reply. Downloads the same image with
+`FirmwareUpdateDownloader` sending one chunk at a time, and then with
+larger windows of chunks in flight, and prints the time each takes. The
+bootloader checks the number of messages and crc32 of every download.
+
+The last download drops some data messages on the way to the bootloader,
+to show that the chunks are resent.
+
+Usage: python -m benchmarks.firmware_download [ack_delay_ms]
+"""
+import asyncio
+import binascii
+import io
+import logging
+import random
+import struct
+import sys
+import time
+from typing import Dict, List, Optional, Set, Tuple, cast
+
+from opentrons_hardware.drivers.can_bus.socket_driver import SocketDriver
+from opentrons_hardware.drivers.can_bus import CanMessenger
+from opentrons_hardware.firmware_bindings import (
+    ArbitrationId,
+    ArbitrationIdParts,
+    CanMessage,
+    NodeId,
+)
+from opentrons_hardware.firmware_bindings.constants import ErrorCode, MessageId
+from opentrons_hardware.firmware_bindings.messages import (
+    MessageDefinition,
+    message_definitions,
+    payloads,
+)
+from opentrons_hardware.firmware_bindings.messages.fields import ErrorCodeField
+from opentrons_hardware.firmware_update import (
+    FirmwareUpdateDownloader,
+    HexRecordProcessor,
+)
+from opentrons_hardware.scripts.sim_socket_can import ConnectionHandler
+
+_DEFAULT_ACK_DELAY_MS = 1.0
+_IMAGE_SIZE = 64 * 1024
+_WINDOW_SIZES = (1, 4, 16, 32)
+_DROP_RATE = 0.01
+_ACK_WAIT_SECONDS = 0.05
+_NODE = NodeId.head_bootloader
+
+
+def _hex_file(image: bytes, base_address: int = 0x08000000) -> str:
+    """Write an image as Intel hex records of 16 bytes."""
+
+    def _record(record_type: int, address: int, data: bytes) -> str:
+        line = struct.pack(">BHB", len(data), address, record_type) + data
+        checksum = (-sum(line)) & 0xFF
+        return f":{(line + bytes([checksum])).hex().upper()}\n"
+
+    records = [_record(4, 0, struct.pack(">H", base_address >> 16))]
+    for offset in range(0, len(image), 16):
+        records.append(_record(0, offset, image[offset : offset + 16]))
+    records.append(_record(1, 0, b""))
+    return "".join(records)
+
+
+class _SimulatedBootloader:
+    """A bootloader node that acks data messages after a delay."""
+
+    def __init__(
+        self, driver: SocketDriver, ack_delay: float, drop_rate: float
+    ) -> None:
+        self._driver = driver
+        self._ack_delay = ack_delay
+        self._drop_rate = drop_rate
+        self._random = random.Random(0)
+        self._written: Dict[int, bytes] = {}
+        self._dropped: Set[int] = set()
+        self.received = 0
+        self.completed: Optional[bool] = None
+
+    def reset(self, drop_rate: float) -> None:
+        self._drop_rate = drop_rate
+        self._written.clear()
+        self._dropped.clear()
+        self.received = 0
+        self.completed = None
+
+    async def run(self) -> None:
+        loop = asyncio.get_event_loop()
+        while True:
+            message = await self._driver.read()
+            if message.arbitration_id.parts.node_id != _NODE:
+                continue
+            message_id = message.arbitration_id.parts.message_id
+            if message_id == MessageId.fw_update_data:
+                self.received += 1
+                data = cast(
+                    payloads.FirmwareUpdateData,
+                    payloads.FirmwareUpdateData.build(message.data),
+                )
+                address = data.address.value
+                if (
+                    address not in self._dropped
+                    and self._random.random() < self._drop_rate
+                ):
+                    # Drop each chunk at most once, so the resend gets through.
+                    self._dropped.add(address)
+                    continue
+                self._written[address] = data.data.value[: data.num_bytes.value]
+                ack = message_definitions.FirmwareUpdateDataAcknowledge(
+                    payload=payloads.FirmwareUpdateDataAcknowledge(
+                        address=data.address,
+                        error_code=ErrorCodeField(ErrorCode.ok),
+                    )
+                )
+                loop.call_later(self._ack_delay, self._send_soon, ack)
+            elif message_id == MessageId.fw_update_complete:
+                complete = cast(
+                    payloads.FirmwareUpdateComplete,
+                    payloads.FirmwareUpdateComplete.build(message.data),
+                )
+                crc32 = 0
+                for address in sorted(self._written):
+                    crc32 = binascii.crc32(self._written[address], crc32)
+                self.completed = (
+                    complete.num_messages.value == len(self._written)
+                    and complete.crc32.value == crc32
+                )
+                await self._send(
+                    message_definitions.FirmwareUpdateCompleteAcknowledge(
+                        payload=payloads.FirmwareUpdateAcknowledge(
+                            error_code=ErrorCodeField(
+                                ErrorCode.ok
+                                if self.completed
+                                else ErrorCode.bad_checksum
+                            )
+                        )
+                    )
+                )
+
+    def _send_soon(self, message: MessageDefinition) -> None:
+        asyncio.get_event_loop().create_task(self._send(message))
+
+    async def _send(self, message: MessageDefinition) -> None:
+        arbitration_id = ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=message.message_id,
+                node_id=NodeId.host,
+                function_code=0,
+                originating_node_id=_NODE,
+            )
+        )
+        await self._driver.send(
+            CanMessage(arbitration_id=arbitration_id, data=message.payload.serialize())
+        )
+
+
+async def _run(ack_delay: float) -> None:
+    server = await asyncio.start_server(ConnectionHandler(), host="127.0.0.1", port=0)
+    assert server.sockets
+    port = server.sockets[0].getsockname()[1]
+
+    node_driver = await SocketDriver.build(host="127.0.0.1", port=port)
+    bootloader = _SimulatedBootloader(node_driver, ack_delay, 0.0)
+    node_task = asyncio.get_event_loop().create_task(bootloader.run())
+
+    image = bytes(random.Random(1).getrandbits(8) for _ in range(_IMAGE_SIZE))
+    hex_file = _hex_file(image)
+
+    host_driver = await SocketDriver.build(host="127.0.0.1", port=port)
+    try:
+        async with CanMessenger(host_driver) as messenger:
+            downloader = FirmwareUpdateDownloader(messenger)
+            runs: List[Tuple[int, float]] = [(w, 0.0) for w in _WINDOW_SIZES]
+            runs.append((_WINDOW_SIZES[-1], _DROP_RATE))
+            baseline = None
+            for window_size, drop_rate in runs:
+                bootloader.reset(drop_rate)
+                start = time.perf_counter()
+                await downloader.run(
+                    node_id=_NODE,
+                    hex_processor=HexRecordProcessor.from_file(io.StringIO(hex_file)),
+                    ack_wait_seconds=_ACK_WAIT_SECONDS,
+                    window_size=window_size,
+                    chunk_retry_count=3,
+                )
+                elapsed = time.perf_counter() - start
+                assert bootloader.completed
+                baseline = baseline or elapsed
+                label = f"window {window_size}" + (
+                    f", {drop_rate:.0%} dropped" if drop_rate else ""
+                )
+                print(
+                    f"  {label:<22} {elapsed * 1e3:8.0f} ms"
+                    f"  {_IMAGE_SIZE / elapsed / 1024:7.1f} KiB/s"
+                    f"  {bootloader.received:5d} data messages"
+                    f"  ({baseline / elapsed:.1f}x)"
+                )
+    finally:
+        node_task.cancel()
+        host_driver.shutdown()
+        node_driver.shutdown()
+        server.close()
+
+
+def main(ack_delay_ms: float) -> None:
+    """Print download times with each window size."""
+    # Resent chunks are logged as warnings.
+    logging.disable(logging.WARNING)
+    print(
+        f"Downloading {_IMAGE_SIZE // 1024} KiB with a "
+        f"{ack_delay_ms:g} ms ack delay:"
+    )
+    asyncio.run(_run(ack_delay_ms / 1000))
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_ACK_DELAY_MS)
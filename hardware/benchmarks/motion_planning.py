@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Benchmark planning motion along paths with many targets.
+
+Plans an arc and a train of moves between wells with `MoveManager`, first
+blending the moves one at a time and then with `vectorized=True`, which
+blends all of them at once with array operations. Checks that both build
+the same moves and blocks in every iteration, and prints the time each
+takes.
+
+Usage: python -m benchmarks.motion_planning [repeat_count]
+"""
+import logging
+import math
+import statistics
+import sys
+import time
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from opentrons_hardware.hardware_control.motion_planning import (
+    AxisConstraints,
+    Coordinates,
+    Move,
+    MoveManager,
+    MoveTarget,
+    SystemConstraints,
+)
+
+_DEFAULT_REPEAT_COUNT = 5
+_TARGET_COUNTS = (10, 100, 1000)
+_ITERATION_LIMIT = 10
+_BLOCK_FIELDS = ("distance", "initial_speed", "acceleration", "final_speed", "time")
+
+_CONSTRAINTS: SystemConstraints[str] = {
+    "X": AxisConstraints.build(
+        max_acceleration=1000,
+        max_speed_discont=40,
+        max_direction_change_speed_discont=20,
+    ),
+    "Y": AxisConstraints.build(
+        max_acceleration=1000,
+        max_speed_discont=40,
+        max_direction_change_speed_discont=20,
+    ),
+    "Z": AxisConstraints.build(
+        max_acceleration=500, max_speed_discont=10, max_direction_change_speed_discont=5
+    ),
+}
+
+Path = Tuple[Coordinates[str, float], List[MoveTarget[str]]]
+
+
+def _arc(count: int) -> Path:
+    """An arc around a well, descending as it goes."""
+    origin = {"X": 150.0, "Y": 100.0, "Z": 80.0}
+    targets = [
+        MoveTarget.build(
+            {
+                "X": 100 + 50 * math.cos(i / count * math.pi),
+                "Y": 100 + 50 * math.sin(i / count * math.pi),
+                "Z": 80 - 20 * i / count,
+            },
+            max_speed=200,
+        )
+        for i in range(1, count + 1)
+    ]
+    return origin, targets
+
+
+def _well_train(count: int) -> Path:
+    """Moves over a plate, going down into and back up out of each well."""
+    origin = {"X": 0.0, "Y": 0.0, "Z": 40.0}
+    targets = []
+    for i in range(count):
+        well = i // 3 % 96
+        position = {
+            "X": 14.38 + 9 * (well % 12),
+            "Y": 74.24 - 9 * (well // 12),
+            "Z": 5.0 if i % 3 == 1 else 40.0,
+        }
+        targets.append(MoveTarget.build(position, max_speed=400 if i % 3 == 0 else 50))
+    return origin, targets
+
+
+def _max_difference(expected: List[Move[str]], actual: List[Move[str]]) -> float:
+    """Get the largest relative difference between the blocks of two moves lists."""
+    assert len(expected) == len(actual)
+    return max(
+        float(
+            abs(getattr(e, name) - getattr(a, name)) / max(1.0, abs(getattr(e, name)))
+        )
+        for expected_move, actual_move in zip(expected, actual)
+        for e, a in zip(expected_move.blocks, actual_move.blocks)
+        for name in _BLOCK_FIELDS
+    )
+
+
+def _time(func: Callable[[], object], repeat_count: int) -> float:
+    times = []
+    for _ in range(repeat_count):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def _benchmark(name: str, path: Path, repeat_count: int) -> None:
+    manager = MoveManager(constraints=_CONSTRAINTS)
+
+    def _plan(vectorized: bool) -> Tuple[bool, List[List[Move[str]]]]:
+        return manager.plan_motion(
+            *path, iteration_limit=_ITERATION_LIMIT, vectorized=vectorized
+        )
+
+    converged, blend_log = _plan(vectorized=False)
+    vectorized_converged, vectorized_blend_log = _plan(vectorized=True)
+    assert converged == vectorized_converged
+    assert len(blend_log) == len(vectorized_blend_log)
+    difference = max(
+        _max_difference(legacy, moves)
+        for legacy, moves in zip(blend_log, vectorized_blend_log)
+    )
+    assert difference < 1e-9, f"vectorized moves differ by {difference}"
+
+    legacy_time = _time(lambda: _plan(vectorized=False), repeat_count)
+    vectorized_time = _time(lambda: _plan(vectorized=True), repeat_count)
+    print(
+        f"  {name:<16} {legacy_time * 1e3:8.1f} ms -> {vectorized_time * 1e3:6.1f} ms"
+        f"  ({legacy_time / vectorized_time:5.1f}x)"
+        f"  {len(blend_log)} iteration(s){'' if converged else ', not converged'}"
+    )
+
+
+def main(repeat_count: int) -> None:
+    """Print planning times for paths of each length."""
+    # Planning logs every move it builds.
+    logging.disable(logging.ERROR)
+    np.seterr(all="ignore")
+    print("Planning with blending -> vectorized:")
+    for count in _TARGET_COUNTS:
+        for name, build in (("arc", _arc), ("well train", _well_train)):
+            _benchmark(f"{count} {name}", build(count), repeat_count)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_REPEAT_COUNT)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Benchmark loading move groups while earlier ones execute.
+
+Runs the same sequence of short move groups with `MoveGroupRunner`, which
+loads every group before executing any of them, and with
+`StreamingMoveGroupRunner`, which starts executing the first group as soon
+as it is loaded and loads the rest while the nodes move. The messenger is
+simulated: every message takes a fixed time to send, and each group
+completes after the duration of its moves.
+
+Usage: python -m benchmarks.move_group_loading [group_count]
+"""
+import asyncio
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Dict, Optional, Set, Tuple, cast
+
+from numpy import float64
+
+from opentrons_hardware.drivers.can_bus.can_messenger import (
+    CanMessenger,
+    MessageListenerCallback,
+)
+from opentrons_hardware.firmware_bindings import ArbitrationId, ArbitrationIdParts
+from opentrons_hardware.firmware_bindings.constants import NodeId
+from opentrons_hardware.firmware_bindings.messages import (
+    MessageDefinition,
+    message_definitions as md,
+)
+from opentrons_hardware.firmware_bindings.messages.payloads import (
+    MoveCompletedPayload,
+)
+from opentrons_hardware.firmware_bindings.utils import UInt8Field, UInt32Field
+from opentrons_hardware.hardware_control.move_group_runner import (
+    MoveGroupRunner,
+    StreamingMoveGroupRunner,
+)
+from opentrons_hardware.hardware_control.motion import (
+    MoveGroups,
+    MoveGroupSingleAxisStep,
+)
+
+_DEFAULT_GROUP_COUNT = 30
+_SEND_SEC = 0.002
+_MOVE_SEC = 0.02
+_NODES = (NodeId.gantry_x, NodeId.gantry_y, NodeId.head)
+_SEQUENCES_PER_GROUP = 3
+
+
+class _SimulatedMessenger:
+    """Takes a while to send, and completes groups after their moves."""
+
+    def __init__(self) -> None:
+        self._slots: Dict[int, Set[Tuple[NodeId, int]]] = defaultdict(set)
+        self._listener: Optional[MessageListenerCallback] = None
+
+    def add_listener(self, listener: MessageListenerCallback, **kwargs: Any) -> None:
+        self._listener = listener
+
+    def remove_listener(self, listener: MessageListenerCallback) -> None:
+        self._listener = None
+
+    async def send(self, node_id: NodeId, message: MessageDefinition) -> None:
+        await asyncio.sleep(_SEND_SEC)
+        if isinstance(message, md.ClearAllMoveGroupsRequest):
+            self._slots.clear()
+        elif isinstance(message, md.AddLinearMoveRequest):
+            self._slots[message.payload.group_id.value].add(
+                (node_id, message.payload.seq_id.value)
+            )
+        elif isinstance(message, md.ExecuteMoveGroupRequest):
+            slot = message.payload.group_id.value
+            asyncio.get_event_loop().call_later(
+                _MOVE_SEC * _SEQUENCES_PER_GROUP, self._complete, slot
+            )
+
+    def _complete(self, slot: int) -> None:
+        assert self._listener
+        for node, seq_id in sorted(self._slots[slot]):
+            self._listener(
+                md.MoveCompleted(
+                    payload=MoveCompletedPayload(
+                        group_id=UInt8Field(slot),
+                        seq_id=UInt8Field(seq_id),
+                        current_position_um=UInt32Field(0),
+                        encoder_position=UInt32Field(0),
+                        ack_id=UInt8Field(1),
+                    )
+                ),
+                ArbitrationId(
+                    parts=ArbitrationIdParts(
+                        message_id=md.MoveCompleted.message_id,
+                        node_id=NodeId.host,
+                        function_code=0,
+                        originating_node_id=node,
+                    )
+                ),
+            )
+
+
+def _move_groups(group_count: int) -> MoveGroups:
+    step = MoveGroupSingleAxisStep(
+        distance_mm=float64(0),
+        velocity_mm_sec=float64(0),
+        duration_sec=float64(_MOVE_SEC),
+    )
+    return [
+        [{node: step for node in _NODES} for _ in range(_SEQUENCES_PER_GROUP)]
+        for _ in range(group_count)
+    ]
+
+
+async def _time(runner: MoveGroupRunner) -> float:
+    messenger = cast(CanMessenger, _SimulatedMessenger())
+    start = time.perf_counter()
+    await runner.run(messenger)
+    return time.perf_counter() - start
+
+
+def main(group_count: int) -> None:
+    """Print the time to run the move groups with each runner."""
+    move_groups = _move_groups(group_count)
+    moving = group_count * _SEQUENCES_PER_GROUP * _MOVE_SEC
+    print(
+        f"Running {group_count} move groups of {_SEQUENCES_PER_GROUP} moves on "
+        f"{len(_NODES)} nodes, {moving * 1e3:.0f} ms of moves, "
+        f"{_SEND_SEC * 1e3:g} ms per message:"
+    )
+    baseline = asyncio.run(_time(MoveGroupRunner(move_groups)))
+    print(f"  {'load all, then run':<24} {baseline * 1e3:7.0f} ms")
+    for max_loaded_groups in (2, 6):
+        runner = StreamingMoveGroupRunner(move_groups, max_loaded_groups)
+        elapsed = asyncio.run(_time(runner))
+        waiting = sum(timing.wait_sec for timing in runner.timings)
+        label = f"streaming, {max_loaded_groups} slots"
+        print(
+            f"  {label:<24} {elapsed * 1e3:7.0f} ms"
+            f"  {waiting * 1e3:5.0f} ms waiting for loads"
+            f"  ({baseline / elapsed:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_GROUP_COUNT)
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""Benchmark capturing sensor readings.
+
+Runs the simulated CAN bus from `opentrons_hardware.scripts.sim_socket_can`
+in this process, and replays sensor readings from several nodes onto it as
+fast as it takes them. Captures them on the host with
+`SensorScheduler.capture_output`, a queue per sensor that is drained into
+lists afterwards the way `capacitive_pass` used to, and with
+`SensorScheduler.capture`, which records them into ring buffers and can
+stream them to a file. Prints the time each takes to receive every reading
+and the peak memory allocated while capturing, measured in a second run;
+the ring buffers are sized to hold every reading.
+
+Usage: python -m benchmarks.sensor_capture [reading_count]
+"""
+import asyncio
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import AsyncExitStack
+from pathlib import Path
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from opentrons_hardware.drivers.can_bus import CanMessenger
+from opentrons_hardware.drivers.can_bus.socket_driver import SocketDriver
+from opentrons_hardware.firmware_bindings import (
+    ArbitrationId,
+    ArbitrationIdParts,
+    CanMessage,
+    NodeId,
+)
+from opentrons_hardware.firmware_bindings.constants import SensorId, SensorType
+from opentrons_hardware.firmware_bindings.messages.fields import (
+    SensorIdField,
+    SensorTypeField,
+)
+from opentrons_hardware.firmware_bindings.messages.message_definitions import (
+    ReadFromSensorResponse,
+)
+from opentrons_hardware.firmware_bindings.messages.payloads import (
+    ReadFromSensorResponsePayload,
+)
+from opentrons_hardware.firmware_bindings.utils import Int32Field
+from opentrons_hardware.scripts.sim_socket_can import ConnectionHandler
+from opentrons_hardware.sensors.capture import CaptureFileWriter
+from opentrons_hardware.sensors.scheduler import SensorScheduler
+from opentrons_hardware.sensors.utils import SensorInformation
+
+_DEFAULT_READING_COUNT = 30000
+_SENSORS = [
+    SensorInformation(
+        sensor_type=SensorType.capacitive,
+        sensor_id=SensorId.S0,
+        node_id=NodeId.pipette_left,
+    ),
+    SensorInformation(
+        sensor_type=SensorType.pressure,
+        sensor_id=SensorId.S0,
+        node_id=NodeId.pipette_right,
+    ),
+    SensorInformation(
+        sensor_type=SensorType.capacitive,
+        sensor_id=SensorId.S0,
+        node_id=NodeId.gripper,
+    ),
+]
+
+# Captures readings until it has the given number of them.
+_Capture = Callable[[CanMessenger, int], Awaitable[None]]
+
+
+def _frames(reading_count: int) -> List[CanMessage]:
+    frames = []
+    for i in range(reading_count):
+        sensor = _SENSORS[i % len(_SENSORS)]
+        payload = ReadFromSensorResponsePayload(
+            sensor=SensorTypeField(sensor.sensor_type),
+            sensor_id=SensorIdField(sensor.sensor_id),
+            sensor_data=Int32Field(i),
+        )
+        arbitration_id = ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=ReadFromSensorResponse.message_id,
+                node_id=NodeId.host,
+                function_code=0,
+                originating_node_id=sensor.node_id,
+            )
+        )
+        frames.append(
+            CanMessage(arbitration_id=arbitration_id, data=payload.serialize())
+        )
+    return frames
+
+
+async def _wait_until(condition: Callable[[], bool]) -> None:
+    while not condition():
+        await asyncio.sleep(0.001)
+
+
+async def _capture_queues(messenger: CanMessenger, reading_count: int) -> None:
+    scheduler = SensorScheduler()
+    async with AsyncExitStack() as stack:
+        queues = [
+            await stack.enter_async_context(scheduler.capture_output(sensor, messenger))
+            for sensor in _SENSORS
+        ]
+        await _wait_until(lambda: sum(q.qsize() for q in queues) == reading_count)
+    readings = [[q.get_nowait() for _ in range(q.qsize())] for q in queues]
+    assert sum(len(r) for r in readings) == reading_count
+
+
+async def _capture_buffers(
+    messenger: CanMessenger, reading_count: int, path: Optional[Path] = None
+) -> None:
+    scheduler = SensorScheduler()
+    sink = CaptureFileWriter(path) if path else None
+    try:
+        capacity = reading_count // len(_SENSORS)
+        async with scheduler.capture(_SENSORS, messenger, capacity, sink) as capture:
+            await _wait_until(
+                lambda: sum(len(capture.buffer(s)) for s in _SENSORS) == reading_count
+            )
+        readings = [capture.buffer(sensor).values() for sensor in _SENSORS]
+        assert sum(len(r) for r in readings) == reading_count
+    finally:
+        if sink:
+            sink.close()
+
+
+async def _replay(
+    capture: _Capture,
+    frames: List[CanMessage],
+    measure_memory: bool,
+) -> float:
+    """Replay the frames and return the capture's time, or its peak memory."""
+    server = await asyncio.start_server(ConnectionHandler(), host="127.0.0.1", port=0)
+    assert server.sockets
+    port = server.sockets[0].getsockname()[1]
+    node_driver = await SocketDriver.build(host="127.0.0.1", port=port)
+    host_driver = await SocketDriver.build(host="127.0.0.1", port=port)
+    try:
+        async with CanMessenger(host_driver) as messenger:
+            if measure_memory:
+                tracemalloc.start()
+            start = time.perf_counter()
+            captured = asyncio.ensure_future(capture(messenger, len(frames)))
+            # Let the capture bind the sensors before replaying.
+            await asyncio.sleep(0.01)
+            for frame in frames:
+                await node_driver.send(frame)
+            await captured
+            elapsed = time.perf_counter() - start
+            if measure_memory:
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                return float(peak)
+            return elapsed
+    finally:
+        host_driver.shutdown()
+        node_driver.shutdown()
+        server.close()
+
+
+def main(reading_count: int) -> None:
+    """Print capture times and memory with queues and with ring buffers."""
+    frames = _frames(reading_count)
+    print(
+        f"Capturing {reading_count} readings from {len(_SENSORS)} sensors "
+        "replayed through the simulated CAN bus:"
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "capture.bin"
+        captures: List[Tuple[str, _Capture]] = [
+            ("queues", _capture_queues),
+            ("ring buffers", _capture_buffers),
+            (
+                "ring buffers and file",
+                lambda m, n: _capture_buffers(m, n, path),
+            ),
+        ]
+        for label, capture in captures:
+            elapsed = asyncio.run(_replay(capture, frames, measure_memory=False))
+            peak = asyncio.run(_replay(capture, frames, measure_memory=True))
+            print(
+                f"  {label:<22} {elapsed * 1e3:7.0f} ms"
+                f"  {reading_count / elapsed:8.0f} readings/s"
+                f"  peak {peak / 1024:7.0f} KiB allocated"
+            )
+        print(f"  file: {path.stat().st_size / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_READING_COUNT)
@@ -1,7 +1,7 @@
 """Can bus drivers package."""
 
 from .driver import CanDriver
-from .can_messenger import CanMessenger, WaitableCallback
+from .can_messenger import CanMessenger, MessageStats, WaitableCallback
 from opentrons_hardware.firmware_bindings.message import CanMessage
 from opentrons_hardware.firmware_bindings.arbitration_id import (
     ArbitrationId,
@@ -26,4 +26,5 @@ __all__ = [
     "CanMessenger",
     "DriverSettings",
     "WaitableCallback",
+    "MessageStats",
 ]
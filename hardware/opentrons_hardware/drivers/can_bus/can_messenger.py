@@ -1,8 +1,10 @@
 """Can messenger class."""
 from __future__ import annotations
 import asyncio
+import time
+from dataclasses import dataclass
 from inspect import Traceback
-from typing import Optional, Callable, Tuple, Dict
+from typing import Optional, Callable, Tuple, Dict, Iterable, List, Set
 import logging
 
 from opentrons_hardware.drivers.can_bus.abstract_driver import AbstractCanDriver
@@ -30,12 +32,66 @@ MessageListenerCallbackFilter = Callable[[ArbitrationId], bool]
 """A function used to filter incoming messages. Returns true to accept message."""
 
 
+_ListenerKey = Tuple[Optional[int], Optional[int]]
+"""A message ID and originating node ID to dispatch on. None matches any ID."""
+
+
+@dataclass(frozen=True)
+class MessageStats:
+    """Statistics about the messages received with one message ID."""
+
+    received: int
+    """The number of messages received."""
+
+    receive_rate_hz: float
+    """The average rate of messages between the first and last received."""
+
+    dispatched: int
+    """The number of messages that were decoded and passed to listeners."""
+
+    mean_dispatch_latency_sec: float
+    """The average time to decode a message and call all of its listeners."""
+
+    max_dispatch_latency_sec: float
+    """The longest time taken to decode a message and call all of its listeners."""
+
+
+class _MessageCounters:
+    """Running counts behind MessageStats."""
+
+    def __init__(self, received_at: float) -> None:
+        self.first_received_at = received_at
+        self.last_received_at = received_at
+        self.received = 0
+        self.dispatched = 0
+        self.total_dispatch_latency_sec = 0.0
+        self.max_dispatch_latency_sec = 0.0
+
+    def to_stats(self) -> MessageStats:
+        receive_period = self.last_received_at - self.first_received_at
+        return MessageStats(
+            received=self.received,
+            receive_rate_hz=(
+                (self.received - 1) / receive_period if receive_period > 0 else 0.0
+            ),
+            dispatched=self.dispatched,
+            mean_dispatch_latency_sec=(
+                self.total_dispatch_latency_sec / self.dispatched
+                if self.dispatched > 0
+                else 0.0
+            ),
+            max_dispatch_latency_sec=self.max_dispatch_latency_sec,
+        )
+
+
 class CanMessenger:
     """High level can messaging class wrapping a CanDriver.
 
     The background task can be controlled with start/stop methods.
 
-    To receive message notifications add a listener using add_listener
+    To receive message notifications add a listener using add_listener.
+    Listeners that only want certain message IDs or nodes should say so when
+    they're added, so that other messages are never decoded for them.
     """
 
     def __init__(self, driver: AbstractCanDriver) -> None:
@@ -45,10 +101,12 @@ class CanMessenger:
             driver: The can bus driver to use.
         """
         self._drive = driver
-        self._listeners: Dict[
-            MessageListenerCallback,
-            Tuple[MessageListenerCallback, Optional[MessageListenerCallbackFilter]],
+        self._listeners_by_key: Dict[
+            _ListenerKey,
+            Dict[MessageListenerCallback, Optional[MessageListenerCallbackFilter]],
         ] = {}
+        self._keys_by_listener: Dict[MessageListenerCallback, Set[_ListenerKey]] = {}
+        self._counters: Dict[int, _MessageCounters] = {}
         self._task: Optional[asyncio.Task[None]] = None
 
     async def send(self, node_id: NodeId, message: MessageDefinition) -> None:
@@ -63,10 +121,11 @@ class CanMessenger:
             )
         )
         data = message.payload.serialize()
-        log.debug(
-            f"Sending -->\n\tarbitration_id: {arbitration_id},\n\t"
-            f"payload: {message.payload}"
-        )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                f"Sending -->\n\tarbitration_id: {arbitration_id},\n\t"
+                f"payload: {message.payload}"
+            )
         await self._drive.send(
             message=CanMessage(arbitration_id=arbitration_id, data=data)
         )
@@ -104,14 +163,49 @@ class CanMessenger:
         self,
         listener: MessageListenerCallback,
         filter: Optional[MessageListenerCallbackFilter] = None,
+        *,
+        message_ids: Optional[Iterable[MessageId]] = None,
+        node_ids: Optional[Iterable[NodeId]] = None,
     ) -> None:
-        """Add a message listener."""
-        self._listeners[listener] = listener, filter
+        """Add a message listener, replacing it if it was already added.
+
+        Args:
+            listener: The function to call with each matching message.
+            filter: A function to further filter the matching messages.
+            message_ids: Only call the listener for messages with these IDs.
+                If omitted, all message IDs match.
+            node_ids: Only call the listener for messages from these nodes.
+                If omitted, all nodes match.
+        """
+        self.remove_listener(listener)
+
+        keys = {
+            (message_id, node_id)
+            for message_id in _key_values(message_ids)
+            for node_id in _key_values(node_ids)
+        }
+        for key in keys:
+            self._listeners_by_key.setdefault(key, {})[listener] = filter
+        self._keys_by_listener[listener] = keys
 
     def remove_listener(self, listener: MessageListenerCallback) -> None:
         """Remove a message listener."""
-        if listener in self._listeners:
-            del self._listeners[listener]
+        for key in self._keys_by_listener.pop(listener, ()):
+            listeners = self._listeners_by_key[key]
+            del listeners[listener]
+            if len(listeners) == 0:
+                del self._listeners_by_key[key]
+
+    def get_stats(self) -> Dict[MessageId, MessageStats]:
+        """Get statistics about received messages, by message ID."""
+        stats = {}
+        for message_id, counters in self._counters.items():
+            try:
+                stats[MessageId(message_id)] = counters.to_stats()
+            except ValueError:
+                # Unrecognized messages are counted, but can't be reported.
+                pass
+        return stats
 
     async def _read_task_shield(self) -> None:
         try:
@@ -125,24 +219,77 @@ class CanMessenger:
     async def _read_task(self) -> None:
         """Read task."""
         async for message in self._drive:
-            message_definition = get_definition(
-                MessageId(message.arbitration_id.parts.message_id)
-            )
-            if message_definition:
-                try:
-                    build = message_definition.payload_type.build(message.data)
+            self._handle_message(message)
+
+    def _handle_message(self, message: CanMessage) -> None:
+        """Decode a received message and pass it to its listeners, if any."""
+        received_at = time.perf_counter()
+        arbitration_id = message.arbitration_id
+        message_id = arbitration_id.parts.message_id
+
+        counters = self._counters.get(message_id)
+        if counters is None:
+            counters = self._counters[message_id] = _MessageCounters(received_at)
+        counters.received += 1
+        counters.last_received_at = received_at
+
+        listeners = self._get_listeners(arbitration_id)
+        debug = log.isEnabledFor(logging.DEBUG)
+
+        # Only decode messages that someone will read.
+        if len(listeners) == 0 and not debug:
+            return
+
+        message_definition = get_definition(MessageId(message_id))
+        if message_definition:
+            try:
+                build = message_definition.payload_type.build(message.data)
+                if debug:
                     log.debug(
-                        f"Received <--\n\tarbitration_id: {message.arbitration_id},\n\t"
+                        f"Received <--\n\tarbitration_id: {arbitration_id},\n\t"
                         f"payload: {build}"
                     )
-                    for listener, filter in self._listeners.values():
-                        if filter and not filter(message.arbitration_id):
-                            continue
-                        listener(message_definition(payload=build), message.arbitration_id)  # type: ignore[arg-type]
-                except BinarySerializableException:
-                    log.exception(f"Failed to build from {message}")
-            else:
-                log.error(f"Message {message} is not recognized.")
+                for listener in listeners:
+                    listener(message_definition(payload=build), arbitration_id)  # type: ignore[arg-type]
+            except BinarySerializableException:
+                log.exception(f"Failed to build from {message}")
+        else:
+            log.error(f"Message {message} is not recognized.")
+
+        if len(listeners) > 0:
+            latency = time.perf_counter() - received_at
+            counters.dispatched += 1
+            counters.total_dispatch_latency_sec += latency
+            counters.max_dispatch_latency_sec = max(
+                counters.max_dispatch_latency_sec, latency
+            )
+
+    def _get_listeners(
+        self, arbitration_id: ArbitrationId
+    ) -> List[MessageListenerCallback]:
+        """Get the listeners that want a message."""
+        message_id = arbitration_id.parts.message_id
+        node_id = arbitration_id.parts.originating_node_id
+        listeners: List[MessageListenerCallback] = []
+
+        for key in (
+            (message_id, node_id),
+            (message_id, None),
+            (None, node_id),
+            (None, None),
+        ):
+            for listener, filter in self._listeners_by_key.get(key, {}).items():
+                if filter is None or filter(arbitration_id):
+                    listeners.append(listener)
+
+        return listeners
+
+
+def _key_values(ids: Optional[Iterable[int]]) -> Iterable[Optional[int]]:
+    """Get the values of one part of a listener key, with None as a wildcard."""
+    if ids is None:
+        return [None]
+    return [int(i) for i in ids]
 
 
 class WaitableCallback:
@@ -152,15 +299,22 @@ class WaitableCallback:
         self,
         messenger: CanMessenger,
         filter: Optional[MessageListenerCallbackFilter] = None,
+        *,
+        message_ids: Optional[Iterable[MessageId]] = None,
+        node_ids: Optional[Iterable[NodeId]] = None,
     ) -> None:
         """Constructor.
 
         Args:
             messenger: Messenger to listen on.
             filter: Optional message filtering function
+            message_ids: Optional message IDs to listen for
+            node_ids: Optional nodes to listen to
         """
         self._messenger = messenger
         self._filter = filter
+        self._message_ids = message_ids
+        self._node_ids = node_ids
         self._queue: asyncio.Queue[
             Tuple[MessageDefinition, ArbitrationId]
         ] = asyncio.Queue()
@@ -173,7 +327,12 @@ class WaitableCallback:
 
     def __enter__(self) -> WaitableCallback:
         """Enter context manager."""
-        self._messenger.add_listener(self, self._filter)
+        self._messenger.add_listener(
+            self,
+            self._filter,
+            message_ids=self._message_ids,
+            node_ids=self._node_ids,
+        )
         return self
 
     def __exit__(
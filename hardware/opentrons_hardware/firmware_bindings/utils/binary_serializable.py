@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 import struct
-from dataclasses import dataclass, fields, astuple
-from typing import TypeVar, Generic, Type
+from dataclasses import dataclass, fields
+from typing import Any, Dict, TypeVar, Generic, List, Sequence, Tuple, Type, Union
 
 
 class BinarySerializableException(BaseException):
@@ -26,6 +26,10 @@ class SerializationException(BinarySerializableException):
 
 T = TypeVar("T")
 
+SerializableT = TypeVar("SerializableT", bound="BinarySerializable")
+
+ReadableBuffer = Union[bytes, bytearray, memoryview]
+
 
 class BinaryFieldBase(Generic[T]):
     """Binary serializable field."""
@@ -34,6 +38,14 @@ class BinaryFieldBase(Generic[T]):
     FORMAT = ""
     """The struct format string for this field."""
 
+    def __new__(cls: Type[This], *args: Any, **kwargs: Any) -> This:
+        """Allocate a new field.
+
+        Skips `typing.Generic.__new__`, which is slow in Python 3.7,
+        since fields are created for every CAN message sent or received.
+        """
+        return object.__new__(cls)  # type: ignore[no-any-return]
+
     def __init__(self, t: T) -> None:
         """Constructor."""
         self._t = t
@@ -138,6 +150,24 @@ class Int8Field(IntFieldBase):
     FORMAT = "b"
 
 
+class _Codec:
+    """A precompiled encoder/decoder for one BinarySerializable class."""
+
+    def __init__(
+        self,
+        format_string: str,
+        named_types: Sequence[Tuple[str, Type[BinaryFieldBase[Any]]]],
+    ) -> None:
+        """Constructor."""
+        self.struct = struct.Struct(format_string)
+        self.names = tuple(name for name, _ in named_types)
+        self.types = tuple(field_type for _, field_type in named_types)
+
+
+_codecs: Dict[type, _Codec] = {}
+"""Each BinarySerializable class's codec, compiled the first time it's used."""
+
+
 @dataclass
 class BinarySerializable:
     """Base class of a dataclass that can be serialized/deserialized into bytes.
@@ -157,10 +187,10 @@ class BinarySerializable:
         Returns:
             Byte buffer
         """
-        string = self._get_format_string()
-        vals = [x.value for x in astuple(self)]
+        codec = self._get_codec()
+        vals = [getattr(self, name).value for name in codec.names]
         try:
-            return struct.pack(string, *vals)
+            return codec.struct.pack(*vals)
         except struct.error as e:
             raise SerializationException(str(e))
 
@@ -181,16 +211,73 @@ class BinarySerializable:
         Returns:
             cls
         """
+        return cls.build_from(data)
+
+    @classmethod
+    def build_from(
+        cls: Type[SerializableT], buffer: ReadableBuffer, offset: int = 0
+    ) -> SerializableT:
+        """Create a BinarySerializable from part of a buffer, without copying it.
+
+        Args:
+            buffer: A buffer, like bytes or a memoryview, with at least enough
+                bytes after `offset` to satisfy all fields.
+            offset: Where in the buffer the serialized data starts.
+
+        Returns:
+            cls
+        """
+        codec = cls._get_codec()
         try:
-            format_string = cls._get_format_string()
-            size = cls.get_size()
-            # ignore bytes beyond the size of message.
-            b = struct.unpack(format_string, data[:size])
-            args = {v.name: v.type.build(b[i]) for i, v in enumerate(fields(cls))}
-            # Mypy is not liking constructing the derived types.
-            return cls(**args)  # type: ignore[call-arg]
+            values = codec.struct.unpack_from(buffer, offset)
         except struct.error as e:
             raise InvalidFieldException(str(e))
+        return cls._from_values(codec, values)
+
+    @classmethod
+    def build_all(
+        cls: Type[SerializableT], buffer: ReadableBuffer
+    ) -> List[SerializableT]:
+        """Create BinarySerializables from a buffer of back-to-back serialized data.
+
+        Extra bytes at the end, too few to hold another object, will be ignored.
+
+        Args:
+            buffer: A buffer, like bytes or a memoryview.
+
+        Returns:
+            A list of cls, in the order they appear in the buffer.
+        """
+        codec = cls._get_codec()
+        size = codec.struct.size
+        if size == 0:
+            return []
+
+        view = memoryview(buffer)
+        view = view[: len(view) - len(view) % size]
+        return [
+            cls._from_values(codec, values) for values in codec.struct.iter_unpack(view)
+        ]
+
+    @classmethod
+    def _from_values(
+        cls: Type[SerializableT], codec: _Codec, values: Tuple[Any, ...]
+    ) -> SerializableT:
+        """Create a BinarySerializable from its unpacked field values."""
+        return cls(*(field_type.build(v) for field_type, v in zip(codec.types, values)))
+
+    @classmethod
+    def _get_codec(cls) -> _Codec:
+        """Get the precompiled codec for this class."""
+        try:
+            return _codecs[cls]
+        except KeyError:
+            codec = _Codec(
+                format_string=cls._get_format_string(),
+                named_types=[(v.name, v.type) for v in fields(cls)],
+            )
+            _codecs[cls] = codec
+            return codec
 
     @classmethod
     def _get_format_string(cls) -> str:
@@ -212,7 +299,7 @@ class BinarySerializable:
     @classmethod
     def get_size(cls) -> int:
         """Get the size of the serializable in bytes."""
-        return struct.calcsize(cls._get_format_string())
+        return cls._get_codec().struct.size
 
 
 class LittleEndianMixIn:
@@ -6,7 +6,13 @@ from .initiator import (
 from .downloader import FirmwareUpdateDownloader
 from .hex_file import from_hex_file_path, from_hex_file, HexRecordProcessor
 from .eraser import FirmwareUpdateEraser
-from .run import run_update
+from .run import (
+    run_update,
+    run_updates,
+    UpdateProgress,
+    UpdateProgressCallback,
+    UpdateState,
+)
 
 __all__ = [
     "FirmwareUpdateDownloader",
@@ -16,4 +22,8 @@ __all__ = [
     "from_hex_file",
     "HexRecordProcessor",
     "run_update",
+    "run_updates",
+    "UpdateProgress",
+    "UpdateProgressCallback",
+    "UpdateState",
 ]
@@ -2,6 +2,8 @@
 import asyncio
 import binascii
 import logging
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional, Tuple
 
 from opentrons_hardware.firmware_bindings import NodeId
 from opentrons_hardware.firmware_bindings.constants import ErrorCode
@@ -12,8 +14,9 @@ from opentrons_hardware.drivers.can_bus.can_messenger import (
     WaitableCallback,
 )
 from opentrons_hardware.firmware_update.errors import ErrorResponse, TimeoutResponse
-from opentrons_hardware.firmware_update.hex_file import HexRecordProcessor
+from opentrons_hardware.firmware_update.hex_file import HexRecordProcessor, Chunk
 from opentrons_hardware.firmware_bindings.messages import (
+    MessageDefinition,
     message_definitions,
     payloads,
     fields,
@@ -22,6 +25,19 @@ from opentrons_hardware.firmware_bindings.messages import (
 logger = logging.getLogger(__name__)
 
 
+DownloadProgressCallback = Callable[[int], None]
+"""Called with the number of bytes acknowledged so far."""
+
+
+@dataclass
+class _InFlightChunk:
+    """A data message that has been sent but not acknowledged."""
+
+    message: message_definitions.FirmwareUpdateData
+    deadline: float
+    retries_left: int
+
+
 class FirmwareUpdateDownloader:
     """Class that downloads FW using CAN messages."""
 
@@ -34,23 +50,99 @@ class FirmwareUpdateDownloader:
         node_id: NodeId,
         hex_processor: HexRecordProcessor,
         ack_wait_seconds: float,
+        window_size: int = 1,
+        chunk_retry_count: int = 0,
+        progress_callback: Optional[DownloadProgressCallback] = None,
     ) -> None:
         """Download hex record chunks to node.
 
+        Up to window_size chunks are sent before waiting for any of them to be
+        acknowledged. Acks are matched to chunks by address, so they may
+        arrive in any order.
+
+        By default a chunk that isn't acknowledged in time fails the download.
+        With chunk_retry_count, it is sent again instead. The chunk may have
+        arrived and only its ack been lost, so enabling this assumes that the
+        bootloader ignores a chunk for an address it has already written:
+        the FirmwareUpdateComplete message counts each chunk once, and a
+        bootloader that counted the duplicate would reject the download.
+
         Args:
             node_id: The target node id.
             hex_processor: The producer of hex chunks.
             ack_wait_seconds: Number of seconds to wait for an ACK
+            window_size: Number of chunks that may be waiting for an ACK
+            chunk_retry_count: Number of times to resend a chunk that isn't
+                ACKed. Only for bootloaders that ignore duplicate chunks.
+            progress_callback: Function called each time a chunk is ACKed
 
         Returns:
             None
         """
-        with WaitableCallback(self._messenger) as reader:
-            num_messages = 0
-            crc32 = 0
-            for chunk in hex_processor.process(
-                fields.FirmwareUpdateDataField.NUM_BYTES
-            ):
+        if window_size < 1:
+            raise ValueError("window_size must be at least 1.")
+
+        with WaitableCallback(
+            self._messenger,
+            message_ids=[
+                message_definitions.FirmwareUpdateDataAcknowledge.message_id,
+                message_definitions.FirmwareUpdateCompleteAcknowledge.message_id,
+            ],
+            node_ids=[node_id],
+        ) as reader:
+            num_messages, crc32 = await self._download_chunks(
+                node_id=node_id,
+                chunks=hex_processor.process(fields.FirmwareUpdateDataField.NUM_BYTES),
+                reader=reader,
+                ack_wait_seconds=ack_wait_seconds,
+                window_size=window_size,
+                chunk_retry_count=chunk_retry_count,
+                progress_callback=progress_callback,
+            )
+
+            # Create and send firmware update complete message.
+            complete_message = message_definitions.FirmwareUpdateComplete(
+                payload=payloads.FirmwareUpdateComplete(
+                    num_messages=UInt32Field(num_messages), crc32=UInt32Field(crc32)
+                )
+            )
+            await self._messenger.send(node_id=node_id, message=complete_message)
+            try:
+                # wait for ack.
+                await asyncio.wait_for(
+                    self._wait_update_complete_ack(node_id, reader), ack_wait_seconds
+                )
+            except asyncio.TimeoutError:
+                raise TimeoutResponse(complete_message)
+
+    async def _download_chunks(
+        self,
+        node_id: NodeId,
+        chunks: Iterable[Chunk],
+        reader: WaitableCallback,
+        ack_wait_seconds: float,
+        window_size: int,
+        chunk_retry_count: int,
+        progress_callback: Optional[DownloadProgressCallback],
+    ) -> Tuple[int, int]:
+        """Send chunks until all of them are acknowledged.
+
+        Returns:
+            The number of chunks and the crc32 of their data.
+        """
+        loop = asyncio.get_event_loop()
+        chunk_iter = iter(chunks)
+        # Chunks waiting for an ACK by address, oldest deadline first.
+        in_flight: Dict[int, _InFlightChunk] = {}
+        num_messages = 0
+        crc32 = 0
+        acked_bytes = 0
+
+        while True:
+            while len(in_flight) < window_size:
+                chunk = next(chunk_iter, None)
+                if chunk is None:
+                    break
                 logger.debug(
                     f"Sending chunk {num_messages} to address {chunk.address:x}."
                 )
@@ -62,43 +154,66 @@ class FirmwareUpdateDownloader:
                     )
                 )
                 await self._messenger.send(node_id=node_id, message=data_message)
-                try:
-                    # Wait for ack.
-                    await asyncio.wait_for(
-                        self._wait_data_message_ack(node_id, reader), ack_wait_seconds
-                    )
-                except asyncio.TimeoutError:
-                    raise TimeoutResponse(data_message)
-
+                in_flight[chunk.address] = _InFlightChunk(
+                    message=data_message,
+                    deadline=loop.time() + ack_wait_seconds,
+                    retries_left=chunk_retry_count,
+                )
                 crc32 = binascii.crc32(data, crc32)
                 num_messages += 1
 
-            # Create and send firmware update complete message.
-            complete_message = message_definitions.FirmwareUpdateComplete(
-                payload=payloads.FirmwareUpdateComplete(
-                    num_messages=UInt32Field(num_messages), crc32=UInt32Field(crc32)
-                )
-            )
-            await self._messenger.send(node_id=node_id, message=complete_message)
+            if not in_flight:
+                return num_messages, crc32
+
+            oldest = next(iter(in_flight.values()))
             try:
-                # wait for ack.
-                await asyncio.wait_for(
-                    self._wait_update_complete_ack(node_id, reader), ack_wait_seconds
+                # Wait for ack.
+                response, _ = await asyncio.wait_for(
+                    reader.read(), max(0.0, oldest.deadline - loop.time())
                 )
             except asyncio.TimeoutError:
-                raise TimeoutResponse(complete_message)
+                await self._resend_oldest(node_id, in_flight, ack_wait_seconds)
+                continue
+
+            acked = self._pop_acked(response, in_flight)
+            if acked and progress_callback:
+                acked_bytes += acked.message.payload.num_bytes.value
+                progress_callback(acked_bytes)
 
     @staticmethod
-    async def _wait_data_message_ack(node_id: NodeId, reader: WaitableCallback) -> None:
-        """Wait for response to data."""
-        async for response, arbitration_id in reader:
-            if arbitration_id.parts.originating_node_id == node_id:
-                if isinstance(
-                    response, message_definitions.FirmwareUpdateDataAcknowledge
-                ):
-                    if response.payload.error_code.value != ErrorCode.ok:
-                        raise ErrorResponse(response)
-                    break
+    def _pop_acked(
+        response: MessageDefinition, in_flight: Dict[int, _InFlightChunk]
+    ) -> Optional[_InFlightChunk]:
+        """Remove the chunk that a response acknowledges, if any."""
+        if isinstance(response, message_definitions.FirmwareUpdateDataAcknowledge):
+            if response.payload.error_code.value != ErrorCode.ok:
+                raise ErrorResponse(response)
+            # Acks for resent chunks can arrive twice. Ignore the extras.
+            return in_flight.pop(response.payload.address.value, None)
+        return None
+
+    async def _resend_oldest(
+        self,
+        node_id: NodeId,
+        in_flight: Dict[int, _InFlightChunk],
+        ack_wait_seconds: float,
+    ) -> None:
+        """Resend the chunk that has waited longest for an ACK."""
+        address, oldest = next(iter(in_flight.items()))
+        if oldest.retries_left == 0:
+            raise TimeoutResponse(oldest.message)
+        logger.warning(
+            f"Resending chunk at address {address:x}, "
+            f"{oldest.retries_left} retries left."
+        )
+        # Move it to the back of the window with a new deadline.
+        del in_flight[address]
+        await self._messenger.send(node_id=node_id, message=oldest.message)
+        in_flight[address] = _InFlightChunk(
+            message=oldest.message,
+            deadline=asyncio.get_event_loop().time() + ack_wait_seconds,
+            retries_left=oldest.retries_left - 1,
+        )
 
     @staticmethod
     async def _wait_update_complete_ack(
@@ -33,7 +33,11 @@ class FirmwareUpdateInitiator:
         Returns:
             None
         """
-        with WaitableCallback(self._messenger) as reader:
+        with WaitableCallback(
+            self._messenger,
+            message_ids=[message_definitions.DeviceInfoResponse.message_id],
+            node_ids=[target.bootloader_node],
+        ) as reader:
             # Create initiate message
             initiate_message = message_definitions.FirmwareUpdateInitiate()
             # Send it to system node
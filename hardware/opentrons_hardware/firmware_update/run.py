@@ -1,6 +1,10 @@
 """Complete FW updater."""
+import asyncio
 import logging
-from typing import Optional, TextIO
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, TextIO
 
 from opentrons_hardware.drivers.can_bus import CanMessenger
 from opentrons_hardware.firmware_bindings import NodeId
@@ -13,11 +17,44 @@ from opentrons_hardware.firmware_update import (
     FirmwareUpdateEraser,
     HexRecordProcessor,
 )
+from opentrons_hardware.firmware_update.hex_file import (
+    HexRecord,
+    RecordType,
+    from_hex_file,
+)
 from opentrons_hardware.firmware_update.target import Target
 
 logger = logging.getLogger(__name__)
 
 
+class UpdateState(str, Enum):
+    """The stages of a node's firmware update."""
+
+    queued = "queued"
+    initializing = "initializing"
+    erasing = "erasing"
+    downloading = "downloading"
+    restarting = "restarting"
+    done = "done"
+    failed = "failed"
+
+
+@dataclass(frozen=True)
+class UpdateProgress:
+    """The progress of a node's firmware update."""
+
+    state: UpdateState
+    downloaded_bytes: int
+    """The number of bytes of firmware the node has acknowledged."""
+
+    total_bytes: int
+    """The number of bytes of firmware in the image."""
+
+
+UpdateProgressCallback = Callable[[NodeId, UpdateProgress], None]
+"""Called each time a node's update makes progress."""
+
+
 async def run_update(
     messenger: CanMessenger,
     node_id: NodeId,
@@ -25,6 +62,8 @@ async def run_update(
     retry_count: int,
     timeout_seconds: float,
     erase: Optional[bool] = True,
+    window_size: int = 1,
+    chunk_retry_count: int = 0,
 ) -> None:
     """Perform a firmware update on a node target.
 
@@ -35,43 +74,205 @@ async def run_update(
         retry_count: Number of times to retry.
         timeout_seconds: How much to wait for responses.
         erase: Whether to erase flash before updating.
+        window_size: Number of data chunks to send before waiting for acks.
+        chunk_retry_count: Number of times to resend a data chunk that isn't
+            acked. See FirmwareUpdateDownloader.run.
 
     Returns:
         None
     """
-    hex_processor = HexRecordProcessor.from_file(hex_file)
+    await _update_node(
+        messenger=messenger,
+        target=Target(system_node=node_id),
+        hex_processor=HexRecordProcessor.from_file(hex_file),
+        retry_count=retry_count,
+        timeout_seconds=timeout_seconds,
+        erase=erase,
+        window_size=window_size,
+        chunk_retry_count=chunk_retry_count,
+        report=lambda state, downloaded_bytes: None,
+    )
 
-    initiator = FirmwareUpdateInitiator(messenger)
-    downloader = FirmwareUpdateDownloader(messenger)
 
-    target = Target(system_node=node_id)
+async def run_updates(
+    messenger: CanMessenger,
+    hex_files: Mapping[NodeId, Path],
+    retry_count: int,
+    timeout_seconds: float,
+    erase: Optional[bool] = True,
+    window_size: int = 1,
+    window_sizes: Optional[Mapping[NodeId, int]] = None,
+    chunk_retry_count: int = 0,
+    progress_callback: Optional[UpdateProgressCallback] = None,
+) -> None:
+    """Perform firmware updates on several node targets at once.
 
-    logger.info(f"Initiating FW Update on {target}.")
+    Each hex file is only read once, however many nodes it is for. The
+    nodes share the bus in proportion to their window sizes, because each
+    one can only have that many data chunks waiting for an ack.
 
-    await initiator.run(
-        target=target,
-        retry_count=retry_count,
-        ready_wait_time_sec=timeout_seconds,
+    If any update fails, the others still run to completion, and then the
+    first failure is raised.
+
+    Args:
+        messenger: The can messenger to use.
+        hex_files: The file containing firmware for each node being updated.
+        retry_count: Number of times to retry.
+        timeout_seconds: How much to wait for responses.
+        erase: Whether to erase flash before updating.
+        window_size: Number of data chunks to send before waiting for acks.
+        window_sizes: Window sizes for particular nodes, instead of window_size.
+        chunk_retry_count: Number of times to resend a data chunk that isn't
+            acked. See FirmwareUpdateDownloader.run.
+        progress_callback: Function called with each node's progress.
+
+    Returns:
+        None
+    """
+    images = _load_images(hex_files.values())
+    reporters = {
+        node_id: _ProgressReporter(
+            node_id=node_id,
+            total_bytes=images[hex_file.resolve()].total_bytes,
+            callback=progress_callback,
+        )
+        for node_id, hex_file in hex_files.items()
+    }
+    for reporter in reporters.values():
+        reporter(UpdateState.queued, 0)
+
+    results = await asyncio.gather(
+        *(
+            _update_node(
+                messenger=messenger,
+                target=Target(system_node=node_id),
+                hex_processor=HexRecordProcessor(images[hex_file.resolve()].records),
+                retry_count=retry_count,
+                timeout_seconds=timeout_seconds,
+                erase=erase,
+                window_size=(window_sizes or {}).get(node_id, window_size),
+                chunk_retry_count=chunk_retry_count,
+                report=reporters[node_id],
+            )
+            for node_id, hex_file in hex_files.items()
+        ),
+        return_exceptions=True,
     )
-    if erase:
-        eraser = FirmwareUpdateEraser(messenger)
-        logger.info(f"Erasing existing FW Update on {target}.")
-        await eraser.run(
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
+class _ProgressReporter:
+    """Reports the progress of one node's update to an UpdateProgressCallback."""
+
+    def __init__(
+        self,
+        node_id: NodeId,
+        total_bytes: int,
+        callback: Optional[UpdateProgressCallback],
+    ) -> None:
+        self._node_id = node_id
+        self._total_bytes = total_bytes
+        self._callback = callback
+
+    def __call__(self, state: UpdateState, downloaded_bytes: int) -> None:
+        if self._callback:
+            self._callback(
+                self._node_id,
+                UpdateProgress(
+                    state=state,
+                    downloaded_bytes=downloaded_bytes,
+                    total_bytes=self._total_bytes,
+                ),
+            )
+
+
+@dataclass(frozen=True)
+class _Image:
+    """The parsed contents of a hex file."""
+
+    records: List[HexRecord]
+    total_bytes: int
+
+
+def _load_images(hex_files: Iterable[Path]) -> Dict[Path, _Image]:
+    """Parse each of the hex files once, by resolved path."""
+    images: Dict[Path, _Image] = {}
+    for hex_file in hex_files:
+        path = hex_file.resolve()
+        if path not in images:
+            with path.open() as f:
+                records = list(from_hex_file(f))
+            images[path] = _Image(
+                records=records,
+                total_bytes=sum(
+                    len(r.data) for r in records if r.record_type == RecordType.Data
+                ),
+            )
+    return images
+
+
+async def _update_node(
+    messenger: CanMessenger,
+    target: Target,
+    hex_processor: HexRecordProcessor,
+    retry_count: int,
+    timeout_seconds: float,
+    erase: Optional[bool],
+    window_size: int,
+    chunk_retry_count: int,
+    report: Callable[[UpdateState, int], None],
+) -> None:
+    """Update one node, reporting each stage."""
+    downloaded_bytes = 0
+
+    def _on_download_progress(acked_bytes: int) -> None:
+        nonlocal downloaded_bytes
+        downloaded_bytes = acked_bytes
+        report(UpdateState.downloading, acked_bytes)
+
+    initiator = FirmwareUpdateInitiator(messenger)
+    downloader = FirmwareUpdateDownloader(messenger)
+
+    try:
+        logger.info(f"Initiating FW Update on {target}.")
+        report(UpdateState.initializing, 0)
+        await initiator.run(
+            target=target,
+            retry_count=retry_count,
+            ready_wait_time_sec=timeout_seconds,
+        )
+        if erase:
+            eraser = FirmwareUpdateEraser(messenger)
+            logger.info(f"Erasing existing FW Update on {target}.")
+            report(UpdateState.erasing, 0)
+            await eraser.run(
+                node_id=target.bootloader_node,
+                timeout_sec=timeout_seconds,
+            )
+        else:
+            logger.info("Skipping erase step.")
+
+        logger.info(f"Downloading FW to {target.bootloader_node}.")
+        report(UpdateState.downloading, 0)
+        await downloader.run(
             node_id=target.bootloader_node,
-            timeout_sec=timeout_seconds,
+            hex_processor=hex_processor,
+            ack_wait_seconds=timeout_seconds,
+            window_size=window_size,
+            chunk_retry_count=chunk_retry_count,
+            progress_callback=_on_download_progress,
         )
-    else:
-        logger.info("Skipping erase step.")
-
-    logger.info(f"Downloading FW to {target.bootloader_node}.")
-    await downloader.run(
-        node_id=target.bootloader_node,
-        hex_processor=hex_processor,
-        ack_wait_seconds=timeout_seconds,
-    )
 
-    logger.info(f"Restarting FW on {target.system_node}.")
-    await messenger.send(
-        node_id=target.bootloader_node,
-        message=FirmwareUpdateStartApp(),
-    )
+        logger.info(f"Restarting FW on {target.system_node}.")
+        report(UpdateState.restarting, downloaded_bytes)
+        await messenger.send(
+            node_id=target.bootloader_node,
+            message=FirmwareUpdateStartApp(),
+        )
+    except Exception:
+        logger.exception(f"FW Update on {target} failed.")
+        report(UpdateState.failed, downloaded_bytes)
+        raise
+    report(UpdateState.done, downloaded_bytes)
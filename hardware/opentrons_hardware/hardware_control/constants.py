@@ -6,3 +6,6 @@ brushed_motor_interrupts_per_sec: Final = 32000
 
 interrupts_per_sec: Final = 100000
 """The number of motor interrupts per second."""
+
+max_move_groups: Final = 6
+"""The number of move groups each node can hold at once."""
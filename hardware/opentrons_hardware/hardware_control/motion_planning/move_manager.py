@@ -2,6 +2,10 @@
 import logging
 from typing import List, Tuple, Generic
 from opentrons_hardware.hardware_control.motion_planning import move_utils
+from opentrons_hardware.hardware_control.motion_planning.vectorized import (
+    Path,
+    blend,
+)
 from opentrons_hardware.hardware_control.motion_planning.types import (
     Coordinates,
     Move,
@@ -56,9 +60,24 @@ class MoveManager(Generic[AxisKey]):
         origin: Coordinates[AxisKey, CoordinateValue],
         target_list: List[MoveTarget[AxisKey]],
         iteration_limit: int = 10,
+        vectorized: bool = False,
     ) -> Tuple[bool, List[List[Move[AxisKey]]]]:
-        """Create and blend moves from targets."""
+        """Create and blend moves from targets.
+
+        Args:
+            origin: where the moves start
+            target_list: where the moves go
+            iteration_limit: how many times to blend the moves before giving up
+            vectorized: blend all the moves in each iteration at once, with
+                array operations, instead of one at a time. The moves are the
+                same either way.
+
+        Returns:
+            Whether the moves are blended, and the moves from each iteration.
+        """
         self._clear_blend_log()
+        if vectorized:
+            return self._plan_motion_vectorized(origin, target_list, iteration_limit)
         to_blend = self._get_initial_moves_from_targets(origin, target_list)
         assert to_blend, "Check target list"
         for i in range(iteration_limit):
@@ -93,3 +112,31 @@ class MoveManager(Generic[AxisKey]):
                 to_blend = self._blend_log[-1]
         log.error("Could not converge!")
         return False, self._blend_log
+
+    def _plan_motion_vectorized(
+        self,
+        origin: Coordinates[AxisKey, CoordinateValue],
+        target_list: List[MoveTarget[AxisKey]],
+        iteration_limit: int,
+    ) -> Tuple[bool, List[List[Move[AxisKey]]]]:
+        """Create and blend moves from targets, all at once."""
+        assert target_list, "Check target list"
+        path = Path.build(origin, target_list, self._constraints)
+        initial_speeds = final_speeds = path.max_speeds
+        for i in range(iteration_limit):
+            log.debug(f"Motion blending iteration: {i}")
+            blended = blend(path, initial_speeds, final_speeds)
+            self._blend_log.append(blended.moves)
+            if blended.all_blended():
+                log.info(
+                    f"built {len(blended.moves)} moves with "
+                    f"{sum(m.nonzero_blocks for m in blended.moves)} "
+                    f"non-zero blocks after {i+1} iteration(s)"
+                )
+                return True, self._blend_log
+            else:
+                self._blend_log[i] = self._add_dummy_start_end_to_moves(blended.moves)
+                initial_speeds = blended.initial_speeds
+                final_speeds = blended.final_speeds
+        log.error("Could not converge!")
+        return False, self._blend_log
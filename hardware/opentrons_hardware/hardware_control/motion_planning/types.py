@@ -2,6 +2,7 @@
 from __future__ import annotations
 import logging
 import dataclasses
+import math
 import numpy as np
 
 
@@ -279,6 +280,7 @@ def vectorize(position: Coordinates[AxisKey, np.float64]) -> "NDArray[np.float64
 
 def is_unit_vector(position: Coordinates[AxisKey, np.float64]) -> bool:
     """Check whether a coordinate vector has unit magnitude."""
-    vectorized = vectorize(position)
-    magnitude = np.linalg.norm(vectorized)  # type: ignore[no-untyped-call]
-    return cast(bool, np.isclose(magnitude, 1.0))
+    # Every Move checks its unit vector, so this avoids numpy's overhead on
+    # such a small vector. The tolerance is the same as np.isclose's.
+    magnitude = math.sqrt(sum(float(v) ** 2 for v in position.values()))
+    return abs(magnitude - 1.0) <= 1e-8 + 1e-5
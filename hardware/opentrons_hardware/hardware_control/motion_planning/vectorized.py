@@ -0,0 +1,365 @@
+"""Vectorized motion planning.
+
+Blends moves with the same rules as `move_utils`, but holds the whole path
+in arrays with a row per move and a column per axis, so that each blending
+iteration is a handful of array operations instead of a call to
+`build_move` for every move.
+"""
+from __future__ import annotations
+import dataclasses
+import numpy as np
+from typing import Generic, List, Sequence, Set, TYPE_CHECKING
+
+from opentrons_hardware.hardware_control.motion_planning.move_utils import (
+    FLOAT_THRESHOLD,
+)
+from opentrons_hardware.hardware_control.motion_planning.types import (
+    Block,
+    Coordinates,
+    CoordinateValue,
+    AxisKey,
+    Move,
+    MoveTarget,
+    SystemConstraints,
+    ZeroLengthMoveError,
+)
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+
+@dataclasses.dataclass(frozen=True)
+class Path(Generic[AxisKey]):
+    """The moves from an origin through a list of targets, as arrays."""
+
+    axes: List[AxisKey]
+    unit_vectors: "NDArray[np.float64]"
+    distances: "NDArray[np.float64]"
+    max_speeds: "NDArray[np.float64]"
+    max_acceleration: "NDArray[np.float64]"
+    max_speed_discont: "NDArray[np.float64]"
+    max_direction_change_speed_discont: "NDArray[np.float64]"
+    unit_vector_coordinates: List[Coordinates[AxisKey, np.float64]]
+
+    @classmethod
+    def build(
+        cls,
+        origin: Coordinates[AxisKey, CoordinateValue],
+        targets: Sequence[MoveTarget[AxisKey]],
+        constraints: SystemConstraints[AxisKey],
+    ) -> Path[AxisKey]:
+        """Build the path, with the constraints of each of its axes."""
+        all_axes: Set[AxisKey] = set()
+        for target in targets:
+            all_axes.update(set(target.position.keys()))
+        axes = list(all_axes)
+
+        positions = np.empty((len(targets) + 1, len(axes)), dtype=np.float64)
+        positions[0] = [origin.get(k, 0) for k in axes]
+        positions[1:] = [
+            [target.position.get(k, 0) for k in axes] for target in targets
+        ]
+        displacements: "NDArray[np.float64]" = positions[1:] - positions[:-1]
+        distances = np.linalg.norm(  # type: ignore[no-untyped-call]
+            displacements, axis=1
+        )
+        for i in np.flatnonzero(distances == 0)[:1]:
+            raise ZeroLengthMoveError(
+                dict(zip(axes, positions[i])), dict(zip(axes, positions[i + 1]))
+            )
+        unit_vectors = displacements / distances[:, np.newaxis]
+
+        return cls(
+            axes=axes,
+            unit_vectors=unit_vectors,
+            distances=distances,
+            max_speeds=np.array(
+                [target.max_speed for target in targets], dtype=np.float64
+            ),
+            max_acceleration=np.array(
+                [constraints[k].max_acceleration for k in axes], dtype=np.float64
+            ),
+            max_speed_discont=np.array(
+                [constraints[k].max_speed_discont for k in axes], dtype=np.float64
+            ),
+            max_direction_change_speed_discont=np.array(
+                [constraints[k].max_direction_change_speed_discont for k in axes],
+                dtype=np.float64,
+            ),
+            unit_vector_coordinates=[
+                dict(zip(axes, unit_vector)) for unit_vector in unit_vectors
+            ],
+        )
+
+    def __len__(self) -> int:
+        """Get the number of moves."""
+        return len(self.distances)
+
+
+@dataclasses.dataclass(frozen=True)
+class BlendedPath(Generic[AxisKey]):
+    """The moves built by one blending iteration over a path."""
+
+    path: Path[AxisKey]
+    moves: List[Move[AxisKey]]
+
+    @property
+    def initial_speeds(self) -> "NDArray[np.float64]":
+        """Get the initial speed of each move."""
+        return np.array([m.initial_speed for m in self.moves], dtype=np.float64)
+
+    @property
+    def final_speeds(self) -> "NDArray[np.float64]":
+        """Get the final speed of each move."""
+        return np.array([m.final_speed for m in self.moves], dtype=np.float64)
+
+    def all_blended(self) -> bool:
+        """Check whether the moves are all blended, as `all_blended` does."""
+        if len(self.moves) < 2:
+            return True
+        path = self.path
+        distances = path.distances
+        block_distances = np.array(
+            [sum(b.distance for b in m.blocks) for m in self.moves], dtype=np.float64
+        )
+        if np.any(np.abs(block_distances - distances) > FLOAT_THRESHOLD) or not np.all(
+            np.isclose(block_distances, distances)
+        ):
+            return False
+
+        unit_vectors = path.unit_vectors
+        final_speeds = (
+            np.array([m.blocks[-1].final_speed for m in self.moves[:-1]])[:, np.newaxis]
+            * unit_vectors[:-1]
+        )
+        initial_speeds = (
+            np.array([m.blocks[0].initial_speed for m in self.moves[1:]])[:, np.newaxis]
+            * unit_vectors[1:]
+        )
+
+        def _less_or_close(
+            constraint: "NDArray[np.float64]",
+        ) -> "NDArray[np.bool_]":
+            less_or_close: "NDArray[np.bool_]" = (
+                (np.abs(final_speeds) <= constraint)
+                | np.isclose(final_speeds, constraint)
+                | (np.abs(initial_speeds) <= constraint)
+                | np.isclose(initial_speeds, constraint)
+            )
+            return less_or_close
+
+        same_direction = unit_vectors[:-1] * unit_vectors[1:] > 0
+        blended = np.where(
+            same_direction,
+            (np.abs(initial_speeds - final_speeds) < FLOAT_THRESHOLD)
+            | _less_or_close(path.max_speed_discont),
+            _less_or_close(path.max_direction_change_speed_discont),
+        )
+        return bool(np.all(blended))
+
+
+def _junction_limits(
+    path: Path[AxisKey],
+    neighbor_unit_vectors: "NDArray[np.float64]",
+    neighbor_speeds: "NDArray[np.float64]",
+) -> "NDArray[np.float64]":
+    """Get the speed limit of each move at its junctions with its neighbors.
+
+    These are the limits of `initial_speed_limit_from_axis` and
+    `final_speed_limit_from_axis`, for every axis of every move at once.
+    """
+    unit_vectors = path.unit_vectors
+    directions: "NDArray[np.float64]" = neighbor_unit_vectors * unit_vectors
+    stopped = (directions == 0) | (neighbor_speeds == 0)[:, np.newaxis]
+    neighbor_axis_speeds = np.abs(
+        neighbor_speeds[:, np.newaxis] * neighbor_unit_vectors
+    )
+    axis_limits = np.where(
+        stopped,
+        path.max_speed_discont,
+        np.where(
+            directions > 0,
+            np.maximum(neighbor_axis_speeds, path.max_speed_discont),
+            path.max_direction_change_speed_discont,
+        ),
+    )
+    with np.errstate(divide="ignore"):
+        # An axis that doesn't move has no limit.
+        axis_speed_limits: "NDArray[np.float64]" = axis_limits / np.abs(unit_vectors)
+    limits: "NDArray[np.float64]" = axis_speed_limits.min(axis=1)
+    return limits
+
+
+def _achievable_final(
+    path: Path[AxisKey],
+    initial_speeds: "NDArray[np.float64]",
+    final_speeds: "NDArray[np.float64]",
+) -> "NDArray[np.float64]":
+    """Limit final speeds the same way as `achievable_final`."""
+    unit_vectors = path.unit_vectors
+    speed_changes: "NDArray[np.float64]" = final_speeds - initial_speeds
+    with np.errstate(divide="ignore", invalid="ignore"):
+        max_axis_final_speeds: "NDArray[np.float64]" = (
+            np.copysign(
+                np.sqrt(
+                    (initial_speeds[:, np.newaxis] * unit_vectors) ** 2
+                    + 2 * path.max_acceleration * path.distances[:, np.newaxis]
+                )
+                / unit_vectors,
+                speed_changes[:, np.newaxis],
+            )
+            + initial_speeds[:, np.newaxis]
+        )
+    axis_limits: "NDArray[np.float64]" = np.where(
+        unit_vectors != 0, np.abs(max_axis_final_speeds), np.inf
+    )
+    limited: "NDArray[np.float64]" = np.copysign(
+        np.minimum(axis_limits.min(axis=1), np.abs(final_speeds)), final_speeds
+    )
+    return limited
+
+
+def _block_accelerations(path: Path[AxisKey]) -> "NDArray[np.float64]":
+    """Get the acceleration of each move's blocks, as `build_blocks` does."""
+    unit_vectors = path.unit_vectors
+    max_acceleration = np.where(unit_vectors != 0, path.max_acceleration, 0.0)
+    acceleration_vectors = (
+        np.linalg.norm(max_acceleration, axis=1)[  # type: ignore[no-untyped-call]
+            :, np.newaxis
+        ]
+        * unit_vectors
+    )
+    for axis in range(len(path.axes)):
+        axis_accelerations = acceleration_vectors[:, axis]
+        over = np.abs(axis_accelerations) > max_acceleration[:, axis]
+        acceleration_vectors[over] *= (
+            max_acceleration[over, axis] / axis_accelerations[over]
+        )[:, np.newaxis]
+    accelerations: "NDArray[np.float64]" = np.linalg.norm(  # type: ignore[no-untyped-call]
+        acceleration_vectors, axis=1
+    )
+    return accelerations
+
+
+def _build_moves(
+    path: Path[AxisKey],
+    initial_speeds: "NDArray[np.float64]",
+    final_speeds: "NDArray[np.float64]",
+) -> List[Move[AxisKey]]:
+    """Build the blocks of every move, as `build_blocks` does."""
+    distances = path.distances
+    max_speeds = path.max_speeds
+    assert np.all(
+        (np.abs(initial_speeds) <= max_speeds)
+        | np.isclose(np.abs(initial_speeds), max_speeds)
+    ), "initial speed exceeds max speed"
+    assert np.all(
+        (np.abs(final_speeds) <= max_speeds)
+        | np.isclose(np.abs(final_speeds), max_speeds)
+    ), "final speed exceeds max speed"
+
+    accelerations = _block_accelerations(path)
+    initial_speed_sq: "NDArray[np.float64]" = initial_speeds**2
+    final_speed_sq: "NDArray[np.float64]" = final_speeds**2
+    max_achievable_speeds = np.sqrt(
+        0.5 * (2 * accelerations * distances + initial_speed_sq + final_speed_sq)
+    )
+    max_speed_sq = np.minimum(max_achievable_speeds, max_speeds) ** 2
+    first_distances = np.abs(max_speed_sq - initial_speed_sq) / (2 * accelerations)
+    final_distances = np.abs(max_speed_sq - final_speed_sq) / (2 * accelerations)
+    # See the FLOAT_THRESHOLD comments in `build_blocks`.
+    trimmed = first_distances + final_distances > (distances + FLOAT_THRESHOLD)
+    trimmed_speed_sq = np.maximum(initial_speed_sq, final_speed_sq)
+    trimmed_first_distances = np.where(
+        trimmed,
+        np.abs(trimmed_speed_sq - initial_speed_sq) / (2 * accelerations),
+        first_distances,
+    )
+    trimmed_final_distances = np.where(
+        trimmed,
+        np.abs(trimmed_speed_sq - final_speed_sq) / (2 * accelerations),
+        final_distances,
+    )
+    coasts = trimmed_first_distances + trimmed_final_distances < (
+        distances - FLOAT_THRESHOLD
+    )
+
+    moves = []
+    for i in range(len(path)):
+        first = Block(
+            initial_speed=initial_speeds[i],
+            acceleration=accelerations[i],
+            distance=first_distances[i],
+        )
+        final = Block(
+            initial_speed=first.final_speed,
+            acceleration=-accelerations[i],
+            distance=final_distances[i],
+        )
+        if trimmed[i]:
+            # Like `build_blocks`, this leaves the speeds the blocks were
+            # built with.
+            first.distance = trimmed_first_distances[i]
+            final.distance = trimmed_final_distances[i]
+        if coasts[i]:
+            coast = Block(
+                initial_speed=final.initial_speed,
+                acceleration=np.float64(0),
+                distance=distances[i] - first.distance - final.distance,
+            )
+        else:
+            coast = Block(np.float64(0), np.float64(0), np.float64(0))
+        moves.append(
+            Move(
+                unit_vector=path.unit_vector_coordinates[i],
+                distance=distances[i],
+                max_speed=max_speeds[i],
+                blocks=(first, coast, final),
+            )
+        )
+    return moves
+
+
+def blend(
+    path: Path[AxisKey],
+    initial_speeds: "NDArray[np.float64]",
+    final_speeds: "NDArray[np.float64]",
+) -> BlendedPath[AxisKey]:
+    """Blend every move in a path once, as `build_move` does.
+
+    Args:
+        path: the path to blend
+        initial_speeds: the initial speed of each move, from the last iteration
+        final_speeds: the final speed of each move, from the last iteration
+
+    Returns:
+        The blended moves.
+    """
+    unit_vectors = path.unit_vectors
+    # A move too short to have a direction joins its neighbors like a stop.
+    long_enough: "NDArray[np.bool_]" = path.distances > FLOAT_THRESHOLD
+    directional = np.where(long_enough[:, np.newaxis], unit_vectors, 0.0)
+    previous_unit_vectors = np.zeros_like(unit_vectors)
+    previous_unit_vectors[1:] = directional[:-1]
+    previous_final_speeds = np.zeros_like(final_speeds)
+    previous_final_speeds[1:] = final_speeds[:-1]
+    next_unit_vectors = np.zeros_like(unit_vectors)
+    next_unit_vectors[:-1] = directional[1:]
+    next_initial_speeds = np.zeros_like(initial_speeds)
+    next_initial_speeds[:-1] = initial_speeds[1:]
+
+    new_initial_speeds = np.minimum(
+        _junction_limits(path, previous_unit_vectors, previous_final_speeds),
+        initial_speeds,
+    )
+    new_final_speeds = _achievable_final(
+        path,
+        new_initial_speeds,
+        np.minimum(
+            _junction_limits(path, next_unit_vectors, next_initial_speeds),
+            final_speeds,
+        ),
+    )
+    return BlendedPath(
+        path=path, moves=_build_moves(path, new_initial_speeds, new_final_speeds)
+    )
@@ -1,8 +1,10 @@
 """Class that schedules motion on can bus."""
 import asyncio
 from collections import defaultdict
+from dataclasses import dataclass
 import logging
-from typing import List, Set, Tuple, Iterator, Union
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple, Iterator, Union
 import numpy as np
 
 from opentrons_hardware.firmware_bindings import ArbitrationId
@@ -27,8 +29,13 @@ from opentrons_hardware.firmware_bindings.messages.payloads import (
     GripperMoveRequestPayload,
     TipActionRequestPayload,
 )
-from .constants import interrupts_per_sec, brushed_motor_interrupts_per_sec
+from .constants import (
+    interrupts_per_sec,
+    brushed_motor_interrupts_per_sec,
+    max_move_groups,
+)
 from opentrons_hardware.hardware_control.motion import (
+    MoveGroup,
     MoveGroups,
     MoveGroupSingleAxisStep,
     MoveGroupSingleGripperStep,
@@ -269,13 +276,295 @@ class MoveGroupRunner:
         """Run all the move groups."""
         scheduler = MoveScheduler(self._move_groups)
         try:
-            can_messenger.add_listener(scheduler)
+            can_messenger.add_listener(
+                scheduler,
+                message_ids=[MoveCompleted.message_id, TipActionResponse.message_id],
+            )
             completions = await scheduler.run(can_messenger)
         finally:
             can_messenger.remove_listener(scheduler)
         return completions
 
 
+@dataclass(frozen=True)
+class MoveGroupTiming:
+    """How long one move group took to load and to execute."""
+
+    load_sec: float
+    """The time taken to send the group's steps to the nodes."""
+
+    execute_sec: float
+    """The time from requesting the group's execution to its last completion."""
+
+    wait_sec: float
+    """The time execution waited for the group to finish loading."""
+
+
+class StreamingMoveGroupRunner(MoveGroupRunner):
+    """A move group runner that loads groups while earlier groups execute.
+
+    Each group is loaded into one of the nodes' move group slots as soon as
+    there is one free, so that it is ready to execute as soon as the group
+    before it completes. Once every slot has been used they are cleared,
+    which has to wait for the last group in them to complete, so loading a
+    group is only on the critical path once every max_loaded_groups groups.
+
+    More groups can be added with append() while the runner is running. If
+    it is kept open, execute() waits for more groups until close() is
+    called; otherwise it returns once it runs out of groups.
+
+    This is opt-in: the OT3 backend still runs each move with
+    MoveGroupRunner, since each of its moves is a single group.
+    """
+
+    def __init__(
+        self,
+        move_groups: MoveGroups,
+        max_loaded_groups: int = max_move_groups,
+        keep_open: bool = False,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            move_groups: The move groups to run.
+            max_loaded_groups: The number of move group slots to load.
+            keep_open: Whether to wait for more groups until close() is called.
+        """
+        super().__init__(move_groups=list(move_groups))
+        if max_loaded_groups < 1:
+            raise ValueError("max_loaded_groups must be at least 1.")
+        self._max_loaded_groups = max_loaded_groups
+        self._is_open = keep_open
+        # Groups loaded, groups whose execution was requested, and groups
+        # completed, counted from the first group.
+        self._loaded = 0
+        self._started = 0
+        self._completed = 0
+        self._load_secs: List[float] = []
+        self._timings: List[MoveGroupTiming] = []
+        # Created when first awaited, so the runner can be built outside
+        # the event loop that runs it.
+        self._state_changed: Optional[asyncio.Event] = None
+        self._group_done: Optional[asyncio.Event] = None
+        self._pending: Set[Tuple[int, int]] = set()
+        self._stop_conditions: Dict[Tuple[int, int], MoveStopCondition] = {}
+        self._positions: Dict[int, Tuple[Tuple[int, int], float]] = {}
+        self._error: Optional[Exception] = None
+
+    @property
+    def timings(self) -> List[MoveGroupTiming]:
+        """The timing of each group that has completed."""
+        return list(self._timings)
+
+    def append(self, move_groups: MoveGroups) -> None:
+        """Add groups to run after the ones already added."""
+        self._move_groups.extend(move_groups)
+        self._notify()
+
+    def close(self) -> None:
+        """Stop waiting for more groups once the ones added have run."""
+        self._is_open = False
+        self._notify()
+
+    async def prep(self, can_messenger: CanMessenger) -> None:
+        """Load the first group, so that execute() can start it right away."""
+        if self._loaded < len(self._move_groups):
+            await self._load_next(can_messenger)
+        self._is_prepped = True
+
+    async def execute(self, can_messenger: CanMessenger) -> NodeDict[float]:
+        """Execute every group, loading the later ones as the earlier execute.
+
+        Returns:
+            The current position after the moves for all the axes that
+            acknowledged completing moves.
+        """
+        can_messenger.add_listener(
+            self._on_completion,
+            message_ids=[MoveCompleted.message_id, TipActionResponse.message_id],
+        )
+        loader = asyncio.get_event_loop().create_task(self._load_ahead(can_messenger))
+        try:
+            while True:
+                await self._wait_for(
+                    lambda: self._started < len(self._move_groups)
+                    or not self._is_open
+                    or loader.done()
+                )
+                if loader.done():
+                    # Loading failed, so raise its error.
+                    await loader
+                if self._started == len(self._move_groups):
+                    break
+                await self._execute_next(can_messenger, loader)
+        finally:
+            loader.cancel()
+            can_messenger.remove_listener(self._on_completion)
+        return {NodeId(node): position[1] for node, position in self._positions.items()}
+
+    async def _load_ahead(self, can_messenger: CanMessenger) -> None:
+        """Load each group as soon as there is a slot for it."""
+        while True:
+            await self._wait_for(
+                lambda: self._loaded < len(self._move_groups)
+                and (
+                    self._loaded % self._max_loaded_groups != 0
+                    or self._completed == self._loaded
+                )
+            )
+            await self._load_next(can_messenger)
+
+    async def _load_next(self, can_messenger: CanMessenger) -> None:
+        """Load the next group into its slot, first clearing the slots if needed."""
+        index = self._loaded
+        slot = index % self._max_loaded_groups
+        start = time.perf_counter()
+        if slot == 0:
+            await self._clear_groups(can_messenger)
+        for seq_i, sequence in enumerate(self._move_groups[index]):
+            for node, step in sequence.items():
+                await can_messenger.send(
+                    node_id=node,
+                    message=self._get_message_type(step, slot, seq_i),
+                )
+        self._load_secs.append(time.perf_counter() - start)
+        self._loaded += 1
+        self._notify()
+
+    async def _execute_next(
+        self, can_messenger: CanMessenger, loader: "asyncio.Task[None]"
+    ) -> None:
+        """Execute the next group once it is loaded, and wait for it to complete."""
+        index = self._started
+        wait_start = time.perf_counter()
+        await self._wait_for(lambda: self._loaded > index or loader.done())
+        if loader.done():
+            await loader
+        wait_sec = time.perf_counter() - wait_start
+
+        group = self._move_groups[index]
+        slot = index % self._max_loaded_groups
+        self._pending = {
+            (node.value, seq_id)
+            for seq_id, sequence in enumerate(group)
+            for node in sequence
+        }
+        self._stop_conditions = {
+            (node.value, seq_id): step.stop_condition
+            for seq_id, sequence in enumerate(group)
+            for node, step in sequence.items()
+        }
+        group_done = self._group_done = asyncio.Event()
+        self._started += 1
+
+        execute_start = time.perf_counter()
+        if self._pending:
+            log.info(f"Executing move group {index} in slot {slot}.")
+            await can_messenger.send(
+                node_id=NodeId.broadcast,
+                message=ExecuteMoveGroupRequest(
+                    payload=ExecuteMoveGroupRequestPayload(
+                        group_id=UInt8Field(slot),
+                        start_trigger=UInt8Field(0),
+                        cancel_trigger=UInt8Field(0),
+                    )
+                ),
+            )
+            try:
+                await asyncio.wait_for(
+                    group_done.wait(), max(1.0, _group_duration(group) * 1.1)
+                )
+            except asyncio.TimeoutError:
+                log.warning("Move set timed out")
+
+        self._timings.append(
+            MoveGroupTiming(
+                load_sec=self._load_secs[index],
+                execute_sec=time.perf_counter() - execute_start,
+                wait_sec=wait_sec,
+            )
+        )
+        self._completed += 1
+        self._notify()
+        if self._error:
+            raise self._error
+
+    def _on_completion(
+        self, message: MessageDefinition, arbitration_id: ArbitrationId
+    ) -> None:
+        """Handle a completion of a step in the executing group."""
+        if not isinstance(message, (MoveCompleted, TipActionResponse)):
+            return
+        node_id = arbitration_id.parts.originating_node_id
+        seq_id = message.payload.seq_id.value
+        index = self._started - 1
+        if message.payload.group_id.value != index % self._max_loaded_groups or (
+            (node_id, seq_id) not in self._pending
+        ):
+            log.warning(
+                f"Got a move ack for ({node_id}, {seq_id}) which is not in this "
+                "group; may have leaked from an earlier timed-out group"
+            )
+            return
+
+        self._pending.remove((node_id, seq_id))
+        self._positions[node_id] = max(
+            self._positions.get(node_id, ((-1, -1), 0.0)),
+            (
+                (index, seq_id),
+                float(message.payload.current_position_um.value) / 1000.0,
+            ),
+        )
+        if not _completion_succeeded(message, self._stop_conditions[(node_id, seq_id)]):
+            self._error = MoveConditionNotMet()
+        if not self._pending:
+            log.info(f"Move group {index} has completed.")
+            assert self._group_done
+            self._group_done.set()
+
+    async def _wait_for(self, condition: Callable[[], bool]) -> None:
+        while not condition():
+            if self._state_changed is None:
+                self._state_changed = asyncio.Event()
+            await self._state_changed.wait()
+
+    def _notify(self) -> None:
+        """Wake everything waiting for the runner's state to change."""
+        if self._state_changed is not None:
+            self._state_changed.set()
+            self._state_changed = None
+
+
+def _group_duration(group: MoveGroup) -> float:
+    return sum(
+        max((float(step.duration_sec) for step in sequence.values()), default=0.0)
+        for sequence in group
+    )
+
+
+def _completion_succeeded(
+    message: _AcceptableMoves, stop_condition: MoveStopCondition
+) -> bool:
+    """Check whether a completed step met its stop condition.
+
+    Used by every runner, so that they agree on what a failed home or tip
+    action looks like.
+    """
+    limit_switch = stop_condition == MoveStopCondition.limit_switch
+    if isinstance(message, MoveCompleted):
+        if limit_switch and message.payload.ack_id.value == 1:
+            log.warning("Homing failed. Condition: Homing timed out.")
+            return False
+    elif not message.payload.success.value:
+        if limit_switch and message.payload.ack_id.value != 1:
+            log.warning("Drop tip failed. Condition Tip still detected.")
+            return False
+        elif not limit_switch:
+            log.warning("Pick up tip failed. Condition Tip not detected.")
+            return False
+    return True
+
+
 class MoveScheduler:
     """A message listener that manages the sending of execute move group messages."""
 
@@ -325,44 +614,15 @@ class MoveScheduler:
             log.info(f"Move group {group_id} has completed.")
             self._event.set()
 
-    def _handle_move_completed(self, message: MoveCompleted) -> None:
-        group_id = message.payload.group_id.value
-        ack_id = message.payload.ack_id.value
-        if self._stop_condition[
-            group_id
-        ] == MoveStopCondition.limit_switch and ack_id != UInt8Field(2):
-            if ack_id == UInt8Field(1):
-                condition = "Homing timed out."
-                log.warning(f"Homing failed. Condition: {condition}")
-                raise MoveConditionNotMet()
-
-    def _handle_tip_action(self, message: TipActionResponse) -> None:
-        group_id = message.payload.group_id.value
-        ack_id = message.payload.ack_id.value
-        limit_switch = bool(
-            self._stop_condition[group_id] == MoveStopCondition.limit_switch
-        )
-        success = message.payload.success.value
-        # TODO need to add tip action type to the response message.
-        if limit_switch and limit_switch != ack_id and not success:
-            condition = "Tip still detected."
-            log.warning(f"Drop tip failed. Condition {condition}")
-            raise MoveConditionNotMet()
-        elif not limit_switch and not success:
-            condition = "Tip not detected."
-            log.warning(f"Pick up tip failed. Condition {condition}")
-            raise MoveConditionNotMet()
-
     def __call__(
         self, message: MessageDefinition, arbitration_id: ArbitrationId
     ) -> None:
         """Incoming message handler."""
-        if isinstance(message, MoveCompleted):
+        if isinstance(message, (MoveCompleted, TipActionResponse)):
             self._remove_move_group(message, arbitration_id)
-            self._handle_move_completed(message)
-        elif isinstance(message, TipActionResponse):
-            self._remove_move_group(message, arbitration_id)
-            self._handle_tip_action(message)
+            stop_condition = self._stop_condition[message.payload.group_id.value]
+            if not _completion_succeeded(message, stop_condition):
+                raise MoveConditionNotMet()
 
     async def run(self, can_messenger: CanMessenger) -> _Completions:
         """Start each move group after the prior has completed."""
@@ -1,6 +1,5 @@
 """Functions for commanding motion limited by tool sensors."""
-import asyncio
-from typing import Union, List, Iterator
+from typing import Union, List, cast
 from logging import getLogger
 from numpy import float64
 from math import copysign
@@ -99,14 +98,13 @@ async def capacitive_pass(
     pass_group = _build_pass_step(mover, distance, speed)
     runner = MoveGroupRunner(move_groups=[[pass_group]])
     await runner.prep(messenger)
-    async with sensor_scheduler.capture_output(sensor, messenger) as output_queue:
+    async with sensor_scheduler.capture([sensor], messenger) as capture:
         await runner.execute(messenger)
 
-    def _drain() -> Iterator[float]:
-        while True:
-            try:
-                yield output_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
-
-    return list(_drain())
+    readings = capture.buffer(sensor)
+    if readings.dropped:
+        LOG.warning(
+            f"capacitive pass kept the last {len(readings)} readings, "
+            f"dropping {readings.dropped}"
+        )
+    return cast(List[float], readings.values().tolist())
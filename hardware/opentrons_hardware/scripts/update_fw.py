@@ -51,6 +51,8 @@ async def run(args: argparse.Namespace) -> None:
     retry_count = args.retry_count
     timeout_seconds = args.timeout_seconds
     erase = not args.no_erase
+    window_size = args.window_size
+    chunk_retry_count = args.chunk_retry_count
 
     async with build.can_messenger(build_settings(args)) as messenger:
         await run_update(
@@ -60,6 +62,8 @@ async def run(args: argparse.Namespace) -> None:
             retry_count=retry_count,
             timeout_seconds=timeout_seconds,
             erase=erase,
+            window_size=window_size,
+            chunk_retry_count=chunk_retry_count,
         )
 
     logger.info("Done")
@@ -94,6 +98,19 @@ def main() -> None:
     parser.add_argument(
         "--timeout-seconds", help="Number of seconds to wait.", type=float, default=10
     )
+    parser.add_argument(
+        "--window-size",
+        help="Number of data chunks to send before waiting for acks.",
+        type=int,
+        default=1,
+    )
+    parser.add_argument(
+        "--chunk-retry-count",
+        help="Number of times to resend a data chunk that isn't acked. Only "
+        "for bootloaders that ignore a repeated chunk.",
+        type=int,
+        default=0,
+    )
     parser.add_argument(
         "--no-erase",
         help="Don't erase existing application from flash.",
@@ -0,0 +1,284 @@
+"""Capture sensor readings into preallocated buffers.
+
+Sensors bound to report their output send a ReadFromSensorResponse for
+every reading. `SensorCapture` listens for them and records the raw
+fixed-point reading and the time it arrived into a ring buffer per sensor,
+which is allocated up front, so that a long capture doesn't build a Python
+object per reading. Readings can also be streamed to an append-only file
+of fixed-size records, which `read_capture_file` maps back into an array.
+"""
+from __future__ import annotations
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import Dict, Iterable, List, Optional, Tuple, Type, TYPE_CHECKING
+
+import numpy as np
+from typing_extensions import Final
+
+from opentrons_hardware.firmware_bindings.arbitration_id import ArbitrationId
+from opentrons_hardware.firmware_bindings.constants import NodeId
+from opentrons_hardware.firmware_bindings.messages.message_definitions import (
+    ReadFromSensorResponse,
+)
+from opentrons_hardware.firmware_bindings.messages.messages import MessageDefinition
+from opentrons_hardware.sensors.utils import (
+    SensorInformation,
+    sensor_fixed_point_conversion,
+)
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+DEFAULT_CAPTURE_CAPACITY: Final = 1 << 16
+"""The number of readings of each sensor a capture keeps by default."""
+
+SAMPLE_DTYPE: Final = np.dtype([("timestamp", "<f8"), ("data", "<i4")])
+"""A reading in a ring buffer: when it arrived, and its fixed-point value."""
+
+RECORD_DTYPE: Final = np.dtype(
+    [
+        ("timestamp", "<f8"),
+        ("node_id", "u1"),
+        ("sensor_type", "u1"),
+        ("sensor_id", "u1"),
+        ("data", "<i4"),
+    ]
+)
+"""A reading in a capture file, which also says which sensor it is from."""
+
+CAPTURE_FILE_MAGIC: Final = b"OTSCAP01"
+"""The start of every capture file, before its records."""
+
+# A sensor's originating node, sensor type and sensor ID.
+SensorKey = Tuple[int, int, int]
+
+
+def _key(sensor: SensorInformation) -> SensorKey:
+    return int(sensor.node_id), int(sensor.sensor_type), int(sensor.sensor_id)
+
+
+class SensorRingBuffer:
+    """The latest readings of a sensor, in preallocated arrays.
+
+    Once the buffer is full, each reading overwrites the oldest one.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Constructor.
+
+        Args:
+            capacity: The number of readings to keep.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        self._samples: "NDArray[np.void]" = np.zeros(capacity, dtype=SAMPLE_DTYPE)
+        self._next = 0
+        self._size = 0
+        self._dropped = 0
+
+    @property
+    def capacity(self) -> int:
+        """The number of readings the buffer can keep."""
+        return len(self._samples)
+
+    @property
+    def dropped(self) -> int:
+        """The number of readings that were overwritten by newer ones."""
+        return self._dropped
+
+    def __len__(self) -> int:
+        """The number of readings in the buffer."""
+        return self._size
+
+    def append(self, timestamp: float, data: int) -> None:
+        """Add a reading, overwriting the oldest one if the buffer is full."""
+        self._samples[self._next] = (timestamp, data)
+        self._next += 1
+        if self._next == len(self._samples):
+            self._next = 0
+        if self._size < len(self._samples):
+            self._size += 1
+        else:
+            self._dropped += 1
+
+    def clear(self) -> None:
+        """Forget every reading."""
+        self._next = 0
+        self._size = 0
+        self._dropped = 0
+
+    def views(self) -> List["NDArray[np.void]"]:
+        """Get the readings, oldest first, without copying them.
+
+        Returns one read-only array, or two if the readings wrap around the
+        end of the buffer. The arrays share the buffer's memory, so they
+        only stay valid until newer readings overwrite them.
+        """
+        if self._size < len(self._samples):
+            parts = [self._samples[: self._size]]
+        else:
+            parts = [self._samples[self._next :], self._samples[: self._next]]
+        views = []
+        for part in parts:
+            if len(part):
+                view = part.view()
+                view.flags.writeable = False
+                views.append(view)
+        return views
+
+    def snapshot(self) -> "NDArray[np.void]":
+        """Get a copy of the readings, oldest first."""
+        snapshot: "NDArray[np.void]" = np.empty(self._size, dtype=SAMPLE_DTYPE)
+        start = 0
+        for view in self.views():
+            snapshot[start : start + len(view)] = view
+            start += len(view)
+        return snapshot
+
+    def timestamps(self) -> "NDArray[np.float64]":
+        """Get the time each reading arrived, oldest first."""
+        timestamps: "NDArray[np.float64]" = self.snapshot()["timestamp"]
+        return timestamps
+
+    def values(self) -> "NDArray[np.float64]":
+        """Get the readings as floats, oldest first."""
+        values: "NDArray[np.float64]" = (
+            self.snapshot()["data"] / sensor_fixed_point_conversion
+        )
+        return values
+
+
+class CaptureFileWriter:
+    """Appends readings to a file of fixed-size records.
+
+    Readings are collected into a preallocated batch, which is written to
+    the file when it fills up and when the writer is flushed or closed.
+    """
+
+    def __init__(self, path: Path, batch_size: int = 4096) -> None:
+        """Constructor.
+
+        Args:
+            path: The file to write. It is replaced if it exists.
+            batch_size: The number of readings to collect between writes.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        self._file = open(path, "wb")
+        self._file.write(CAPTURE_FILE_MAGIC)
+        self._batch: "NDArray[np.void]" = np.zeros(batch_size, dtype=RECORD_DTYPE)
+        self._batched = 0
+        self._written = 0
+
+    @property
+    def written(self) -> int:
+        """The number of readings written to the file so far."""
+        return self._written
+
+    def write(self, key: SensorKey, timestamp: float, data: int) -> None:
+        """Add a reading from a sensor."""
+        self._batch[self._batched] = (timestamp, *key, data)
+        self._batched += 1
+        if self._batched == len(self._batch):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the batched readings to the file."""
+        if self._batched:
+            self._file.write(self._batch[: self._batched].data)
+            self._written += self._batched
+            self._batched = 0
+        self._file.flush()
+
+    def close(self) -> None:
+        """Write the batched readings and close the file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> CaptureFileWriter:
+        """Use the writer as a context manager that closes it."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Close the writer."""
+        self.close()
+
+
+def read_capture_file(path: Path) -> "NDArray[np.void]":
+    """Map a capture file's records into a read-only array."""
+    with open(path, "rb") as f:
+        magic = f.read(len(CAPTURE_FILE_MAGIC))
+    if magic != CAPTURE_FILE_MAGIC:
+        raise ValueError(f"{path} is not a sensor capture file.")
+    if path.stat().st_size == len(CAPTURE_FILE_MAGIC):
+        # An empty file can't be mapped.
+        return np.zeros(0, dtype=RECORD_DTYPE)
+    return np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=len(magic))
+
+
+class SensorCapture:
+    """A message listener that records sensor readings.
+
+    Only readings from the sensors it was built with are recorded; the
+    rest are ignored.
+    """
+
+    def __init__(
+        self,
+        sensors: Iterable[SensorInformation],
+        capacity: int = DEFAULT_CAPTURE_CAPACITY,
+        sink: Optional[CaptureFileWriter] = None,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            sensors: The sensors to record.
+            capacity: The number of readings to keep for each sensor.
+            sink: A file to also write every reading to.
+        """
+        self._buffers: Dict[SensorKey, SensorRingBuffer] = {
+            _key(sensor): SensorRingBuffer(capacity) for sensor in sensors
+        }
+        self._sink = sink
+
+    @property
+    def node_ids(self) -> List[NodeId]:
+        """The nodes of the sensors being recorded."""
+        return sorted({NodeId(key[0]) for key in self._buffers})
+
+    def buffer(self, sensor: SensorInformation) -> SensorRingBuffer:
+        """Get the readings recorded from a sensor."""
+        return self._buffers[_key(sensor)]
+
+    def flush(self) -> None:
+        """Write any readings batched for the file."""
+        if self._sink:
+            self._sink.flush()
+
+    def __call__(
+        self, message: MessageDefinition, arbitration_id: ArbitrationId
+    ) -> None:
+        """Record a reading, if it is from one of the sensors."""
+        if not isinstance(message, ReadFromSensorResponse):
+            return
+        payload = message.payload
+        key = (
+            arbitration_id.parts.originating_node_id,
+            payload.sensor.value,
+            payload.sensor_id.value,
+        )
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            return
+        timestamp = time.monotonic()
+        data = payload.sensor_data.value
+        buffer.append(timestamp, data)
+        if self._sink:
+            self._sink.write(key, timestamp, data)
@@ -3,14 +3,21 @@ import asyncio
 import logging
 from contextlib import asynccontextmanager
 
-from typing import Optional, Type, TypeVar, Callable, AsyncIterator, cast
+from typing import (
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Callable,
+    AsyncIterator,
+    cast,
+)
 
 from opentrons_hardware.firmware_bindings.constants import (
     NodeId,
     SensorOutputBinding,
     SensorId,
     SensorType,
-    MessageId,
 )
 from opentrons_hardware.firmware_bindings.arbitration_id import ArbitrationId
 
@@ -46,6 +53,11 @@ from opentrons_hardware.firmware_bindings.messages.fields import (
     SensorThresholdModeField,
 )
 
+from opentrons_hardware.sensors.capture import (
+    CaptureFileWriter,
+    DEFAULT_CAPTURE_CAPACITY,
+    SensorCapture,
+)
 from opentrons_hardware.sensors.utils import (
     ReadSensorInformation,
     SensorDataType,
@@ -71,7 +83,11 @@ class SensorScheduler:
         self, sensor: PollSensorInformation, can_messenger: CanMessenger, timeout: int
     ) -> Optional[SensorDataType]:
         """Send poll message."""
-        with WaitableCallback(can_messenger) as reader:
+        with WaitableCallback(
+            can_messenger,
+            message_ids=[ReadFromSensorResponse.message_id],
+            node_ids=[sensor.node_id],
+        ) as reader:
             data: Optional[SensorDataType] = None
             await can_messenger.send(
                 node_id=sensor.node_id,
@@ -120,7 +136,11 @@ class SensorScheduler:
         self, sensor: ReadSensorInformation, can_messenger: CanMessenger, timeout: int
     ) -> Optional[SensorDataType]:
         """Send read message."""
-        with WaitableCallback(can_messenger) as reader:
+        with WaitableCallback(
+            can_messenger,
+            message_ids=[ReadFromSensorResponse.message_id],
+            node_ids=[sensor.node_id],
+        ) as reader:
             data: Optional[SensorDataType] = None
             await can_messenger.send(
                 node_id=sensor.node_id,
@@ -163,7 +183,11 @@ class SensorScheduler:
         def _format(response: ReadFromSensorResponse) -> SensorDataType:
             return SensorDataType.build(response.payload.sensor_data)
 
-        with WaitableCallback(can_messenger) as reader:
+        with WaitableCallback(
+            can_messenger,
+            message_ids=[ReadFromSensorResponse.message_id],
+            node_ids=[node_id],
+        ) as reader:
             try:
                 data = await self._wait_for_response(
                     node_id, reader, ReadFromSensorResponse, _format
@@ -180,7 +204,11 @@ class SensorScheduler:
         timeout: float = 1.0,
     ) -> Optional[SensorDataType]:
         """Send threshold message."""
-        with WaitableCallback(can_messenger) as reader:
+        with WaitableCallback(
+            can_messenger,
+            message_ids=[SensorThresholdResponse.message_id],
+            node_ids=[sensor.node_id],
+        ) as reader:
             data: Optional[SensorDataType] = None
             await can_messenger.send(
                 node_id=sensor.node_id,
@@ -244,7 +272,11 @@ class SensorScheduler:
         timeout: int,
     ) -> bool:
         """Send threshold message."""
-        with WaitableCallback(can_messenger) as reader:
+        with WaitableCallback(
+            can_messenger,
+            message_ids=[PeripheralStatusResponse.message_id],
+            node_ids=[node_id],
+        ) as reader:
             status = False
             await can_messenger.send(
                 node_id=node_id,
@@ -298,7 +330,10 @@ class SensorScheduler:
         )
         try:
             if log:
-                can_messenger.add_listener(self._log_sensor_output)
+                can_messenger.add_listener(
+                    self._log_sensor_output,
+                    message_ids=[ReadFromSensorResponse.message_id],
+                )
             yield
         finally:
             if log:
@@ -333,16 +368,11 @@ class SensorScheduler:
                 SensorDataType.build(payload.sensor_data).to_float()
             )
 
-        def _filter(arbitration_id: ArbitrationId) -> bool:
-            return (
-                NodeId(arbitration_id.parts.originating_node_id)
-                == target_sensor.node_id
-            ) and (
-                MessageId(arbitration_id.parts.message_id)
-                == MessageId.read_sensor_response
-            )
-
-        can_messenger.add_listener(_logging_listener, _filter)
+        can_messenger.add_listener(
+            _logging_listener,
+            message_ids=[ReadFromSensorResponse.message_id],
+            node_ids=[target_sensor.node_id],
+        )
         await can_messenger.send(
             node_id=target_sensor.node_id,
             message=BindSensorOutputRequest(
@@ -369,3 +399,53 @@ class SensorScheduler:
                     )
                 ),
             )
+
+    @asynccontextmanager
+    async def capture(
+        self,
+        target_sensors: Sequence[SensorInformation],
+        can_messenger: CanMessenger,
+        capacity: int = DEFAULT_CAPTURE_CAPACITY,
+        sink: Optional[CaptureFileWriter] = None,
+    ) -> AsyncIterator[SensorCapture]:
+        """While acquired, record the sensors' logging output into ring buffers.
+
+        Unlike capture_output, this records any number of sensors, doesn't
+        build an object per reading, and can stream the readings to a file.
+        """
+        capture = SensorCapture(target_sensors, capacity, sink)
+        can_messenger.add_listener(
+            capture,
+            message_ids=[ReadFromSensorResponse.message_id],
+            node_ids=capture.node_ids,
+        )
+        for sensor in target_sensors:
+            await self._send_output_binding(
+                sensor, can_messenger, SensorOutputBinding.report
+            )
+        try:
+            yield capture
+        finally:
+            can_messenger.remove_listener(capture)
+            for sensor in target_sensors:
+                await self._send_output_binding(
+                    sensor, can_messenger, SensorOutputBinding.none
+                )
+            capture.flush()
+
+    @staticmethod
+    async def _send_output_binding(
+        sensor: SensorInformation,
+        can_messenger: CanMessenger,
+        binding: SensorOutputBinding,
+    ) -> None:
+        await can_messenger.send(
+            node_id=sensor.node_id,
+            message=BindSensorOutputRequest(
+                payload=BindSensorOutputRequestPayload(
+                    sensor=SensorTypeField(sensor.sensor_type),
+                    sensor_id=SensorIdField(sensor.sensor_id),
+                    binding=SensorOutputBindingField(binding.value),
+                )
+            ),
+        )
@@ -2,6 +2,7 @@
 from __future__ import annotations
 import asyncio
 from asyncio import Queue
+from typing import List, Optional
 
 import pytest
 from mock import AsyncMock, Mock
@@ -196,11 +197,127 @@ async def test_filter_messages(
     listener.assert_not_called()
 
 
+@pytest.mark.parametrize(
+    "message_ids,node_ids,expected_called",
+    [
+        [None, None, True],
+        [[MessageId.get_move_group_request], None, True],
+        [[MessageId.get_move_group_request], [NodeId.gantry_x], True],
+        [[MessageId.get_move_group_request, MessageId.move_completed], None, True],
+        [None, [NodeId.gantry_x, NodeId.gantry_y], True],
+        [[MessageId.move_completed], None, False],
+        [None, [NodeId.gantry_y], False],
+        [[MessageId.get_move_group_request], [NodeId.gantry_y], False],
+    ],
+)
+async def test_listen_messages_by_id(
+    subject: CanMessenger,
+    incoming_messages: Queue[CanMessage],
+    message_ids: Optional[List[MessageId]],
+    node_ids: Optional[List[NodeId]],
+    expected_called: bool,
+) -> None:
+    """It should only call listeners for the message and node IDs they want."""
+    incoming_messages.put_nowait(
+        CanMessage(
+            arbitration_id=ArbitrationId(
+                parts=ArbitrationIdParts(
+                    message_id=MessageId.get_move_group_request,
+                    node_id=0,
+                    function_code=0,
+                    originating_node_id=NodeId.gantry_x,
+                )
+            ),
+            data=b"\1",
+        )
+    )
+
+    listener = Mock(spec=MessageListenerCallback)
+    subject.add_listener(listener, message_ids=message_ids, node_ids=node_ids)
+
+    subject.start()
+    while not incoming_messages.empty():
+        await asyncio.sleep(0.01)
+    await subject.stop()
+
+    assert listener.called == expected_called
+
+
+async def test_remove_listener_by_id(
+    subject: CanMessenger, incoming_messages: Queue[CanMessage]
+) -> None:
+    """It should stop calling a listener once it's removed."""
+    listener = Mock(spec=MessageListenerCallback)
+    subject.add_listener(listener, message_ids=[MessageId.get_move_group_request])
+    subject.remove_listener(listener)
+
+    incoming_messages.put_nowait(
+        CanMessage(
+            arbitration_id=ArbitrationId(
+                parts=ArbitrationIdParts(
+                    message_id=MessageId.get_move_group_request,
+                    node_id=0,
+                    function_code=0,
+                    originating_node_id=NodeId.gantry_x,
+                )
+            ),
+            data=b"\1",
+        )
+    )
+
+    subject.start()
+    while not incoming_messages.empty():
+        await asyncio.sleep(0.01)
+    await subject.stop()
+
+    listener.assert_not_called()
+
+
+async def test_message_stats(
+    subject: CanMessenger, incoming_messages: Queue[CanMessage]
+) -> None:
+    """It should count received messages, and the ones passed to listeners."""
+    for message_id in [
+        MessageId.get_move_group_request,
+        MessageId.get_move_group_request,
+        MessageId.heartbeat_request,
+    ]:
+        incoming_messages.put_nowait(
+            CanMessage(
+                arbitration_id=ArbitrationId(
+                    parts=ArbitrationIdParts(
+                        message_id=message_id,
+                        node_id=0,
+                        function_code=0,
+                        originating_node_id=NodeId.gantry_x,
+                    )
+                ),
+                data=b"\1",
+            )
+        )
+
+    listener = Mock(spec=MessageListenerCallback)
+    subject.add_listener(listener, message_ids=[MessageId.get_move_group_request])
+
+    subject.start()
+    while not incoming_messages.empty():
+        await asyncio.sleep(0.01)
+    await subject.stop()
+
+    stats = subject.get_stats()
+    assert stats[MessageId.get_move_group_request].received == 2
+    assert stats[MessageId.get_move_group_request].dispatched == 2
+    assert stats[MessageId.heartbeat_request].received == 1
+    assert stats[MessageId.heartbeat_request].dispatched == 0
+
+
 async def test_waitable_callback_context() -> None:
     """It should add itself and remove itself using context manager."""
     mock_messenger = Mock(spec=CanMessenger)
     with WaitableCallback(mock_messenger) as callback:
-        mock_messenger.add_listener.assert_called_once_with(callback, None)
+        mock_messenger.add_listener.assert_called_once_with(
+            callback, None, message_ids=None, node_ids=None
+        )
     mock_messenger.remove_listener.assert_called_once_with(callback)
 
 
@@ -212,5 +329,7 @@ async def test_waitable_callback_context_with_filter() -> None:
         return False
 
     with WaitableCallback(mock_messenger, some_func) as callback:
-        mock_messenger.add_listener.assert_called_once_with(callback, some_func)
+        mock_messenger.add_listener.assert_called_once_with(
+            callback, some_func, message_ids=None, node_ids=None
+        )
     mock_messenger.remove_listener.assert_called_once_with(callback)
@@ -0,0 +1,75 @@
+"""Binary serializable tests."""
+from dataclasses import dataclass
+
+import pytest
+
+from opentrons_hardware.firmware_bindings import utils
+
+
+@dataclass
+class _Parent(utils.BinarySerializable):
+    a: utils.UInt8Field
+    b: utils.Int16Field
+
+
+@dataclass
+class _Child(_Parent):
+    c: utils.UInt32Field
+
+
+@dataclass
+class _LittleEndian(utils.LittleEndianBinarySerializable):
+    b: utils.Int16Field
+    c: utils.UInt32Field
+
+
+def test_serialize() -> None:
+    """It should serialize fields in order, big endian."""
+    subject = _Child(
+        a=utils.UInt8Field(1), b=utils.Int16Field(-2), c=utils.UInt32Field(3)
+    )
+    assert subject.serialize() == b"\x01\xff\xfe\x00\x00\x00\x03"
+
+
+def test_serialize_little_endian() -> None:
+    """It should serialize fields little endian, if asked."""
+    subject = _LittleEndian(b=utils.Int16Field(-2), c=utils.UInt32Field(3))
+    assert subject.serialize() == b"\xfe\xff\x03\x00\x00\x00"
+
+
+def test_subclasses_have_own_codecs() -> None:
+    """It should not share a codec between a class and its subclasses."""
+    assert _Parent.get_size() == 3
+    assert _Child.get_size() == 7
+    assert _Parent.build(b"\x01\xff\xfe") == _Parent(
+        a=utils.UInt8Field(1), b=utils.Int16Field(-2)
+    )
+
+
+def test_build_ignores_extra_bytes() -> None:
+    """It should build from a buffer that's longer than it needs to be."""
+    assert _Parent.build(b"\x01\x00\x02\xff\xff") == _Parent(
+        a=utils.UInt8Field(1), b=utils.Int16Field(2)
+    )
+
+
+def test_build_too_few_bytes() -> None:
+    """It should raise if the buffer is too short."""
+    with pytest.raises(utils.InvalidFieldException):
+        _Parent.build(b"\x01\x00")
+
+
+def test_build_from_offset() -> None:
+    """It should build from an offset into a memoryview."""
+    buffer = memoryview(b"\xaa\xaa\x01\x00\x02")
+    assert _Parent.build_from(buffer, offset=2) == _Parent(
+        a=utils.UInt8Field(1), b=utils.Int16Field(2)
+    )
+
+
+def test_build_all() -> None:
+    """It should build each object from back-to-back data, ignoring leftovers."""
+    assert _Parent.build_all(b"\x01\x00\x02\x03\x00\x04\xff") == [
+        _Parent(a=utils.UInt8Field(1), b=utils.Int16Field(2)),
+        _Parent(a=utils.UInt8Field(3), b=utils.Int16Field(4)),
+    ]
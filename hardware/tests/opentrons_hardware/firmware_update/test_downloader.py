@@ -275,3 +275,254 @@ async def test_messaging_complete_no_response(
 
     with pytest.raises(TimeoutResponse):
         await subject.run(NodeId.gantry_y_bootloader, mock_hex_processor, 0.5)
+
+
+def _data_ack(
+    can_message_notifier: MockCanMessageNotifier, node_id: NodeId, address: int
+) -> None:
+    """Acknowledge the data message at an address."""
+    can_message_notifier.notify(
+        FirmwareUpdateDataAcknowledge(
+            payload=payloads.FirmwareUpdateDataAcknowledge(
+                address=utils.UInt32Field(address),
+                error_code=ErrorCodeField(ErrorCode.ok),
+            )
+        ),
+        ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=FirmwareUpdateDataAcknowledge.message_id,
+                node_id=NodeId.host,
+                function_code=0,
+                originating_node_id=node_id,
+            )
+        ),
+    )
+
+
+def _complete_ack(
+    can_message_notifier: MockCanMessageNotifier, node_id: NodeId
+) -> None:
+    """Acknowledge the update complete message."""
+    can_message_notifier.notify(
+        FirmwareUpdateCompleteAcknowledge(
+            payload=payloads.FirmwareUpdateAcknowledge(
+                error_code=ErrorCodeField(ErrorCode.ok)
+            )
+        ),
+        ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=FirmwareUpdateCompleteAcknowledge.message_id,
+                node_id=NodeId.host,
+                function_code=0,
+                originating_node_id=node_id,
+            )
+        ),
+    )
+
+
+@pytest.fixture
+def window_chunks() -> List[Chunk]:
+    """Enough data chunks to fill a window twice."""
+    return [Chunk(address=0x40 * i, data=[i] * 0x20) for i in range(8)]
+
+
+async def test_windowed_out_of_order_acks(
+    subject: downloader.FirmwareUpdateDownloader,
+    window_chunks: List[Chunk],
+    mock_hex_processor: MagicMock,
+    mock_messenger: AsyncMock,
+    can_message_notifier: MockCanMessageNotifier,
+) -> None:
+    """It should fill the window before waiting, and accept acks in any order."""
+    unacked: List[int] = []
+    max_unacked = 0
+
+    def responder(node_id: NodeId, message: MessageDefinition) -> None:
+        """Ack each full window of data messages in reverse order."""
+        nonlocal max_unacked
+        if isinstance(message, FirmwareUpdateData):
+            unacked.append(message.payload.address.value)
+            max_unacked = max(max_unacked, len(unacked))
+            if len(unacked) == 4:
+                while unacked:
+                    _data_ack(can_message_notifier, node_id, unacked.pop())
+        elif isinstance(message, FirmwareUpdateComplete):
+            _complete_ack(can_message_notifier, node_id)
+
+    mock_messenger.send.side_effect = responder
+    mock_hex_processor.process.return_value = iter(window_chunks)
+
+    await subject.run(NodeId.gantry_y_bootloader, mock_hex_processor, 10, window_size=4)
+
+    assert max_unacked == 4
+    crc32 = 0
+    for c in window_chunks:
+        crc32 = binascii.crc32(bytes(c.data), crc32)
+    mock_messenger.send.assert_called_with(
+        node_id=NodeId.gantry_y_bootloader,
+        message=FirmwareUpdateComplete(
+            payload=payloads.FirmwareUpdateComplete(
+                num_messages=utils.UInt32Field(len(window_chunks)),
+                crc32=utils.UInt32Field(crc32),
+            )
+        ),
+    )
+
+
+async def test_windowed_retransmit(
+    subject: downloader.FirmwareUpdateDownloader,
+    window_chunks: List[Chunk],
+    mock_hex_processor: MagicMock,
+    mock_messenger: AsyncMock,
+    can_message_notifier: MockCanMessageNotifier,
+) -> None:
+    """It should resend a chunk that isn't acked, and ignore duplicate acks."""
+    sent_addresses: List[int] = []
+
+    def responder(node_id: NodeId, message: MessageDefinition) -> None:
+        """Drop the first copy of one chunk, and ack another one twice."""
+        if isinstance(message, FirmwareUpdateData):
+            address = message.payload.address.value
+            sent_addresses.append(address)
+            if address == 0x80 and sent_addresses.count(address) == 1:
+                return
+            _data_ack(can_message_notifier, node_id, address)
+            if address == 0x40:
+                _data_ack(can_message_notifier, node_id, address)
+        elif isinstance(message, FirmwareUpdateComplete):
+            _complete_ack(can_message_notifier, node_id)
+
+    mock_messenger.send.side_effect = responder
+    mock_hex_processor.process.return_value = iter(window_chunks)
+
+    await subject.run(
+        NodeId.gantry_y_bootloader,
+        mock_hex_processor,
+        0.1,
+        window_size=4,
+        chunk_retry_count=1,
+    )
+
+    assert sent_addresses.count(0x80) == 2
+    assert len(sent_addresses) == len(window_chunks) + 1
+    complete = mock_messenger.send.call_args.kwargs["message"]
+    assert complete.payload.num_messages.value == len(window_chunks)
+
+
+async def test_windowed_lost_ack(
+    subject: downloader.FirmwareUpdateDownloader,
+    window_chunks: List[Chunk],
+    mock_hex_processor: MagicMock,
+    mock_messenger: AsyncMock,
+    can_message_notifier: MockCanMessageNotifier,
+) -> None:
+    """It should resend a chunk whose ack is lost, and still count it once."""
+    written = {}
+    received = 0
+
+    def responder(node_id: NodeId, message: MessageDefinition) -> None:
+        """Write chunks by address, and lose the first ack of one of them."""
+        nonlocal received
+        if isinstance(message, FirmwareUpdateData):
+            received += 1
+            address = message.payload.address.value
+            first = address not in written
+            written[address] = bytes(
+                message.payload.data.value[: message.payload.num_bytes.value]
+            )
+            if address == 0x80 and first:
+                return
+            _data_ack(can_message_notifier, node_id, address)
+        elif isinstance(message, FirmwareUpdateComplete):
+            _complete_ack(can_message_notifier, node_id)
+
+    mock_messenger.send.side_effect = responder
+    mock_hex_processor.process.return_value = iter(window_chunks)
+
+    await subject.run(
+        NodeId.gantry_y_bootloader,
+        mock_hex_processor,
+        0.1,
+        window_size=4,
+        chunk_retry_count=1,
+    )
+
+    assert received == len(window_chunks) + 1
+    # What a bootloader that ignores the repeated chunk would check.
+    crc32 = 0
+    for address in sorted(written):
+        crc32 = binascii.crc32(written[address], crc32)
+    complete = mock_messenger.send.call_args.kwargs["message"]
+    assert complete.payload.num_messages.value == len(written)
+    assert complete.payload.crc32.value == crc32
+
+
+async def test_lost_ack_fails_without_retries(
+    subject: downloader.FirmwareUpdateDownloader,
+    window_chunks: List[Chunk],
+    mock_hex_processor: MagicMock,
+    mock_messenger: AsyncMock,
+    can_message_notifier: MockCanMessageNotifier,
+) -> None:
+    """It should not resend chunks unless asked to."""
+
+    def responder(node_id: NodeId, message: MessageDefinition) -> None:
+        """Lose the ack of one chunk."""
+        if isinstance(message, FirmwareUpdateData):
+            address = message.payload.address.value
+            if address != 0x80:
+                _data_ack(can_message_notifier, node_id, address)
+
+    mock_messenger.send.side_effect = responder
+    mock_hex_processor.process.return_value = iter(window_chunks)
+
+    with pytest.raises(TimeoutResponse):
+        await subject.run(
+            NodeId.gantry_y_bootloader, mock_hex_processor, 0.1, window_size=4
+        )
+    sent = [
+        c.kwargs["message"].payload.address.value
+        for c in mock_messenger.send.call_args_list
+    ]
+    assert sent.count(0x80) == 1
+
+
+async def test_windowed_retries_exhausted(
+    subject: downloader.FirmwareUpdateDownloader,
+    window_chunks: List[Chunk],
+    mock_hex_processor: MagicMock,
+    mock_messenger: AsyncMock,
+) -> None:
+    """It should fail once a chunk has been resent chunk_retry_count times."""
+    mock_hex_processor.process.return_value = iter(window_chunks)
+
+    with pytest.raises(TimeoutResponse) as exc_info:
+        await subject.run(
+            NodeId.gantry_y_bootloader,
+            mock_hex_processor,
+            0.05,
+            window_size=2,
+            chunk_retry_count=2,
+        )
+
+    assert exc_info.value.message == FirmwareUpdateData(
+        payload=payloads.FirmwareUpdateData.create(
+            address=0, data=bytes(window_chunks[0].data)
+        )
+    )
+    sent = [
+        c.kwargs["message"].payload.address.value
+        for c in mock_messenger.send.call_args_list
+    ]
+    assert sent == [0x00, 0x40, 0x00, 0x40, 0x00, 0x40]
+
+
+async def test_invalid_window_size(
+    subject: downloader.FirmwareUpdateDownloader,
+    mock_hex_processor: MagicMock,
+) -> None:
+    """It should reject a window that can't hold a chunk."""
+    with pytest.raises(ValueError):
+        await subject.run(
+            NodeId.gantry_y_bootloader, mock_hex_processor, 10, window_size=0
+        )
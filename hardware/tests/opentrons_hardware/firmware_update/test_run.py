@@ -1,5 +1,6 @@
 """Tests for run module."""
-from typing import Iterator
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List
 
 import mock
 import pytest
@@ -14,8 +15,13 @@ from opentrons_hardware.firmware_update import (
     FirmwareUpdateDownloader,
     FirmwareUpdateEraser,
     run_update,
+    run_updates,
     HexRecordProcessor,
+    UpdateProgress,
+    UpdateState,
 )
+from opentrons_hardware.firmware_update.hex_file import from_hex_file
+from opentrons_hardware.firmware_update.errors import BootloaderNotReady
 from opentrons_hardware.firmware_update.target import Target
 
 
@@ -70,6 +76,8 @@ async def test_run_update(
         retry_count=12,
         timeout_seconds=11,
         erase=should_erase,
+        window_size=4,
+        chunk_retry_count=2,
     )
     mock_initiator_run.assert_called_once_with(
         target=target, retry_count=12, ready_wait_time_sec=11
@@ -84,8 +92,126 @@ async def test_run_update(
         node_id=target.bootloader_node,
         hex_processor=mock_hex_record_processor,
         ack_wait_seconds=11,
+        window_size=4,
+        chunk_retry_count=2,
+        progress_callback=mock.ANY,
     )
     mock_messenger.send.assert_called_once_with(
         node_id=target.bootloader_node, message=FirmwareUpdateStartApp()
     )
     mock_hex_record_builder.assert_called_once_with(mock_hex_file)
+
+
+@pytest.fixture
+def hex_files(tmp_path: Path) -> Dict[NodeId, Path]:
+    """Hex files for several nodes, with the pipettes sharing one."""
+    head_file = tmp_path / "head.hex"
+    head_file.write_text(":0400000001020304F2\n:00000001FF\n")
+    pipette_file = tmp_path / "pipette.hex"
+    pipette_file.write_text(":020000000506F3\n:00000001FF\n")
+    return {
+        NodeId.head: head_file,
+        NodeId.pipette_left: pipette_file,
+        NodeId.pipette_right: tmp_path / "." / "pipette.hex",
+    }
+
+
+async def test_run_updates(
+    mock_initiator_run: AsyncMock,
+    mock_downloader_run: AsyncMock,
+    mock_eraser_run: AsyncMock,
+    hex_files: Dict[NodeId, Path],
+) -> None:
+    """It should update every node, reading each file once."""
+    mock_messenger = AsyncMock()
+    progress: Dict[NodeId, List[UpdateProgress]] = {n: [] for n in hex_files}
+    downloaded: Dict[NodeId, bytes] = {}
+
+    async def _download(
+        node_id: NodeId,
+        hex_processor: HexRecordProcessor,
+        progress_callback: Callable[[int], None],
+        **kwargs: Any,
+    ) -> None:
+        data = b""
+        for chunk in hex_processor.process(56):
+            data += bytes(chunk.data)
+            progress_callback(len(data))
+        downloaded[node_id] = data
+
+    mock_downloader_run.side_effect = _download
+
+    with mock.patch(
+        "opentrons_hardware.firmware_update.run.from_hex_file", wraps=from_hex_file
+    ) as mock_from_hex_file:
+        await run_updates(
+            messenger=mock_messenger,
+            hex_files=hex_files,
+            retry_count=3,
+            timeout_seconds=11,
+            window_size=2,
+            window_sizes={NodeId.head: 8},
+            chunk_retry_count=1,
+            progress_callback=lambda n, p: progress[n].append(p),
+        )
+
+    assert mock_from_hex_file.call_count == 2
+    assert downloaded == {
+        NodeId.head_bootloader: bytes([1, 2, 3, 4]),
+        NodeId.pipette_left_bootloader: bytes([5, 6]),
+        NodeId.pipette_right_bootloader: bytes([5, 6]),
+    }
+    assert {
+        c.kwargs["node_id"]: c.kwargs["window_size"]
+        for c in mock_downloader_run.call_args_list
+    } == {
+        NodeId.head_bootloader: 8,
+        NodeId.pipette_left_bootloader: 2,
+        NodeId.pipette_right_bootloader: 2,
+    }
+    assert all(
+        c.kwargs["chunk_retry_count"] == 1 for c in mock_downloader_run.call_args_list
+    )
+    assert mock_eraser_run.call_count == 3
+    assert [(p.state, p.downloaded_bytes) for p in progress[NodeId.head]] == [
+        (UpdateState.queued, 0),
+        (UpdateState.initializing, 0),
+        (UpdateState.erasing, 0),
+        (UpdateState.downloading, 0),
+        (UpdateState.downloading, 4),
+        (UpdateState.restarting, 4),
+        (UpdateState.done, 4),
+    ]
+    assert all(p.total_bytes == 2 for p in progress[NodeId.pipette_left])
+
+
+async def test_run_updates_failure(
+    mock_initiator_run: AsyncMock,
+    mock_downloader_run: AsyncMock,
+    mock_eraser_run: AsyncMock,
+    hex_files: Dict[NodeId, Path],
+) -> None:
+    """It should finish the other updates before raising a failure."""
+    mock_messenger = AsyncMock()
+    states: Dict[NodeId, UpdateState] = {}
+
+    async def _initiate(target: Target, **kwargs: Any) -> None:
+        if target.system_node == NodeId.pipette_left:
+            raise BootloaderNotReady()
+
+    mock_initiator_run.side_effect = _initiate
+
+    with pytest.raises(BootloaderNotReady):
+        await run_updates(
+            messenger=mock_messenger,
+            hex_files=hex_files,
+            retry_count=3,
+            timeout_seconds=11,
+            progress_callback=lambda n, p: states.update({n: p.state}),
+        )
+
+    assert states == {
+        NodeId.head: UpdateState.done,
+        NodeId.pipette_left: UpdateState.failed,
+        NodeId.pipette_right: UpdateState.done,
+    }
@@ -1,5 +1,7 @@
 """Tests for motion planning."""
+import dataclasses
 import numpy as np
+import pytest
 from hypothesis import given, assume, strategies as st
 from hypothesis.extra import numpy as hynp
 from typing import Iterator, List
@@ -8,8 +10,10 @@ from opentrons_hardware.hardware_control.motion_planning import move_manager
 from opentrons_hardware.hardware_control.motion_planning.types import (
     AxisConstraints,
     Coordinates,
+    Move,
     MoveTarget,
     SystemConstraints,
+    ZeroLengthMoveError,
     vectorize,
 )
 
@@ -187,3 +191,130 @@ def test_close_move_plan(
     )
 
     assert converged
+
+
+def _assert_same_blend_logs(
+    expected: List[List[Move[str]]], actual: List[List[Move[str]]]
+) -> None:
+    assert len(actual) == len(expected)
+    for expected_moves, actual_moves in zip(expected, actual):
+        assert len(actual_moves) == len(expected_moves)
+        for expected_move, actual_move in zip(expected_moves, actual_moves):
+            assert actual_move.unit_vector.keys() == expected_move.unit_vector.keys()
+            assert np.allclose(
+                vectorize(actual_move.unit_vector), vectorize(expected_move.unit_vector)
+            )
+            assert np.isclose(actual_move.distance, expected_move.distance)
+            assert actual_move.max_speed == expected_move.max_speed
+            for expected_block, actual_block in zip(
+                expected_move.blocks, actual_move.blocks
+            ):
+                assert np.allclose(
+                    dataclasses.astuple(actual_block),
+                    dataclasses.astuple(expected_block),
+                    equal_nan=True,
+                )
+
+
+@given(
+    x_constraint=generate_axis_constraint(),
+    y_constraint=generate_axis_constraint(),
+    z_constraint=generate_axis_constraint(),
+    a_constraint=generate_axis_constraint(),
+    b_constraint=generate_axis_constraint(),
+    c_constraint=generate_axis_constraint(),
+    origin=generate_coordinates(),
+    targets=generate_target_list(),
+)
+def test_vectorized_move_plan(
+    x_constraint: AxisConstraints,
+    y_constraint: AxisConstraints,
+    z_constraint: AxisConstraints,
+    a_constraint: AxisConstraints,
+    b_constraint: AxisConstraints,
+    c_constraint: AxisConstraints,
+    origin: Coordinates[str, np.float64],
+    targets: List[MoveTarget[str]],
+) -> None:
+    """It should build the same moves when vectorized."""
+    assume(reject_close_coordinates(origin, targets[0].position))
+    constraints: SystemConstraints[str] = {
+        "X": x_constraint,
+        "Y": y_constraint,
+        "Z": z_constraint,
+        "A": a_constraint,
+        "B": b_constraint,
+        "C": c_constraint,
+    }
+    manager = move_manager.MoveManager(constraints=constraints)
+    expected = manager.plan_motion(
+        origin=origin, target_list=targets, iteration_limit=20
+    )
+    converged, blend_log = manager.plan_motion(
+        origin=origin, target_list=targets, iteration_limit=20, vectorized=True
+    )
+
+    assert converged == expected[0]
+    _assert_same_blend_logs(expected[1], blend_log)
+
+
+@given(
+    x_constraint=generate_axis_constraint(),
+    y_constraint=generate_axis_constraint(),
+    z_constraint=generate_axis_constraint(),
+    a_constraint=generate_axis_constraint(),
+    b_constraint=generate_axis_constraint(),
+    c_constraint=generate_axis_constraint(),
+    origin=generate_coordinates(),
+    data=st.data(),
+)
+def test_vectorized_close_move_plan(
+    x_constraint: AxisConstraints,
+    y_constraint: AxisConstraints,
+    z_constraint: AxisConstraints,
+    a_constraint: AxisConstraints,
+    b_constraint: AxisConstraints,
+    c_constraint: AxisConstraints,
+    origin: Coordinates[str, np.float64],
+    data: st.DataObject,
+) -> None:
+    """It should build the same moves when vectorized."""
+    targets = data.draw(generate_close_target_list(origin))
+    constraints: SystemConstraints[str] = {
+        "X": x_constraint,
+        "Y": y_constraint,
+        "Z": z_constraint,
+        "A": a_constraint,
+        "B": b_constraint,
+        "C": c_constraint,
+    }
+    manager = move_manager.MoveManager(constraints=constraints)
+    expected = manager.plan_motion(
+        origin=origin, target_list=targets, iteration_limit=20
+    )
+    converged, blend_log = manager.plan_motion(
+        origin=origin, target_list=targets, iteration_limit=20, vectorized=True
+    )
+
+    assert converged == expected[0]
+    _assert_same_blend_logs(expected[1], blend_log)
+
+
+def test_vectorized_zero_length_move() -> None:
+    """It should raise for a target that's already reached, like blending does."""
+    constraints: SystemConstraints[str] = {
+        "X": AxisConstraints.build(1000, 40, 20),
+        "Y": AxisConstraints.build(1000, 40, 20),
+    }
+    manager = move_manager.MoveManager(constraints=constraints)
+    targets = [
+        MoveTarget.build({"X": 10, "Y": 10}, 100),
+        MoveTarget.build({"X": 10, "Y": 10}, 100),
+    ]
+
+    with pytest.raises(ZeroLengthMoveError):
+        manager.plan_motion(origin={"X": 0, "Y": 0}, target_list=targets)
+    with pytest.raises(ZeroLengthMoveError):
+        manager.plan_motion(
+            origin={"X": 0, "Y": 0}, target_list=targets, vectorized=True
+        )
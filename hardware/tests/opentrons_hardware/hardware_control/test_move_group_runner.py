@@ -1,12 +1,18 @@
 """Tests for the move scheduler."""
+import asyncio
+from collections import defaultdict
+
 import pytest
-from typing import List, Any
+from typing import Dict, List, Any, Optional, Set, Tuple, cast
 from numpy import float64
 from mock import AsyncMock, call, MagicMock
 from opentrons_hardware.firmware_bindings import ArbitrationId, ArbitrationIdParts
 
 from opentrons_hardware.firmware_bindings.constants import NodeId
-from opentrons_hardware.drivers.can_bus.can_messenger import MessageListenerCallback
+from opentrons_hardware.drivers.can_bus.can_messenger import (
+    CanMessenger,
+    MessageListenerCallback,
+)
 from opentrons_hardware.firmware_bindings.messages.message_definitions import (
     AddLinearMoveRequest,
     HomeRequest,
@@ -30,8 +36,12 @@ from opentrons_hardware.hardware_control.motion import (
 from opentrons_hardware.hardware_control.move_group_runner import (
     MoveGroupRunner,
     MoveScheduler,
+    StreamingMoveGroupRunner,
     _CompletionPacket,
 )
+from opentrons_hardware.hardware_control.motion_planning.move_utils import (
+    MoveConditionNotMet,
+)
 from opentrons_hardware.hardware_control.types import NodeMap
 from opentrons_hardware.firmware_bindings.messages import (
     message_definitions as md,
@@ -562,3 +572,165 @@ async def test_empty_groups(
     mg = MoveGroupRunner(empty_group)
     await mg.run(mock_can_messenger)
     mock_can_messenger.send.assert_not_called()
+
+
+class MockStreamingMessenger:
+    """Mock CanMessenger that completes executed groups after a delay."""
+
+    def __init__(self, execute_sec: float = 0.01, ack_id: int = 1) -> None:
+        """Constructor."""
+        self.sent: List[MessageDefinition] = []
+        self._execute_sec = execute_sec
+        self._ack_id = ack_id
+        self._slots: Dict[int, Set[Tuple[NodeId, int]]] = defaultdict(set)
+        self._executions = 0
+        self._listener: Optional[MessageListenerCallback] = None
+
+    def add_listener(self, listener: MessageListenerCallback, **kwargs: Any) -> None:
+        """Add the listener."""
+        self._listener = listener
+
+    def remove_listener(self, listener: MessageListenerCallback) -> None:
+        """Remove the listener."""
+        self._listener = None
+
+    async def send(self, node_id: NodeId, message: MessageDefinition) -> None:
+        """Record a message, and act on it like the nodes would."""
+        self.sent.append(message)
+        if isinstance(message, md.ClearAllMoveGroupsRequest):
+            self._slots.clear()
+        elif isinstance(message, (md.AddLinearMoveRequest, md.HomeRequest)):
+            self._slots[message.payload.group_id.value].add(
+                (node_id, message.payload.seq_id.value)
+            )
+        elif isinstance(message, md.ExecuteMoveGroupRequest):
+            self._executions += 1
+            asyncio.get_event_loop().call_later(
+                self._execute_sec,
+                self._complete,
+                message.payload.group_id.value,
+                self._executions,
+            )
+
+    def _complete(self, slot: int, execution: int) -> None:
+        assert self._listener
+        for node, seq_id in sorted(self._slots[slot]):
+            self._listener(
+                md.MoveCompleted(
+                    payload=MoveCompletedPayload(
+                        group_id=UInt8Field(slot),
+                        seq_id=UInt8Field(seq_id),
+                        current_position_um=UInt32Field(execution * 1000),
+                        encoder_position=UInt32Field(0),
+                        ack_id=UInt8Field(self._ack_id),
+                    )
+                ),
+                _build_arb(node),
+            )
+
+    def summary(self) -> List[Tuple[str, int]]:
+        """The kind and group ID of each message sent."""
+        summary = []
+        for m in self.sent:
+            group_id = getattr(m.payload, "group_id", None)
+            summary.append(
+                (type(m).__name__, -1 if group_id is None else group_id.value)
+            )
+        return summary
+
+
+async def test_streaming_loads_ahead(move_group_multiple: MoveGroups) -> None:
+    """It should load later groups while the first one executes."""
+    messenger = MockStreamingMessenger()
+    subject = StreamingMoveGroupRunner(move_group_multiple)
+
+    position = await subject.run(cast(CanMessenger, messenger))
+
+    assert messenger.summary() == [
+        ("ClearAllMoveGroupsRequest", -1),
+        ("AddLinearMoveRequest", 0),
+        ("ExecuteMoveGroupRequest", 0),
+        ("AddLinearMoveRequest", 1),
+        ("AddLinearMoveRequest", 1),
+        ("AddLinearMoveRequest", 2),
+        ("AddLinearMoveRequest", 2),
+        ("ExecuteMoveGroupRequest", 1),
+        ("ExecuteMoveGroupRequest", 2),
+    ]
+    assert position == {
+        NodeId.head: 1,
+        NodeId.gantry_x: 2,
+        NodeId.gantry_y: 2,
+        NodeId.pipette_left: 3,
+    }
+    timings = subject.timings
+    assert len(timings) == 3
+    # Only the first group was loaded while nothing was executing.
+    assert timings[1].wait_sec < timings[0].execute_sec
+    assert timings[2].wait_sec < timings[0].execute_sec
+
+
+async def test_streaming_reuses_slots(move_group_multiple: MoveGroups) -> None:
+    """It should clear the slots once they've all been used and have completed."""
+    messenger = MockStreamingMessenger()
+    subject = StreamingMoveGroupRunner(move_group_multiple, max_loaded_groups=2)
+
+    position = await subject.run(cast(CanMessenger, messenger))
+
+    assert messenger.summary() == [
+        ("ClearAllMoveGroupsRequest", -1),
+        ("AddLinearMoveRequest", 0),
+        ("ExecuteMoveGroupRequest", 0),
+        ("AddLinearMoveRequest", 1),
+        ("AddLinearMoveRequest", 1),
+        ("ExecuteMoveGroupRequest", 1),
+        ("ClearAllMoveGroupsRequest", -1),
+        ("AddLinearMoveRequest", 0),
+        ("AddLinearMoveRequest", 0),
+        ("ExecuteMoveGroupRequest", 0),
+    ]
+    assert position[NodeId.pipette_left] == 3
+
+
+async def test_streaming_append(move_group_multiple: MoveGroups) -> None:
+    """It should run groups appended while it runs, until it is closed."""
+    messenger = MockStreamingMessenger()
+    subject = StreamingMoveGroupRunner(move_group_multiple[:1], keep_open=True)
+
+    task = asyncio.get_event_loop().create_task(
+        subject.run(cast(CanMessenger, messenger))
+    )
+    await asyncio.sleep(0.05)
+    assert len(subject.timings) == 1
+    assert not task.done()
+
+    subject.append(move_group_multiple[1:])
+    subject.close()
+    position = await task
+
+    assert len(subject.timings) == 3
+    assert position[NodeId.head] == 1
+    assert position[NodeId.pipette_left] == 3
+
+
+async def test_streaming_condition_not_met(
+    move_group_home_single: MoveGroups,
+) -> None:
+    """It should raise if a home times out."""
+    messenger = MockStreamingMessenger(ack_id=1)
+    subject = StreamingMoveGroupRunner(move_group_home_single)
+
+    with pytest.raises(MoveConditionNotMet):
+        await subject.run(cast(CanMessenger, messenger))
+
+
+async def test_scheduler_condition_not_met(
+    mock_can_messenger: AsyncMock, move_group_home_single: MoveGroups
+) -> None:
+    """It should raise if a home times out, like the streaming runner."""
+    subject = MoveScheduler(move_groups=move_group_home_single)
+    mock_sender = MockSendMoveCompleter(move_group_home_single, subject)
+    mock_can_messenger.send.side_effect = mock_sender.mock_send
+
+    with pytest.raises(MoveConditionNotMet):
+        await subject.run(can_messenger=mock_can_messenger)
@@ -0,0 +1,196 @@
+"""Tests for sensor capture."""
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from opentrons_hardware.firmware_bindings.arbitration_id import (
+    ArbitrationId,
+    ArbitrationIdParts,
+)
+from opentrons_hardware.firmware_bindings.constants import (
+    NodeId,
+    SensorId,
+    SensorType,
+)
+from opentrons_hardware.firmware_bindings.messages.fields import (
+    SensorIdField,
+    SensorTypeField,
+)
+from opentrons_hardware.firmware_bindings.messages.message_definitions import (
+    ReadFromSensorResponse,
+)
+from opentrons_hardware.firmware_bindings.messages.payloads import (
+    ReadFromSensorResponsePayload,
+)
+from opentrons_hardware.firmware_bindings.utils import Int32Field
+from opentrons_hardware.sensors.capture import (
+    CaptureFileWriter,
+    SensorCapture,
+    SensorRingBuffer,
+    read_capture_file,
+)
+from opentrons_hardware.sensors.utils import SensorInformation
+
+
+def _reading(
+    node_id: NodeId, sensor_type: SensorType, sensor_id: SensorId, data: int
+) -> ReadFromSensorResponse:
+    return ReadFromSensorResponse(
+        payload=ReadFromSensorResponsePayload(
+            sensor=SensorTypeField(sensor_type),
+            sensor_id=SensorIdField(sensor_id),
+            sensor_data=Int32Field(data),
+        )
+    )
+
+
+def _arbitration_id(node_id: NodeId) -> ArbitrationId:
+    return ArbitrationId(
+        parts=ArbitrationIdParts(
+            message_id=ReadFromSensorResponse.message_id,
+            node_id=NodeId.host,
+            originating_node_id=node_id,
+            function_code=0,
+        )
+    )
+
+
+def test_ring_buffer_fills() -> None:
+    """It should keep readings in order until it is full."""
+    subject = SensorRingBuffer(4)
+    for i in range(3):
+        subject.append(float(i), i << 16)
+
+    assert len(subject) == 3
+    assert subject.dropped == 0
+    assert subject.timestamps().tolist() == [0.0, 1.0, 2.0]
+    assert subject.values().tolist() == [0.0, 1.0, 2.0]
+
+
+def test_ring_buffer_wraps() -> None:
+    """It should overwrite the oldest readings once it is full."""
+    subject = SensorRingBuffer(4)
+    for i in range(10):
+        subject.append(float(i), i << 16)
+
+    assert len(subject) == 4
+    assert subject.dropped == 6
+    assert subject.values().tolist() == [6.0, 7.0, 8.0, 9.0]
+    assert subject.snapshot()["timestamp"].tolist() == [6.0, 7.0, 8.0, 9.0]
+
+    subject.clear()
+    assert len(subject) == 0
+    assert subject.views() == []
+    assert subject.values().tolist() == []
+
+
+def test_ring_buffer_views() -> None:
+    """It should share its memory with read-only views, and not with snapshots."""
+    subject = SensorRingBuffer(4)
+    for i in range(6):
+        subject.append(float(i), i)
+
+    views = subject.views()
+    assert [view["data"].tolist() for view in views] == [[2, 3], [4, 5]]
+    assert all(
+        np.shares_memory(view, subject._samples)  # type: ignore[no-untyped-call]
+        for view in views
+    )
+    assert not any(view.flags.writeable for view in views)
+    with pytest.raises(ValueError):
+        views[0]["data"][0] = 0
+
+    snapshot = subject.snapshot()
+    assert not np.shares_memory(  # type: ignore[no-untyped-call]
+        snapshot, subject._samples
+    )
+    assert snapshot["data"].tolist() == [2, 3, 4, 5]
+
+
+def test_ring_buffer_capacity() -> None:
+    """It should need room for at least one reading."""
+    with pytest.raises(ValueError):
+        SensorRingBuffer(0)
+
+
+def test_capture_records_sensors() -> None:
+    """It should record each sensor's readings in its own buffer."""
+    capacitive = SensorInformation(
+        sensor_type=SensorType.capacitive,
+        sensor_id=SensorId.S0,
+        node_id=NodeId.pipette_left,
+    )
+    pressure = SensorInformation(
+        sensor_type=SensorType.pressure,
+        sensor_id=SensorId.S0,
+        node_id=NodeId.pipette_right,
+    )
+    subject = SensorCapture([capacitive, pressure], capacity=8)
+    assert subject.node_ids == [NodeId.pipette_left, NodeId.pipette_right]
+
+    for i in range(3):
+        subject(
+            _reading(NodeId.pipette_left, SensorType.capacitive, SensorId.S0, i << 16),
+            _arbitration_id(NodeId.pipette_left),
+        )
+        subject(
+            _reading(NodeId.pipette_right, SensorType.pressure, SensorId.S0, i << 15),
+            _arbitration_id(NodeId.pipette_right),
+        )
+        # Not one of the sensors being captured.
+        subject(
+            _reading(NodeId.pipette_left, SensorType.capacitive, SensorId.S1, 1),
+            _arbitration_id(NodeId.pipette_left),
+        )
+
+    assert subject.buffer(capacitive).values().tolist() == [0.0, 1.0, 2.0]
+    assert subject.buffer(pressure).values().tolist() == [0.0, 0.5, 1.0]
+    timestamps = subject.buffer(capacitive).timestamps().tolist()
+    assert timestamps == sorted(timestamps)
+
+
+def test_capture_file(tmp_path: Path) -> None:
+    """It should write every reading to the file in batches."""
+    sensor = SensorInformation(
+        sensor_type=SensorType.humidity,
+        sensor_id=SensorId.S0,
+        node_id=NodeId.gripper,
+    )
+    path = tmp_path / "capture.bin"
+    with CaptureFileWriter(path, batch_size=4) as writer:
+        subject = SensorCapture([sensor], capacity=2, sink=writer)
+        for i in range(10):
+            subject(
+                _reading(NodeId.gripper, SensorType.humidity, SensorId.S0, i),
+                _arbitration_id(NodeId.gripper),
+            )
+        assert writer.written == 8
+        subject.flush()
+        assert writer.written == 10
+
+    records = read_capture_file(path)
+    assert records["data"].tolist() == list(range(10))
+    assert set(records["node_id"].tolist()) == {NodeId.gripper.value}
+    assert set(records["sensor_type"].tolist()) == {SensorType.humidity.value}
+    assert set(records["sensor_id"].tolist()) == {SensorId.S0.value}
+    # The ring buffer only kept the latest readings.
+    assert subject.buffer(sensor).snapshot()["data"].tolist() == [8, 9]
+    assert records["timestamp"][-2:].tolist() == (
+        subject.buffer(sensor).timestamps().tolist()
+    )
+
+
+def test_capture_file_empty(tmp_path: Path) -> None:
+    """It should read a capture file with no readings."""
+    path = tmp_path / "capture.bin"
+    CaptureFileWriter(path).close()
+    assert len(read_capture_file(path)) == 0
+
+
+def test_capture_file_invalid(tmp_path: Path) -> None:
+    """It should refuse to read other files."""
+    path = tmp_path / "capture.bin"
+    path.write_bytes(b"not a capture")
+    with pytest.raises(ValueError):
+        read_capture_file(path)
@@ -97,3 +97,68 @@ async def test_capture_output(
 
     for index, value in enumerate(_drain()):
         assert value == index
+
+
+async def test_capture(
+    mock_messenger: mock.AsyncMock,
+    can_message_notifier: MockCanMessageNotifier,
+) -> None:
+    """Test that readings from several sensors are captured into buffers."""
+    subject = scheduler.SensorScheduler()
+    sensors = [
+        utils.SensorInformation(
+            sensor_type=sensor_type,
+            sensor_id=SensorId.S0,
+            node_id=NodeId.pipette_left,
+        )
+        for sensor_type in (SensorType.capacitive, SensorType.pressure)
+    ]
+
+    def _bind_message(
+        sensor_type: SensorType, binding: SensorOutputBinding
+    ) -> BindSensorOutputRequest:
+        return BindSensorOutputRequest(
+            payload=BindSensorOutputRequestPayload(
+                sensor=SensorTypeField(sensor_type),
+                sensor_id=SensorIdField(SensorId.S0),
+                binding=SensorOutputBindingField(binding.value),
+            )
+        )
+
+    async with subject.capture(sensors, mock_messenger) as capture:
+        assert mock_messenger.send.call_args_list == [
+            mock.call(
+                node_id=NodeId.pipette_left,
+                message=_bind_message(sensor.sensor_type, SensorOutputBinding.report),
+            )
+            for sensor in sensors
+        ]
+        for i in range(10):
+            for sensor in sensors:
+                can_message_notifier.notify(
+                    ReadFromSensorResponse(
+                        payload=ReadFromSensorResponsePayload(
+                            sensor=SensorTypeField(sensor.sensor_type),
+                            sensor_id=SensorIdField(SensorId.S0),
+                            sensor_data=Int32Field(i << 16),
+                        )
+                    ),
+                    ArbitrationId(
+                        parts=ArbitrationIdParts(
+                            message_id=ReadFromSensorResponse.message_id,
+                            node_id=NodeId.host,
+                            originating_node_id=NodeId.pipette_left,
+                            function_code=0,
+                        )
+                    ),
+                )
+    assert mock_messenger.send.call_args_list[2:] == [
+        mock.call(
+            node_id=NodeId.pipette_left,
+            message=_bind_message(sensor.sensor_type, SensorOutputBinding.none),
+        )
+        for sensor in sensors
+    ]
+    mock_messenger.remove_listener.assert_called_once_with(capture)
+    for sensor in sensors:
+        assert capture.buffer(sensor).values().tolist() == list(range(10))
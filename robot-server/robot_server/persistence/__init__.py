@@ -13,11 +13,20 @@ from robot_server.app_state import AppState, AppStateAccessor, get_app_state
 from robot_server.settings import get_settings
 
 from .database import create_sql_engine, sqlite_rowid
-from .tables import protocol_table, analysis_table, run_table, action_table
+from .memory_cache import MemoryCache, MemoryCacheStats
+from .tables import (
+    protocol_table,
+    analysis_table,
+    analysis_cache_table,
+    run_table,
+    run_command_table,
+    action_table,
+)
 
 _sql_engine_accessor = AppStateAccessor[sqlalchemy.engine.Engine]("sql_engine")
 _persistence_directory_accessor = AppStateAccessor[Path]("persistence_directory")
 _protocol_directory_accessor = AppStateAccessor[Path]("protocol_directory")
+_persistence_cache_accessor = AppStateAccessor[MemoryCache]("persistence_cache")
 
 _TEMP_PERSISTENCE_DIR_PREFIX: Final = "opentrons-robot-server-"
 _DATABASE_FILE: Final = "robot_server.db"
@@ -76,6 +85,19 @@ def get_sql_engine(
     # https://github.com/tiangolo/fastapi/issues/617
 
 
+def get_persistence_cache(
+    app_state: AppState = Depends(get_app_state),
+) -> MemoryCache:
+    """Return a singleton in-memory cache shared by all persistence-backed stores."""
+    cache = _persistence_cache_accessor.get_from(app_state)
+
+    if cache is None:
+        cache = MemoryCache(max_size_bytes=get_settings().persistence_cache_size_bytes)
+        _persistence_cache_accessor.set_on(app_state, cache)
+
+    return cache
+
+
 class PersistenceResetter:
     """Dependency class to handle robot server reset options."""
 
@@ -110,13 +132,19 @@ def get_persistence_resetter(
 __all__ = [
     "get_persistence_directory",
     "get_sql_engine",
+    "get_persistence_cache",
     "PersistenceResetter",
     "get_persistence_resetter",
     # database tables
     "protocol_table",
     "analysis_table",
+    "analysis_cache_table",
     "run_table",
+    "run_command_table",
     "action_table",
     # database utilities and helpers
     "sqlite_rowid",
+    # in-memory caching
+    "MemoryCache",
+    "MemoryCacheStats",
 ]
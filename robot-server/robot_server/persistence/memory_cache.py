@@ -0,0 +1,206 @@
+"""A size-bounded, in-memory cache for data read out of persistent storage."""
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    TypeVar,
+    cast,
+)
+
+
+_ValueT = TypeVar("_ValueT")
+
+_DEFAULT_MAX_SIZE_BYTES = 16 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class MemoryCacheStats:
+    """Usage statistics of a `MemoryCache`."""
+
+    entry_count: int
+    size_bytes: int
+    max_size_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class _CacheEntry(NamedTuple):
+    value: object
+    size_bytes: int
+    tags: Iterable[Hashable]
+
+
+class MemoryCache:
+    """A least-recently-used cache with a memory budget, shared between stores.
+
+    Unlike `functools.lru_cache`, this cache limits the total estimated
+    size of its entries rather than their count, and it lets entries be
+    invalidated individually, or in groups by tag, rather than wholesale.
+    For example, a store might tag all cached data about a given run with
+    that run's ID, so that changing one run only invalidates that run.
+
+    Cached values are shared between callers, so they must not be mutated.
+    """
+
+    def __init__(self, max_size_bytes: int = _DEFAULT_MAX_SIZE_BYTES) -> None:
+        """Initialize the cache with the maximum total size of its entries."""
+        self._max_size_bytes = max_size_bytes
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._keys_by_tag: Dict[Hashable, Set[Hashable]] = {}
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> object:
+        """Get a cached value, marking it as most recently used.
+
+        Raises:
+            KeyError: The key is not in the cache.
+        """
+        try:
+            entry = self._entries[key]
+        except KeyError:
+            self._misses += 1
+            raise
+
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def put(
+        self,
+        key: Hashable,
+        value: object,
+        tags: Iterable[Hashable] = (),
+        size_bytes: Optional[int] = None,
+    ) -> None:
+        """Add a value to the cache, evicting old entries to make room if needed.
+
+        Args:
+            key: The key to store the value under, replacing any existing value.
+            value: The value to store.
+            tags: Tags to associate with this entry, for `invalidate_tag()`.
+            size_bytes: The size of the value, if known.
+                Otherwise, it will be estimated with `estimate_size()`.
+        """
+        self.invalidate(key)
+
+        if size_bytes is None:
+            size_bytes = estimate_size(value)
+
+        # Don't flush out the whole cache for something that can't fit anyway.
+        if size_bytes > self._max_size_bytes:
+            return
+
+        while self._size_bytes + size_bytes > self._max_size_bytes:
+            oldest_key = next(iter(self._entries))
+            self.invalidate(oldest_key)
+            self._evictions += 1
+
+        tags = tuple(tags)
+        self._entries[key] = _CacheEntry(value=value, size_bytes=size_bytes, tags=tags)
+        self._size_bytes += size_bytes
+
+        for tag in tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+
+    def get_or_put(
+        self,
+        key: Hashable,
+        compute: Callable[[], _ValueT],
+        tags: Iterable[Hashable] = (),
+    ) -> _ValueT:
+        """Get a cached value, computing and caching it on a cache miss.
+
+        Exceptions raised by `compute` are propagated, and nothing is cached.
+        """
+        try:
+            return cast(_ValueT, self.get(key))
+        except KeyError:
+            value = compute()
+            self.put(key=key, value=value, tags=tags)
+            return value
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a single entry from the cache, if it's present."""
+        entry = self._entries.pop(key, None)
+
+        if entry is not None:
+            self._size_bytes -= entry.size_bytes
+
+            for tag in entry.tags:
+                keys = self._keys_by_tag[tag]
+                keys.discard(key)
+                if len(keys) == 0:
+                    del self._keys_by_tag[tag]
+
+    def invalidate_tag(self, tag: Hashable) -> None:
+        """Remove all entries associated with a tag from the cache."""
+        for key in list(self._keys_by_tag.get(tag, ())):
+            self.invalidate(key)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        self._entries.clear()
+        self._keys_by_tag.clear()
+        self._size_bytes = 0
+
+    def get_stats(self) -> MemoryCacheStats:
+        """Get the cache's current size and its hit, miss, and eviction counts."""
+        return MemoryCacheStats(
+            entry_count=len(self._entries),
+            size_bytes=self._size_bytes,
+            max_size_bytes=self._max_size_bytes,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+        )
+
+
+def estimate_size(value: object) -> int:
+    """Estimate the memory used by an object and everything it references.
+
+    Walks containers, dataclasses, and Pydantic models, counting each
+    distinct object once. Classes, enum members, and other singletons
+    are shared across the process, so they are not counted.
+    """
+    seen: Set[int] = set()
+    to_visit: List[object] = [value]
+    total = 0
+
+    while len(to_visit) > 0:
+        obj = to_visit.pop()
+
+        if id(obj) in seen or isinstance(obj, (type, Enum)) or obj is None:
+            continue
+
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+
+        if isinstance(obj, (str, bytes, bytearray, int, float)):
+            continue
+        elif isinstance(obj, dict):
+            to_visit.extend(obj.keys())
+            to_visit.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            to_visit.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            to_visit.append(vars(obj))
+
+        slots = getattr(type(obj), "__slots__", ())
+        for slot in (slots,) if isinstance(slots, str) else slots:
+            if hasattr(obj, slot):
+                to_visit.append(getattr(obj, slot))
+
+    return total
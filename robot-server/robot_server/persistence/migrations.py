@@ -23,17 +23,28 @@ Database schema versions:
     - `run_table.commands` column added
     - `run_table.engine_status` column added
     - `run_table._updated_at` column added
+- Version 2
+    - `run_command_table` added, storing one JSON row per run command
+    - `run_table.commands` pickles moved into `run_command_table` and cleared
+- Version 3
+    - `analysis_table.completed_analysis_commands` column added
+    - `analysis_table.completed_analysis` pickles split into compressed JSON,
+      with the analysis's commands moved to `completed_analysis_commands`
 """
+import json
 import logging
+import pickle
+import zlib
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from typing_extensions import Final
 
 import sqlalchemy
+from pydantic.json import pydantic_encoder
 
-from .tables import migration_table, run_table
+from .tables import analysis_table, migration_table, run_table, run_command_table
 
-_LATEST_SCHEMA_VERSION: Final = 1
+_LATEST_SCHEMA_VERSION: Final = 3
 
 _log = logging.getLogger(__name__)
 
@@ -53,6 +64,10 @@ def migrate(sql_engine: sqlalchemy.engine.Engine) -> None:
         if version is not None:
             if version < 1:
                 _migrate_0_to_1(transaction)
+            if version < 2:
+                _migrate_1_to_2(transaction)
+            if version < 3:
+                _migrate_2_to_3(transaction)
 
             _log.info(
                 f"Migrated database from schema {version}"
@@ -130,3 +145,72 @@ def _migrate_0_to_1(transaction: sqlalchemy.engine.Connection) -> None:
     transaction.execute(add_commands_column)
     transaction.execute(add_status_column)
     transaction.execute(add_updated_at_column)
+
+
+def _migrate_1_to_2(transaction: sqlalchemy.engine.Connection) -> None:
+    """Migrate to schema version 2.
+
+    The `run_command` table itself is created by SQLAlchemy. This migration
+    moves each run's pickled `run.commands` list into `run_command` rows,
+    one JSON-encoded command per row, and then clears the pickled column.
+    """
+    select_pickled_commands = sqlalchemy.select(
+        run_table.c.id, run_table.c.commands
+    ).where(run_table.c.commands.is_not(None))
+
+    for row in transaction.execute(select_pickled_commands).all():
+        commands: List[Dict[str, Any]] = row.commands
+
+        if len(commands) > 0:
+            transaction.execute(
+                sqlalchemy.insert(run_command_table),
+                [
+                    {
+                        "run_id": row.id,
+                        "index_in_run": index,
+                        "command_id": command["id"],
+                        "command": json.dumps(command, default=pydantic_encoder),
+                    }
+                    for index, command in enumerate(commands)
+                ],
+            )
+
+    transaction.execute(sqlalchemy.update(run_table).values(commands=None))
+
+
+def _migrate_2_to_3(transaction: sqlalchemy.engine.Connection) -> None:
+    """Migrate to schema version 3.
+
+    This migration adds the following nullable column to the analysis table:
+
+    - Column("completed_analysis_commands", sqlalchemy.LargeBinary, nullable=True)
+
+    And then re-encodes each pickled `analysis.completed_analysis` as
+    zlib-compressed JSON, split between the two columns.
+    """
+    add_commands_column = sqlalchemy.text(
+        "ALTER TABLE analysis ADD completed_analysis_commands BLOB"
+    )
+    transaction.execute(add_commands_column)
+
+    select_pickled_analyses = sqlalchemy.select(
+        analysis_table.c.id, analysis_table.c.completed_analysis
+    )
+
+    for row in transaction.execute(select_pickled_analyses).all():
+        completed_analysis: Dict[str, Any] = pickle.loads(row.completed_analysis)
+        commands = completed_analysis.pop("commands")
+
+        transaction.execute(
+            sqlalchemy.update(analysis_table)
+            .where(analysis_table.c.id == row.id)
+            .values(
+                completed_analysis=_compress_json(completed_analysis),
+                completed_analysis_commands=_compress_json(commands),
+            )
+        )
+
+
+def _compress_json(obj: object) -> bytes:
+    encoded = json.dumps(obj, default=pydantic_encoder).encode("utf-8")
+    return zlib.compress(encoded)
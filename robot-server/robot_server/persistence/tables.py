@@ -53,11 +53,60 @@ analysis_table = sqlalchemy.Table(
         sqlalchemy.String,
         nullable=False,
     ),
+    # NOTE: since schema v3, this is zlib-compressed JSON of the analysis
+    # without its commands; before that, it was the whole analysis, pickled
     sqlalchemy.Column(
         "completed_analysis",
         sqlalchemy.LargeBinary,
         nullable=False,
     ),
+    # column added in schema v3
+    # zlib-compressed JSON list of the analysis's commands
+    sqlalchemy.Column(
+        "completed_analysis_commands",
+        sqlalchemy.LargeBinary,
+        nullable=True,
+    ),
+)
+
+# Completed analyses, keyed by a hash of everything they were analyzed from,
+# so that an identical protocol doesn't need to be analyzed again.
+# Entries are copied from, and outlive, the analyses in `analysis_table`.
+analysis_cache_table = sqlalchemy.Table(
+    "analysis_cache",
+    _metadata,
+    sqlalchemy.Column(
+        "key",
+        sqlalchemy.String,
+        primary_key=True,
+    ),
+    sqlalchemy.Column(
+        "analyzer_version",
+        sqlalchemy.String,
+        nullable=False,
+    ),
+    # Same encodings as `analysis_table`'s columns of the same names.
+    sqlalchemy.Column(
+        "completed_analysis",
+        sqlalchemy.LargeBinary,
+        nullable=False,
+    ),
+    sqlalchemy.Column(
+        "completed_analysis_commands",
+        sqlalchemy.LargeBinary,
+        nullable=False,
+    ),
+    sqlalchemy.Column(
+        "size_bytes",
+        sqlalchemy.Integer,
+        nullable=False,
+    ),
+    sqlalchemy.Column(
+        "last_used_at",
+        UTCDateTime,
+        index=True,
+        nullable=False,
+    ),
 )
 
 
@@ -83,6 +132,7 @@ run_table = sqlalchemy.Table(
     # column added in schema v1
     sqlalchemy.Column("state_summary", sqlalchemy.PickleType, nullable=True),
     # column added in schema v1
+    # NOTE: unused since schema v2; commands are stored in `run_command_table`
     sqlalchemy.Column("commands", sqlalchemy.PickleType, nullable=True),
     # column added in schema v1
     sqlalchemy.Column("engine_status", sqlalchemy.String, nullable=True),
@@ -109,6 +159,22 @@ action_table = sqlalchemy.Table(
 )
 
 
+# table added in schema v2
+run_command_table = sqlalchemy.Table(
+    "run_command",
+    _metadata,
+    sqlalchemy.Column(
+        "run_id",
+        sqlalchemy.String,
+        sqlalchemy.ForeignKey("run.id"),
+        primary_key=True,
+    ),
+    sqlalchemy.Column("index_in_run", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column("command_id", sqlalchemy.String, index=True, nullable=False),
+    sqlalchemy.Column("command", sqlalchemy.String, nullable=False),
+)
+
+
 def add_tables_to_db(sql_engine: sqlalchemy.engine.Engine) -> None:
     """Create the necessary database tables to back all data stores.
 
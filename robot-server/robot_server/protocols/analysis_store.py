@@ -1,22 +1,33 @@
 """Protocol analysis storage."""
 from __future__ import annotations
 
-import pickle
+import hashlib
+import json
+import zlib
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from logging import getLogger
 from typing import Dict, List, Optional
 
 import anyio
 import sqlalchemy
+from pydantic import parse_raw_as
 
+from opentrons import __version__ as opentrons_version
 from opentrons.protocol_engine import (
     Command,
     ErrorOccurrence,
     LoadedPipette,
     LoadedLabware,
 )
+from opentrons.protocol_reader import ProtocolSource
 
-from robot_server.persistence import analysis_table, sqlite_rowid
+from robot_server.persistence import (
+    MemoryCache,
+    analysis_table,
+    analysis_cache_table,
+    sqlite_rowid,
+)
 
 from .analysis_models import (
     AnalysisSummary,
@@ -26,6 +37,7 @@ from .analysis_models import (
     AnalysisResult,
     AnalysisStatus,
 )
+from .protocol_store import protocol_cache_tag
 
 
 _log = getLogger(__name__)
@@ -54,6 +66,12 @@ _log = getLogger(__name__)
 # robot software version.
 _CURRENT_ANALYZER_VERSION = "initial"
 
+# A middle-of-the-road zlib level. Analyses are written once and read many times,
+# and decompression speed doesn't depend on the level.
+_COMPRESSION_LEVEL = 6
+
+_DEFAULT_ANALYSIS_CACHE_SIZE_BYTES = 64 * 1024 * 1024
+
 
 class AnalysisNotFoundError(ValueError):
     """Exception raised if a given analysis is not found."""
@@ -63,14 +81,6 @@ class AnalysisNotFoundError(ValueError):
         super().__init__(f'Analysis "{analysis_id}" not found.')
 
 
-# TODO(mm, 2022-05-19): Unlike ProtocolStore and RunStore, this class doesn't
-# have an in-memory cache. This is because of implementation difficulties:
-# this class is currently the only one of the three to have any async methods,
-# which functools.lru_cache() doesn't support.
-#
-# We should have a consistent strategy across all stores.
-# Either figure out an in-memory cache that supports async methods,
-# or remove in-memory caching from all stores.
 class AnalysisStore:
     """Storage interface for protocol analyses.
 
@@ -80,10 +90,82 @@ class AnalysisStore:
     so they're only kept in-memory, and lost when the store instance is destroyed.
     """
 
-    def __init__(self, sql_engine: sqlalchemy.engine.Engine) -> None:
-        """Initialize the `AnalysisStore`."""
+    def __init__(
+        self,
+        sql_engine: sqlalchemy.engine.Engine,
+        cache: Optional[MemoryCache] = None,
+        analysis_cache_size_bytes: int = _DEFAULT_ANALYSIS_CACHE_SIZE_BYTES,
+    ) -> None:
+        """Initialize the `AnalysisStore`.
+
+        Args:
+            sql_engine: The SQL database to store completed analyses in.
+            cache: An in-memory cache for completed analyses read from the database,
+                which may be shared with other stores.
+            analysis_cache_size_bytes: The maximum total size of the completed
+                analyses kept for reuse by `add_from_cache()`.
+        """
         self._pending_store = _PendingAnalysisStore()
-        self._completed_store = _CompletedAnalysisStore(sql_engine=sql_engine)
+        self._completed_store = _CompletedAnalysisStore(
+            sql_engine=sql_engine,
+            cache=cache or MemoryCache(),
+        )
+        self._analysis_cache = _AnalysisCache(
+            sql_engine=sql_engine,
+            max_size_bytes=analysis_cache_size_bytes,
+        )
+
+    @staticmethod
+    async def get_cache_key(protocol_source: ProtocolSource) -> str:
+        """Get the key that a protocol's analysis is cached under.
+
+        The key is a hash of the names, roles, and contents of the protocol's
+        files, including any custom labware, and of the analyzer and
+        `opentrons` library versions. Protocols with the same key would
+        be analyzed identically.
+        """
+
+        def compute_key() -> str:
+            key = hashlib.sha256()
+            for version in (_CURRENT_ANALYZER_VERSION, opentrons_version):
+                key.update(f"{version}\0".encode("utf-8"))
+            for file in sorted(protocol_source.files, key=lambda f: f.path.name):
+                contents = file.path.read_bytes()
+                key.update(
+                    f"{file.path.name}\0{file.role.value}\0{len(contents)}\0".encode(
+                        "utf-8"
+                    )
+                )
+                key.update(contents)
+            return key.hexdigest()
+
+        return await anyio.to_thread.run_sync(compute_key)
+
+    async def add_from_cache(
+        self, protocol_id: str, analysis_id: str, cache_key: str
+    ) -> Optional[AnalysisSummary]:
+        """Add a completed analysis copied from the cache, if there is one.
+
+        Args:
+            protocol_id: The protocol to add the analysis to.
+            analysis_id: The ID of the new analysis.
+                Must be unique across *all* protocols, not just this one.
+            cache_key: The protocol's key from `get_cache_key()`.
+
+        Returns:
+            A summary of the just-added analysis, or `None` if no analysis
+            was cached under the key, and nothing was added.
+        """
+        resource = self._analysis_cache.get(
+            key=cache_key, protocol_id=protocol_id, analysis_id=analysis_id
+        )
+        if resource is None:
+            return None
+
+        await self._completed_store.add(completed_analysis_resource=resource)
+        return AnalysisSummary.construct(
+            id=analysis_id, status=AnalysisStatus.COMPLETED
+        )
 
     def add_pending(self, protocol_id: str, analysis_id: str) -> AnalysisSummary:
         """Add a new pending analysis to the store.
@@ -110,6 +192,7 @@ class AnalysisStore:
         labware: List[LoadedLabware],
         pipettes: List[LoadedPipette],
         errors: List[ErrorOccurrence],
+        cache_key: Optional[str] = None,
     ) -> None:
         """Promote a pending analysis to completed, adding details of its results.
 
@@ -121,6 +204,8 @@ class AnalysisStore:
             pipettes: See `CompletedAnalysis.pipettes`.
             errors: See `CompletedAnalysis.errors`. Also used to infer whether
                 the completed analysis result is `OK` or `NOT_OK`.
+            cache_key: If given, also cache the completed analysis under this key,
+                for `add_from_cache()`.
         """
         protocol_id = self._pending_store.get_protocol_id(analysis_id=analysis_id)
 
@@ -142,15 +227,21 @@ class AnalysisStore:
             pipettes=pipettes,
             errors=errors,
         )
-        completed_analysis_resource = _CompletedAnalysisResource(
-            id=completed_analysis.id,
-            protocol_id=protocol_id,
-            analyzer_version=_CURRENT_ANALYZER_VERSION,
-            completed_analysis=completed_analysis,
+        completed_analysis_resource = (
+            await _CompletedAnalysisResource.from_completed_analysis(
+                protocol_id=protocol_id,
+                analyzer_version=_CURRENT_ANALYZER_VERSION,
+                completed_analysis=completed_analysis,
+            )
         )
         await self._completed_store.add(
-            completed_analysis_resource=completed_analysis_resource
+            completed_analysis_resource=completed_analysis_resource,
+            completed_analysis=completed_analysis,
         )
+        if cache_key is not None:
+            self._analysis_cache.put(
+                key=cache_key, resource=completed_analysis_resource
+            )
 
         self._pending_store.remove(analysis_id=analysis_id)
 
@@ -168,7 +259,9 @@ class AnalysisStore:
         if pending_analysis is not None:
             return pending_analysis
         elif completed_analysis_resource is not None:
-            return completed_analysis_resource.completed_analysis
+            return await self._completed_store.get_completed_analysis(
+                completed_analysis_resource
+            )
         else:
             raise AnalysisNotFoundError(analysis_id=analysis_id)
 
@@ -200,7 +293,8 @@ class AnalysisStore:
             protocol_id=protocol_id
         )
         completed_analyses: List[ProtocolAnalysis] = [
-            resource.completed_analysis for resource in completed_analysis_resources
+            await self._completed_store.get_completed_analysis(resource)
+            for resource in completed_analysis_resources
         ]
 
         pending_analysis = self._pending_store.get_by_protocol(protocol_id=protocol_id)
@@ -271,51 +365,89 @@ class _PendingAnalysisStore:
 class _CompletedAnalysisResource:
     """A protocol analysis that's been completed, storable in a SQL database.
 
+    The analysis is stored in two columns: a summary of everything but
+    its commands, and its commands. Each is stored as zlib-compressed JSON.
+    Only the summary is parsed when reading a row. The commands, which make up
+    the vast majority of a typical analysis, are kept compressed until
+    they're needed by `get_completed_analysis()`.
+
     See `_CompletedAnalysisStore`.
     """
 
-    id: str  # Already in completed_analysis, but pulled out for efficient querying.
+    id: str  # Already in summary, but pulled out for efficient querying.
     protocol_id: str
     analyzer_version: str
-    completed_analysis: CompletedAnalysis
+    summary: CompletedAnalysis  # With an empty `commands` list.
+    encoded_commands: bytes
 
-    async def to_sql_values(self) -> Dict[str, object]:
-        """Return this data as a dict that can be passed to a SQLALchemy insert.
+    @classmethod
+    async def from_completed_analysis(
+        cls,
+        protocol_id: str,
+        analyzer_version: str,
+        completed_analysis: CompletedAnalysis,
+    ) -> _CompletedAnalysisResource:
+        """Split a completed analysis into its summary and its encoded commands.
 
         This potentially involves heavy serialization, so it's offloaded
         to a worker thread.
 
         Do not modify anything while serialization is ongoing in its worker thread.
+        """
+
+        def encode_commands() -> bytes:
+            commands_json = ",".join(c.json() for c in completed_analysis.commands)
+            return _compress(f"[{commands_json}]")
+
+        encoded_commands = await anyio.to_thread.run_sync(
+            encode_commands,
+            # Cancellation may orphan the worker thread,
+            # but that should be harmless in this case.
+            cancellable=True,
+        )
+
+        return cls(
+            id=completed_analysis.id,
+            protocol_id=protocol_id,
+            analyzer_version=analyzer_version,
+            summary=completed_analysis.copy(update={"commands": []}),
+            encoded_commands=encoded_commands,
+        )
+
+    async def get_completed_analysis(self) -> CompletedAnalysis:
+        """Decode the commands and return the full completed analysis.
 
-        Avoid calling this from inside a SQL transaction, since it might be slow.
+        This potentially involves heavy parsing, so it's offloaded to a worker thread.
         """
 
-        def serialize_completed_analysis() -> bytes:
-            return pickle.dumps(self.completed_analysis.dict())
+        def parse_commands() -> List[Command]:
+            return parse_raw_as(List[Command], _decompress(self.encoded_commands))
 
-        serialized_completed_analysis = await anyio.to_thread.run_sync(
-            serialize_completed_analysis,
+        commands = await anyio.to_thread.run_sync(
+            parse_commands,
             # Cancellation may orphan the worker thread,
             # but that should be harmless in this case.
             cancellable=True,
         )
 
+        return self.summary.copy(update={"commands": commands})
+
+    def to_sql_values(self) -> Dict[str, object]:
+        """Return this data as a dict that can be passed to a SQLALchemy insert."""
         return {
             "id": self.id,
             "protocol_id": self.protocol_id,
             "analyzer_version": self.analyzer_version,
-            "completed_analysis": serialized_completed_analysis,
+            "completed_analysis": _compress(self.summary.json(exclude={"commands"})),
+            "completed_analysis_commands": self.encoded_commands,
         }
 
     @classmethod
-    async def from_sql_row(
-        cls, sql_row: sqlalchemy.engine.Row
-    ) -> _CompletedAnalysisResource:
+    def from_sql_row(cls, sql_row: sqlalchemy.engine.Row) -> _CompletedAnalysisResource:
         """Extract the data from a SQLAlchemy row object.
 
-        This potentially involves heavy parsing, so it's offloaded to a worker thread.
-
-        Avoid calling this from inside a SQL transaction, since it might be slow.
+        Only the analysis summary is parsed here, which is cheap,
+        so this doesn't need to be offloaded to a worker thread.
         """
         analyzer_version = sql_row.analyzer_version
         if analyzer_version != _CURRENT_ANALYZER_VERSION:
@@ -332,32 +464,46 @@ class _CompletedAnalysisResource:
         protocol_id = sql_row.protocol_id
         assert isinstance(protocol_id, str)
 
-        def parse_completed_analysis() -> CompletedAnalysis:
-            return CompletedAnalysis.parse_obj(pickle.loads(sql_row.completed_analysis))
+        encoded_commands = sql_row.completed_analysis_commands
+        assert isinstance(encoded_commands, bytes)
 
-        completed_analysis = await anyio.to_thread.run_sync(
-            parse_completed_analysis,
-            # Cancellation may orphan the worker thread,
-            # but that should be harmless in this case.
-            cancellable=True,
+        summary = CompletedAnalysis.parse_obj(
+            {**json.loads(_decompress(sql_row.completed_analysis)), "commands": []}
         )
 
         return cls(
             id=id,
             protocol_id=protocol_id,
             analyzer_version=analyzer_version,
-            completed_analysis=completed_analysis,
+            summary=summary,
+            encoded_commands=encoded_commands,
         )
 
 
 class _CompletedAnalysisStore:
-    """A SQL-backed persistent store of protocol analyses that are completed."""
+    """A SQL-backed persistent store of protocol analyses that are completed.
+
+    Parsing a completed analysis is expensive, so parsed analyses are kept
+    in an in-memory cache, tagged with their protocol so that they're
+    invalidated when `ProtocolStore` deletes the protocol and its analyses.
+    Completed analyses are otherwise never modified, so they never go stale.
+    """
 
-    def __init__(self, sql_engine: sqlalchemy.engine.Engine) -> None:
+    def __init__(
+        self,
+        sql_engine: sqlalchemy.engine.Engine,
+        cache: MemoryCache,
+    ) -> None:
         self._sql_engine = sql_engine
+        self._cache = cache
 
     async def get_by_id(self, analysis_id: str) -> Optional[_CompletedAnalysisResource]:
         """Return the analysis with the given ID, if it exists."""
+        try:
+            return self._get_cached(analysis_id)
+        except KeyError:
+            pass
+
         statement = sqlalchemy.select(analysis_table).where(
             analysis_table.c.id == analysis_id
         )
@@ -366,7 +512,10 @@ class _CompletedAnalysisStore:
                 result = transaction.execute(statement).one()
             except sqlalchemy.exc.NoResultFound:
                 return None
-        return await _CompletedAnalysisResource.from_sql_row(result)
+
+        resource = _CompletedAnalysisResource.from_sql_row(result)
+        self._put_cached(resource)
+        return resource
 
     async def get_by_protocol(
         self, protocol_id: str
@@ -376,17 +525,95 @@ class _CompletedAnalysisStore:
         If protocol_id doesn't point to a valid protocol, returns an empty list;
         doesn't raise an error.
         """
-        statement = (
-            sqlalchemy.select(analysis_table)
-            .where(analysis_table.c.protocol_id == protocol_id)
-            .order_by(sqlite_rowid)
-        )
-        with self._sql_engine.begin() as transaction:
-            results = transaction.execute(statement).all()
-        return [await _CompletedAnalysisResource.from_sql_row(r) for r in results]
+        analysis_ids = self.get_ids_by_protocol(protocol_id=protocol_id)
+        resources_by_id: Dict[str, _CompletedAnalysisResource] = {}
+
+        for analysis_id in analysis_ids:
+            try:
+                resources_by_id[analysis_id] = self._get_cached(analysis_id)
+            except KeyError:
+                pass
+
+        missing_ids = [i for i in analysis_ids if i not in resources_by_id]
+
+        if len(missing_ids) > 0:
+            statement = sqlalchemy.select(analysis_table).where(
+                analysis_table.c.id.in_(missing_ids)
+            )
+            with self._sql_engine.begin() as transaction:
+                results = transaction.execute(statement).all()
+
+            for row in results:
+                resource = _CompletedAnalysisResource.from_sql_row(row)
+                resources_by_id[resource.id] = resource
+                self._put_cached(resource)
+
+        return [
+            resources_by_id[analysis_id]
+            for analysis_id in analysis_ids
+            if analysis_id in resources_by_id
+        ]
 
     def get_ids_by_protocol(self, protocol_id: str) -> List[str]:
         """Like `get_by_protocol()`, but return only the ID of each analysis."""
+        return self._cache.get_or_put(
+            key=("analysis_store.get_ids_by_protocol", protocol_id),
+            compute=lambda: self._sql_get_ids_by_protocol(protocol_id=protocol_id),
+            tags=[protocol_cache_tag(protocol_id)],
+        )
+
+    async def get_completed_analysis(
+        self, resource: _CompletedAnalysisResource
+    ) -> CompletedAnalysis:
+        """Return a resource's full completed analysis, decoding its commands.
+
+        Full analyses are cached separately from the resources themselves,
+        so the cache's memory budget can evict these big objects while
+        keeping the compact resources around.
+        """
+        key = ("analysis_store.completed_analysis", resource.id)
+
+        try:
+            completed_analysis = self._cache.get(key)
+        except KeyError:
+            completed_analysis = await resource.get_completed_analysis()
+            self._cache.put(
+                key=key,
+                value=completed_analysis,
+                tags=[protocol_cache_tag(resource.protocol_id)],
+            )
+
+        assert isinstance(completed_analysis, CompletedAnalysis)
+        return completed_analysis
+
+    async def add(
+        self,
+        completed_analysis_resource: _CompletedAnalysisResource,
+        completed_analysis: Optional[CompletedAnalysis] = None,
+    ) -> None:
+        """Insert a completed analysis.
+
+        If given the full `completed_analysis` that the resource was built from,
+        cache it, so its first read doesn't need to decode it again.
+        """
+        statement = analysis_table.insert().values(
+            completed_analysis_resource.to_sql_values()
+        )
+        with self._sql_engine.begin() as transaction:
+            transaction.execute(statement)
+
+        protocol_id = completed_analysis_resource.protocol_id
+        self._cache.invalidate(("analysis_store.get_ids_by_protocol", protocol_id))
+        self._put_cached(completed_analysis_resource)
+
+        if completed_analysis is not None:
+            self._cache.put(
+                key=("analysis_store.completed_analysis", completed_analysis.id),
+                value=completed_analysis,
+                tags=[protocol_cache_tag(protocol_id)],
+            )
+
+    def _sql_get_ids_by_protocol(self, protocol_id: str) -> List[str]:
         statement = (
             sqlalchemy.select(analysis_table.c.id)
             .where(analysis_table.c.protocol_id == protocol_id)
@@ -402,15 +629,131 @@ class _CompletedAnalysisStore:
 
         return result_ids
 
-    async def add(
-        self, completed_analysis_resource: _CompletedAnalysisResource
+    def _get_cached(self, analysis_id: str) -> _CompletedAnalysisResource:
+        resource = self._cache.get(("analysis_store.completed", analysis_id))
+        assert isinstance(resource, _CompletedAnalysisResource)
+        return resource
+
+    def _put_cached(self, resource: _CompletedAnalysisResource) -> None:
+        self._cache.put(
+            key=("analysis_store.completed", resource.id),
+            value=resource,
+            tags=[protocol_cache_tag(resource.protocol_id)],
+        )
+
+
+class _AnalysisCache:
+    """A SQL-backed cache of completed analyses, keyed by what they analyzed.
+
+    Entries are copies of completed analyses, so they outlive the protocols
+    they were analyzed for. Their total size is bounded: adding an entry
+    evicts the least recently used entries until everything fits.
+    """
+
+    def __init__(
+        self, sql_engine: sqlalchemy.engine.Engine, max_size_bytes: int
     ) -> None:
-        statement = analysis_table.insert().values(
-            await completed_analysis_resource.to_sql_values()
+        self._sql_engine = sql_engine
+        self._max_size_bytes = max_size_bytes
+
+    def get(
+        self, key: str, protocol_id: str, analysis_id: str
+    ) -> Optional[_CompletedAnalysisResource]:
+        """Return a copy of the cached analysis, as a new analysis of a protocol.
+
+        Marks the entry as most recently used.
+        """
+        statement = sqlalchemy.select(analysis_cache_table).where(
+            analysis_cache_table.c.key == key
         )
         with self._sql_engine.begin() as transaction:
-            transaction.execute(statement)
+            row = transaction.execute(statement).first()
+            if row is None:
+                return None
+            transaction.execute(
+                sqlalchemy.update(analysis_cache_table)
+                .where(analysis_cache_table.c.key == key)
+                .values(last_used_at=datetime.now(tz=timezone.utc))
+            )
+
+        encoded_commands = row.completed_analysis_commands
+        assert isinstance(encoded_commands, bytes)
+
+        summary = CompletedAnalysis.parse_obj(
+            {
+                **json.loads(_decompress(row.completed_analysis)),
+                "id": analysis_id,
+                "commands": [],
+            }
+        )
+
+        return _CompletedAnalysisResource(
+            id=analysis_id,
+            protocol_id=protocol_id,
+            analyzer_version=row.analyzer_version,
+            summary=summary,
+            encoded_commands=encoded_commands,
+        )
+
+    def put(self, key: str, resource: _CompletedAnalysisResource) -> None:
+        """Cache a completed analysis, evicting old entries to make room if needed."""
+        values = resource.to_sql_values()
+        encoded_summary = values["completed_analysis"]
+        assert isinstance(encoded_summary, bytes)
+        size_bytes = len(encoded_summary) + len(resource.encoded_commands)
+
+        # Don't flush out the whole cache for something that can't fit anyway.
+        if size_bytes > self._max_size_bytes:
+            return
+
+        with self._sql_engine.begin() as transaction:
+            transaction.execute(
+                sqlalchemy.delete(analysis_cache_table).where(
+                    analysis_cache_table.c.key == key
+                )
+            )
+            transaction.execute(
+                sqlalchemy.insert(analysis_cache_table).values(
+                    key=key,
+                    analyzer_version=resource.analyzer_version,
+                    completed_analysis=encoded_summary,
+                    completed_analysis_commands=resource.encoded_commands,
+                    size_bytes=size_bytes,
+                    last_used_at=datetime.now(tz=timezone.utc),
+                )
+            )
+
+            entries = transaction.execute(
+                sqlalchemy.select(
+                    analysis_cache_table.c.key, analysis_cache_table.c.size_bytes
+                ).order_by(
+                    sqlalchemy.desc(analysis_cache_table.c.last_used_at),
+                    sqlalchemy.desc(sqlite_rowid),
+                )
+            ).all()
+
+            total_size_bytes = 0
+            evicted_keys: List[str] = []
+            for entry in entries:
+                total_size_bytes += entry.size_bytes
+                if total_size_bytes > self._max_size_bytes:
+                    evicted_keys.append(entry.key)
+
+            if len(evicted_keys) > 0:
+                transaction.execute(
+                    sqlalchemy.delete(analysis_cache_table).where(
+                        analysis_cache_table.c.key.in_(evicted_keys)
+                    )
+                )
 
 
 def _summarize_pending(pending_analysis: PendingAnalysis) -> AnalysisSummary:
     return AnalysisSummary(id=pending_analysis.id, status=pending_analysis.status)
+
+
+def _compress(json_str: str) -> bytes:
+    return zlib.compress(json_str.encode("utf-8"), _COMPRESSION_LEVEL)
+
+
+def _decompress(data: bytes) -> str:
+    return zlib.decompress(data).decode("utf-8")
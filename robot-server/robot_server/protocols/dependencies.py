@@ -14,7 +14,13 @@ from opentrons.protocol_runner import create_simulating_runner
 
 from robot_server.app_state import AppState, AppStateAccessor, get_app_state
 from robot_server.deletion_planner import ProtocolDeletionPlanner
-from robot_server.persistence import get_sql_engine, get_persistence_directory
+from robot_server.settings import get_settings
+from robot_server.persistence import (
+    MemoryCache,
+    get_sql_engine,
+    get_persistence_cache,
+    get_persistence_directory,
+)
 
 from .protocol_auto_deleter import ProtocolAutoDeleter
 from .protocol_store import (
@@ -58,6 +64,7 @@ async def get_protocol_store(
     sql_engine: SQLEngine = Depends(get_sql_engine),
     protocol_directory: Path = Depends(get_protocol_directory),
     protocol_reader: ProtocolReader = Depends(get_protocol_reader),
+    cache: MemoryCache = Depends(get_persistence_cache),
 ) -> ProtocolStore:
     """Get a singleton ProtocolStore to keep track of created protocols."""
     protocol_store = _protocol_store_accessor.get_from(app_state)
@@ -67,6 +74,7 @@ async def get_protocol_store(
             sql_engine=sql_engine,
             protocols_directory=protocol_directory,
             protocol_reader=protocol_reader,
+            cache=cache,
         )
         _protocol_store_accessor.set_on(app_state, protocol_store)
 
@@ -76,12 +84,17 @@ async def get_protocol_store(
 def get_analysis_store(
     app_state: AppState = Depends(get_app_state),
     sql_engine: SQLEngine = Depends(get_sql_engine),
+    cache: MemoryCache = Depends(get_persistence_cache),
 ) -> AnalysisStore:
     """Get a singleton AnalysisStore to keep track of created analyses."""
     analysis_store = _analysis_store_accessor.get_from(app_state)
 
     if analysis_store is None:
-        analysis_store = AnalysisStore(sql_engine=sql_engine)
+        analysis_store = AnalysisStore(
+            sql_engine=sql_engine,
+            cache=cache,
+            analysis_cache_size_bytes=get_settings().analysis_cache_size_bytes,
+        )
         _analysis_store_accessor.set_on(app_state, analysis_store)
 
     return analysis_store
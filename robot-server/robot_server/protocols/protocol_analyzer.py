@@ -1,5 +1,6 @@
 """Protocol analysis module."""
 import logging
+from typing import Optional
 
 from opentrons.protocol_runner import ProtocolRunner
 
@@ -26,8 +27,13 @@ class ProtocolAnalyzer:
         self,
         protocol_resource: ProtocolResource,
         analysis_id: str,
+        cache_key: Optional[str] = None,
     ) -> None:
-        """Analyze a given protocol, storing the analysis when complete."""
+        """Analyze a given protocol, storing the analysis when complete.
+
+        If given a `cache_key`, the analysis is also cached under it,
+        so an identical protocol can reuse it rather than be analyzed again.
+        """
         result = await self._protocol_runner.run(protocol_resource.source)
 
         log.info(f'Completed analysis "{analysis_id}".')
@@ -38,4 +44,5 @@ class ProtocolAnalyzer:
             labware=result.state_summary.labware,
             pipettes=result.state_summary.pipettes,
             errors=result.state_summary.errors,
+            cache_key=cache_key,
         )
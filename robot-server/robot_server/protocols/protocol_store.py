@@ -3,16 +3,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from functools import lru_cache
 from logging import getLogger
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 from anyio import Path as AsyncPath, create_task_group
 import sqlalchemy
 
 from opentrons.protocol_reader import ProtocolReader, ProtocolSource
 from robot_server.persistence import (
+    MemoryCache,
     analysis_table,
     protocol_table,
     run_table,
@@ -20,9 +20,6 @@ from robot_server.persistence import (
 )
 
 
-_CACHE_ENTRIES = 32
-
-
 _log = getLogger(__name__)
 
 
@@ -88,6 +85,7 @@ class ProtocolStore:
         *,
         _sql_engine: sqlalchemy.engine.Engine,
         _sources_by_id: Dict[str, ProtocolSource],
+        _cache: Optional[MemoryCache],
     ) -> None:
         """Do not call directly.
 
@@ -95,11 +93,13 @@ class ProtocolStore:
         """
         self._sql_engine = _sql_engine
         self._sources_by_id = _sources_by_id
+        self._cache = _cache or MemoryCache()
 
     @classmethod
     def create_empty(
         cls,
         sql_engine: sqlalchemy.engine.Engine,
+        cache: Optional[MemoryCache] = None,
     ) -> ProtocolStore:
         """Return a new, empty ProtocolStore.
 
@@ -110,8 +110,10 @@ class ProtocolStore:
                 see `add_tables_to_db()`.
                 This should have no protocol data currently stored.
                 If there is data, use `rehydrate()` instead.
+            cache: An in-memory cache for data read from the database,
+                which may be shared with other stores.
         """
-        return cls(_sql_engine=sql_engine, _sources_by_id={})
+        return cls(_sql_engine=sql_engine, _sources_by_id={}, _cache=cache)
 
     @classmethod
     async def rehydrate(
@@ -119,6 +121,7 @@ class ProtocolStore:
         sql_engine: sqlalchemy.engine.Engine,
         protocols_directory: Path,
         protocol_reader: ProtocolReader,
+        cache: Optional[MemoryCache] = None,
     ) -> ProtocolStore:
         """Return a new ProtocolStore, picking up where a former one left off.
 
@@ -137,6 +140,8 @@ class ProtocolStore:
                 named after its protocol ID.
             protocol_reader: An interface to compute `ProtocolSource`s from protocol
                 files while rehydrating.
+            cache: An in-memory cache for data read from the database,
+                which may be shared with other stores.
         """
         # The SQL database is the canonical source of which protocols
         # have been added successfully.
@@ -153,6 +158,7 @@ class ProtocolStore:
         return ProtocolStore(
             _sql_engine=sql_engine,
             _sources_by_id=sources_by_id,
+            _cache=cache,
         )
 
     def insert(self, resource: ProtocolResource) -> None:
@@ -168,16 +174,19 @@ class ProtocolStore:
             )
         )
         self._sources_by_id[resource.protocol_id] = resource.source
-        self._clear_caches()
+        self._invalidate_protocol(resource.protocol_id)
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
     def get(self, protocol_id: str) -> ProtocolResource:
         """Get a single protocol by ID.
 
         Raises:
             ProtocolNotFoundError
         """
-        sql_resource = self._sql_get(protocol_id=protocol_id)
+        sql_resource = self._cache.get_or_put(
+            key=("protocol_store.get", protocol_id),
+            compute=lambda: self._sql_get(protocol_id=protocol_id),
+            tags=[protocol_cache_tag(protocol_id)],
+        )
         return ProtocolResource(
             protocol_id=sql_resource.protocol_id,
             created_at=sql_resource.created_at,
@@ -185,10 +194,13 @@ class ProtocolStore:
             source=self._sources_by_id[sql_resource.protocol_id],
         )
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
     def get_all(self) -> List[ProtocolResource]:
         """Get all protocols currently saved in this store."""
-        all_sql_resources = self._sql_get_all()
+        all_sql_resources = self._cache.get_or_put(
+            key=("protocol_store.get_all",),
+            compute=self._sql_get_all,
+            tags=[_ALL_PROTOCOLS_TAG],
+        )
         return [
             ProtocolResource(
                 protocol_id=r.protocol_id,
@@ -199,18 +211,14 @@ class ProtocolStore:
             for r in all_sql_resources
         ]
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
     def has(self, protocol_id: str) -> bool:
         """Check for the presence of a protocol ID in the store."""
-        statement = sqlalchemy.select(protocol_table).where(
-            protocol_table.c.id == protocol_id
+        return self._cache.get_or_put(
+            key=("protocol_store.has", protocol_id),
+            compute=lambda: self._sql_has(protocol_id=protocol_id),
+            tags=[protocol_cache_tag(protocol_id)],
         )
 
-        with self._sql_engine.begin() as transaction:
-            result = transaction.execute(statement).one_or_none()
-
-        return result is not None
-
     def remove(self, protocol_id: str) -> None:
         """Remove a `ProtocolResource` from the store.
 
@@ -227,6 +235,7 @@ class ProtocolStore:
                 there is a run currently referencing the protocol.
         """
         self._sql_remove(protocol_id=protocol_id)
+        self._invalidate_protocol(protocol_id)
 
         deleted_source = self._sources_by_id.pop(protocol_id)
         protocol_dir = deleted_source.directory
@@ -236,8 +245,6 @@ class ProtocolStore:
         if protocol_dir:
             protocol_dir.rmdir()
 
-        self._clear_caches()
-
     # Note that this is NOT cached like the other getters because we would need
     # to invalidate the cache whenever the runs table changes, which is not something
     # that this class can easily monitor.
@@ -283,6 +290,16 @@ class ProtocolStore:
         with self._sql_engine.begin() as transaction:
             transaction.execute(statement)
 
+    def _sql_has(self, protocol_id: str) -> bool:
+        statement = sqlalchemy.select(protocol_table).where(
+            protocol_table.c.id == protocol_id
+        )
+
+        with self._sql_engine.begin() as transaction:
+            result = transaction.execute(statement).one_or_none()
+
+        return result is not None
+
     def _sql_get(self, protocol_id: str) -> _DBProtocolResource:
         statement = sqlalchemy.select(protocol_table).where(
             protocol_table.c.id == protocol_id
@@ -333,10 +350,23 @@ class ProtocolStore:
         if result.rowcount < 1:
             raise ProtocolNotFoundError(protocol_id=protocol_id)
 
-    def _clear_caches(self) -> None:
-        self.get.cache_clear()
-        self.get_all.cache_clear()
-        self.has.cache_clear()
+    def _invalidate_protocol(self, protocol_id: str) -> None:
+        # Also invalidates anything else cached under this protocol's tag,
+        # like its analyses, which `_sql_remove()` deletes alongside it.
+        self._cache.invalidate_tag(protocol_cache_tag(protocol_id))
+        self._cache.invalidate_tag(_ALL_PROTOCOLS_TAG)
+
+
+_ALL_PROTOCOLS_TAG = ("protocol",)
+
+
+def protocol_cache_tag(protocol_id: str) -> Tuple[str, str]:
+    """Get the `MemoryCache` tag for cached data that belongs to a protocol.
+
+    Invalidating this tag invalidates everything cached about the protocol,
+    including from other stores that share the cache, like its analyses.
+    """
+    return ("protocol", protocol_id)
 
 
 # TODO(mm, 2022-04-18):
@@ -19,13 +19,14 @@ from robot_server.service.json_api import (
     SimpleEmptyBody,
     MultiBodyMeta,
     PydanticResponse,
+    StreamingPydanticResponse,
 )
 
 from .protocol_auto_deleter import ProtocolAutoDeleter
 from .protocol_models import Protocol, ProtocolFile, Metadata
 from .protocol_analyzer import ProtocolAnalyzer
 from .analysis_store import AnalysisStore, AnalysisNotFoundError
-from .analysis_models import ProtocolAnalysis
+from .analysis_models import ProtocolAnalysis, AnalysisStatus
 from .protocol_store import (
     ProtocolStore,
     ProtocolResource,
@@ -153,27 +154,44 @@ async def create_protocol(
     protocol_auto_deleter.make_room_for_new_protocol()
     protocol_store.insert(protocol_resource)
 
-    task_runner.run(
-        protocol_analyzer.analyze,
-        protocol_resource=protocol_resource,
-        analysis_id=analysis_id,
-    )
-    pending_analysis = analysis_store.add_pending(
+    # Identical files analyze identically, so reuse any earlier analysis of them.
+    cache_key = await analysis_store.get_cache_key(source)
+    analysis_summary = await analysis_store.add_from_cache(
         protocol_id=protocol_id,
         analysis_id=analysis_id,
+        cache_key=cache_key,
     )
 
+    if analysis_summary is None:
+        task_runner.run(
+            protocol_analyzer.analyze,
+            protocol_resource=protocol_resource,
+            analysis_id=analysis_id,
+            cache_key=cache_key,
+        )
+        analysis_summary = analysis_store.add_pending(
+            protocol_id=protocol_id,
+            analysis_id=analysis_id,
+        )
+
     data = Protocol(
         id=protocol_id,
         createdAt=created_at,
         protocolType=source.config.protocol_type,
         metadata=Metadata.parse_obj(source.metadata),
-        analysisSummaries=[pending_analysis],
+        analysisSummaries=[analysis_summary],
         key=key,
         files=[ProtocolFile(name=f.path.name, role=f.role) for f in source.files],
     )
 
-    log.info(f'Created protocol "{protocol_id}" and started analysis "{analysis_id}".')
+    if analysis_summary.status == AnalysisStatus.PENDING:
+        log.info(
+            f'Created protocol "{protocol_id}" and started analysis "{analysis_id}".'
+        )
+    else:
+        log.info(
+            f'Created protocol "{protocol_id}" with cached analysis "{analysis_id}".'
+        )
 
     return await PydanticResponse.create(
         content=SimpleBody.construct(data=data),
@@ -308,7 +326,7 @@ async def get_protocol_analyses(
     protocolId: str,
     protocol_store: ProtocolStore = Depends(get_protocol_store),
     analysis_store: AnalysisStore = Depends(get_analysis_store),
-) -> PydanticResponse[SimpleMultiBody[ProtocolAnalysis]]:
+) -> StreamingPydanticResponse[SimpleMultiBody[ProtocolAnalysis]]:
     """Get a protocol's full analyses list.
 
     Analyses are returned in order from least-recently started to most-recently started.
@@ -325,7 +343,7 @@ async def get_protocol_analyses(
 
     analyses = await analysis_store.get_by_protocol(protocolId)
 
-    return await PydanticResponse.create(
+    return StreamingPydanticResponse(
         content=SimpleMultiBody.construct(
             data=analyses,
             meta=MultiBodyMeta(cursor=0, totalLength=len(analyses)),
@@ -348,7 +366,7 @@ async def get_protocol_analysis_by_id(
     analysisId: str,
     protocol_store: ProtocolStore = Depends(get_protocol_store),
     analysis_store: AnalysisStore = Depends(get_analysis_store),
-) -> PydanticResponse[SimpleBody[ProtocolAnalysis]]:
+) -> StreamingPydanticResponse[SimpleBody[ProtocolAnalysis]]:
     """Get a protocol analysis by analysis ID.
 
     Arguments:
@@ -371,4 +389,4 @@ async def get_protocol_analysis_by_id(
             status.HTTP_404_NOT_FOUND
         ) from error
 
-    return await PydanticResponse.create(content=SimpleBody.construct(data=analysis))
+    return StreamingPydanticResponse(content=SimpleBody.construct(data=analysis))
@@ -6,7 +6,7 @@ from opentrons.hardware_control import HardwareControlAPI
 
 from robot_server.app_state import AppState, AppStateAccessor, get_app_state
 from robot_server.hardware import get_hardware
-from robot_server.persistence import get_sql_engine
+from robot_server.persistence import MemoryCache, get_sql_engine, get_persistence_cache
 from robot_server.service.task_runner import get_task_runner, TaskRunner
 from robot_server.deletion_planner import RunDeletionPlanner
 
@@ -22,12 +22,13 @@ _engine_store_accessor = AppStateAccessor[EngineStore]("engine_store")
 async def get_run_store(
     app_state: AppState = Depends(get_app_state),
     sql_engine: SQLEngine = Depends(get_sql_engine),
+    cache: MemoryCache = Depends(get_persistence_cache),
 ) -> RunStore:
     """Get a singleton RunStore to keep track of created runs."""
     run_store = _run_store_accessor.get_from(app_state)
 
     if run_store is None:
-        run_store = RunStore(sql_engine=sql_engine)
+        run_store = RunStore(sql_engine=sql_engine, cache=cache)
         _run_store_accessor.set_on(app_state, run_store)
 
     return run_store
@@ -21,6 +21,7 @@ from robot_server.service.json_api import (
     MultiBody,
     MultiBodyMeta,
     PydanticResponse,
+    StreamingPydanticResponse,
 )
 
 from ..run_models import RunCommandSummary
@@ -242,7 +243,7 @@ async def get_run_commands(
         description="The maximum number of commands in the list to return.",
     ),
     run_data_manager: RunDataManager = Depends(get_run_data_manager),
-) -> PydanticResponse[MultiBody[RunCommandSummary, CommandCollectionLinks]]:
+) -> StreamingPydanticResponse[MultiBody[RunCommandSummary, CommandCollectionLinks]]:
     """Get a summary of a set of commands in a run.
 
     Arguments:
@@ -297,7 +298,7 @@ async def get_run_commands(
             ),
         )
 
-    return await PydanticResponse.create(
+    return StreamingPydanticResponse(
         content=MultiBody.construct(data=data, meta=meta, links=links),
         status_code=status.HTTP_200_OK,
     )
@@ -0,0 +1,251 @@
+"""Incremental persistence of a run's commands while the run executes."""
+import asyncio
+import logging
+from typing import Dict, List, Optional, Set
+
+from opentrons.ordered_set import OrderedSet
+from opentrons.protocol_engine import AbstractPlugin, actions as pe_actions
+from opentrons.protocol_engine.commands import Command, CommandStatus
+
+from .run_store import RunStore
+
+log = logging.getLogger(__name__)
+
+_DEFAULT_FLUSH_INTERVAL_SEC = 1.0
+_DEFAULT_MAX_BATCH_SIZE = 100
+_DEFAULT_MAX_PENDING = 1000
+_DEFAULT_MAX_WRITE_ATTEMPTS = 3
+
+_FINAL_STATUSES = (CommandStatus.SUCCEEDED, CommandStatus.FAILED)
+
+
+class RunCommandWriter(AbstractPlugin):
+    """A ProtocolEngine plugin to persist a run's commands as they complete.
+
+    Completed commands are batched up and appended to the `RunStore`
+    by a background task, either every `flush_interval_sec` seconds or
+    as soon as `max_batch_size` commands are waiting to be written.
+    `RunStore.insert_commands` does the writing in a worker thread, so
+    writes don't block the event loop.
+
+    At most `max_pending` commands wait to be written. Commands that
+    complete while that many are waiting, and commands whose write has
+    failed `max_write_attempts` times in a row, are left for the final
+    write instead of being retried.
+
+    Commands already in the engine when the plugin is added, like the
+    commands of a JSON protocol, are picked up when it is set up. When the
+    engine finishes, every command in its state that hasn't been written
+    yet is written, so archiving the run only needs to store its state
+    summary.
+    If the server stops partway through a run, the commands written so far
+    remain available as the run's command history.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        run_store: RunStore,
+        flush_interval_sec: float = _DEFAULT_FLUSH_INTERVAL_SEC,
+        max_batch_size: int = _DEFAULT_MAX_BATCH_SIZE,
+        max_pending: int = _DEFAULT_MAX_PENDING,
+        max_write_attempts: int = _DEFAULT_MAX_WRITE_ATTEMPTS,
+    ) -> None:
+        """Initialize the plugin with its dependencies.
+
+        Args:
+            run_id: The run whose commands will be written.
+            run_store: The store to write commands to.
+            flush_interval_sec: Maximum time a completed command waits
+                before it is written.
+            max_batch_size: Number of waiting commands that will trigger
+                a write before `flush_interval_sec` has elapsed.
+            max_pending: Maximum number of commands waiting to be written.
+            max_write_attempts: Number of times in a row a write may fail
+                before its commands are left for the final write.
+        """
+        self._run_id = run_id
+        self._run_store = run_store
+        self._flush_interval_sec = flush_interval_sec
+        self._max_batch_size = max_batch_size
+        self._max_pending = max(max_pending, max_batch_size)
+        self._max_write_attempts = max_write_attempts
+
+        # Mirrors the index assignment done by the engine's CommandStore,
+        # which sees the same actions in the same order as this plugin
+        # once it has been seeded with the commands already in state.
+        self._index_by_id: Dict[str, int] = {}
+        # Commands that have been queued but not seen to complete.
+        self._open_ids: OrderedSet[str] = OrderedSet()
+        self._pending_ids: OrderedSet[str] = OrderedSet()
+        self._written_ids: Set[str] = set()
+        self._failed_writes = 0
+        self._overflowed = False
+
+        self._batch_full: Optional[asyncio.Event] = None
+        self._write_lock: Optional[asyncio.Lock] = None
+        self._flush_task: Optional["asyncio.Task[None]"] = None
+
+    def setup(self) -> None:
+        """Track the commands in state and start writing completed commands.
+
+        Commands already in state, like a JSON protocol's, were queued
+        before the plugin was added, so the plugin never saw them queued.
+        """
+        self._batch_full = asyncio.Event()
+        self._write_lock = asyncio.Lock()
+
+        for command in self.state.commands.get_all():
+            self._add_index(command.id)
+            if command.status in _FINAL_STATUSES:
+                self._add_pending(command.id, notify=False)
+            else:
+                self._open_ids.add(command.id)
+
+        self._flush_task = asyncio.create_task(self._flush_periodically())
+
+    async def teardown(self) -> None:
+        """Stop the background task and write all remaining commands.
+
+        Called by the ProtocolEngine once it has finished, at which point
+        every command's state is final.
+        """
+        if self._flush_task is not None:
+            assert self._write_lock is not None, "Plugin has not been set up."
+            # Let a write that is in progress finish before stopping.
+            async with self._write_lock:
+                self._flush_task.cancel()
+                await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+
+        # Every command is written under its index in state, which covers
+        # any command the plugin didn't see queued.
+        self._index_by_id = {
+            command.id: index
+            for index, command in enumerate(self.state.commands.get_all())
+        }
+        self._pending_ids = OrderedSet(
+            command_id
+            for command_id in self._index_by_id
+            if command_id not in self._written_ids
+        )
+        await self._flush(final=True)
+
+    def handle_action(self, action: pe_actions.Action) -> None:
+        """Track queued commands and mark completed commands to be written."""
+        if isinstance(action, pe_actions.QueueCommandAction):
+            self._add_index(action.command_id)
+            self._open_ids.add(action.command_id)
+
+        elif isinstance(action, pe_actions.UpdateCommandAction):
+            command = action.command
+            self._add_index(command.id)
+
+            if command.status in _FINAL_STATUSES:
+                self._open_ids.discard(command.id)
+                self._add_pending(command.id)
+
+        elif isinstance(action, pe_actions.FailCommandAction):
+            # Failing a command also fails some of the commands queued
+            # after it. Which ones is up to the engine, so every open
+            # command is checked, and those that have failed get written.
+            self._add_pending(action.command_id)
+            for command_id in self._open_ids:
+                self._add_pending(command_id)
+
+    def _add_index(self, command_id: str) -> None:
+        if command_id not in self._index_by_id:
+            self._index_by_id[command_id] = len(self._index_by_id)
+
+    def _add_pending(self, command_id: str, notify: bool = True) -> None:
+        if command_id in self._written_ids:
+            return
+
+        if len(self._pending_ids) >= self._max_pending:
+            if not self._overflowed:
+                log.warning(
+                    f"More than {self._max_pending} commands are waiting to be"
+                    f" written for run {self._run_id}; leaving the rest for the"
+                    " final write."
+                )
+                self._overflowed = True
+            return
+
+        self._pending_ids.add(command_id)
+
+        if notify and len(self._pending_ids) >= self._max_batch_size:
+            assert self._batch_full is not None, "Plugin has not been set up."
+            self._batch_full.set()
+
+    async def _flush_periodically(self) -> None:
+        assert self._batch_full is not None, "Plugin has not been set up."
+
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._batch_full.wait(),
+                    timeout=self._flush_interval_sec,
+                )
+            except asyncio.TimeoutError:
+                pass
+
+            self._batch_full.clear()
+            await self._flush()
+
+    async def _flush(self, final: bool = False) -> None:
+        if len(self._pending_ids) == 0:
+            return
+
+        pending_ids = self._pending_ids
+        self._pending_ids = OrderedSet()
+        self._overflowed = False
+
+        # Commands are read from state rather than from the actions that
+        # marked them, so they reflect every action handled since. Until
+        # the final write, only commands that have completed are written;
+        # the others are marked again once they complete.
+        commands_by_index = {}
+        for command_id in pending_ids:
+            command = self.state.commands.get(command_id)
+            if final or command.status in _FINAL_STATUSES:
+                self._open_ids.discard(command_id)
+                commands_by_index[self._index_by_id[command_id]] = command
+
+        if len(commands_by_index) == 0:
+            return
+
+        written_ids = [command.id for command in commands_by_index.values()]
+        try:
+            await self._write(commands_by_index)
+        except Exception as e:
+            self._handle_failed_write(written_ids, e, final)
+        else:
+            self._failed_writes = 0
+            self._written_ids.update(written_ids)
+
+    def _handle_failed_write(
+        self, command_ids: List[str], error: Exception, final: bool
+    ) -> None:
+        self._failed_writes += 1
+        message = f"Unable to write {len(command_ids)} commands for run {self._run_id}"
+
+        if final:
+            log.error(f"{message}.", exc_info=error)
+        elif self._failed_writes < self._max_write_attempts:
+            log.warning(f"{message}; will retry.", exc_info=error)
+            for command_id in command_ids:
+                self._add_pending(command_id, notify=False)
+        else:
+            log.warning(
+                f"{message} after {self._failed_writes} attempts;"
+                " leaving them for the final write.",
+                exc_info=error,
+            )
+
+    async def _write(self, commands_by_index: Dict[int, Command]) -> None:
+        assert self._write_lock is not None, "Plugin has not been set up."
+        async with self._write_lock:
+            await self._run_store.insert_commands(
+                run_id=self._run_id,
+                commands_by_index=commands_by_index,
+            )
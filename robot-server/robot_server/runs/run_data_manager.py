@@ -16,6 +16,7 @@ from robot_server.service.task_runner import TaskRunner
 
 from .engine_store import EngineStore
 from .run_store import RunResource, RunStore
+from .run_command_writer import RunCommandWriter
 from .run_models import Run
 
 
@@ -102,10 +103,10 @@ class RunDataManager:
         prev_run_id = self._engine_store.current_run_id
         if prev_run_id is not None:
             prev_run_result = await self._engine_store.clear()
+            # The previous run's commands were written by its RunCommandWriter
             self._run_store.update_run_state(
                 run_id=prev_run_id,
                 summary=prev_run_result.state_summary,
-                commands=prev_run_result.commands,
             )
 
         state_summary = await self._engine_store.create(
@@ -118,6 +119,9 @@ class RunDataManager:
             created_at=created_at,
             protocol_id=protocol.protocol_id if protocol is not None else None,
         )
+        self._engine_store.engine.add_plugin(
+            RunCommandWriter(run_id=run_id, run_store=self._run_store)
+        )
 
         return _build_run(
             run_resource=run_resource,
@@ -198,11 +202,12 @@ class RunDataManager:
         next_current = current if current is False else True
 
         if next_current is False:
-            commands, state_summary = await self._engine_store.clear()
+            # Clearing the engine finishes it, which makes the run's
+            # RunCommandWriter write any commands it hasn't already
+            _, state_summary = await self._engine_store.clear()
             run_resource = self._run_store.update_run_state(
                 run_id=run_id,
                 summary=state_summary,
-                commands=commands,
             )
         else:
             state_summary = self._engine_store.engine.state_view.get_summary()
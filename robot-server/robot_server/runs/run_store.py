@@ -2,25 +2,27 @@
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
-from functools import lru_cache
-from typing import Any, Dict, List, Optional, cast
+from typing import Dict, List, Mapping, Optional, Tuple
 
+import anyio
 import sqlalchemy
-from pydantic import parse_obj_as
+from pydantic import parse_raw_as
 
 from opentrons.util.helpers import utc_now
 from opentrons.protocol_engine import StateSummary, CommandSlice
 from opentrons.protocol_engine.commands import Command
 
-from robot_server.persistence import run_table, action_table
+from robot_server.persistence import (
+    MemoryCache,
+    run_table,
+    run_command_table,
+    action_table,
+)
 from robot_server.protocols import ProtocolNotFoundError
 
 from .action_models import RunAction, RunActionType
 
 
-_CACHE_ENTRIES = 32
-
-
 @dataclass(frozen=True)
 class RunResource:
     """An entry in the run store, used to construct response models.
@@ -54,22 +56,35 @@ class CommandNotFoundError(ValueError):
 class RunStore:
     """Methods for storing and retrieving run resources."""
 
-    def __init__(self, sql_engine: sqlalchemy.engine.Engine) -> None:
-        """Initialize a RunStore with sql engine."""
+    def __init__(
+        self,
+        sql_engine: sqlalchemy.engine.Engine,
+        cache: Optional[MemoryCache] = None,
+    ) -> None:
+        """Initialize a RunStore with sql engine.
+
+        Args:
+            sql_engine: The database to store runs in.
+            cache: An in-memory cache for data read from the database,
+                which may be shared with other stores.
+        """
         self._sql_engine = sql_engine
+        self._cache = cache or MemoryCache()
 
     def update_run_state(
         self,
         run_id: str,
         summary: StateSummary,
-        commands: List[Command],
+        commands: Optional[List[Command]] = None,
     ) -> RunResource:
         """Update the run's state summary and commands list.
 
         Args:
             run_id: The run to update
             summary: The run's equipment and status summary.
-            commands: The run's commands.
+            commands: The run's commands, replacing any that were previously
+                stored. If `None`, the stored commands are left untouched,
+                e.g. because they were already written with `insert_commands`.
 
         Returns:
             The run resource.
@@ -82,8 +97,6 @@ class RunStore:
             .where(run_table.c.id == run_id)
             .values(
                 _convert_state_to_sql_values(
-                    run_id=run_id,
-                    commands=commands,
                     state_summary=summary,
                     engine_status=summary.status,
                 )
@@ -97,6 +110,10 @@ class RunStore:
             action_table.c.run_id == run_id
         )
 
+        delete_commands = sqlalchemy.delete(run_command_table).where(
+            run_command_table.c.run_id == run_id
+        )
+
         with self._sql_engine.begin() as transaction:
             transaction.execute(update_run)
 
@@ -107,9 +124,67 @@ class RunStore:
 
             action_rows = transaction.execute(select_actions).all()
 
-        self._clear_caches()
+            if commands is not None:
+                transaction.execute(delete_commands)
+
+            if commands:
+                transaction.execute(
+                    sqlalchemy.insert(run_command_table),
+                    _convert_commands_to_sql_values(
+                        run_id=run_id,
+                        commands_by_index=dict(enumerate(commands)),
+                    ),
+                )
+
+        self._cache.invalidate_tag(_run_tag(run_id))
         return _convert_row_to_run(row=run_row, action_rows=action_rows)
 
+    async def insert_commands(
+        self,
+        run_id: str,
+        commands_by_index: Mapping[int, Command],
+    ) -> None:
+        """Insert or replace some of a run's commands.
+
+        Used to persist commands incrementally, as they complete,
+        instead of all at once when the run is archived.
+
+        The commands are serialized and written in a worker thread, so they
+        don't block the event loop. The cache is only touched once the write
+        has finished, back on the event loop.
+
+        Args:
+            run_id: The run the commands belong to.
+            commands_by_index: The commands to store, keyed by their
+                index in the run's overall list of commands.
+
+        Raises:
+            RunNotFoundError: The given run ID was not found in the store.
+        """
+        if len(commands_by_index) == 0:
+            return
+
+        upsert = sqlalchemy.insert(run_command_table).prefix_with("OR REPLACE")
+
+        def write_commands() -> None:
+            with self._sql_engine.begin() as transaction:
+                try:
+                    transaction.execute(
+                        upsert,
+                        _convert_commands_to_sql_values(
+                            run_id=run_id,
+                            commands_by_index=commands_by_index,
+                        ),
+                    )
+                except sqlalchemy.exc.IntegrityError as e:
+                    raise RunNotFoundError(run_id=run_id) from e
+
+        try:
+            await anyio.to_thread.run_sync(write_commands)
+        finally:
+            # Even a failed write may have been cut short after committing.
+            self._cache.invalidate_tag(_run_tag(run_id))
+
     def insert_action(self, run_id: str, action: RunAction) -> None:
         """Insert a run action into the store.
 
@@ -130,7 +205,7 @@ class RunStore:
             except sqlalchemy.exc.IntegrityError as e:
                 raise RunNotFoundError(run_id=run_id) from e
 
-        self._clear_caches()
+        self._invalidate_run(run_id)
 
     def insert(
         self,
@@ -171,17 +246,17 @@ class RunStore:
                 ), "Insert run failed due to unexpected IntegrityError"
                 raise ProtocolNotFoundError(protocol_id=run.protocol_id)
 
-        self._clear_caches()
+        self._invalidate_run(run_id)
         return run
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
     def has(self, run_id: str) -> bool:
         """Whether a given run exists in the store."""
-        statement = sqlalchemy.select(run_table.c.id).where(run_table.c.id == run_id)
-        with self._sql_engine.begin() as transaction:
-            return transaction.execute(statement).first() is not None
+        return self._cache.get_or_put(
+            key=("run_store.has", run_id),
+            compute=lambda: self._sql_has(run_id),
+            tags=[_run_tag(run_id)],
+        )
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
     def get(self, run_id: str) -> RunResource:
         """Get a specific run entry by its identifier.
 
@@ -194,50 +269,24 @@ class RunStore:
         Raises:
             RunNotFoundError: The given run ID was not found.
         """
-        select_run_resource = sqlalchemy.select(_run_columns).where(
-            run_table.c.id == run_id
-        )
-
-        select_actions = sqlalchemy.select(action_table).where(
-            action_table.c.run_id == run_id
+        return self._cache.get_or_put(
+            key=("run_store.get", run_id),
+            compute=lambda: self._sql_get(run_id),
+            tags=[_run_tag(run_id)],
         )
 
-        with self._sql_engine.begin() as transaction:
-            try:
-                run_row = transaction.execute(select_run_resource).one()
-            except sqlalchemy.exc.NoResultFound as e:
-                raise RunNotFoundError(run_id) from e
-            action_rows = transaction.execute(select_actions).all()
-
-        return _convert_row_to_run(run_row, action_rows)
-
-    @lru_cache(maxsize=_CACHE_ENTRIES)
     def get_all(self) -> List[RunResource]:
         """Get all known run resources.
 
         Returns:
             All stored run entries.
         """
-        select_runs = sqlalchemy.select(_run_columns)
-        select_actions = sqlalchemy.select(action_table)
-        actions_by_run_id = defaultdict(list)
-
-        with self._sql_engine.begin() as transaction:
-            runs = transaction.execute(select_runs).all()
-            actions = transaction.execute(select_actions).all()
-
-        for action_row in actions:
-            actions_by_run_id[action_row.run_id].append(action_row)
-
-        return [
-            _convert_row_to_run(
-                row=run_row,
-                action_rows=actions_by_run_id[run_row.id],
-            )
-            for run_row in runs
-        ]
+        return self._cache.get_or_put(
+            key=("run_store.get_all",),
+            compute=self._sql_get_all,
+            tags=[_ALL_RUNS_TAG],
+        )
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
     def get_state_summary(self, run_id: str) -> Optional[StateSummary]:
         """Get the archived run state summary.
 
@@ -245,33 +294,10 @@ class RunStore:
         captured when the run was archived. It contains
         status, equipment, and error information.
         """
-        select_run_data = sqlalchemy.select(run_table.c.state_summary).where(
-            run_table.c.id == run_id
-        )
-
-        with self._sql_engine.begin() as transaction:
-            row = transaction.execute(select_run_data).one()
-
-        return (
-            StateSummary.parse_obj(row.state_summary)
-            if row.state_summary is not None
-            else None
-        )
-
-    @lru_cache(maxsize=_CACHE_ENTRIES)
-    def _get_all_unparsed_commands(self, run_id: str) -> List[Dict[str, Any]]:
-        select_run_commands = sqlalchemy.select(run_table.c.commands).where(
-            run_table.c.id == run_id
-        )
-
-        with self._sql_engine.begin() as transaction:
-            try:
-                row = transaction.execute(select_run_commands).one()
-            except sqlalchemy.exc.NoResultFound:
-                raise RunNotFoundError(run_id=run_id)
-
-        return (
-            cast(List[Dict[str, Any]], row.commands) if row.commands is not None else []
+        return self._cache.get_or_put(
+            key=("run_store.get_state_summary", run_id),
+            compute=lambda: self._sql_get_state_summary(run_id),
+            tags=[_run_tag(run_id)],
         )
 
     def get_commands_slice(
@@ -282,6 +308,10 @@ class RunStore:
     ) -> CommandSlice:
         """Get a slice of run commands from the store.
 
+        Only the requested page of commands is read from the database
+        and parsed, so the cost of this call scales with `length`
+        rather than with the total number of commands in the run.
+
         Args:
             run_id: Run ID to pull commands from.
             length: Number of commands to return.
@@ -294,17 +324,33 @@ class RunStore:
         Raises:
             RunNotFoundError: The given run ID was not found.
         """
-        command_intent_dicts = self._get_all_unparsed_commands(run_id)
-        commands_length = len(command_intent_dicts)
-        if cursor is None:
-            cursor = commands_length - length
-
-        # start is inclusive, stop is exclusive
-        actual_cursor = max(0, min(cursor, commands_length - 1))
-        stop = min(commands_length, actual_cursor + length)
+        with self._sql_engine.begin() as transaction:
+            if not _has_run(transaction, run_id):
+                raise RunNotFoundError(run_id=run_id)
+
+            commands_length = _get_commands_length(transaction, run_id)
+
+            if cursor is None:
+                cursor = commands_length - length
+
+            # start is inclusive, stop is exclusive
+            actual_cursor = max(0, min(cursor, commands_length - 1))
+            stop = min(commands_length, actual_cursor + length)
+
+            select_slice = (
+                sqlalchemy.select(run_command_table.c.command)
+                .where(
+                    run_command_table.c.run_id == run_id,
+                    run_command_table.c.index_in_run >= actual_cursor,
+                    run_command_table.c.index_in_run < stop,
+                )
+                .order_by(run_command_table.c.index_in_run)
+            )
+            slice_rows = transaction.execute(select_slice).all()
+
         sliced_commands: List[Command] = [
-            parse_obj_as(Command, command)  # type: ignore[arg-type]
-            for command in command_intent_dicts[actual_cursor:stop]
+            parse_raw_as(Command, row.command)  # type: ignore[arg-type]
+            for row in slice_rows
         ]
 
         return CommandSlice(
@@ -313,7 +359,6 @@ class RunStore:
             commands=sliced_commands,
         )
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
     def get_command(self, run_id: str, command_id: str) -> Command:
         """Get run command by id.
 
@@ -328,21 +373,11 @@ class RunStore:
             RunNotFoundError: The given run ID was not found in the store.
             CommandNotFoundError: The given command ID was not found in the store.
         """
-        select_run_commands = sqlalchemy.select(run_table.c.commands).where(
-            run_table.c.id == run_id
+        return self._cache.get_or_put(
+            key=("run_store.get_command", run_id, command_id),
+            compute=lambda: self._sql_get_command(run_id, command_id),
+            tags=[_run_tag(run_id)],
         )
-        with self._sql_engine.begin() as transaction:
-            try:
-                row = transaction.execute(select_run_commands).one()
-            except sqlalchemy.exc.NoResultFound as e:
-                raise RunNotFoundError(run_id=run_id) from e
-
-        try:
-            command = next(c for c in row.commands if c["id"] == command_id)
-        except StopIteration as e:
-            raise CommandNotFoundError(command_id=command_id) from e
-
-        return parse_obj_as(Command, command)  # type: ignore[arg-type]
 
     def remove(self, run_id: str) -> None:
         """Remove a run by its unique identifier.
@@ -357,28 +392,126 @@ class RunStore:
         delete_actions = sqlalchemy.delete(action_table).where(
             action_table.c.run_id == run_id
         )
+        delete_commands = sqlalchemy.delete(run_command_table).where(
+            run_command_table.c.run_id == run_id
+        )
         with self._sql_engine.begin() as transaction:
             transaction.execute(delete_actions)
+            transaction.execute(delete_commands)
             result = transaction.execute(delete_run)
 
         if result.rowcount < 1:
             raise RunNotFoundError(run_id)
 
-        self._clear_caches()
+        self._invalidate_run(run_id)
+
+    def _invalidate_run(self, run_id: str) -> None:
+        """Invalidate cached data about a run, including lists of all runs."""
+        self._cache.invalidate_tag(_run_tag(run_id))
+        self._cache.invalidate_tag(_ALL_RUNS_TAG)
+
+    def _sql_has(self, run_id: str) -> bool:
+        statement = sqlalchemy.select(run_table.c.id).where(run_table.c.id == run_id)
+        with self._sql_engine.begin() as transaction:
+            return transaction.execute(statement).first() is not None
+
+    def _sql_get(self, run_id: str) -> RunResource:
+        select_run_resource = sqlalchemy.select(_run_columns).where(
+            run_table.c.id == run_id
+        )
+
+        select_actions = sqlalchemy.select(action_table).where(
+            action_table.c.run_id == run_id
+        )
+
+        with self._sql_engine.begin() as transaction:
+            try:
+                run_row = transaction.execute(select_run_resource).one()
+            except sqlalchemy.exc.NoResultFound as e:
+                raise RunNotFoundError(run_id) from e
+            action_rows = transaction.execute(select_actions).all()
+
+        return _convert_row_to_run(run_row, action_rows)
 
-    def _clear_caches(self) -> None:
-        self.has.cache_clear()
-        self.get.cache_clear()
-        self.get_all.cache_clear()
-        self.get_state_summary.cache_clear()
-        self.get_command.cache_clear()
-        self._get_all_unparsed_commands.cache_clear()
+    def _sql_get_all(self) -> List[RunResource]:
+        select_runs = sqlalchemy.select(_run_columns)
+        select_actions = sqlalchemy.select(action_table)
+        actions_by_run_id = defaultdict(list)
+
+        with self._sql_engine.begin() as transaction:
+            runs = transaction.execute(select_runs).all()
+            actions = transaction.execute(select_actions).all()
+
+        for action_row in actions:
+            actions_by_run_id[action_row.run_id].append(action_row)
+
+        return [
+            _convert_row_to_run(
+                row=run_row,
+                action_rows=actions_by_run_id[run_row.id],
+            )
+            for run_row in runs
+        ]
+
+    def _sql_get_state_summary(self, run_id: str) -> Optional[StateSummary]:
+        select_run_data = sqlalchemy.select(run_table.c.state_summary).where(
+            run_table.c.id == run_id
+        )
+
+        with self._sql_engine.begin() as transaction:
+            row = transaction.execute(select_run_data).one()
+
+        return (
+            StateSummary.parse_obj(row.state_summary)
+            if row.state_summary is not None
+            else None
+        )
+
+    def _sql_get_command(self, run_id: str, command_id: str) -> Command:
+        select_command = sqlalchemy.select(run_command_table.c.command).where(
+            run_command_table.c.run_id == run_id,
+            run_command_table.c.command_id == command_id,
+        )
+
+        with self._sql_engine.begin() as transaction:
+            row = transaction.execute(select_command).first()
+
+            if row is None:
+                if not _has_run(transaction, run_id):
+                    raise RunNotFoundError(run_id=run_id)
+                raise CommandNotFoundError(command_id=command_id)
+
+        return parse_raw_as(Command, row.command)  # type: ignore[arg-type]
+
+
+# Cache tags for data about a single run, and for data about all runs.
+_ALL_RUNS_TAG = ("run",)
+
+
+def _run_tag(run_id: str) -> Tuple[str, str]:
+    return ("run", run_id)
 
 
 # The columns that must be present in a row passed to _convert_row_to_run().
 _run_columns = [run_table.c.id, run_table.c.protocol_id, run_table.c.created_at]
 
 
+def _has_run(transaction: sqlalchemy.engine.Connection, run_id: str) -> bool:
+    statement = sqlalchemy.select(run_table.c.id).where(run_table.c.id == run_id)
+    return transaction.execute(statement).first() is not None
+
+
+def _get_commands_length(transaction: sqlalchemy.engine.Connection, run_id: str) -> int:
+    # Command indices are contiguous from 0, so the max index can be read
+    # straight off of the primary key rather than counting every row.
+    select_last_index = sqlalchemy.select(
+        sqlalchemy.func.max(run_command_table.c.index_in_run)
+    ).where(run_command_table.c.run_id == run_id)
+    last_index: Optional[int] = transaction.execute(select_last_index).scalar()
+
+    return last_index + 1 if last_index is not None else 0
+
+
 def _convert_row_to_run(
     row: sqlalchemy.engine.Row,
     action_rows: List[sqlalchemy.engine.Row],
@@ -425,14 +558,26 @@ def _convert_action_to_sql_values(action: RunAction, run_id: str) -> Dict[str, o
 
 
 def _convert_state_to_sql_values(
-    run_id: str,
     state_summary: StateSummary,
-    commands: List[Command],
     engine_status: str,
 ) -> Dict[str, object]:
     return {
         "state_summary": state_summary.dict(),
         "engine_status": engine_status,
-        "commands": [command.dict() for command in commands],
         "_updated_at": utc_now(),
     }
+
+
+def _convert_commands_to_sql_values(
+    run_id: str,
+    commands_by_index: Mapping[int, Command],
+) -> List[Dict[str, object]]:
+    return [
+        {
+            "run_id": run_id,
+            "index_in_run": index,
+            "command_id": command.id,
+            "command": command.json(),
+        }
+        for index, command in commands_by_index.items()
+    ]
@@ -14,6 +14,7 @@ from .response import (
     DeprecatedResponseDataModel,
     ResourceModel,
     PydanticResponse,
+    StreamingPydanticResponse,
 )
 
 
@@ -22,6 +23,7 @@ __all__ = [
     "RequestModel",
     # response models
     "PydanticResponse",
+    "StreamingPydanticResponse",
     # response body models
     "BaseResponseBody",
     "Body",
@@ -1,9 +1,11 @@
 from __future__ import annotations
+import json
 from anyio import to_thread
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import Any, Dict, Generic, Iterator, List, Optional, TypeVar
 from pydantic import Field, BaseModel
 from pydantic.generics import GenericModel
-from fastapi.responses import JSONResponse
+from pydantic.json import pydantic_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from .resource_links import ResourceLinks as DeprecatedResourceLinks
 
 
@@ -140,6 +142,113 @@ class PydanticResponse(JSONResponse, Generic[ResponseBodyT]):
         return content.json().encode(self.charset)
 
 
+class StreamingPydanticResponse(StreamingResponse, Generic[ResponseBodyT]):
+    """A JSON response that renders its Pydantic body while it's being sent.
+
+    Lists of models in the body, like a run's commands or an analysis's
+    commands, are rendered one item at a time and sent in chunks of about
+    `chunk_size` bytes. Clients get the start of the body right away rather
+    than once the whole thing has been rendered, and the fully rendered body
+    is never held in memory all at once.
+
+    The body is rendered in worker threads, like `PydanticResponse.create`.
+    The rendered JSON is equivalent to `PydanticResponse`'s, although the
+    fields of the streamed parts may not be in the same order.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: ResponseBodyT,
+        status_code: int = 200,
+        chunk_size: int = 64 * 1024,
+    ) -> None:
+        """Initialize the response object, without rendering anything yet."""
+        super().__init__(
+            content=_iter_json_chunks(content, chunk_size=chunk_size),
+            status_code=status_code,
+        )
+        self.content = content
+
+
+def _iter_json_chunks(content: BaseModel, chunk_size: int) -> Iterator[bytes]:
+    chunk: List[str] = []
+    chunk_length = 0
+
+    for fragment in _iter_json(content):
+        chunk.append(fragment)
+        chunk_length += len(fragment)
+
+        if chunk_length >= chunk_size:
+            yield "".join(chunk).encode("utf-8")
+            chunk = []
+            chunk_length = 0
+
+    if len(chunk) > 0:
+        yield "".join(chunk).encode("utf-8")
+
+
+def _iter_json(value: object, depth: int = 0) -> Iterator[str]:
+    """Render a value to JSON, splitting up lists of models into fragments.
+
+    Like `BaseResponseBody`, this always excludes `None` fields from models.
+    """
+    if isinstance(value, BaseModel) and _contains_model_list(value, depth):
+        separator = ""
+        yield "{"
+        for name in value.__fields__:
+            field_value = getattr(value, name)
+            if field_value is not None:
+                yield f"{separator}{json.dumps(name)}: "
+                yield from _iter_json(field_value, depth + 1)
+                separator = ", "
+        yield "}"
+
+    elif _is_model_list(value) and depth < _MAX_STREAMED_DEPTH:
+        assert isinstance(value, list)
+        separator = ""
+        yield "["
+        for item in value:
+            yield separator
+            yield from _iter_json(item, depth + 1)
+            separator = ", "
+        yield "]"
+
+    elif isinstance(value, BaseModel):
+        yield value.json(exclude_none=True)
+
+    else:
+        yield json.dumps(value, default=pydantic_encoder)
+
+
+# Deep enough to reach the commands in `SimpleMultiBody[CompletedAnalysis]`,
+# (body -> data -> analysis -> commands), but shallow enough that commands
+# themselves, and anything nested in them, are rendered whole by Pydantic.
+_MAX_STREAMED_DEPTH = 4
+
+
+def _contains_model_list(value: object, depth: int) -> bool:
+    if depth >= _MAX_STREAMED_DEPTH:
+        return False
+    elif _is_model_list(value):
+        return True
+    elif isinstance(value, BaseModel):
+        return any(
+            _contains_model_list(getattr(value, name), depth + 1)
+            for name in value.__fields__
+        )
+    else:
+        return False
+
+
+def _is_model_list(value: object) -> bool:
+    # Lists in response bodies are homogeneous, so checking the first item will do.
+    return (
+        isinstance(value, list) and len(value) > 0 and isinstance(value[0], BaseModel)
+    )
+
+
 # TODO(mc, 2021-12-09): remove this model
 class DeprecatedResponseDataModel(BaseModel):
     """A model representing an identifiable resource of the server.
@@ -75,5 +75,23 @@ class RobotServerSettings(BaseSettings):
         ),
     )
 
+    persistence_cache_size_bytes: int = Field(
+        16 * 1024 * 1024,
+        description=(
+            "The approximate maximum amount of memory, in bytes, that the server"
+            " may use to cache runs, protocols, and analyses read from"
+            " persistent storage."
+        ),
+    )
+
+    analysis_cache_size_bytes: int = Field(
+        64 * 1024 * 1024,
+        description=(
+            "The approximate maximum amount of storage, in bytes, that the server"
+            " may use to keep completed protocol analyses for reuse when"
+            " identical protocol files are uploaded again."
+        ),
+    )
+
     class Config:
         env_prefix = "OT_ROBOT_SERVER_"
@@ -1,6 +1,6 @@
 """Request and response models for /system endpoints."""
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from robot_server.service.json_api import (
     DeprecatedResponseModel,
     DeprecatedResponseDataModel,
@@ -21,3 +21,23 @@ class SystemTimeResponseAttributes(DeprecatedResponseDataModel, SystemTimeAttrib
 SystemTimeResponse = DeprecatedResponseModel[SystemTimeResponseAttributes]
 
 SystemTimeRequest = RequestModel[SystemTimeAttributes]
+
+
+class PersistenceCacheStats(BaseModel):
+    """Usage statistics of the in-memory cache in front of persistent storage."""
+
+    entryCount: int = Field(..., description="Number of entries in the cache.")
+    sizeBytes: int = Field(
+        ...,
+        description="Estimated total size of the entries in the cache, in bytes.",
+    )
+    maxSizeBytes: int = Field(
+        ...,
+        description="Memory budget of the cache, in bytes.",
+    )
+    hits: int = Field(..., description="Number of lookups found in the cache.")
+    misses: int = Field(..., description="Number of lookups not found in the cache.")
+    evictions: int = Field(
+        ...,
+        description="Number of entries evicted to stay within the memory budget.",
+    )
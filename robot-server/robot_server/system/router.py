@@ -3,13 +3,21 @@
 Endpoints include:
 
 - /system/time: allows the client to read & update robot system time
+- /system/persistenceCache: allows the client to debug persistence cache usage
 """
 from datetime import datetime
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, status
 
+from robot_server.persistence import MemoryCache, get_persistence_cache
+from robot_server.service.json_api import PydanticResponse, SimpleBody
 from robot_server.service.json_api.resource_links import ResourceLinkKey, ResourceLink
 
-from .models import SystemTimeRequest, SystemTimeResponse, SystemTimeResponseAttributes
+from .models import (
+    PersistenceCacheStats,
+    SystemTimeRequest,
+    SystemTimeResponse,
+    SystemTimeResponseAttributes,
+)
 from .time_utils import get_system_time, set_system_time
 
 
@@ -51,3 +59,34 @@ async def set_time(new_time: SystemTimeRequest) -> SystemTimeResponse:
     """Set the robot's system time."""
     sys_time = await set_system_time(new_time.data.systemTime)
     return _create_time_response(sys_time)
+
+
+@system_router.get(
+    "/system/persistenceCache",
+    summary="Get persistence cache statistics",
+    description=(
+        "Get the size and hit, miss, and eviction counts of the in-memory cache"
+        " that the server keeps in front of its stored runs, protocols,"
+        " and analyses. Intended for debugging memory use and performance."
+    ),
+    responses={status.HTTP_200_OK: {"model": SimpleBody[PersistenceCacheStats]}},
+)
+async def get_persistence_cache_stats(
+    cache: MemoryCache = Depends(get_persistence_cache),
+) -> PydanticResponse[SimpleBody[PersistenceCacheStats]]:
+    """Get usage statistics of the persistence cache."""
+    stats = cache.get_stats()
+
+    return await PydanticResponse.create(
+        content=SimpleBody.construct(
+            data=PersistenceCacheStats(
+                entryCount=stats.entry_count,
+                sizeBytes=stats.size_bytes,
+                maxSizeBytes=stats.max_size_bytes,
+                hits=stats.hits,
+                misses=stats.misses,
+                evictions=stats.evictions,
+            )
+        ),
+        status_code=status.HTTP_200_OK,
+    )
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Benchmark the storage encoding of completed protocol analyses.
+
+Compares the original encoding (the whole analysis as one pickled dict)
+against the current one (compressed JSON, with commands in their own column),
+for a synthetic analysis with a configurable number of commands.
+
+Usage: python -m scripts.benchmark_analysis_storage [command_count]
+"""
+import asyncio
+import pickle
+import sys
+import timeit
+from datetime import datetime, timezone
+from typing import Callable, List
+
+from opentrons.protocol_engine import commands as pe_commands
+
+from robot_server.protocols.analysis_models import AnalysisResult, CompletedAnalysis
+from robot_server.protocols.analysis_store import (
+    _CURRENT_ANALYZER_VERSION,
+    _CompletedAnalysisResource,
+)
+
+_DEFAULT_COMMAND_COUNT = 5000
+_REPETITIONS = 5
+
+
+def make_analysis(command_count: int) -> CompletedAnalysis:
+    """Make a synthetic completed analysis with the given number of commands."""
+    created_at = datetime(year=2022, month=1, day=1, tzinfo=timezone.utc)
+    commands: List[pe_commands.Command] = [
+        pe_commands.Aspirate(
+            id=f"command-{i}",
+            key=f"command-key-{i}",
+            status=pe_commands.CommandStatus.SUCCEEDED,
+            createdAt=created_at,
+            startedAt=created_at,
+            completedAt=created_at,
+            params=pe_commands.AspirateParams(
+                pipetteId="pipette-id",
+                labwareId="labware-id",
+                wellName=f"A{i % 12 + 1}",
+                volume=100,
+                flowRate=150,
+            ),
+            result=pe_commands.AspirateResult(volume=100),
+        )
+        for i in range(command_count)
+    ]
+
+    return CompletedAnalysis(
+        id="analysis-id",
+        result=AnalysisResult.OK,
+        pipettes=[],
+        labware=[],
+        commands=commands,
+        errors=[],
+    )
+
+
+def _time_ms(func: Callable[[], object]) -> float:
+    return min(timeit.repeat(func, number=1, repeat=_REPETITIONS)) * 1000
+
+
+def main(command_count: int) -> None:
+    """Print the encoded size and decoding time of each encoding."""
+    analysis = make_analysis(command_count)
+
+    pickled = pickle.dumps(analysis.dict())
+
+    resource = asyncio.run(
+        _CompletedAnalysisResource.from_completed_analysis(
+            protocol_id="protocol-id",
+            analyzer_version=_CURRENT_ANALYZER_VERSION,
+            completed_analysis=analysis,
+        )
+    )
+    sql_values = resource.to_sql_values()
+    encoded_summary = sql_values["completed_analysis"]
+    encoded_commands = sql_values["completed_analysis_commands"]
+    assert isinstance(encoded_summary, bytes)
+    assert isinstance(encoded_commands, bytes)
+
+    class _Row:
+        id = resource.id
+        protocol_id = resource.protocol_id
+        analyzer_version = resource.analyzer_version
+        completed_analysis = encoded_summary
+        completed_analysis_commands = encoded_commands
+
+    def parse_pickled() -> CompletedAnalysis:
+        return CompletedAnalysis.parse_obj(pickle.loads(pickled))
+
+    def parse_summary() -> _CompletedAnalysisResource:
+        return _CompletedAnalysisResource.from_sql_row(_Row)  # type: ignore[arg-type]
+
+    def parse_full() -> CompletedAnalysis:
+        return asyncio.run(parse_summary().get_completed_analysis())
+
+    assert parse_full() == parse_pickled()
+
+    print(f"Completed analysis with {command_count} commands:")
+    print(f"  pickled:    {len(pickled):>10,} bytes")
+    print(f"  compressed: {len(encoded_summary) + len(encoded_commands):>10,} bytes")
+    print(f"  parse pickled analysis:     {_time_ms(parse_pickled):8.1f} ms")
+    print(f"  parse compressed summary:   {_time_ms(parse_summary):8.1f} ms")
+    print(f"  parse compressed analysis:  {_time_ms(parse_full):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_COMMAND_COUNT)
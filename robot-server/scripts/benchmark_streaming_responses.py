@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Benchmark streaming a large protocol analysis as an HTTP response body.
+
+Compares `PydanticResponse`, which renders the whole body before sending
+anything, against `StreamingPydanticResponse`, which renders it as it's sent.
+Each response type is measured in its own subprocess, so that peak RSS
+reflects only that response type.
+
+Usage: python -m scripts.benchmark_streaming_responses [command_count]
+"""
+import asyncio
+import resource
+import subprocess
+import sys
+import time
+from typing import Optional
+
+from robot_server.service.json_api import (
+    MultiBodyMeta,
+    PydanticResponse,
+    SimpleMultiBody,
+    StreamingPydanticResponse,
+)
+
+from .benchmark_analysis_storage import make_analysis
+
+_DEFAULT_COMMAND_COUNT = 5000
+_RESPONSE_TYPES = ["PydanticResponse", "StreamingPydanticResponse"]
+
+
+def _max_rss_kib() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+async def _measure(response_type: str, command_count: int) -> None:
+    analysis = make_analysis(command_count)
+    content = SimpleMultiBody.construct(
+        data=[analysis],
+        meta=MultiBodyMeta(cursor=0, totalLength=1),
+    )
+    rss_before = _max_rss_kib()
+    body_length = 0
+    first_byte: Optional[float] = None
+    start = time.perf_counter()
+
+    if response_type == "PydanticResponse":
+        response = await PydanticResponse.create(content=content)
+        first_byte = time.perf_counter()
+        body_length = len(response.body)
+    else:
+        streaming_response = StreamingPydanticResponse(content=content)
+        async for chunk in streaming_response.body_iterator:
+            first_byte = first_byte or time.perf_counter()
+            body_length += len(chunk)
+
+    end = time.perf_counter()
+    assert first_byte is not None
+
+    print(
+        f"  {response_type:<26}"
+        f" first byte: {(first_byte - start) * 1000:7.1f} ms"
+        f"   total: {(end - start) * 1000:7.1f} ms"
+        f"   peak RSS growth: {_max_rss_kib() - rss_before:>7,} KiB"
+        f"   body: {body_length:>10,} bytes"
+    )
+
+
+def main(command_count: int) -> None:
+    """Measure each response type in a subprocess and print the results."""
+    print(f"Analysis response with {command_count} commands:")
+
+    for response_type in _RESPONSE_TYPES:
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "scripts.benchmark_streaming_responses",
+                str(command_count),
+                response_type,
+            ],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_COMMAND_COUNT
+
+    if len(sys.argv) > 2:
+        asyncio.run(_measure(response_type=sys.argv[2], command_count=count))
+    else:
+        main(count)
@@ -0,0 +1,129 @@
+"""Tests for robot_server.persistence.memory_cache."""
+import pytest
+
+from robot_server.persistence.memory_cache import (
+    MemoryCache,
+    MemoryCacheStats,
+    estimate_size,
+)
+
+
+def test_get_and_put() -> None:
+    """It should return cached values and count hits and misses."""
+    subject = MemoryCache(max_size_bytes=100)
+
+    with pytest.raises(KeyError):
+        subject.get("key")
+
+    subject.put(key="key", value="value", size_bytes=10)
+
+    assert subject.get("key") == "value"
+    assert subject.get_stats() == MemoryCacheStats(
+        entry_count=1,
+        size_bytes=10,
+        max_size_bytes=100,
+        hits=1,
+        misses=1,
+        evictions=0,
+    )
+
+
+def test_get_or_put() -> None:
+    """It should only compute a value on a cache miss."""
+    subject = MemoryCache()
+    computed = []
+
+    def _compute() -> str:
+        computed.append("value")
+        return "value"
+
+    assert subject.get_or_put(key="key", compute=_compute) == "value"
+    assert subject.get_or_put(key="key", compute=_compute) == "value"
+    assert computed == ["value"]
+
+
+def test_evicts_least_recently_used() -> None:
+    """It should evict the least-recently-used entries to stay within budget."""
+    subject = MemoryCache(max_size_bytes=30)
+
+    subject.put(key="a", value="a", size_bytes=10)
+    subject.put(key="b", value="b", size_bytes=10)
+    subject.put(key="c", value="c", size_bytes=10)
+    subject.get("a")
+    subject.put(key="d", value="d", size_bytes=20)
+
+    assert subject.get("a") == "a"
+    assert subject.get("d") == "d"
+
+    for evicted_key in ["b", "c"]:
+        with pytest.raises(KeyError):
+            subject.get(evicted_key)
+
+    stats = subject.get_stats()
+    assert stats.size_bytes == 30
+    assert stats.evictions == 2
+
+
+def test_does_not_cache_oversized_values() -> None:
+    """It should skip values larger than its whole budget, evicting nothing."""
+    subject = MemoryCache(max_size_bytes=30)
+
+    subject.put(key="small", value="small", size_bytes=10)
+    subject.put(key="huge", value="huge", size_bytes=31)
+
+    assert subject.get("small") == "small"
+
+    with pytest.raises(KeyError):
+        subject.get("huge")
+
+    assert subject.get_stats().evictions == 0
+
+
+def test_put_replaces_existing_entry() -> None:
+    """It should account for the size of a replaced entry."""
+    subject = MemoryCache(max_size_bytes=100)
+
+    subject.put(key="key", value="old", size_bytes=10)
+    subject.put(key="key", value="new", size_bytes=20)
+
+    assert subject.get("key") == "new"
+    assert subject.get_stats().size_bytes == 20
+
+
+def test_invalidate() -> None:
+    """It should invalidate entries individually, by tag, or all at once."""
+    subject = MemoryCache(max_size_bytes=100)
+
+    subject.put(key="a", value="a", tags=["tag-1"], size_bytes=10)
+    subject.put(key="b", value="b", tags=["tag-1", "tag-2"], size_bytes=10)
+    subject.put(key="c", value="c", tags=["tag-2"], size_bytes=10)
+    subject.put(key="d", value="d", size_bytes=10)
+
+    subject.invalidate("d")
+    subject.invalidate_tag("tag-1")
+
+    assert subject.get("c") == "c"
+    assert subject.get_stats().size_bytes == 10
+
+    for invalidated_key in ["a", "b", "d"]:
+        with pytest.raises(KeyError):
+            subject.get(invalidated_key)
+
+    subject.clear()
+
+    with pytest.raises(KeyError):
+        subject.get("c")
+
+    assert subject.get_stats().size_bytes == 0
+
+
+def test_estimate_size() -> None:
+    """It should count the contents of containers and objects."""
+    small = {"key": "value"}
+    big = {"key": "value" * 1000}
+    nested = {"outer": [big, big]}
+
+    assert estimate_size(big) > estimate_size(small)
+    assert estimate_size(nested) > estimate_size(big)
+    # The same object referenced twice is only counted once.
+    assert estimate_size(nested) < 2 * estimate_size(big)
@@ -1,6 +1,10 @@
 """Test SQL database migrations."""
+import json
+import pickle
+import zlib
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Generator
+from typing import Generator, List
 
 import pytest
 import sqlalchemy
@@ -10,13 +14,32 @@ from robot_server.persistence.database import create_sql_engine
 from robot_server.persistence.tables import (
     migration_table,
     run_table,
+    run_command_table,
     action_table,
     protocol_table,
     analysis_table,
 )
 
 
-TABLES = [run_table, action_table, protocol_table, analysis_table]
+TABLES = [run_table, run_command_table, action_table, protocol_table, analysis_table]
+
+
+def _create_analysis_table_v2(sql_engine: sqlalchemy.engine.Engine) -> None:
+    """Replace the analysis table with one matching schema versions 0 through 2."""
+    sql_engine.execute("DROP TABLE analysis")
+    sql_engine.execute(
+        """
+        CREATE TABLE analysis (
+            id VARCHAR NOT NULL,
+            protocol_id VARCHAR NOT NULL,
+            analyzer_version VARCHAR NOT NULL,
+            completed_analysis BLOB NOT NULL,
+            PRIMARY KEY (id),
+            FOREIGN KEY(protocol_id) REFERENCES protocol (id)
+        )
+        """
+    )
+    sql_engine.execute("CREATE INDEX ix_analysis_protocol_id ON analysis (protocol_id)")
 
 
 @pytest.fixture
@@ -24,6 +47,7 @@ def database_v0(tmp_path: Path) -> Path:
     """Create a database matching schema version 0."""
     db_path = tmp_path / "migration-test-v0.db"
     sql_engine = create_sql_engine(db_path)
+    _create_analysis_table_v2(sql_engine)
     sql_engine.execute("DROP TABLE migration")
     sql_engine.execute("DROP TABLE run")
     sql_engine.execute(
@@ -46,6 +70,41 @@ def database_v1(tmp_path: Path) -> Path:
     """Create a database matching schema version 1."""
     db_path = tmp_path / "migration-test-v1.db"
     sql_engine = create_sql_engine(db_path)
+    _create_analysis_table_v2(sql_engine)
+    sql_engine.execute("DROP TABLE run_command")
+    sql_engine.execute("DELETE FROM migration")
+    sql_engine.execute(
+        sqlalchemy.insert(migration_table).values(
+            created_at=datetime.now(tz=timezone.utc),
+            version=1,
+        )
+    )
+    sql_engine.dispose()
+    return db_path
+
+
+@pytest.fixture
+def database_v2(tmp_path: Path) -> Path:
+    """Create a database matching schema version 2."""
+    db_path = tmp_path / "migration-test-v2.db"
+    sql_engine = create_sql_engine(db_path)
+    _create_analysis_table_v2(sql_engine)
+    sql_engine.execute("DELETE FROM migration")
+    sql_engine.execute(
+        sqlalchemy.insert(migration_table).values(
+            created_at=datetime.now(tz=timezone.utc),
+            version=2,
+        )
+    )
+    sql_engine.dispose()
+    return db_path
+
+
+@pytest.fixture
+def database_v3(tmp_path: Path) -> Path:
+    """Create a database matching schema version 3."""
+    db_path = tmp_path / "migration-test-v3.db"
+    sql_engine = create_sql_engine(db_path)
     sql_engine.dispose()
     return db_path
 
@@ -64,19 +123,114 @@ def subject(database_path: Path) -> Generator[sqlalchemy.engine.Engine, None, No
 
 
 @pytest.mark.parametrize(
-    "database_path",
+    ("database_path", "expected_versions"),
     [
-        lazy_fixture("database_v0"),
-        lazy_fixture("database_v1"),
+        (lazy_fixture("database_v0"), [3]),
+        (lazy_fixture("database_v1"), [1, 3]),
+        (lazy_fixture("database_v2"), [2, 3]),
+        (lazy_fixture("database_v3"), [3]),
     ],
 )
-def test_migration(subject: sqlalchemy.engine.Engine) -> None:
+def test_migration(
+    subject: sqlalchemy.engine.Engine,
+    expected_versions: List[int],
+) -> None:
     """It should migrate a table."""
     migrations = subject.execute(sqlalchemy.select(migration_table)).all()
 
-    assert [m.version for m in migrations] == [1]
+    assert [m.version for m in migrations] == expected_versions
 
     # all table queries work without raising
     for table in TABLES:
         values = subject.execute(sqlalchemy.select(table)).all()
         assert values == []
+
+
+def test_migrate_1_to_2_moves_commands(database_v1: Path) -> None:
+    """It should move pickled run commands into the run_command table."""
+    commands = [
+        {
+            "id": "command-1",
+            "createdAt": datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+        },
+        {
+            "id": "command-2",
+            "createdAt": datetime(year=2022, month=2, day=2, tzinfo=timezone.utc),
+        },
+    ]
+
+    sql_engine = sqlalchemy.create_engine(f"sqlite:///{database_v1}")
+    sql_engine.execute(
+        sqlalchemy.text(
+            "INSERT INTO run (id, created_at, commands)"
+            " VALUES ('run-id', '2021-01-01 00:00:00', :commands)"
+        ),
+        commands=pickle.dumps(commands),
+    )
+    sql_engine.dispose()
+
+    subject = create_sql_engine(database_v1)
+    command_rows = subject.execute(
+        sqlalchemy.select(run_command_table).order_by(run_command_table.c.index_in_run)
+    ).all()
+    run_row = subject.execute(sqlalchemy.select(run_table)).one()
+    subject.dispose()
+
+    assert [(row.run_id, row.index_in_run, row.command_id) for row in command_rows] == [
+        ("run-id", 0, "command-1"),
+        ("run-id", 1, "command-2"),
+    ]
+    assert json.loads(command_rows[1].command) == {
+        "id": "command-2",
+        "createdAt": "2022-02-02T00:00:00+00:00",
+    }
+    assert run_row.commands is None
+
+
+def test_migrate_2_to_3_splits_analyses(database_v2: Path) -> None:
+    """It should re-encode pickled analyses as compressed JSON columns."""
+    completed_analysis = {
+        "id": "analysis-id",
+        "result": "ok",
+        "labware": [],
+        "pipettes": [],
+        "errors": [],
+        "commands": [
+            {
+                "id": "command-1",
+                "createdAt": datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+            },
+        ],
+    }
+
+    sql_engine = sqlalchemy.create_engine(f"sqlite:///{database_v2}")
+    sql_engine.execute(
+        sqlalchemy.text(
+            "INSERT INTO protocol (id, created_at)"
+            " VALUES ('protocol-id', '2021-01-01 00:00:00')"
+        )
+    )
+    sql_engine.execute(
+        sqlalchemy.text(
+            "INSERT INTO analysis"
+            " (id, protocol_id, analyzer_version, completed_analysis)"
+            " VALUES ('analysis-id', 'protocol-id', 'initial', :completed_analysis)"
+        ),
+        completed_analysis=pickle.dumps(completed_analysis),
+    )
+    sql_engine.dispose()
+
+    subject = create_sql_engine(database_v2)
+    analysis_row = subject.execute(sqlalchemy.select(analysis_table)).one()
+    subject.dispose()
+
+    assert json.loads(zlib.decompress(analysis_row.completed_analysis)) == {
+        "id": "analysis-id",
+        "result": "ok",
+        "labware": [],
+        "pipettes": [],
+        "errors": [],
+    }
+    assert json.loads(zlib.decompress(analysis_row.completed_analysis_commands)) == [
+        {"id": "command-1", "createdAt": "2021-01-01T00:00:00+00:00"},
+    ]
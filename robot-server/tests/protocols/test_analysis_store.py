@@ -1,6 +1,7 @@
 """Tests for the AnalysisStore interface."""
 import pytest
 
+from dataclasses import replace
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, NamedTuple
@@ -15,9 +16,12 @@ from opentrons.protocol_engine import (
 )
 from opentrons.protocol_reader import (
     ProtocolSource,
+    ProtocolSourceFile,
+    ProtocolFileRole,
     JsonProtocolConfig,
 )
 
+from robot_server.persistence import MemoryCache
 from robot_server.protocols.analysis_models import (
     AnalysisResult,
     AnalysisStatus,
@@ -36,20 +40,26 @@ from robot_server.protocols.protocol_store import (
 
 
 @pytest.fixture
-def protocol_store(sql_engine: SQLEngine) -> ProtocolStore:
+def cache() -> MemoryCache:
+    """Return an in-memory cache shared by the stores under test."""
+    return MemoryCache()
+
+
+@pytest.fixture
+def protocol_store(sql_engine: SQLEngine, cache: MemoryCache) -> ProtocolStore:
     """Return a `ProtocolStore` linked to the same database as the subject under test.
 
     `ProtocolStore` is tested elsewhere.
     We only need it here to prepare the database for our `AnalysisStore` tests.
     An analysis always needs a protocol to link to.
     """
-    return ProtocolStore.create_empty(sql_engine=sql_engine)
+    return ProtocolStore.create_empty(sql_engine=sql_engine, cache=cache)
 
 
 @pytest.fixture
-def subject(sql_engine: SQLEngine) -> AnalysisStore:
+def subject(sql_engine: SQLEngine, cache: MemoryCache) -> AnalysisStore:
     """Return the `AnalysisStore` test subject."""
-    return AnalysisStore(sql_engine=sql_engine)
+    return AnalysisStore(sql_engine=sql_engine, cache=cache)
 
 
 def make_dummy_protocol_resource(protocol_id: str) -> ProtocolResource:
@@ -257,3 +267,185 @@ async def test_update_infers_status_from_errors(
     analysis = (await subject.get_by_protocol("protocol-id"))[0]
     assert isinstance(analysis, CompletedAnalysis)
     assert analysis.result == expected_result
+
+
+async def test_get_uncached(
+    sql_engine: SQLEngine,
+    subject: AnalysisStore,
+    protocol_store: ProtocolStore,
+) -> None:
+    """It should read back analyses that another store instance wrote."""
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
+
+    for analysis_id in ["analysis-id-1", "analysis-id-2"]:
+        subject.add_pending(protocol_id="protocol-id", analysis_id=analysis_id)
+        await subject.update(
+            analysis_id=analysis_id,
+            labware=[],
+            pipettes=[],
+            commands=[],
+            errors=[],
+        )
+
+    expected = await subject.get_by_protocol("protocol-id")
+    other_store = AnalysisStore(sql_engine=sql_engine)
+
+    assert await other_store.get("analysis-id-2") == expected[1]
+    assert await other_store.get_by_protocol("protocol-id") == expected
+
+
+async def test_protocol_removal_invalidates_cache(
+    tmp_path: Path,
+    subject: AnalysisStore,
+    protocol_store: ProtocolStore,
+) -> None:
+    """It should not return cached analyses of a protocol that has been removed."""
+    protocol_resource = make_dummy_protocol_resource(protocol_id="protocol-id")
+    protocol_resource = replace(
+        protocol_resource,
+        source=replace(protocol_resource.source, directory=tmp_path / "protocol-id"),
+    )
+    (tmp_path / "protocol-id").mkdir()
+    protocol_store.insert(protocol_resource)
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
+    await subject.update(
+        analysis_id="analysis-id",
+        labware=[],
+        pipettes=[],
+        commands=[],
+        errors=[],
+    )
+
+    assert len(await subject.get_by_protocol("protocol-id")) == 1
+
+    protocol_store.remove(protocol_id="protocol-id")
+
+    assert await subject.get_by_protocol("protocol-id") == []
+    assert subject.get_summaries_by_protocol("protocol-id") == []
+
+    with pytest.raises(AnalysisNotFoundError):
+        await subject.get("analysis-id")
+
+
+def make_protocol_source(directory: Path, contents: str) -> ProtocolSource:
+    """Return a `ProtocolSource` with a single main file with the given contents."""
+    directory.mkdir()
+    main_file = directory / "protocol.json"
+    main_file.write_text(contents)
+    return ProtocolSource(
+        directory=directory,
+        main_file=main_file,
+        config=JsonProtocolConfig(schema_version=123),
+        files=[ProtocolSourceFile(path=main_file, role=ProtocolFileRole.MAIN)],
+        metadata={},
+        labware_definitions=[],
+    )
+
+
+async def test_get_cache_key(tmp_path: Path) -> None:
+    """It should key protocols by the contents of their files."""
+    source = make_protocol_source(tmp_path / "original", "{}")
+    same_source = make_protocol_source(tmp_path / "same", "{}")
+    different_source = make_protocol_source(tmp_path / "different", "[]")
+
+    key = await AnalysisStore.get_cache_key(source)
+
+    assert await AnalysisStore.get_cache_key(same_source) == key
+    assert await AnalysisStore.get_cache_key(different_source) != key
+
+
+async def test_add_from_cache(
+    tmp_path: Path, subject: AnalysisStore, protocol_store: ProtocolStore
+) -> None:
+    """It should add a copy of a cached analysis to another protocol."""
+    command = pe_commands.WaitForResume(
+        id="pause-1",
+        key="command-key",
+        status=pe_commands.CommandStatus.SUCCEEDED,
+        createdAt=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+        params=pe_commands.WaitForResumeParams(message="hello world"),
+        result=pe_commands.WaitForResumeResult(),
+    )
+    original_protocol = make_dummy_protocol_resource(protocol_id="protocol-id-1")
+    original_protocol = replace(
+        original_protocol,
+        source=make_protocol_source(tmp_path / "protocol-id-1", "{}"),
+    )
+    protocol_store.insert(original_protocol)
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id-2"))
+
+    assert (
+        await subject.add_from_cache(
+            protocol_id="protocol-id-1", analysis_id="analysis-id-1", cache_key="key"
+        )
+        is None
+    )
+
+    subject.add_pending(protocol_id="protocol-id-1", analysis_id="analysis-id-1")
+    await subject.update(
+        analysis_id="analysis-id-1",
+        labware=[],
+        pipettes=[],
+        commands=[command],
+        errors=[],
+        cache_key="key",
+    )
+    # Removing the original protocol should not remove its cached analysis.
+    protocol_store.remove(protocol_id="protocol-id-1")
+
+    result = await subject.add_from_cache(
+        protocol_id="protocol-id-2", analysis_id="analysis-id-2", cache_key="key"
+    )
+
+    assert result == AnalysisSummary(
+        id="analysis-id-2", status=AnalysisStatus.COMPLETED
+    )
+    assert await subject.get_by_protocol("protocol-id-2") == [
+        CompletedAnalysis(
+            id="analysis-id-2",
+            result=AnalysisResult.OK,
+            labware=[],
+            pipettes=[],
+            commands=[command],
+            errors=[],
+        )
+    ]
+
+
+async def test_cache_evicts_least_recently_used(
+    sql_engine: SQLEngine, protocol_store: ProtocolStore
+) -> None:
+    """It should evict the least recently used analyses to stay within its size."""
+    subject = AnalysisStore(sql_engine=sql_engine, analysis_cache_size_bytes=250)
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
+
+    async def add(analysis_id: str, cache_key: str) -> None:
+        subject.add_pending(protocol_id="protocol-id", analysis_id=analysis_id)
+        await subject.update(
+            analysis_id=analysis_id,
+            labware=[],
+            pipettes=[],
+            commands=[],
+            errors=[],
+            cache_key=cache_key,
+        )
+
+    copy_ids = iter(f"copy-id-{i}" for i in range(10))
+
+    async def is_cached(cache_key: str) -> bool:
+        summary = await subject.add_from_cache(
+            protocol_id="protocol-id",
+            analysis_id=next(copy_ids),
+            cache_key=cache_key,
+        )
+        return summary is not None
+
+    # Each of these analyses takes about 100 bytes, so only 2 fit.
+    await add("analysis-id-1", "key-1")
+    await add("analysis-id-2", "key-2")
+    assert await is_cached("key-1")
+    await add("analysis-id-3", "key-3")
+
+    assert await is_cached("key-3")
+    assert await is_cached("key-1")
+    assert not await is_cached("key-2")
@@ -111,6 +111,7 @@ async def test_analyze(
     await subject.analyze(
         protocol_resource=protocol_resource,
         analysis_id="analysis-id",
+        cache_key="cache-key",
     )
 
     decoy.verify(
@@ -120,5 +121,6 @@ async def test_analyze(
             labware=[analysis_labware],
             pipettes=[analysis_pipette],
             errors=[analysis_error],
+            cache_key="cache-key",
         ),
     )
@@ -295,6 +295,14 @@ async def test_create_protocol(
         )
     ).then_return(protocol_source)
 
+    decoy.when(await analysis_store.get_cache_key(protocol_source)).then_return(
+        "cache-key"
+    )
+    decoy.when(
+        await analysis_store.add_from_cache(
+            protocol_id="protocol-id", analysis_id="analysis-id", cache_key="cache-key"
+        )
+    ).then_return(None)
     decoy.when(
         analysis_store.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
     ).then_return(pending_analysis)
@@ -332,7 +340,89 @@ async def test_create_protocol(
             protocol_analyzer.analyze,
             analysis_id="analysis-id",
             protocol_resource=protocol_resource,
+            cache_key="cache-key",
+        ),
+    )
+
+
+async def test_create_protocol_cached_analysis(
+    decoy: Decoy,
+    protocol_store: ProtocolStore,
+    analysis_store: AnalysisStore,
+    protocol_reader: ProtocolReader,
+    protocol_analyzer: ProtocolAnalyzer,
+    task_runner: TaskRunner,
+    protocol_auto_deleter: ProtocolAutoDeleter,
+) -> None:
+    """It should reuse a cached analysis instead of analyzing the protocol."""
+    protocol_directory = Path("/dev/null")
+
+    protocol_file = UploadFile(filename="foo.json")
+
+    protocol_source = ProtocolSource(
+        directory=Path("/dev/null"),
+        main_file=Path("/dev/null/foo.json"),
+        files=[
+            ProtocolSourceFile(
+                path=Path("/dev/null/foo.json"),
+                role=ProtocolFileRole.MAIN,
+            )
+        ],
+        metadata={},
+        config=JsonProtocolConfig(schema_version=123),
+        labware_definitions=[],
+    )
+
+    completed_analysis = AnalysisSummary(
+        id="analysis-id",
+        status=AnalysisStatus.COMPLETED,
+    )
+
+    decoy.when(
+        await protocol_reader.read_and_save(
+            files=[protocol_file],
+            directory=protocol_directory / "protocol-id",
+        )
+    ).then_return(protocol_source)
+    decoy.when(await analysis_store.get_cache_key(protocol_source)).then_return(
+        "cache-key"
+    )
+    decoy.when(
+        await analysis_store.add_from_cache(
+            protocol_id="protocol-id", analysis_id="analysis-id", cache_key="cache-key"
+        )
+    ).then_return(completed_analysis)
+
+    result = await create_protocol(
+        files=[protocol_file],
+        key=None,
+        protocol_directory=protocol_directory,
+        protocol_store=protocol_store,
+        analysis_store=analysis_store,
+        protocol_reader=protocol_reader,
+        protocol_analyzer=protocol_analyzer,
+        task_runner=task_runner,
+        protocol_auto_deleter=protocol_auto_deleter,
+        protocol_id="protocol-id",
+        analysis_id="analysis-id",
+        created_at=datetime(year=2021, month=1, day=1),
+    )
+
+    assert result.content.data.analysisSummaries == [completed_analysis]
+    decoy.verify(
+        task_runner.run(
+            protocol_analyzer.analyze,
+            analysis_id=matchers.Anything(),
+            protocol_resource=matchers.Anything(),
+            cache_key=matchers.Anything(),
+        ),
+        times=0,
+    )
+    decoy.verify(
+        analysis_store.add_pending(
+            protocol_id=matchers.Anything(), analysis_id=matchers.Anything()
         ),
+        times=0,
     )
 
 
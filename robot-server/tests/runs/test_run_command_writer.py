@@ -0,0 +1,498 @@
+"""Tests for robot_server.runs.run_command_writer."""
+import asyncio
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+import pytest
+from decoy import Decoy, matchers
+
+from opentrons.protocol_engine import (
+    actions as pe_actions,
+    commands as pe_commands,
+    errors as pe_errors,
+)
+from opentrons.protocol_engine.actions import ActionDispatcher
+from opentrons.protocol_engine.state import StateView
+
+from robot_server.runs.run_command_writer import RunCommandWriter
+from robot_server.runs.run_store import RunStore
+
+
+def _make_command(
+    command_id: str,
+    status: pe_commands.CommandStatus,
+) -> pe_commands.Command:
+    return pe_commands.WaitForResume(
+        id=command_id,
+        key=command_id,
+        status=status,
+        createdAt=datetime(year=2021, month=1, day=1),
+        params=pe_commands.WaitForResumeParams(message="hello world"),
+    )
+
+
+async def _wait_for(condition: Callable[[], bool]) -> None:
+    """Wait for a write in a worker thread to happen."""
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    assert condition()
+
+
+@pytest.fixture
+def mock_run_store(decoy: Decoy) -> RunStore:
+    """Get a mock RunStore."""
+    return decoy.mock(cls=RunStore)
+
+
+@pytest.fixture
+def mock_state_view(decoy: Decoy) -> StateView:
+    """Get a mock StateView, with no commands in state to begin with."""
+    state_view = decoy.mock(cls=StateView)
+    decoy.when(state_view.commands.get_all()).then_return([])
+    return state_view
+
+
+@pytest.fixture
+def subject(
+    decoy: Decoy,
+    mock_run_store: RunStore,
+    mock_state_view: StateView,
+) -> RunCommandWriter:
+    """Get a RunCommandWriter test subject, configured as if by the engine."""
+    writer = RunCommandWriter(
+        run_id="run-id",
+        run_store=mock_run_store,
+        flush_interval_sec=999,
+        max_batch_size=2,
+    )
+    writer._configure(
+        state=mock_state_view,
+        action_dispatcher=decoy.mock(cls=ActionDispatcher),
+    )
+    return writer
+
+
+async def test_writes_completed_commands_in_batches(
+    decoy: Decoy,
+    mock_run_store: RunStore,
+    mock_state_view: StateView,
+    subject: RunCommandWriter,
+) -> None:
+    """It should write completed commands once a batch fills up."""
+    command_1 = _make_command("command-1", pe_commands.CommandStatus.SUCCEEDED)
+    command_2 = _make_command("command-2", pe_commands.CommandStatus.SUCCEEDED)
+
+    decoy.when(mock_state_view.commands.get("command-1")).then_return(command_1)
+    decoy.when(mock_state_view.commands.get("command-2")).then_return(command_2)
+
+    written: List[Dict[int, pe_commands.Command]] = []
+    decoy.when(
+        await mock_run_store.insert_commands(
+            run_id="run-id",
+            commands_by_index=matchers.Anything(),
+        )
+    ).then_do(lambda run_id, commands_by_index: written.append(commands_by_index))
+
+    subject.setup()
+    subject.handle_action(pe_actions.UpdateCommandAction(command=command_1))
+    subject.handle_action(pe_actions.UpdateCommandAction(command=command_2))
+    await _wait_for(lambda: len(written) == 1)
+
+    assert written == [{0: command_1, 1: command_2}]
+
+    decoy.when(mock_state_view.commands.get_all()).then_return([command_1, command_2])
+    await subject.teardown()
+
+    assert written == [{0: command_1, 1: command_2}]
+
+
+async def test_does_not_write_incomplete_commands_until_teardown(
+    decoy: Decoy,
+    mock_run_store: RunStore,
+    mock_state_view: StateView,
+    subject: RunCommandWriter,
+) -> None:
+    """It should write commands that never completed when the engine finishes."""
+    running_command = _make_command("command-1", pe_commands.CommandStatus.RUNNING)
+    queued_command = _make_command("command-2", pe_commands.CommandStatus.QUEUED)
+
+    decoy.when(mock_state_view.commands.get("command-1")).then_return(running_command)
+    decoy.when(mock_state_view.commands.get("command-2")).then_return(queued_command)
+
+    subject.setup()
+    subject.handle_action(
+        pe_actions.QueueCommandAction(
+            command_id="command-1",
+            created_at=datetime(year=2021, month=1, day=1),
+            request=pe_commands.WaitForResumeCreate(
+                params=pe_commands.WaitForResumeParams()
+            ),
+        )
+    )
+    subject.handle_action(
+        pe_actions.QueueCommandAction(
+            command_id="command-2",
+            created_at=datetime(year=2021, month=1, day=1),
+            request=pe_commands.WaitForResumeCreate(
+                params=pe_commands.WaitForResumeParams()
+            ),
+        )
+    )
+    subject.handle_action(pe_actions.UpdateCommandAction(command=running_command))
+
+    decoy.verify(
+        await mock_run_store.insert_commands(
+            run_id=matchers.Anything(),
+            commands_by_index=matchers.Anything(),
+        ),
+        times=0,
+    )
+
+    decoy.when(mock_state_view.commands.get_all()).then_return(
+        [running_command, queued_command]
+    )
+    await subject.teardown()
+
+    decoy.verify(
+        await mock_run_store.insert_commands(
+            run_id="run-id",
+            commands_by_index={0: running_command, 1: queued_command},
+        ),
+        times=1,
+    )
+
+
+async def test_writes_failed_command_from_state(
+    decoy: Decoy,
+    mock_run_store: RunStore,
+    mock_state_view: StateView,
+    subject: RunCommandWriter,
+) -> None:
+    """It should write a failed command as it appears in state."""
+    running_command = _make_command("command-1", pe_commands.CommandStatus.RUNNING)
+    failed_command = _make_command("command-1", pe_commands.CommandStatus.FAILED)
+
+    decoy.when(mock_state_view.commands.get("command-1")).then_return(failed_command)
+
+    subject.setup()
+    subject.handle_action(pe_actions.UpdateCommandAction(command=running_command))
+    subject.handle_action(
+        pe_actions.FailCommandAction(
+            command_id="command-1",
+            error_id="error-id",
+            failed_at=datetime(year=2021, month=1, day=1),
+            error=pe_errors.ProtocolEngineError("oh no"),
+        )
+    )
+    decoy.when(mock_state_view.commands.get_all()).then_return([failed_command])
+    await subject.teardown()
+
+    decoy.verify(
+        await mock_run_store.insert_commands(
+            run_id="run-id",
+            commands_by_index={0: failed_command},
+        ),
+        times=1,
+    )
+
+
+async def test_retries_failed_writes(
+    decoy: Decoy,
+    mock_run_store: RunStore,
+    mock_state_view: StateView,
+    subject: RunCommandWriter,
+) -> None:
+    """It should keep commands around to retry if a write fails."""
+    command_1 = _make_command("command-1", pe_commands.CommandStatus.SUCCEEDED)
+    command_2 = _make_command("command-2", pe_commands.CommandStatus.SUCCEEDED)
+    written: List[Dict[int, pe_commands.Command]] = []
+
+    def _fail_first_write(
+        run_id: str,
+        commands_by_index: Dict[int, pe_commands.Command],
+    ) -> None:
+        if len(written) == 0:
+            written.append({})
+            raise RuntimeError("oh no")
+        written.append(commands_by_index)
+
+    decoy.when(mock_state_view.commands.get("command-1")).then_return(command_1)
+    decoy.when(mock_state_view.commands.get("command-2")).then_return(command_2)
+    decoy.when(
+        await mock_run_store.insert_commands(
+            run_id="run-id",
+            commands_by_index=matchers.Anything(),
+        )
+    ).then_do(_fail_first_write)
+
+    subject.setup()
+    subject.handle_action(pe_actions.UpdateCommandAction(command=command_1))
+    subject.handle_action(pe_actions.UpdateCommandAction(command=command_2))
+    await _wait_for(lambda: len(written) == 1)
+    decoy.when(mock_state_view.commands.get_all()).then_return([command_1, command_2])
+    await subject.teardown()
+
+    assert written == [{}, {0: command_1, 1: command_2}]
+
+
+def _build_subject(
+    decoy: Decoy,
+    run_store: RunStore,
+    state_view: StateView,
+    **kwargs: Any,
+) -> RunCommandWriter:
+    writer = RunCommandWriter(run_id="run-id", run_store=run_store, **kwargs)
+    writer._configure(
+        state=state_view,
+        action_dispatcher=decoy.mock(cls=ActionDispatcher),
+    )
+    return writer
+
+
+async def test_gives_up_after_repeated_failures(
+    decoy: Decoy,
+    mock_run_store: RunStore,
+    mock_state_view: StateView,
+) -> None:
+    """It should leave commands for the final write after too many failures."""
+    command_1 = _make_command("command-1", pe_commands.CommandStatus.SUCCEEDED)
+    command_2 = _make_command("command-2", pe_commands.CommandStatus.SUCCEEDED)
+    attempts: List[Dict[int, pe_commands.Command]] = []
+
+    def _fail(run_id: str, commands_by_index: Dict[int, pe_commands.Command]) -> None:
+        attempts.append(commands_by_index)
+        raise RuntimeError("oh no")
+
+    decoy.when(mock_state_view.commands.get("command-1")).then_return(command_1)
+    decoy.when(mock_state_view.commands.get("command-2")).then_return(command_2)
+    decoy.when(
+        await mock_run_store.insert_commands(
+            run_id="run-id",
+            commands_by_index=matchers.Anything(),
+        )
+    ).then_do(_fail)
+
+    subject = _build_subject(
+        decoy,
+        mock_run_store,
+        mock_state_view,
+        flush_interval_sec=0.01,
+        max_batch_size=2,
+        max_write_attempts=2,
+    )
+    subject.setup()
+    subject.handle_action(pe_actions.UpdateCommandAction(command=command_1))
+    subject.handle_action(pe_actions.UpdateCommandAction(command=command_2))
+    await _wait_for(lambda: len(attempts) == 2)
+    # Several more flush intervals go by without another attempt.
+    await asyncio.sleep(0.05)
+    assert len(attempts) == 2
+
+    decoy.when(mock_state_view.commands.get_all()).then_return([command_1, command_2])
+    await subject.teardown()
+
+    assert attempts == [{0: command_1, 1: command_2}] * 3
+
+
+async def test_limits_pending_commands(
+    decoy: Decoy,
+    mock_run_store: RunStore,
+    mock_state_view: StateView,
+) -> None:
+    """It should leave commands beyond its limit for the final write."""
+    commands = [
+        _make_command(f"command-{i}", pe_commands.CommandStatus.SUCCEEDED)
+        for i in range(5)
+    ]
+    written: List[Dict[int, pe_commands.Command]] = []
+
+    for command in commands:
+        decoy.when(mock_state_view.commands.get(command.id)).then_return(command)
+    decoy.when(
+        await mock_run_store.insert_commands(
+            run_id="run-id",
+            commands_by_index=matchers.Anything(),
+        )
+    ).then_do(lambda run_id, commands_by_index: written.append(commands_by_index))
+
+    subject = _build_subject(
+        decoy,
+        mock_run_store,
+        mock_state_view,
+        flush_interval_sec=999,
+        max_batch_size=3,
+        max_pending=3,
+    )
+    subject.setup()
+    for command in commands:
+        subject.handle_action(pe_actions.UpdateCommandAction(command=command))
+    await _wait_for(lambda: len(written) == 1)
+    decoy.when(mock_state_view.commands.get_all()).then_return(commands)
+    await subject.teardown()
+
+    assert written == [
+        {0: commands[0], 1: commands[1], 2: commands[2]},
+        {3: commands[3], 4: commands[4]},
+    ]
+
+
+async def test_writes_cascaded_failures(
+    decoy: Decoy,
+    mock_run_store: RunStore,
+    mock_state_view: StateView,
+) -> None:
+    """It should write commands failed along with another one right away."""
+    failed_command = _make_command("command-0", pe_commands.CommandStatus.FAILED)
+    cascaded_command = _make_command("command-1", pe_commands.CommandStatus.FAILED)
+    queued_command = _make_command("command-2", pe_commands.CommandStatus.QUEUED)
+    written: List[Dict[int, pe_commands.Command]] = []
+
+    for command in (failed_command, cascaded_command, queued_command):
+        decoy.when(mock_state_view.commands.get(command.id)).then_return(command)
+    decoy.when(
+        await mock_run_store.insert_commands(
+            run_id="run-id",
+            commands_by_index=matchers.Anything(),
+        )
+    ).then_do(lambda run_id, commands_by_index: written.append(commands_by_index))
+
+    subject = _build_subject(
+        decoy,
+        mock_run_store,
+        mock_state_view,
+        flush_interval_sec=0.01,
+    )
+    subject.setup()
+    for command_id in ("command-0", "command-1", "command-2"):
+        subject.handle_action(
+            pe_actions.QueueCommandAction(
+                command_id=command_id,
+                created_at=datetime(year=2021, month=1, day=1),
+                request=pe_commands.WaitForResumeCreate(
+                    params=pe_commands.WaitForResumeParams()
+                ),
+            )
+        )
+    subject.handle_action(
+        pe_actions.FailCommandAction(
+            command_id="command-0",
+            error_id="error-id",
+            failed_at=datetime(year=2021, month=1, day=1),
+            error=pe_errors.ProtocolEngineError("oh no"),
+        )
+    )
+    await _wait_for(lambda: len(written) == 1)
+
+    assert written == [{0: failed_command, 1: cascaded_command}]
+
+    decoy.when(mock_state_view.commands.get_all()).then_return(
+        [failed_command, cascaded_command, queued_command]
+    )
+    await subject.teardown()
+
+    assert written == [
+        {0: failed_command, 1: cascaded_command},
+        {2: queued_command},
+    ]
+
+
+async def test_writes_commands_already_in_state(
+    decoy: Decoy,
+    mock_run_store: RunStore,
+    mock_state_view: StateView,
+    subject: RunCommandWriter,
+) -> None:
+    """It should write commands queued before it was added, like a JSON protocol's.
+
+    Commands added after it was set up get the same index as in the engine.
+    """
+    protocol_commands = [
+        _make_command(f"command-{i}", pe_commands.CommandStatus.QUEUED)
+        for i in range(3)
+    ]
+    added_command = _make_command("command-3", pe_commands.CommandStatus.QUEUED)
+    all_commands = [*protocol_commands, added_command]
+
+    for command in all_commands:
+        decoy.when(mock_state_view.commands.get(command.id)).then_return(command)
+    decoy.when(mock_state_view.commands.get_all()).then_return(protocol_commands)
+
+    subject.setup()
+    subject.handle_action(
+        pe_actions.QueueCommandAction(
+            command_id="command-3",
+            created_at=datetime(year=2021, month=1, day=1),
+            request=pe_commands.WaitForResumeCreate(
+                params=pe_commands.WaitForResumeParams()
+            ),
+        )
+    )
+    # The run is never played.
+    decoy.when(mock_state_view.commands.get_all()).then_return(all_commands)
+    await subject.teardown()
+
+    decoy.verify(
+        await mock_run_store.insert_commands(
+            run_id="run-id",
+            commands_by_index=dict(enumerate(all_commands)),
+        ),
+        times=1,
+    )
+
+
+async def test_writes_commands_failed_with_run(
+    decoy: Decoy,
+    mock_run_store: RunStore,
+    mock_state_view: StateView,
+) -> None:
+    """It should write queued commands the engine fails when the run fails."""
+    running_command = _make_command("command-0", pe_commands.CommandStatus.RUNNING)
+    failed_command = _make_command("command-0", pe_commands.CommandStatus.FAILED)
+    queued_commands = [
+        _make_command(f"command-{i}", pe_commands.CommandStatus.QUEUED) for i in (1, 2)
+    ]
+    cascaded_commands = [
+        _make_command(f"command-{i}", pe_commands.CommandStatus.FAILED) for i in (1, 2)
+    ]
+    written: List[Dict[int, pe_commands.Command]] = []
+
+    decoy.when(mock_state_view.commands.get_all()).then_return(
+        [running_command, *queued_commands]
+    )
+    decoy.when(mock_state_view.commands.get("command-0")).then_return(failed_command)
+    for command in cascaded_commands:
+        decoy.when(mock_state_view.commands.get(command.id)).then_return(command)
+    decoy.when(
+        await mock_run_store.insert_commands(
+            run_id="run-id",
+            commands_by_index=matchers.Anything(),
+        )
+    ).then_do(lambda run_id, commands_by_index: written.append(commands_by_index))
+
+    subject = _build_subject(
+        decoy,
+        mock_run_store,
+        mock_state_view,
+        flush_interval_sec=0.01,
+    )
+    subject.setup()
+    subject.handle_action(
+        pe_actions.FailCommandAction(
+            command_id="command-0",
+            error_id="error-id",
+            failed_at=datetime(year=2021, month=1, day=1),
+            error=pe_errors.ProtocolEngineError("oh no"),
+        )
+    )
+    await _wait_for(lambda: len(written) == 1)
+
+    assert written == [dict(enumerate([failed_command, *cascaded_commands]))]
+
+    decoy.when(mock_state_view.commands.get_all()).then_return(
+        [failed_command, *cascaded_commands]
+    )
+    await subject.teardown()
+
+    assert len(written) == 1
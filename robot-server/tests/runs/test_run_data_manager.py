@@ -25,6 +25,7 @@ from robot_server.protocols import ProtocolResource
 from robot_server.runs.engine_store import EngineStore, EngineConflictError
 from robot_server.runs.run_data_manager import RunDataManager, RunNotCurrentError
 from robot_server.runs.run_models import Run
+from robot_server.runs.run_command_writer import RunCommandWriter
 from robot_server.runs.run_store import (
     RunStore,
     RunResource,
@@ -134,6 +135,10 @@ async def test_create(
         protocol=None,
     )
 
+    decoy.verify(
+        mock_engine_store.engine.add_plugin(matchers.IsA(RunCommandWriter)),
+        times=1,
+    )
     assert result == Run(
         id=run_resource.run_id,
         protocolId=run_resource.protocol_id,
@@ -480,7 +485,6 @@ async def test_update_current(
         mock_run_store.update_run_state(
             run_id=run_id,
             summary=engine_state_summary,
-            commands=[run_command],
         )
     ).then_return(run_resource)
 
@@ -527,7 +531,6 @@ async def test_update_current_noop(
         mock_run_store.update_run_state(
             run_id=run_id,
             summary=matchers.Anything(),
-            commands=matchers.Anything(),
         ),
         times=0,
     )
@@ -609,7 +612,6 @@ async def test_create_archives_existing(
         mock_run_store.update_run_state(
             run_id=run_id_old,
             summary=engine_state_summary,
-            commands=[run_command],
         )
     )
 
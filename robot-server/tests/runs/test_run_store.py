@@ -486,3 +486,83 @@ def test_get_commands_slice_run_not_found(subject: RunStore) -> None:
     )
     with pytest.raises(RunNotFoundError):
         subject.get_commands_slice(run_id="not-run-id", cursor=1, length=3)
+
+
+def test_update_run_state_replaces_commands(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+    state_summary: StateSummary,
+) -> None:
+    """It should replace any previously stored commands."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+    )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands[1:],
+    )
+
+    result = subject.get_commands_slice(run_id="run-id", cursor=0, length=999)
+
+    assert result == CommandSlice(
+        cursor=0,
+        total_length=2,
+        commands=protocol_commands[1:],
+    )
+    with pytest.raises(CommandNotFoundError):
+        subject.get_command(run_id="run-id", command_id="pause-1")
+
+
+async def test_insert_commands(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+    state_summary: StateSummary,
+) -> None:
+    """It should insert or replace commands by index and keep them on finalize."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    # Cached before the commands are inserted, and invalidated by inserting them.
+    assert subject.get_commands_slice(run_id="run-id", cursor=0, length=999) == (
+        CommandSlice(cursor=0, total_length=0, commands=[])
+    )
+    await subject.insert_commands(
+        run_id="run-id",
+        commands_by_index={0: protocol_commands[0], 1: protocol_commands[0]},
+    )
+    await subject.insert_commands(
+        run_id="run-id",
+        commands_by_index={1: protocol_commands[1], 2: protocol_commands[2]},
+    )
+    subject.update_run_state(run_id="run-id", summary=state_summary)
+
+    result = subject.get_commands_slice(run_id="run-id", cursor=0, length=999)
+
+    assert result == CommandSlice(
+        cursor=0,
+        total_length=3,
+        commands=protocol_commands,
+    )
+    assert subject.get_state_summary(run_id="run-id") == state_summary
+
+
+async def test_insert_commands_run_not_found(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should raise if the run does not exist."""
+    with pytest.raises(RunNotFoundError, match="run-id"):
+        await subject.insert_commands(
+            run_id="run-id",
+            commands_by_index={0: protocol_commands[0]},
+        )
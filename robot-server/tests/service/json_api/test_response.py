@@ -1,6 +1,7 @@
+import json
 import pytest
 from pydantic import BaseModel
-from typing import Any, Dict, NamedTuple, Optional
+from typing import Any, Dict, List, NamedTuple, Optional
 
 from robot_server.service.json_api.resource_links import ResourceLink
 from robot_server.service.json_api.response import (
@@ -14,6 +15,9 @@ from robot_server.service.json_api.response import (
     MultiBodyMeta,
     DeprecatedResponseModel,
     DeprecatedMultiResponseModel,
+    BaseResponseBody,
+    PydanticResponse,
+    StreamingPydanticResponse,
 )
 
 
@@ -121,3 +125,60 @@ RESPONSE_SPECS = [
 @pytest.mark.parametrize(ResponseSpec._fields, RESPONSE_SPECS)
 def test_response_to_dict(subject: BaseModel, expected: Dict[str, Any]) -> None:
     assert subject.dict() == expected
+
+
+class _NestedResource(ResourceModel):
+    id: str
+    children: List[_Resource]
+    val: Optional[int] = None
+
+
+STREAMING_RESPONSE_SPECS = [
+    spec for spec in RESPONSE_SPECS if isinstance(spec.subject, BaseResponseBody)
+] + [
+    ResponseSpec(
+        subject=SimpleBody(
+            data=_NestedResource(
+                id="parent",
+                children=[_Resource(id="hello", val=1), _Resource(id="goodbye")],
+            ),
+        ),
+        expected={
+            "data": {
+                "id": "parent",
+                "children": [{"id": "hello", "val": 1}, {"id": "goodbye"}],
+            },
+        },
+    ),
+    ResponseSpec(
+        subject=SimpleMultiBody(
+            data=[
+                _NestedResource(id="parent-1", children=[_Resource(id="hello")]),
+                _NestedResource(id="parent-2", children=[]),
+            ],
+            meta=MultiBodyMeta(cursor=0, totalLength=2),
+        ),
+        expected={
+            "data": [
+                {"id": "parent-1", "children": [{"id": "hello"}]},
+                {"id": "parent-2", "children": []},
+            ],
+            "meta": {"cursor": 0, "totalLength": 2},
+        },
+    ),
+]
+
+
+@pytest.mark.parametrize(ResponseSpec._fields, STREAMING_RESPONSE_SPECS)
+async def test_streaming_response(
+    subject: BaseResponseBody, expected: Dict[str, Any]
+) -> None:
+    """It should stream the same JSON as a non-streaming response."""
+    response = StreamingPydanticResponse(content=subject, chunk_size=1)
+    chunks = [chunk async for chunk in response.body_iterator]
+    body = b"".join(chunks)
+
+    assert json.loads(body) == expected
+    assert json.loads(body) == json.loads(PydanticResponse(content=subject).body)
+    assert response.content is subject
+    assert response.media_type == "application/json"
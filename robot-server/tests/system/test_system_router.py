@@ -5,8 +5,15 @@ from datetime import datetime, timezone
 from starlette.testclient import TestClient
 from typing import Iterator
 
-from robot_server.service.json_api import ResourceLink, ResourceLinks, ResourceLinkKey
+from robot_server.persistence import MemoryCache
+from robot_server.service.json_api import (
+    ResourceLink,
+    ResourceLinks,
+    ResourceLinkKey,
+    SimpleBody,
+)
 from robot_server.system import errors, router
+from robot_server.system.models import PersistenceCacheStats
 
 
 @pytest.fixture
@@ -105,3 +112,27 @@ def test_set_system_time(
         "links": response_links,
     }
     assert response.status_code == 200
+
+
+async def test_get_persistence_cache_stats() -> None:
+    """It should return the persistence cache's usage statistics."""
+    cache = MemoryCache(max_size_bytes=100)
+    cache.put(key="key", value="value", size_bytes=10)
+    cache.get("key")
+
+    with pytest.raises(KeyError):
+        cache.get("other-key")
+
+    result = await router.get_persistence_cache_stats(cache=cache)
+
+    assert result.content == SimpleBody(
+        data=PersistenceCacheStats(
+            entryCount=1,
+            sizeBytes=10,
+            maxSizeBytes=100,
+            hits=1,
+            misses=1,
+            evictions=0,
+        )
+    )
+    assert result.status_code == 200